@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Migration: Convert ad_embeddings.vec from JSON text to packed float32.
+
+Rewrites every legacy JSON vector into the versioned binary format written
+by src.db.ad.encode_embedding (~1.5KB per 384-dim vector instead of ~8KB).
+On Postgres the column is first retyped from TEXT to BYTEA; SQLite stores
+BLOBs in the existing column as-is. Rows already packed are skipped, so the
+migration is safe to re-run.
+
+Run with: python -m migrations.010_pack_ad_embeddings [--batch-size N]
+"""
+
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.db import (
+    _is_postgres,
+    connect,
+    decode_embedding,
+    encode_embedding,
+    execute,
+    executemany,
+)
+from src.db.ad import is_packed_embedding
+
+DEFAULT_BATCH_SIZE = 500
+
+
+def _retype_postgres_column(con) -> None:
+    cur = execute(
+        con,
+        """SELECT data_type FROM information_schema.columns
+           WHERE table_name = 'ad_embeddings' AND column_name = 'vec'""",
+    )
+    row = cur.fetchone()
+    if row and row[0] != "bytea":
+        execute(
+            con,
+            "ALTER TABLE ad_embeddings ALTER COLUMN vec TYPE BYTEA USING convert_to(vec, 'UTF8')",
+        )
+        print("  Retyped ad_embeddings.vec TEXT -> BYTEA")
+
+
+def run_migration(batch_size: int = DEFAULT_BATCH_SIZE):
+    """Pack all JSON ad_embeddings vectors, paging by utterance_id."""
+    print("Running migration 010: Pack ad_embeddings vectors as float32...")
+
+    con = connect()
+    converted = 0
+    skipped = 0
+    try:
+        if _is_postgres():
+            _retype_postgres_column(con)
+            con.commit()
+
+        last_id = ""
+        while True:
+            cur = execute(
+                con,
+                """SELECT utterance_id, vec FROM ad_embeddings
+                   WHERE utterance_id > :last_id
+                   ORDER BY utterance_id LIMIT :limit""",
+                {"last_id": last_id, "limit": batch_size},
+            )
+            rows = cur.fetchall()
+            if not rows:
+                break
+            last_id = rows[-1][0]
+
+            updates = []
+            for utterance_id, raw in rows:
+                if is_packed_embedding(raw):
+                    skipped += 1
+                    continue
+                updates.append(
+                    {"utterance_id": utterance_id, "vec": encode_embedding(decode_embedding(raw))}
+                )
+
+            if updates:
+                executemany(
+                    con,
+                    "UPDATE ad_embeddings SET vec = :vec WHERE utterance_id = :utterance_id",
+                    updates,
+                )
+                con.commit()
+                converted += len(updates)
+                print(f"  Converted {converted} rows (through {last_id})")
+
+    except Exception as e:
+        con.rollback()
+        print(f"\nMigration failed: {e}")
+        raise
+    finally:
+        con.close()
+
+    print(f"\nMigration 010 complete: {converted} converted, {skipped} already packed.")
+    return {"converted": converted, "skipped": skipped}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Pack ad_embeddings vectors as float32")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    args = parser.parse_args()
+    run_migration(batch_size=args.batch_size)
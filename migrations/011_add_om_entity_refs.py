@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Migration: Add om_entity_refs inverted index and backfill it.
+
+om_entity_refs maps each canonical entity (GAO report number, bill, case
+number, ...) to the om_events rows that reference it, so deduplication can
+look entities up by index instead of scanning canonical_refs with LIKE.
+Existing events are backfilled from their canonical_refs JSON; inserts are
+idempotent, so the migration is safe to re-run.
+
+Run with: python -m migrations.011_add_om_entity_refs [--batch-size N]
+"""
+
+import argparse
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.db import connect, execute, executemany
+from src.oversight.db_helpers import entity_ref_rows
+
+DEFAULT_BATCH_SIZE = 1000
+
+
+def run_migration(batch_size: int = DEFAULT_BATCH_SIZE):
+    """Create om_entity_refs and backfill it from om_events.canonical_refs."""
+    print("Running migration 011: Add om_entity_refs index...")
+
+    con = connect()
+    indexed = 0
+    try:
+        execute(
+            con,
+            """
+            CREATE TABLE IF NOT EXISTS om_entity_refs (
+                entity_type TEXT NOT NULL,
+                entity_value TEXT NOT NULL,
+                event_id TEXT NOT NULL,
+                PRIMARY KEY (entity_value, entity_type, event_id),
+                FOREIGN KEY (event_id) REFERENCES om_events(event_id)
+            )
+        """,
+        )
+        execute(
+            con,
+            """
+            CREATE INDEX IF NOT EXISTS idx_om_entity_refs_event
+            ON om_entity_refs(event_id)
+        """,
+        )
+        con.commit()
+        print("  OK: Created om_entity_refs table and indexes")
+
+        last_id = ""
+        while True:
+            cur = execute(
+                con,
+                """SELECT event_id, canonical_refs FROM om_events
+                   WHERE event_id > :last_id AND canonical_refs IS NOT NULL
+                   ORDER BY event_id LIMIT :limit""",
+                {"last_id": last_id, "limit": batch_size},
+            )
+            rows = cur.fetchall()
+            if not rows:
+                break
+            last_id = rows[-1][0]
+
+            refs_rows = []
+            for event_id, raw in rows:
+                try:
+                    refs = json.loads(raw)
+                except ValueError:
+                    print(f"  WARN: Skipping {event_id}: canonical_refs is not valid JSON")
+                    continue
+                if isinstance(refs, dict):
+                    refs_rows.extend(entity_ref_rows(event_id, refs))
+
+            executemany(
+                con,
+                """INSERT INTO om_entity_refs (entity_type, entity_value, event_id)
+                   VALUES (:entity_type, :entity_value, :event_id)
+                   ON CONFLICT(entity_value, entity_type, event_id) DO NOTHING""",
+                refs_rows,
+            )
+            con.commit()
+            indexed += len(refs_rows)
+            print(f"  Indexed {indexed} entity refs (through {last_id})")
+
+    except Exception as e:
+        con.rollback()
+        print(f"\nMigration failed: {e}")
+        raise
+    finally:
+        con.close()
+
+    print(f"\nMigration 011 complete: {indexed} entity refs indexed.")
+    return {"indexed": indexed}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Add and backfill om_entity_refs")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    args = parser.parse_args()
+    run_migration(batch_size=args.batch_size)
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Migration: Add compound_watermarks table for the incremental correlator.
+
+Run with: python -m migrations.012_add_compound_watermarks
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.db import connect, execute
+
+
+def run_migration():
+    """Create compound_watermarks table."""
+    print("Running migration 012: Add compound_watermarks table...")
+
+    con = connect()
+    try:
+        execute(
+            con,
+            """
+            CREATE TABLE IF NOT EXISTS compound_watermarks (
+                source_type TEXT PRIMARY KEY,
+                watermark TEXT NOT NULL,
+                updated_at TEXT NOT NULL
+            )
+        """,
+        )
+        con.commit()
+        print("  OK: Created compound_watermarks table")
+
+    except Exception as e:
+        con.rollback()
+        print(f"\nMigration failed: {e}")
+        raise
+    finally:
+        con.close()
+
+    print("\nMigration 012 complete.")
+
+
+if __name__ == "__main__":
+    run_migration()
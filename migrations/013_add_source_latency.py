@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Migration: Add per-source fetch latency to state_source_health.
+
+Adds last_latency_ms (INTEGER), recorded by the state monitor alongside the
+success/failure health update for every source fetch.
+
+Run with: python -m migrations.013_add_source_latency
+"""
+
+import os
+import sys
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.db import connect, execute
+
+ALTER_STATEMENTS = [
+    "ALTER TABLE state_source_health ADD COLUMN last_latency_ms INTEGER",
+]
+
+
+def run_migration():
+    """Add last_latency_ms to state_source_health."""
+    print("Running migration 013: Add last_latency_ms to state_source_health...")
+
+    con = connect()
+    try:
+        for sql in ALTER_STATEMENTS:
+            try:
+                execute(con, sql)
+                print(f"  OK: {sql}")
+            except Exception as e:
+                print(f"  Skipped (already exists): {e}")
+
+        con.commit()
+        print("\nMigration 013: Added last_latency_ms to state_source_health")
+
+    except Exception as e:
+        con.rollback()
+        print(f"\nMigration failed: {e}")
+        raise
+    finally:
+        con.close()
+
+
+if __name__ == "__main__":
+    run_migration()
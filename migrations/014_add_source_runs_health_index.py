@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Migration: Add the source_runs indexes behind /api/health.
+
+/api/health walks the distinct source_ids with a recursive CTE, then looks
+up each source's latest run on (source_id, ended_at) and its last
+successful run on (source_id, status, ended_at). Every step is an index
+seek, so the query does not grow with run history. SQLite databases
+already have idx_source_runs_source; Postgres did not.
+
+Run with: python -m migrations.014_add_source_runs_health_index
+"""
+
+import os
+import sys
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.db import connect, execute
+
+STATEMENTS = [
+    "CREATE INDEX IF NOT EXISTS idx_source_runs_source ON source_runs(source_id, ended_at)",
+    """
+    CREATE INDEX IF NOT EXISTS idx_source_runs_source_status_ended
+    ON source_runs(source_id, status, ended_at)
+    """,
+]
+
+
+def run_migration():
+    """Create idx_source_runs_source and idx_source_runs_source_status_ended."""
+    print("Running migration 014: Add source_runs health indexes...")
+
+    con = connect()
+    try:
+        for stmt in STATEMENTS:
+            execute(con, stmt)
+        con.commit()
+        print("\nMigration 014: Created source_runs health indexes")
+
+    except Exception as e:
+        con.rollback()
+        print(f"\nMigration failed: {e}")
+        raise
+    finally:
+        con.close()
+
+
+if __name__ == "__main__":
+    run_migration()
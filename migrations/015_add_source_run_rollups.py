@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Migration: Add source_run_rollups and backfill it from source_runs.
+
+insert_source_run keeps one (source_id, day, status) count row up to date
+per run, so /api/runs/stats reads the rollups instead of aggregating the
+whole run history. Also indexes source_runs(ended_at) for the rolling
+24-hour count.
+
+Run with: python -m migrations.015_add_source_run_rollups
+"""
+
+import os
+import sys
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.db import connect, execute, rebuild_source_run_rollups
+
+STATEMENTS = [
+    """
+    CREATE TABLE IF NOT EXISTS source_run_rollups (
+      source_id TEXT NOT NULL,
+      day TEXT NOT NULL,
+      status TEXT NOT NULL,
+      run_count INTEGER NOT NULL DEFAULT 0,
+      PRIMARY KEY (source_id, day, status)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_source_run_rollups_day ON source_run_rollups(day)",
+    "CREATE INDEX IF NOT EXISTS idx_source_runs_ended ON source_runs(ended_at)",
+]
+
+
+def run_migration():
+    """Create source_run_rollups and populate it from existing runs."""
+    print("Running migration 015: Add source_run_rollups...")
+
+    con = connect()
+    try:
+        for stmt in STATEMENTS:
+            execute(con, stmt)
+        con.commit()
+        print("  Created source_run_rollups and indexes")
+    except Exception as e:
+        con.rollback()
+        print(f"\nMigration failed: {e}")
+        raise
+    finally:
+        con.close()
+
+    rows = rebuild_source_run_rollups()
+    print(f"\nMigration 015: Backfilled {rows} rollup rows")
+
+
+if __name__ == "__main__":
+    run_migration()
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Migration: Add ml_score_cache for persisted SignalScorer results.
+
+Rows are keyed by a hash of a signal's scoring inputs and the scoring
+config (src/ml/cache.py), so re-ingests and backfills can reuse scores
+across runs when ML_SCORE_CACHE_PERSIST is set.
+
+Run with: python -m migrations.016_add_ml_score_cache
+"""
+
+import os
+import sys
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.db import connect, execute
+
+STATEMENTS = [
+    """
+    CREATE TABLE IF NOT EXISTS ml_score_cache (
+      cache_key TEXT PRIMARY KEY,
+      config_hash TEXT NOT NULL,
+      importance_score REAL NOT NULL,
+      impact_score REAL NOT NULL,
+      urgency_score REAL NOT NULL,
+      overall_risk TEXT NOT NULL,
+      overall_score REAL NOT NULL,
+      confidence REAL NOT NULL,
+      recommendations_json TEXT NOT NULL,
+      created_at TEXT NOT NULL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_ml_score_cache_config ON ml_score_cache(config_hash)",
+]
+
+
+def run_migration():
+    """Create the ml_score_cache table."""
+    print("Running migration 016: Add ml_score_cache...")
+
+    con = connect()
+    try:
+        for stmt in STATEMENTS:
+            execute(con, stmt)
+        con.commit()
+        print("  Created ml_score_cache and index")
+    except Exception as e:
+        con.rollback()
+        print(f"\nMigration failed: {e}")
+        raise
+    finally:
+        con.close()
+
+    print("\nMigration 016: Complete")
+
+
+if __name__ == "__main__":
+    run_migration()
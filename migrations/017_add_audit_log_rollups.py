@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Migration: Add audit_log_rollups and backfill it from audit_log.
+
+The batched audit writer keeps one (hour, action, user_email,
+response_status, success) row of counts and a duration histogram up to
+date, so get_audit_stats reads the rollups instead of aggregating every
+audit_log row in the period.
+
+Run with: python -m migrations.017_add_audit_log_rollups
+"""
+
+import os
+import sys
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.auth.audit_rollups import rebuild_audit_rollups
+from src.db import connect, execute
+
+STATEMENTS = [
+    """
+    CREATE TABLE IF NOT EXISTS audit_log_rollups (
+      hour TEXT NOT NULL,
+      action TEXT NOT NULL,
+      user_email TEXT NOT NULL DEFAULT '',
+      response_status INTEGER NOT NULL DEFAULT 0,
+      success INTEGER NOT NULL,
+      request_count INTEGER NOT NULL DEFAULT 0,
+      duration_count INTEGER NOT NULL DEFAULT 0,
+      duration_sum_ms BIGINT NOT NULL DEFAULT 0,
+      duration_le_50 INTEGER NOT NULL DEFAULT 0,
+      duration_le_100 INTEGER NOT NULL DEFAULT 0,
+      duration_le_250 INTEGER NOT NULL DEFAULT 0,
+      duration_le_500 INTEGER NOT NULL DEFAULT 0,
+      duration_le_1000 INTEGER NOT NULL DEFAULT 0,
+      duration_le_2500 INTEGER NOT NULL DEFAULT 0,
+      duration_gt_2500 INTEGER NOT NULL DEFAULT 0,
+      PRIMARY KEY (hour, action, user_email, response_status, success)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_audit_log_rollups_hour ON audit_log_rollups(hour)",
+]
+
+
+def run_migration():
+    """Create audit_log_rollups and populate it from existing audit rows."""
+    print("Running migration 017: Add audit_log_rollups...")
+
+    con = connect()
+    try:
+        for stmt in STATEMENTS:
+            execute(con, stmt)
+        con.commit()
+        print("  Created audit_log_rollups and index")
+    except Exception as e:
+        con.rollback()
+        print(f"\nMigration failed: {e}")
+        raise
+    finally:
+        con.close()
+
+    rows = rebuild_audit_rollups()
+    print(f"\nMigration 017: Backfilled {rows} rollup rows")
+
+
+if __name__ == "__main__":
+    run_migration()
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Migration: Index the canary watermark columns.
+
+Post-run canaries (src/resilience/canary.py) read MAX(column) before a run
+and, afterwards, check only the rows at or past it. Both lookups need an
+index on the watermark column of each checked table.
+
+Run with: python -m migrations.018_add_canary_watermark_indexes
+"""
+
+import os
+import sys
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.db import connect, execute
+
+STATEMENTS = [
+    "CREATE INDEX IF NOT EXISTS idx_fr_seen_first_seen ON fr_seen(first_seen_at)",
+    "CREATE INDEX IF NOT EXISTS idx_ecfr_seen_first_seen ON ecfr_seen(first_seen_at)",
+    "CREATE INDEX IF NOT EXISTS idx_bills_updated ON bills(updated_at)",
+    "CREATE INDEX IF NOT EXISTS idx_hearings_updated ON hearings(updated_at)",
+    "CREATE INDEX IF NOT EXISTS idx_om_events_fetched ON om_events(fetched_at)",
+    "CREATE INDEX IF NOT EXISTS idx_lda_filings_first_seen ON lda_filings(first_seen_at)",
+]
+
+
+def run_migration():
+    """Create the canary watermark indexes."""
+    print("Running migration 018: Add canary watermark indexes...")
+
+    con = connect()
+    try:
+        for stmt in STATEMENTS:
+            execute(con, stmt)
+            print(f"  OK: {stmt}")
+        con.commit()
+        print("\nMigration 018: Created canary watermark indexes")
+
+    except Exception as e:
+        con.rollback()
+        print(f"\nMigration failed: {e}")
+        raise
+    finally:
+        con.close()
+
+
+if __name__ == "__main__":
+    run_migration()
@@ -15,6 +15,26 @@ CREATE TABLE IF NOT EXISTS source_runs (
   errors_json TEXT NOT NULL DEFAULT '[]'
 );
 
+-- /api/health: the recursive CTE steps through distinct source_ids and reads each
+-- source's latest run from (source_id, ended_at) and its last success from
+-- (source_id, status, ended_at); both are index seeks per source
+CREATE INDEX IF NOT EXISTS idx_source_runs_source ON source_runs(source_id, ended_at);
+CREATE INDEX IF NOT EXISTS idx_source_runs_source_status_ended ON source_runs(source_id, status, ended_at);
+-- /api/runs/stats: rolling 24h run count
+CREATE INDEX IF NOT EXISTS idx_source_runs_ended ON source_runs(ended_at);
+
+-- source_run_rollups: per source/day/status run counts, maintained by
+-- insert_source_run so /api/runs/stats does not scan source_runs
+CREATE TABLE IF NOT EXISTS source_run_rollups (
+  source_id TEXT NOT NULL,
+  day TEXT NOT NULL,
+  status TEXT NOT NULL,
+  run_count INTEGER NOT NULL DEFAULT 0,
+  PRIMARY KEY (source_id, day, status)
+);
+
+CREATE INDEX IF NOT EXISTS idx_source_run_rollups_day ON source_run_rollups(day);
+
 CREATE TABLE IF NOT EXISTS fr_seen (
   doc_id TEXT PRIMARY KEY,
   published_date TEXT NOT NULL,
@@ -70,7 +90,7 @@ CREATE TABLE IF NOT EXISTS ad_utterances (
 
 CREATE TABLE IF NOT EXISTS ad_embeddings (
   utterance_id TEXT PRIMARY KEY,
-  vec TEXT NOT NULL,
+  vec BYTEA NOT NULL,
   model_id TEXT NOT NULL,
   embedded_at TEXT NOT NULL,
   FOREIGN KEY (utterance_id) REFERENCES ad_utterances(utterance_id)
@@ -204,6 +224,17 @@ CREATE INDEX IF NOT EXISTS idx_om_events_pub_timestamp ON om_events(pub_timestam
 CREATE INDEX IF NOT EXISTS idx_om_events_surfaced ON om_events(surfaced, surfaced_at);
 CREATE INDEX IF NOT EXISTS idx_om_events_source_type ON om_events(primary_source_type);
 
+-- Inverted index over om_events.canonical_refs for entity-based deduplication
+CREATE TABLE IF NOT EXISTS om_entity_refs (
+  entity_type TEXT NOT NULL,
+  entity_value TEXT NOT NULL,
+  event_id TEXT NOT NULL,
+  PRIMARY KEY (entity_value, entity_type, event_id),
+  FOREIGN KEY (event_id) REFERENCES om_events(event_id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_om_entity_refs_event ON om_entity_refs(event_id);
+
 CREATE TABLE IF NOT EXISTS om_related_coverage (
   id INTEGER GENERATED BY DEFAULT AS IDENTITY PRIMARY KEY,
   event_id TEXT NOT NULL,
@@ -340,6 +371,7 @@ CREATE TABLE IF NOT EXISTS state_source_health (
     last_success TEXT,
     last_failure TEXT,
     last_error TEXT,
+    last_latency_ms INTEGER,
     FOREIGN KEY (source_id) REFERENCES state_sources(source_id)
 );
 
@@ -750,6 +782,29 @@ CREATE INDEX IF NOT EXISTS idx_audit_log_action ON audit_log(action, timestamp);
 CREATE INDEX IF NOT EXISTS idx_audit_log_resource ON audit_log(resource, timestamp);
 CREATE INDEX IF NOT EXISTS idx_audit_log_success ON audit_log(success, timestamp);
 
+-- audit_log_rollups: hourly audit counts and duration histogram, maintained
+-- by the batched audit writer so get_audit_stats does not scan audit_log
+CREATE TABLE IF NOT EXISTS audit_log_rollups (
+    hour TEXT NOT NULL,
+    action TEXT NOT NULL,
+    user_email TEXT NOT NULL DEFAULT '',
+    response_status INTEGER NOT NULL DEFAULT 0,
+    success INTEGER NOT NULL,
+    request_count INTEGER NOT NULL DEFAULT 0,
+    duration_count INTEGER NOT NULL DEFAULT 0,
+    duration_sum_ms BIGINT NOT NULL DEFAULT 0,
+    duration_le_50 INTEGER NOT NULL DEFAULT 0,
+    duration_le_100 INTEGER NOT NULL DEFAULT 0,
+    duration_le_250 INTEGER NOT NULL DEFAULT 0,
+    duration_le_500 INTEGER NOT NULL DEFAULT 0,
+    duration_le_1000 INTEGER NOT NULL DEFAULT 0,
+    duration_le_2500 INTEGER NOT NULL DEFAULT 0,
+    duration_gt_2500 INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (hour, action, user_email, response_status, success)
+);
+
+CREATE INDEX IF NOT EXISTS idx_audit_log_rollups_hour ON audit_log_rollups(hour);
+
 -- Seed commander account
 INSERT INTO users (user_id, email, display_name, role, is_active)
 VALUES ('pending-commander', 'x_aguiar@yahoo.com', 'Xavier Aguiar', 'commander', TRUE)
@@ -1002,3 +1057,36 @@ CREATE TABLE IF NOT EXISTS compound_signals (
 CREATE INDEX IF NOT EXISTS idx_compound_signals_rule ON compound_signals(rule_id);
 CREATE INDEX IF NOT EXISTS idx_compound_signals_created ON compound_signals(created_at);
 CREATE INDEX IF NOT EXISTS idx_compound_signals_severity ON compound_signals(severity_score);
+
+-- Incremental correlator: last changed-at value read per source table
+CREATE TABLE IF NOT EXISTS compound_watermarks (
+    source_type TEXT PRIMARY KEY,
+    watermark TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+);
+
+-- ML score cache: scores keyed by a hash of the scoring inputs and config
+-- (src/ml/cache.py); read/written when ML_SCORE_CACHE_PERSIST is set
+CREATE TABLE IF NOT EXISTS ml_score_cache (
+    cache_key TEXT PRIMARY KEY,
+    config_hash TEXT NOT NULL,
+    importance_score REAL NOT NULL,
+    impact_score REAL NOT NULL,
+    urgency_score REAL NOT NULL,
+    overall_risk TEXT NOT NULL,
+    overall_score REAL NOT NULL,
+    confidence REAL NOT NULL,
+    recommendations_json TEXT NOT NULL,
+    created_at TEXT NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_ml_score_cache_config ON ml_score_cache(config_hash);
+
+-- Canary watermarks: post-run canaries find the rows a run wrote by these
+-- columns (src/resilience/canary.py)
+CREATE INDEX IF NOT EXISTS idx_fr_seen_first_seen ON fr_seen(first_seen_at);
+CREATE INDEX IF NOT EXISTS idx_ecfr_seen_first_seen ON ecfr_seen(first_seen_at);
+CREATE INDEX IF NOT EXISTS idx_bills_updated ON bills(updated_at);
+CREATE INDEX IF NOT EXISTS idx_hearings_updated ON hearings(updated_at);
+CREATE INDEX IF NOT EXISTS idx_om_events_fetched ON om_events(fetched_at);
+CREATE INDEX IF NOT EXISTS idx_lda_filings_first_seen ON lda_filings(first_seen_at);
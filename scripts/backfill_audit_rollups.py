@@ -0,0 +1,55 @@
+"""
+Rebuild or verify audit_log_rollups against audit_log.
+
+The batched audit writer keeps the rollups current, but rows written or
+deleted directly in audit_log (manual fixes, restores) leave them stale.
+--check reports any rollup row whose values disagree with the raw audit
+rows without changing anything; otherwise the rollups are rebuilt.
+
+Run with: python -m scripts.backfill_audit_rollups [--check]
+"""
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+
+# Add parent to path for imports
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.auth.audit_rollups import check_audit_rollups, rebuild_audit_rollups
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s %(levelname)s %(message)s",
+)
+logger = logging.getLogger(__name__)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rebuild or verify audit_log_rollups")
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Only compare rollups with audit_log; exit 1 on any mismatch",
+    )
+    args = parser.parse_args()
+
+    if args.check:
+        mismatches = check_audit_rollups()
+        for m in mismatches:
+            logger.warning(
+                f"{m['hour']} {m['action']} {m['user_email'] or '-'} "
+                f"{m['response_status']} success={m['success']}: "
+                f"audit_log={m['expected']} rollup={m['actual']}"
+            )
+        logger.info(f"Rollup check complete: {len(mismatches)} mismatches")
+        return 0 if not mismatches else 1
+
+    rows = rebuild_audit_rollups()
+    logger.info(f"Rebuilt audit_log_rollups: {rows} rows")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,10 +1,12 @@
 """
 Backfill ML scores for om_events that are missing them.
 
-This script queries om_events with NULL ml_score and runs each through
-the ML scoring pipeline.
+This script queries om_events with NULL ml_score and scores them in
+batches with SignalScorer.score_batch (the same scores check_escalation
+would assign one event at a time). Each batch is written back with one
+executemany in a single transaction.
 
-Run with: python -m scripts.backfill_om_ml_scores [--limit N] [--dry-run]
+Run with: python -m scripts.backfill_om_ml_scores [--limit N] [--batch-size N] [--dry-run]
 """
 
 import argparse
@@ -15,8 +17,8 @@ from pathlib import Path
 # Add parent to path for imports
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-from src.db import connect, execute
-from src.oversight.pipeline.escalation import _try_ml_score
+from src.db import connect, execute, executemany
+from src.ml import SignalScorer
 
 logging.basicConfig(
     level=logging.INFO,
@@ -24,6 +26,8 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+DEFAULT_BATCH_SIZE = 1000
+
 
 def get_events_missing_ml_score(limit: int = 100) -> list[dict]:
     """Get om_events that don't have ml_score populated."""
@@ -47,13 +51,16 @@ def get_events_missing_ml_score(limit: int = 100) -> list[dict]:
     return rows
 
 
-def backfill_ml_scores(limit: int = 100, dry_run: bool = False) -> dict:
+def backfill_ml_scores(
+    limit: int = 100, dry_run: bool = False, batch_size: int = DEFAULT_BATCH_SIZE
+) -> dict:
     """
     Backfill ml_score and ml_risk_level for om_events.
 
     Args:
         limit: Maximum number of events to process
         dry_run: If True, don't actually update the database
+        batch_size: Events scored and written per batch
 
     Returns:
         Stats dict with counts
@@ -66,46 +73,64 @@ def backfill_ml_scores(limit: int = 100, dry_run: bool = False) -> dict:
     if not events:
         return stats
 
-    for event in events:
-        stats["processed"] += 1
+    scorer = SignalScorer()
+    for start in range(0, len(events), batch_size):
+        batch = events[start : start + batch_size]
+        stats["processed"] += len(batch)
         try:
-            title = event["title"] or ""
-            content = event["raw_content"] or ""
-            ml_score, ml_risk_level, _ = _try_ml_score(title, content)
-
-            if ml_score is None:
-                stats["skipped_no_score"] += 1
-                continue
-
-            if dry_run:
-                logger.info(
-                    f"[DRY RUN] Would update {event['event_id']}: "
-                    f"ml_score={ml_score}, ml_risk_level={ml_risk_level}"
-                )
-            else:
-                con = connect()
-                execute(
-                    con,
-                    """
-                    UPDATE om_events
-                    SET ml_score = :ml_score, ml_risk_level = :ml_risk_level
-                    WHERE event_id = :event_id
-                    """,
+            # Same input check_escalation's _try_ml_score builds per event
+            results = scorer.score_batch(
+                [
                     {
-                        "ml_score": ml_score,
-                        "ml_risk_level": ml_risk_level,
-                        "event_id": event["event_id"],
-                    },
+                        "title": event["title"] or "",
+                        "content": event["raw_content"] or "",
+                        "source_type": "oversight",
+                    }
+                    for event in batch
+                ]
+            )
+        except Exception as e:
+            logger.warning(f"ML scoring unavailable for batch at offset {start}: {e}")
+            stats["skipped_no_score"] += len(batch)
+            continue
+
+        updates = [
+            {
+                "ml_score": result.overall_score,
+                "ml_risk_level": result.overall_risk.value,
+                "event_id": event["event_id"],
+            }
+            for event, result in zip(batch, results)
+        ]
+
+        if dry_run:
+            for update in updates:
+                logger.info(
+                    f"[DRY RUN] Would update {update['event_id']}: "
+                    f"ml_score={update['ml_score']}, ml_risk_level={update['ml_risk_level']}"
                 )
-                con.commit()
-                con.close()
-                logger.info(f"Updated {event['event_id']}: ml_score={ml_score}")
-
-            stats["updated"] += 1
+            stats["updated"] += len(updates)
+            continue
 
+        con = connect()
+        try:
+            executemany(
+                con,
+                """
+                UPDATE om_events
+                SET ml_score = :ml_score, ml_risk_level = :ml_risk_level
+                WHERE event_id = :event_id
+                """,
+                updates,
+            )
+            con.commit()
+            stats["updated"] += len(updates)
+            logger.info(f"Updated {stats['updated']}/{len(events)} events")
         except Exception as e:
-            logger.error(f"Error processing {event['event_id']}: {e}")
-            stats["errors"] += 1
+            logger.error(f"Error writing batch at offset {start}: {e}")
+            stats["errors"] += len(updates)
+        finally:
+            con.close()
 
     return stats
 
@@ -123,11 +148,19 @@ def main():
         action="store_true",
         help="Don't actually update the database",
     )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help=f"Events scored and written per batch (default: {DEFAULT_BATCH_SIZE})",
+    )
     args = parser.parse_args()
 
     logger.info(f"Starting ML score backfill (limit={args.limit}, dry_run={args.dry_run})")
 
-    stats = backfill_ml_scores(limit=args.limit, dry_run=args.dry_run)
+    stats = backfill_ml_scores(
+        limit=args.limit, dry_run=args.dry_run, batch_size=max(1, args.batch_size)
+    )
 
     logger.info(f"Backfill complete: {stats}")
     return 0 if stats["errors"] == 0 else 1
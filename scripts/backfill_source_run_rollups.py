@@ -0,0 +1,54 @@
+"""
+Rebuild or verify source_run_rollups against source_runs.
+
+insert_source_run keeps the rollups current, but rows written or deleted
+directly in source_runs (cleanup scripts, manual fixes) leave them stale.
+--check reports any (source, day, status) whose rollup count disagrees with
+the raw runs without changing anything; otherwise the rollups are rebuilt.
+
+Run with: python -m scripts.backfill_source_run_rollups [--check]
+"""
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+
+# Add parent to path for imports
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.db import check_source_run_rollups, rebuild_source_run_rollups
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s %(levelname)s %(message)s",
+)
+logger = logging.getLogger(__name__)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rebuild or verify source_run_rollups")
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Only compare rollups with source_runs; exit 1 on any mismatch",
+    )
+    args = parser.parse_args()
+
+    if args.check:
+        mismatches = check_source_run_rollups()
+        for m in mismatches:
+            logger.warning(
+                f"{m['source_id']} {m['day']} {m['status']}: "
+                f"source_runs={m['expected']} rollup={m['actual']}"
+            )
+        logger.info(f"Rollup check complete: {len(mismatches)} mismatches")
+        return 0 if not mismatches else 1
+
+    rows = rebuild_source_run_rollups()
+    logger.info(f"Rebuilt source_run_rollups: {rows} rows")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
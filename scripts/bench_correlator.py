@@ -0,0 +1,172 @@
+"""
+Benchmark the correlation engine: full re-evaluation vs incremental mode.
+
+Seeds a temporary SQLite database with --events rows spread over the five
+source tables and the last 30 days, then times:
+- full:        CorrelationEngine().evaluate_rules() over the whole window
+- incremental: a warm engine evaluating --new freshly inserted rows against
+               its sliding window (the steady-state cron case)
+
+The one-off cold start of the incremental engine (no watermarks yet: a full
+evaluation plus building the indexed window) is reported separately.
+
+Run with: python -m scripts.bench_correlator [--events 10000] [--new 100]
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+# Add parent to path for imports
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import src.db as db
+import src.db.core as db_core
+from src.signals.correlator import CorrelationEngine
+
+_PHRASES = [
+    "disability benefits",
+    "claims processing backlog",
+    "board of veterans appeals",
+    "schedule for rating disabilities",
+    "contractor exam quality",
+    "medical examination delays",
+    "caregiver program",
+    "home loan guaranty",
+    "education benefits",
+    "community care access",
+]
+_STATES = ["TX", "FL", "CA", "NY", "PA", "OH", "GA", "NC", "VA", "AZ"]
+_SOURCES = ["oversight", "bill", "hearing", "federal_register", "state"]
+
+
+def _title(rng: random.Random, i: int) -> str:
+    return f"{rng.choice(_PHRASES).title()} update {i} and {rng.choice(_PHRASES)} review"
+
+
+def _insert_rows(con, rows: list[tuple[str, int, str, str]]) -> None:
+    """Insert (source_type, index, title, timestamp) rows into their tables."""
+    by_source: dict[str, list[dict]] = {st: [] for st in _SOURCES}
+    for source_type, i, title, ts in rows:
+        by_source[source_type].append(
+            {"id": f"{source_type}-{i}", "i": i, "title": title, "ts": ts}
+        )
+
+    db.executemany(
+        con,
+        """INSERT INTO om_events (
+            event_id, event_type, theme, primary_source_type, primary_url,
+            pub_timestamp, pub_precision, pub_source, title, summary,
+            fetched_at, created_at, updated_at
+        ) VALUES (
+            :id, 'report', 'oversight', 'gao', 'https://example.com/' || :id,
+            :ts, 'datetime', 'bench', :title, '', :ts, :ts, :ts
+        )""",
+        by_source["oversight"],
+    )
+    db.executemany(
+        con,
+        """INSERT INTO bills (
+            bill_id, congress, bill_type, bill_number, title, policy_area,
+            introduced_date, first_seen_at, updated_at
+        ) VALUES (:id, 119, 'hr', :i, :title, 'Armed Forces', :ts, :ts, :ts)""",
+        by_source["bill"],
+    )
+    db.executemany(
+        con,
+        """INSERT INTO hearings (
+            event_id, congress, chamber, committee_code, committee_name,
+            hearing_date, title, status, first_seen_at, updated_at
+        ) VALUES (:id, 119, 'House', 'HSVR', 'Veterans Affairs', :ts, :title,
+                  'scheduled', :ts, :ts)""",
+        by_source["hearing"],
+    )
+    db.executemany(
+        con,
+        """INSERT INTO fr_seen (
+            doc_id, published_date, first_seen_at, source_url, document_type, title
+        ) VALUES (:id, :ts, :ts, 'https://example.com/' || :id, 'Rule', :title)""",
+        by_source["federal_register"],
+    )
+    db.executemany(
+        con,
+        """INSERT INTO state_signals (
+            signal_id, state, source_id, title, content, url, pub_date, fetched_at
+        ) VALUES (
+            :id, :state, 'bench-src', :title, '', 'https://example.com/' || :id, :ts, :ts
+        )""",
+        [{**row, "state": _STATES[row["i"] % len(_STATES)]} for row in by_source["state"]],
+    )
+    con.commit()
+
+
+def _make_rows(rng: random.Random, start: int, n: int, max_age_hours: float):
+    now = datetime.now(UTC)
+    rows = []
+    for i in range(start, start + n):
+        ts = (now - timedelta(hours=rng.uniform(0, max_age_hours))).isoformat()
+        rows.append((_SOURCES[i % len(_SOURCES)], i, _title(rng, i), ts))
+    # Insert in time order, as ingest would
+    rows.sort(key=lambda r: r[3])
+    return rows
+
+
+def _fresh_db(path: Path, n_events: int, rng: random.Random) -> None:
+    db.close_pool()
+    if path.exists():
+        path.unlink()
+    db_core.DB_PATH = path
+    db.DB_PATH = path
+    db.init_db()
+    con = db.connect()
+    db.execute(
+        con,
+        """INSERT INTO state_sources (source_id, state, source_type, name, url, created_at)
+           VALUES ('bench-src', 'TX', 'news', 'Bench', 'https://example.com', '2024-01-01')""",
+    )
+    _insert_rows(con, _make_rows(rng, 0, n_events, 719))
+    con.close()
+
+
+def _timed(fn):
+    t0 = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - t0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark full vs incremental correlation")
+    parser.add_argument("--events", type=int, default=10000)
+    parser.add_argument("--new", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    with tempfile.TemporaryDirectory() as tmp:
+        _fresh_db(Path(tmp) / "bench_correlator.db", args.events, rng)
+
+        engine = CorrelationEngine()
+        cold_signals, cold_s = _timed(lambda: engine.evaluate_rules(incremental=True))
+
+        con = db.connect()
+        _insert_rows(con, _make_rows(rng, args.events, args.new, 1))
+        con.close()
+
+        full_signals, full_s = _timed(lambda: CorrelationEngine().evaluate_rules())
+        inc_signals, inc_s = _timed(lambda: engine.evaluate_rules(incremental=True))
+        db.close_pool()
+
+    print(f"window events:        {args.events + args.new}")
+    print(f"new events:           {args.new}")
+    print(f"incremental cold (s): {cold_s:.3f}  ({len(cold_signals)} signals, one-off)")
+    print(f"full (s):             {full_s:.3f}  ({len(full_signals)} signals)")
+    print(f"incremental (s):      {inc_s:.3f}  ({len(inc_signals)} signals)")
+    print(f"speedup:              {full_s / inc_s:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
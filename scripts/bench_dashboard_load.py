@@ -0,0 +1,195 @@
+"""
+Load test for the dashboard API: N concurrent clients polling the hot endpoints.
+
+Each client loops over the endpoints the dashboard refreshes, one request at
+a time, like a browser tab on auto-refresh. Latency is measured per request
+and reported as p50/p99 per endpoint and overall.
+
+By default the app runs in-process over ASGI against a temporary SQLite
+database seeded with synthetic runs and an analyst user, so the numbers
+reflect event-loop and DB-executor contention rather than network. Pass
+--url (and --session-cookie) to load a running server instead.
+
+Run with: python -m scripts.bench_dashboard_load [--clients 200] [--rounds 5]
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+# Add parent to path for imports
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import httpx
+
+DEFAULT_ENDPOINTS = [
+    "/api/runs",
+    "/api/runs/stats",
+    "/api/health",
+    "/api/errors",
+    "/api/documents/fr",
+    "/api/documents/ecfr",
+    "/api/state/stats",
+    "/api/oversight/stats",
+]
+
+BENCH_USER_ID = "bench-analyst"
+BENCH_EMAIL = "bench-analyst@example.com"
+
+
+def _seed_db(path: Path, runs: int) -> None:
+    import src.db as db
+    import src.db.core as db_core
+
+    db.close_pool()
+    db_core.DB_PATH = path
+    db.DB_PATH = path
+    db.init_db()
+
+    sources = ["federal_register", "ecfr", "congress_bills", "hearings", "oversight", "lda"]
+    statuses = ["SUCCESS", "SUCCESS", "NO_DATA", "ERROR"]
+    now = datetime.now(UTC)
+    for i in range(runs):
+        ended_at = (now - timedelta(hours=i)).isoformat()
+        db.insert_source_run(
+            {
+                "source_id": sources[i % len(sources)],
+                "started_at": ended_at,
+                "ended_at": ended_at,
+                "status": statuses[i % len(statuses)],
+                "records_fetched": i % 50,
+                "errors": ["bench error"] if i % 4 == 3 else [],
+            }
+        )
+
+    con = db.connect()
+    db.execute(
+        con,
+        "INSERT INTO users(user_id, email, display_name, role) "
+        "VALUES (:user_id, :email, 'Bench Analyst', 'analyst')",
+        {"user_id": BENCH_USER_ID, "email": BENCH_EMAIL},
+    )
+    con.commit()
+    con.close()
+
+
+def _percentile(sorted_values: list[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    idx = min(len(sorted_values) - 1, max(0, round(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[idx]
+
+
+async def _client_loop(
+    client: httpx.AsyncClient,
+    endpoints: list[str],
+    rounds: int,
+    latencies: dict[str, list[float]],
+    failures: dict[str, int],
+) -> None:
+    for _ in range(rounds):
+        for path in endpoints:
+            t0 = time.perf_counter()
+            try:
+                resp = await client.get(path)
+                ok = resp.status_code < 400
+            except httpx.HTTPError:
+                ok = False
+            latencies[path].append((time.perf_counter() - t0) * 1000)
+            if not ok:
+                failures[path] += 1
+
+
+async def _run(args, client: httpx.AsyncClient) -> None:
+    latencies: dict[str, list[float]] = defaultdict(list)
+    failures: dict[str, int] = defaultdict(int)
+
+    t0 = time.perf_counter()
+    await asyncio.gather(
+        *(
+            _client_loop(client, args.endpoints, args.rounds, latencies, failures)
+            for _ in range(args.clients)
+        )
+    )
+    elapsed = time.perf_counter() - t0
+
+    print(
+        f"{args.clients} clients x {args.rounds} rounds x {len(args.endpoints)} endpoints "
+        f"in {elapsed:.2f}s"
+    )
+    print(f"{'endpoint':<24} {'requests':>8} {'errors':>7} {'p50 (ms)':>9} {'p99 (ms)':>9}")
+    all_latencies: list[float] = []
+    for path in args.endpoints:
+        values = sorted(latencies[path])
+        all_latencies.extend(values)
+        print(
+            f"{path:<24} {len(values):>8} {failures[path]:>7} "
+            f"{_percentile(values, 50):>9.1f} {_percentile(values, 99):>9.1f}"
+        )
+    all_latencies.sort()
+    print(
+        f"{'overall':<24} {len(all_latencies):>8} {sum(failures.values()):>7} "
+        f"{_percentile(all_latencies, 50):>9.1f} {_percentile(all_latencies, 99):>9.1f}"
+    )
+    print(f"throughput: {len(all_latencies) / elapsed:.0f} req/s")
+
+
+async def _run_in_process(args) -> None:
+    from src.auth.firebase_config import create_session_token
+    from src.auth.middleware import SESSION_COOKIE_NAME
+    from src.dashboard_api import app
+    from src.db import close_async_db
+
+    # dashboard_api logs every request at INFO; keep the report readable
+    logging.getLogger().setLevel(logging.WARNING)
+
+    cookies = {SESSION_COOKIE_NAME: create_session_token(BENCH_USER_ID, BENCH_EMAIL)}
+    limits = httpx.Limits(max_connections=args.clients)
+    transport = httpx.ASGITransport(app=app)
+    try:
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://bench", cookies=cookies, limits=limits
+        ) as client:
+            await _run(args, client)
+    finally:
+        await close_async_db()
+
+
+async def _run_remote(args) -> None:
+    from src.auth.middleware import SESSION_COOKIE_NAME
+
+    cookies = {SESSION_COOKIE_NAME: args.session_cookie} if args.session_cookie else None
+    limits = httpx.Limits(max_connections=args.clients)
+    async with httpx.AsyncClient(
+        base_url=args.url, cookies=cookies, limits=limits, timeout=60.0
+    ) as client:
+        await _run(args, client)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the dashboard API")
+    parser.add_argument("--clients", type=int, default=200, help="Concurrent clients")
+    parser.add_argument("--rounds", type=int, default=5, help="Polling rounds per client")
+    parser.add_argument("--endpoints", nargs="+", default=DEFAULT_ENDPOINTS)
+    parser.add_argument("--runs", type=int, default=5000, help="Seeded source_runs (in-process)")
+    parser.add_argument("--url", help="Base URL of a running server (default: in-process)")
+    parser.add_argument("--session-cookie", help="Session cookie value for --url")
+    args = parser.parse_args()
+
+    if args.url:
+        asyncio.run(_run_remote(args))
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        _seed_db(Path(tmp) / "bench_dashboard.db", args.runs)
+        asyncio.run(_run_in_process(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Benchmark FR delta ingest: per-package upsert_fr_seen vs bulk insert_new_fr_seen.
+
+Each scenario seeds a fresh temporary SQLite database so that ~90% of the
+listed packages are already known (the steady-state cron case), then times
+both paths over the same package list.
+
+Run with: python -m scripts.bench_fr_ingest [--sizes 1000 10000] [--seen-ratio 0.9]
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+# Add parent to path for imports
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import src.db as db
+import src.db.core as db_core
+
+
+def _make_packages(n: int) -> list[dict]:
+    start = date(2024, 1, 1)
+    return [
+        {
+            "doc_id": f"FR-BENCH-{i:06d}",
+            "published_date": (start + timedelta(days=i % 90)).isoformat(),
+            "source_url": f"https://www.govinfo.gov/bench/{i}",
+        }
+        for i in range(n)
+    ]
+
+
+def _fresh_db(path: Path, packages: list[dict], seen_ratio: float) -> None:
+    db.close_pool()
+    if path.exists():
+        path.unlink()
+    db_core.DB_PATH = path
+    db.DB_PATH = path
+    db.init_db()
+    seeded = packages[: int(len(packages) * seen_ratio)]
+    db.bulk_insert_fr_seen([{**pkg, "first_seen_at": "2024-01-01T00:00:00Z"} for pkg in seeded])
+
+
+def _per_row(packages: list[dict]) -> int:
+    new = 0
+    for pkg in packages:
+        if db.upsert_fr_seen(
+            pkg["doc_id"], pkg["published_date"], "2024-04-01T00:00:00Z", pkg["source_url"]
+        ):
+            new += 1
+    return new
+
+
+def _bulk(packages: list[dict]) -> int:
+    return len(db.insert_new_fr_seen(packages, "2024-04-01T00:00:00Z"))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark FR delta ingest paths")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--seen-ratio", type=float, default=0.9)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "bench_fr.db"
+        print(f"{'packages':>10} {'per-row (s)':>12} {'bulk (s)':>10} {'speedup':>8} {'new':>6}")
+        for size in args.sizes:
+            packages = _make_packages(size)
+
+            _fresh_db(path, packages, args.seen_ratio)
+            t0 = time.perf_counter()
+            per_row_new = _per_row(packages)
+            per_row_s = time.perf_counter() - t0
+
+            _fresh_db(path, packages, args.seen_ratio)
+            t0 = time.perf_counter()
+            bulk_new = _bulk(packages)
+            bulk_s = time.perf_counter() - t0
+
+            assert per_row_new == bulk_new, (per_row_new, bulk_new)
+            print(
+                f"{size:>10} {per_row_s:>12.3f} {bulk_s:>10.3f} "
+                f"{per_row_s / bulk_s:>7.1f}x {bulk_new:>6}"
+            )
+        db.close_pool()
+
+
+if __name__ == "__main__":
+    main()
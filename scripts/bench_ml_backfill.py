@@ -0,0 +1,164 @@
+"""
+Benchmark the om_events ML score backfill: per-event vs batch scoring.
+
+Seeds a temporary SQLite database with synthetic om_events rows (100k by
+default), then times:
+
+- per-event scoring: SignalScorer.score() for each row, as the backfill did
+- batch scoring: SignalScorer.score_batch() over the same rows
+- the full backfill (scripts.backfill_om_ml_scores) including DB writes
+
+Per-event and batch results are compared and must be identical.
+
+Run with: python -m scripts.bench_ml_backfill [--rows 100000] [--batch-size 1000]
+"""
+
+import argparse
+import logging
+import random
+import sys
+import tempfile
+import time
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+# Add parent to path for imports
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+VOCABULARY = (
+    "the va veterans affairs inspector general audit report found that department "
+    "did not ensure disability claims compensation benefit appeals were processed "
+    "within required timeframes committee hearing senate house oversight review "
+    "of medical centers staffing wait times community care contracts and the "
+    "effective date of the final rule deadline mandatory implementation"
+).split()
+
+CITATIONS = ["38 CFR 3.310", "38 U.S.C. 5110", "Public Law 117-168", "P.L. 118-5"]
+
+
+def _synthetic_text(rng: random.Random, min_words: int, max_words: int) -> str:
+    words = rng.choices(VOCABULARY, k=rng.randint(min_words, max_words))
+    sentences = [" ".join(words[i : i + 18]) for i in range(0, len(words), 18)]
+    # About a third of the texts cite a statute or regulation
+    if rng.random() < 0.3:
+        sentences.append(f"see {rng.choice(CITATIONS)}")
+    return ". ".join(s.capitalize() for s in sentences) + "."
+
+
+def _seed_db(path: Path, rows: int, seed: int) -> None:
+    import src.db as db
+    import src.db.core as db_core
+
+    db.close_pool()
+    db_core.DB_PATH = path
+    db.DB_PATH = path
+    db.init_db()
+
+    rng = random.Random(seed)
+    now = datetime.now(UTC)
+    con = db.connect()
+    for start in range(0, rows, 5000):
+        batch = []
+        for i in range(start, min(rows, start + 5000)):
+            fetched_at = (now - timedelta(minutes=i)).isoformat()
+            batch.append(
+                {
+                    "event_id": f"om-bench-{i:07d}",
+                    "event_type": "report",
+                    "primary_source_type": "oig",
+                    "primary_url": f"https://example.com/report/{i}",
+                    "pub_precision": "day",
+                    "pub_source": "extracted",
+                    "title": _synthetic_text(rng, 6, 16),
+                    "raw_content": _synthetic_text(rng, 40, 600),
+                    "fetched_at": fetched_at,
+                }
+            )
+        db.executemany(
+            con,
+            """
+            INSERT INTO om_events(event_id, event_type, primary_source_type, primary_url,
+                                  pub_precision, pub_source, title, raw_content, fetched_at)
+            VALUES (:event_id, :event_type, :primary_source_type, :primary_url,
+                    :pub_precision, :pub_source, :title, :raw_content, :fetched_at)
+            """,
+            batch,
+        )
+    con.commit()
+    con.close()
+
+
+def _comparable(result) -> tuple:
+    return (
+        result.signal_id,
+        result.importance_score,
+        result.impact_score,
+        result.urgency_score,
+        result.overall_risk,
+        result.overall_score,
+        result.confidence,
+        tuple(result.recommendations),
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark om_events ML score backfill")
+    parser.add_argument("--rows", type=int, default=100_000, help="Seeded om_events rows")
+    parser.add_argument("--batch-size", type=int, default=1000, help="Backfill batch size")
+    parser.add_argument("--seed", type=int, default=13, help="Random seed for synthetic text")
+    args = parser.parse_args()
+
+    # The backfill logs every batch at INFO; keep the report readable
+    logging.basicConfig(level=logging.WARNING)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        t0 = time.perf_counter()
+        _seed_db(Path(tmp) / "bench_ml.db", args.rows, args.seed)
+        print(f"seeded {args.rows} om_events in {time.perf_counter() - t0:.1f}s")
+
+        from scripts.backfill_om_ml_scores import backfill_ml_scores, get_events_missing_ml_score
+        from src.ml import SignalScorer
+
+        events = get_events_missing_ml_score(args.rows)
+        signals = [
+            {
+                "signal_id": event["event_id"],
+                "title": event["title"] or "",
+                "content": event["raw_content"] or "",
+                "source_type": "oversight",
+            }
+            for event in events
+        ]
+        scorer = SignalScorer()
+
+        t0 = time.perf_counter()
+        per_event = [scorer.score(signal) for signal in signals]
+        per_event_s = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        batched = []
+        for start in range(0, len(signals), args.batch_size):
+            batched.extend(scorer.score_batch(signals[start : start + args.batch_size]))
+        batch_s = time.perf_counter() - t0
+
+        mismatches = sum(
+            _comparable(a) != _comparable(b) for a, b in zip(per_event, batched, strict=True)
+        )
+
+        t0 = time.perf_counter()
+        stats = backfill_ml_scores(limit=args.rows, batch_size=args.batch_size)
+        backfill_s = time.perf_counter() - t0
+
+    n = len(signals)
+    print(f"{'path':<24} {'seconds':>9} {'rows/s':>10}")
+    print(f"{'per-event score()':<24} {per_event_s:>9.2f} {n / per_event_s:>10.0f}")
+    print(f"{'score_batch()':<24} {batch_s:>9.2f} {n / batch_s:>10.0f}")
+    print(f"{'backfill (with writes)':<24} {backfill_s:>9.2f} {n / backfill_s:>10.0f}")
+    print(f"speedup (scoring): {per_event_s / batch_s:.1f}x")
+    print(f"backfill stats: {stats}")
+    print(f"mismatched results: {mismatches}")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
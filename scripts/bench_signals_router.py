@@ -0,0 +1,140 @@
+"""
+Micro-benchmark for signal condition evaluation: interpreted vs compiled plans.
+
+"before" replays the old SignalsRouter loop (evaluate_expression on the raw
+condition dicts, re-parsing every expression per envelope); "after" walks the
+compiled CategoryPlans built at schema load. Suppression checks and DB writes
+are excluded so only condition evaluation is measured.
+
+Run with: python -m scripts.bench_signals_router [--envelopes 2000]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add parent to path for imports
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.signals.engine.evaluator import evaluate_compiled, evaluate_expression
+from src.signals.envelope import Envelope
+from src.signals.schema.loader import load_category_schema
+
+CATEGORIES = [
+    "oversight_accountability",
+    "legislative_action",
+    "regulatory_change",
+    "claims_operations",
+]
+
+_SAMPLES = [
+    (
+        "congress_gov",
+        "hearing_notice",
+        "Hearing on GAO Report",
+        "The GAO found issues with VA disability claims. This is an investigation.",
+    ),
+    (
+        "govinfo",
+        "rule",
+        "Final Rule: Schedule for Rating Disabilities",
+        "VA amends 38 CFR part 4. Interim final rule; comments due.",
+    ),
+    (
+        "congress_gov",
+        "bill_text",
+        "Veterans Benefits Act",
+        "Bill passed the House and was referred to committee for markup.",
+    ),
+    (
+        "house_veterans",
+        "press_release",
+        "Chairman statement",
+        "Statement on the backlog of pending claims and OIG findings.",
+    ),
+]
+
+
+def _make_envelopes(n: int) -> list[Envelope]:
+    envelopes = []
+    for i in range(n):
+        source, auth_type, title, body = _SAMPLES[i % len(_SAMPLES)]
+        envelopes.append(
+            Envelope(
+                event_id=f"bench-{i}",
+                authority_id=f"AUTH-{i}",
+                authority_source=source,
+                authority_type=auth_type,
+                title=title,
+                body_text=body * 5,
+                committee="HVAC" if i % 2 else "SVAC",
+            )
+        )
+    return envelopes
+
+
+def _interpreted(schemas, envelopes) -> int:
+    passed = 0
+    for envelope in envelopes:
+        for category_id, schema in schemas.items():
+            for indicator in schema.indicators:
+                if "indicator_condition" in indicator:
+                    ind = evaluate_expression(
+                        indicator["indicator_condition"],
+                        envelope,
+                        f"{category_id}:indicator_condition",
+                    )
+                    if not ind.passed:
+                        continue
+                for trigger in indicator.get("triggers", []):
+                    condition = trigger.get("condition")
+                    if (
+                        condition
+                        and evaluate_expression(condition, envelope, trigger["trigger_id"]).passed
+                    ):
+                        passed += 1
+    return passed
+
+
+def _compiled(plans, envelopes) -> int:
+    passed = 0
+    for envelope in envelopes:
+        for plan in plans:
+            for indicator in plan.indicators:
+                if indicator.condition is not None:
+                    if not evaluate_compiled(indicator.condition, envelope).passed:
+                        continue
+                for trigger in indicator.triggers:
+                    if evaluate_compiled(trigger.condition, envelope).passed:
+                        passed += 1
+    return passed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark signal condition evaluation")
+    parser.add_argument("--envelopes", type=int, default=2000)
+    args = parser.parse_args()
+
+    schemas = {cat: load_category_schema(cat) for cat in CATEGORIES}
+    plans = [schema.plan for schema in schemas.values()]
+    envelopes = _make_envelopes(args.envelopes)
+
+    t0 = time.perf_counter()
+    before_hits = _interpreted(schemas, envelopes)
+    before_s = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    after_hits = _compiled(plans, envelopes)
+    after_s = time.perf_counter() - t0
+
+    assert before_hits == after_hits, (before_hits, after_hits)
+    print(f"envelopes:        {len(envelopes)}")
+    print(f"trigger hits:     {after_hits}")
+    print(f"before (env/sec): {len(envelopes) / before_s:,.0f}")
+    print(f"after  (env/sec): {len(envelopes) / after_s:,.0f}")
+    print(f"speedup:          {before_s / after_s:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+Benchmark topic/theme/severity tagging: per-keyword loops vs compiled taxonomies.
+
+Generates --titles synthetic titles from the taxonomies' own vocabulary and
+times, for each taxonomy, the loop the call site used before against the
+shared KeywordTaxonomy / RegexTaxonomy it uses now:
+- correlator topics:   ``kw in text`` per keyword      -> KeywordTaxonomy
+- oversight themes:    ``kw in text`` per keyword      -> KeywordTaxonomy
+- state severity:      one ``\\bkw\\b`` regex per keyword -> KeywordTaxonomy(whole_words)
+- ceo_brief issues:    ``re.search`` per pattern        -> RegexTaxonomy
+
+Every title's result is asserted equal between the two implementations.
+
+Run with: python -m scripts.bench_topic_extraction [--titles 100000]
+"""
+
+import argparse
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+# Add parent to path for imports
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.ceo_brief.aggregator import _ISSUE_TAXONOMY, ISSUE_PATTERNS
+from src.oversight.runner import _THEME_KEYWORDS, _THEME_TAXONOMY
+from src.signals.correlator import TOPIC_KEYWORDS, TOPIC_TAXONOMY
+from src.state.classify import (
+    _SEVERITY_TAXONOMY,
+    HIGH_SEVERITY_KEYWORDS,
+    MEDIUM_SEVERITY_KEYWORDS,
+)
+
+_FILLER = [
+    "VA", "update", "review", "report", "veterans", "regional", "office",
+    "announces", "new", "2025", "the", "of", "and", "for", "in", "on",
+]  # fmt: skip
+
+
+def _titles(n: int, seed: int) -> list[str]:
+    vocabulary = [kw for kws in TOPIC_KEYWORDS.values() for kw in kws]
+    vocabulary += [kw for kws in _THEME_KEYWORDS.values() for kw in kws]
+    vocabulary += HIGH_SEVERITY_KEYWORDS + MEDIUM_SEVERITY_KEYWORDS
+    rng = random.Random(seed)
+    titles = []
+    for _ in range(n):
+        words = [rng.choice(_FILLER) for _ in range(rng.randint(6, 14))]
+        for _ in range(rng.randint(0, 2)):
+            words.insert(rng.randrange(len(words) + 1), rng.choice(vocabulary))
+        titles.append(" ".join(words))
+    return titles
+
+
+def _old_substring_tag(taxonomy):
+    def tag(text):
+        lower = text.lower()
+        return [label for label, kws in taxonomy.items() if any(kw in lower for kw in kws)]
+
+    return tag
+
+
+_OLD_SEVERITY = {
+    label: [(kw, re.compile(r"\b" + re.escape(kw) + r"\b", re.IGNORECASE)) for kw in kws]
+    for label, kws in (("high", HIGH_SEVERITY_KEYWORDS), ("medium", MEDIUM_SEVERITY_KEYWORDS))
+}
+
+
+def _old_severity(text):
+    result = {}
+    for label, patterns in _OLD_SEVERITY.items():
+        hits = [kw for kw, pattern in patterns if pattern.search(text)]
+        if hits:
+            result[label] = hits
+    return result
+
+
+def _old_issue_counts(text):
+    text = text.lower()
+    scores = {}
+    for area, patterns in ISSUE_PATTERNS.items():
+        score = sum(1 for p in patterns if re.search(p, text, re.IGNORECASE))
+        if score:
+            scores[area] = score
+    return scores
+
+
+def _timed(fn, titles):
+    t0 = time.perf_counter()
+    results = [fn(t) for t in titles]
+    return results, time.perf_counter() - t0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark compiled keyword taxonomies")
+    parser.add_argument("--titles", type=int, default=100000)
+    parser.add_argument("--seed", type=int, default=11)
+    args = parser.parse_args()
+
+    titles = _titles(args.titles, args.seed)
+    cases = [
+        ("correlator topics", _old_substring_tag(TOPIC_KEYWORDS), TOPIC_TAXONOMY.tag),
+        ("oversight themes", _old_substring_tag(_THEME_KEYWORDS), _THEME_TAXONOMY.tag),
+        ("state severity", _old_severity, _SEVERITY_TAXONOMY.matches),
+        ("ceo_brief issues", _old_issue_counts, lambda t: _ISSUE_TAXONOMY.counts(t.lower())),
+    ]
+
+    print(f"titles: {len(titles)}")
+    for name, before, after in cases:
+        old_results, old_s = _timed(before, titles)
+        new_results, new_s = _timed(after, titles)
+        assert old_results == new_results, f"{name}: results differ"
+        print(f"{name:<18} before {old_s:7.3f}s  after {new_s:7.3f}s  speedup {old_s / new_s:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
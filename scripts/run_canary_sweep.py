@@ -0,0 +1,53 @@
+"""
+Run every registered pipeline canary against whole tables.
+
+Post-run canaries only check the rows each run wrote. This sweep runs the
+same checks in full-scan mode, for a nightly job. It reports each check's
+result and timing and exits 1 if any critical check fails.
+
+Run with: python -m scripts.run_canary_sweep [--source SOURCE_ID ...]
+"""
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+
+# Add parent to path for imports
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.resilience.canary import CANARY_REGISTRY, run_canaries
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s %(levelname)s %(message)s",
+)
+logger = logging.getLogger(__name__)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run all canaries in full-scan mode")
+    parser.add_argument(
+        "--source",
+        action="append",
+        choices=sorted(CANARY_REGISTRY),
+        help="Only sweep this source (repeatable; default: all)",
+    )
+    args = parser.parse_args()
+
+    critical = 0
+    for source_id in args.source or CANARY_REGISTRY:
+        for result in run_canaries(source_id, full_scan=True):
+            line = f"{source_id} {result.check} [{result.duration_ms:.1f} ms]: {result.message}"
+            if result.passed:
+                logger.info(line)
+            else:
+                logger.warning(f"{line} ({result.severity})")
+                critical += result.severity == "critical"
+
+    logger.info(f"Canary sweep complete: {critical} critical failures")
+    return 1 if critical else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -9,12 +9,13 @@ import logging
 import math
 from datetime import UTC, datetime
 
+import numpy as np
 import requests
 
+from .agenda_drift_index import typical_utterances
 from .db import (
     get_ad_embeddings_for_member,
     get_ad_recent_deviations_for_hearing,
-    get_ad_typical_utterances,
     get_ad_utterance_by_id,
     get_latest_ad_baseline,
     insert_ad_baseline,
@@ -74,6 +75,59 @@ def _std_dev(values: list[float], mean: float) -> float:
     return math.sqrt(variance)
 
 
+# -----------------------------------------------------------------------------
+# Vectorized (NumPy) engine
+#
+# Embeddings are held as one float32 matrix per member; reductions accumulate in
+# float64 so results match the pure-Python helpers above to ~1e-7.
+# -----------------------------------------------------------------------------
+
+
+def to_matrix(vectors) -> np.ndarray:
+    """Stack embedding vectors into a C-contiguous (n, dim) float32 matrix."""
+    matrix = np.asarray(vectors, dtype=np.float32)
+    if matrix.ndim == 1:
+        matrix = matrix.reshape(1, -1)
+    return np.ascontiguousarray(matrix)
+
+
+def centroid_vector(matrix: np.ndarray) -> np.ndarray:
+    """Element-wise mean of the rows of ``matrix`` (float64)."""
+    if matrix.shape[0] == 0:
+        raise ValueError("Cannot compute mean of empty vector list")
+    return matrix.mean(axis=0, dtype=np.float64)
+
+
+def cosine_distances(matrix: np.ndarray, vec) -> np.ndarray:
+    """Cosine distance from every row of ``matrix`` to ``vec`` in one pass.
+
+    Rows (or ``vec``) with near-zero norm get distance 1.0, as in cosine_distance().
+    """
+    vec = np.asarray(vec, dtype=np.float64)
+    if matrix.shape[1] != vec.shape[0]:
+        raise ValueError(f"Vector dimension mismatch: {matrix.shape[1]} vs {vec.shape[0]}")
+
+    dots = matrix @ vec
+    row_norms = np.linalg.norm(matrix.astype(np.float64, copy=False), axis=1)
+    vec_norm = float(np.linalg.norm(vec))
+
+    distances = np.ones(matrix.shape[0], dtype=np.float64)
+    if vec_norm < 1e-9:
+        return distances
+    valid = row_norms >= 1e-9
+    distances[valid] = 1.0 - dots[valid] / (row_norms[valid] * vec_norm)
+    return distances
+
+
+def compute_baseline_stats(matrix: np.ndarray) -> tuple[np.ndarray, float, float]:
+    """Centroid plus mean/sample-std of row distances to it, in matrix operations."""
+    centroid = centroid_vector(matrix)
+    distances = cosine_distances(matrix, centroid)
+    mu = float(distances.mean())
+    sigma = float(distances.std(ddof=1)) if distances.shape[0] >= 2 else 0.0
+    return centroid, mu, sigma
+
+
 def build_baseline(member_id: str) -> dict | None:
     """
     Build baseline from member's historical embeddings.
@@ -90,23 +144,19 @@ def build_baseline(member_id: str) -> dict | None:
     if len(embeddings) < 5:
         return None  # Need minimum data for meaningful baseline
 
-    vectors = [e[1] for e in embeddings]
-    centroid = _mean_vector(vectors)
-
-    # Compute distances from each embedding to centroid
-    distances = [cosine_distance(v, centroid) for v in vectors]
-    mu = sum(distances) / len(distances)
-    sigma = _std_dev(distances, mu)
+    matrix = to_matrix([e[1] for e in embeddings])
+    centroid, mu, sigma = compute_baseline_stats(matrix)
+    centroid_list = centroid.tolist()
 
     # Persist baseline
-    baseline_id = insert_ad_baseline(member_id, centroid, mu, sigma, len(vectors))
+    baseline_id = insert_ad_baseline(member_id, centroid_list, mu, sigma, matrix.shape[0])
 
     return {
         "member_id": member_id,
-        "vec_mean": centroid,
+        "vec_mean": centroid_list,
         "mu": mu,
         "sigma": sigma,
-        "n": len(vectors),
+        "n": matrix.shape[0],
         "baseline_id": baseline_id,
     }
 
@@ -117,14 +167,20 @@ def detect_deviation(
     vec: list[float],
     hearing_id: str,
     note: str = None,
+    baseline: dict | None = None,
+    dist: float | None = None,
 ) -> dict | None:
     """
     Compare utterance embedding to member's baseline.
 
+    Batch callers may pass the already-loaded ``baseline`` and a precomputed
+    ``dist`` (see cosine_distances) to skip the per-utterance lookup and math.
+
     Returns deviation_event dict if flagged (dist >= threshold AND z >= threshold),
     else None.
     """
-    baseline = get_latest_ad_baseline(member_id)
+    if baseline is None:
+        baseline = get_latest_ad_baseline(member_id)
     if not baseline:
         return None  # No baseline yet
 
@@ -132,7 +188,8 @@ def detect_deviation(
     mu = baseline["mu"]
     sigma = baseline["sigma"]
 
-    dist = cosine_distance(vec, centroid)
+    if dist is None:
+        dist = cosine_distance(vec, centroid)
 
     # Compute z-score (handle zero sigma)
     if sigma < 1e-9:
@@ -314,8 +371,8 @@ def explain_deviation(member_id: str, flagged_utterance_id: str) -> str | None:
     if not flagged:
         return None
 
-    # Fetch 3-5 typical utterances for comparison
-    typical = get_ad_typical_utterances(
+    # Fetch 3-5 typical utterances (nearest the baseline centroid) for comparison
+    typical = typical_utterances(
         member_id,
         exclude_utterance_id=flagged_utterance_id,
         limit=5,
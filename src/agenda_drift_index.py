@@ -0,0 +1,415 @@
+"""
+Nearest-neighbour index over agenda drift utterance embeddings.
+
+Each member gets one index holding their embeddings as an L2-normalized
+float32 matrix, so a top-k cosine similarity query is one matrix-vector
+product plus an argpartition. Indexes are persisted as .npz files under
+AD_INDEX_DIR and refreshed incrementally from ad_embeddings using an
+embedded_at watermark (embed_utterances refreshes them after each run).
+
+Search modes:
+- flat (default): exact scan of every row. Members have at most a few
+  thousand utterances, which scans in well under a millisecond.
+- ivf: rows are bucketed around k-means centroids and a query only scans the
+  ``nprobe`` nearest buckets. Approximate; for very large indexes. Enable
+  with AD_INDEX_MODE=ivf.
+"""
+
+import logging
+import os
+import re
+import threading
+import time
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+from . import db
+
+logger = logging.getLogger(__name__)
+
+ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_INDEX_DIR = ROOT / "data" / "ad_index"
+
+MODE_FLAT = "flat"
+MODE_IVF = "ivf"
+
+IVF_MIN_ROWS = 4096  # Below this an ivf index still scans flat
+IVF_DEFAULT_NPROBE = 8
+IVF_TRAIN_ITERATIONS = 10
+IVF_TRAIN_SAMPLES_PER_LIST = 64
+
+# How long a loaded index is trusted before checking ad_embeddings for new rows
+REFRESH_INTERVAL_SECONDS = 300
+
+
+def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    """L2-normalize rows; near-zero rows stay zero (similarity 0 to everything)."""
+    matrix = np.asarray(matrix, dtype=np.float32)
+    if matrix.ndim == 1:
+        matrix = matrix.reshape(1, -1)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms < 1e-9] = 1.0
+    return np.ascontiguousarray(matrix / norms, dtype=np.float32)
+
+
+def _top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """Positions of the k highest scores, best first (ties keep row order)."""
+    if k >= scores.shape[0]:
+        return np.argsort(-scores, kind="stable")
+    part = np.argpartition(-scores, k - 1)[:k]
+    return part[np.argsort(-scores[part], kind="stable")]
+
+
+def _train_ivf(matrix: np.ndarray, nlist: int, seed: int = 0) -> np.ndarray:
+    """Spherical k-means centroids over a sample of ``matrix`` rows."""
+    rng = np.random.default_rng(seed)
+    n = matrix.shape[0]
+    sample_size = min(n, nlist * IVF_TRAIN_SAMPLES_PER_LIST)
+    sample = matrix[rng.choice(n, sample_size, replace=False)]
+    centroids = sample[rng.choice(sample_size, nlist, replace=False)].copy()
+    for _ in range(IVF_TRAIN_ITERATIONS):
+        assign = np.argmax(sample @ centroids.T, axis=1)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, assign, sample)
+        counts = np.bincount(assign, minlength=nlist)
+        # Empty lists keep their previous centroid
+        filled = counts > 0
+        centroids[filled] = sums[filled]
+        centroids = _normalize_rows(centroids)
+    return centroids
+
+
+@dataclass
+class SimilarUtterance:
+    utterance_id: str
+    similarity: float
+
+
+class MemberIndex:
+    """Top-k cosine similarity index over one member's utterance embeddings."""
+
+    def __init__(self, member_id: str, mode: str = MODE_FLAT, nprobe: int = IVF_DEFAULT_NPROBE):
+        if mode not in (MODE_FLAT, MODE_IVF):
+            raise ValueError(f"Unknown index mode: {mode}")
+        self.member_id = member_id
+        self.mode = mode
+        self.nprobe = nprobe
+        self.ids: list[str] = []
+        self.matrix = np.zeros((0, 0), dtype=np.float32)
+        self.watermark: str | None = None
+        self._pos: dict[str, int] = {}
+        # ivf state: centroids, bucket per row, rows per bucket (built lazily)
+        self._centroids: np.ndarray | None = None
+        self._assign: np.ndarray | None = None
+        self._lists: list[np.ndarray] | None = None
+        self._trained_rows = 0
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __contains__(self, utterance_id: str) -> bool:
+        return utterance_id in self._pos
+
+    @property
+    def dim(self) -> int:
+        return self.matrix.shape[1]
+
+    def vector(self, utterance_id: str) -> np.ndarray | None:
+        """Normalized stored vector for ``utterance_id``, or None."""
+        pos = self._pos.get(utterance_id)
+        return None if pos is None else self.matrix[pos]
+
+    def upsert(self, ids: Sequence[str], vectors) -> None:
+        """Add new rows and overwrite rows whose utterance_id is already indexed."""
+        if not len(ids):
+            return
+        rows = _normalize_rows(vectors)
+        if self.ids and rows.shape[1] != self.dim:
+            raise ValueError(f"Vector dimension mismatch: {rows.shape[1]} vs {self.dim}")
+
+        latest = {uid: i for i, uid in enumerate(ids)}  # Last write wins within a batch
+        updated = [(self._pos[uid], i) for uid, i in latest.items() if uid in self._pos]
+        added = [(uid, i) for uid, i in latest.items() if uid not in self._pos]
+
+        matrix = self.matrix if self.ids else np.zeros((0, rows.shape[1]), dtype=np.float32)
+        if updated:
+            matrix = matrix.copy()  # Concurrent searches keep reading the old matrix
+            positions, src = zip(*updated)
+            matrix[list(positions)] = rows[list(src)]
+        if added:
+            start = len(self.ids)
+            matrix = np.vstack([matrix, rows[[i for _, i in added]]])
+            for offset, (uid, _) in enumerate(added):
+                self._pos[uid] = start + offset
+            self.ids.extend(uid for uid, _ in added)
+        self.matrix = matrix
+
+        if self._centroids is not None:
+            if len(self.ids) >= 2 * self._trained_rows:
+                self._reset_ivf()
+            else:
+                changed = [p for p, _ in updated]
+                changed.extend(range(len(self.ids) - len(added), len(self.ids)))
+                assign = np.resize(self._assign, len(self.ids))
+                assign[changed] = np.argmax(self.matrix[changed] @ self._centroids.T, axis=1)
+                self._assign = assign
+                self._lists = None
+
+    def _reset_ivf(self) -> None:
+        self._centroids = None
+        self._assign = None
+        self._lists = None
+        self._trained_rows = 0
+
+    def _ensure_ivf(self) -> bool:
+        """Train/bucket the ivf structure if this index should use it."""
+        if self.mode != MODE_IVF or len(self.ids) < IVF_MIN_ROWS:
+            return False
+        if self._centroids is None:
+            nlist = max(1, int(np.sqrt(len(self.ids))))
+            self._centroids = _train_ivf(self.matrix, nlist)
+            self._assign = np.argmax(self.matrix @ self._centroids.T, axis=1)
+            self._trained_rows = len(self.ids)
+            self._lists = None
+        if self._lists is None:
+            order = np.argsort(self._assign, kind="stable")
+            counts = np.bincount(self._assign, minlength=self._centroids.shape[0])
+            self._lists = np.split(order, np.cumsum(counts)[:-1])
+        return True
+
+    def search(
+        self, query, k: int = 10, exclude: Iterable[str] = (), nprobe: int | None = None
+    ) -> list[SimilarUtterance]:
+        """Return up to ``k`` indexed utterances most similar to ``query``."""
+        if not self.ids or k <= 0:
+            return []
+        q = np.asarray(query, dtype=np.float32).reshape(-1)
+        if q.shape[0] != self.dim:
+            raise ValueError(f"Vector dimension mismatch: {q.shape[0]} vs {self.dim}")
+        norm = float(np.linalg.norm(q))
+        if norm < 1e-9:
+            return []
+        q = q / norm
+
+        matrix = self.matrix
+        if self._ensure_ivf():
+            probe = _top_k(self._centroids @ q, nprobe or self.nprobe)
+            candidates = np.concatenate([self._lists[c] for c in probe])
+            scores = matrix[candidates] @ q
+        else:
+            candidates = None
+            scores = matrix @ q
+
+        excluded = [self._pos[uid] for uid in exclude if uid in self._pos]
+        if excluded:
+            if candidates is None:
+                scores[excluded] = -np.inf
+            else:
+                scores[np.isin(candidates, excluded)] = -np.inf
+
+        hits = []
+        for pos in _top_k(scores, k):
+            if scores[pos] == -np.inf:
+                break
+            row = pos if candidates is None else candidates[pos]
+            hits.append(SimilarUtterance(self.ids[row], float(scores[pos])))
+        return hits
+
+    def save(self, path: Path) -> None:
+        """Atomically write the index to ``path`` (.npz)."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.name + ".tmp")
+        with open(tmp, "wb") as f:
+            np.savez(
+                f,
+                member_id=np.array(self.member_id),
+                mode=np.array(self.mode),
+                watermark=np.array(self.watermark or ""),
+                ids=np.array(self.ids, dtype=str),
+                matrix=self.matrix,
+            )
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: Path, nprobe: int = IVF_DEFAULT_NPROBE) -> "MemberIndex":
+        with np.load(path, allow_pickle=False) as data:
+            index = cls(str(data["member_id"]), mode=str(data["mode"]), nprobe=nprobe)
+            index.watermark = str(data["watermark"]) or None
+            index.ids = data["ids"].tolist()
+            index.matrix = np.ascontiguousarray(data["matrix"], dtype=np.float32)
+        index._pos = {uid: i for i, uid in enumerate(index.ids)}
+        return index
+
+
+# -----------------------------------------------------------------------------
+# Persisted per-member indexes
+# -----------------------------------------------------------------------------
+
+
+@dataclass
+class _CacheEntry:
+    index: MemberIndex
+    mtime: float | None
+    checked_at: float
+
+
+_cache: dict[str, _CacheEntry] = {}
+_lock = threading.Lock()
+
+
+def index_dir() -> Path:
+    return Path(os.environ.get("AD_INDEX_DIR", DEFAULT_INDEX_DIR))
+
+
+def default_mode() -> str:
+    return os.environ.get("AD_INDEX_MODE", MODE_FLAT)
+
+
+def _index_path(member_id: str) -> Path:
+    return index_dir() / f"{re.sub(r'[^A-Za-z0-9_.-]', '_', member_id)}.npz"
+
+
+def _mtime(path: Path) -> float | None:
+    try:
+        return path.stat().st_mtime
+    except FileNotFoundError:
+        return None
+
+
+def _apply_new_embeddings(index: MemberIndex) -> int:
+    """Pull rows embedded since the index watermark. Returns rows applied."""
+    rows = db.get_ad_embeddings_since(index.watermark, member_id=index.member_id)
+    # The watermark query is inclusive; skip rows the index already holds
+    fresh = [r for r in rows if r[3] != index.watermark or r[1] not in index]
+    if fresh:
+        index.upsert([r[1] for r in fresh], [r[2] for r in fresh])
+        index.watermark = fresh[-1][3]
+    return len(fresh)
+
+
+def _save(index: MemberIndex, path: Path) -> float | None:
+    try:
+        index.save(path)
+    except OSError as e:
+        logger.warning("Could not persist agenda drift index for %s: %s", index.member_id, e)
+        return None
+    return _mtime(path)
+
+
+def get_member_index(member_id: str, refresh: bool = False) -> MemberIndex:
+    """Return the member's index, loading or building it on first use.
+
+    The cached copy is reloaded when its file changes and checked against
+    ad_embeddings at most every REFRESH_INTERVAL_SECONDS (or when ``refresh``).
+    """
+    path = _index_path(member_id)
+    mtime = _mtime(path)
+    now = time.monotonic()
+
+    with _lock:
+        entry = _cache.get(member_id)
+        if entry is not None and entry.mtime != mtime:
+            entry = None
+        if entry is not None and not refresh and now - entry.checked_at < REFRESH_INTERVAL_SECONDS:
+            return entry.index
+
+        if entry is not None:
+            index = entry.index
+        elif mtime is not None:
+            index = MemberIndex.load(path)
+        else:
+            index = MemberIndex(member_id, mode=default_mode())
+
+        if _apply_new_embeddings(index) or mtime is None:
+            mtime = _save(index, path)
+        _cache[member_id] = _CacheEntry(index=index, mtime=mtime, checked_at=now)
+        return index
+
+
+def refresh_member_indexes(member_ids: Iterable[str]) -> dict[str, int]:
+    """Apply newly written embeddings to each member's index and persist it.
+
+    Returns {member_id: index size}.
+    """
+    return {member_id: len(get_member_index(member_id, refresh=True)) for member_id in member_ids}
+
+
+def clear_cache() -> None:
+    """Drop all in-memory indexes (files on disk are kept)."""
+    with _lock:
+        _cache.clear()
+
+
+# -----------------------------------------------------------------------------
+# Queries
+# -----------------------------------------------------------------------------
+
+
+def typical_utterances(
+    member_id: str, exclude_utterance_id: str = None, limit: int = 5
+) -> list[dict]:
+    """Utterances closest to the member's baseline centroid, with similarity.
+
+    Utterances with deviation events are skipped so results reflect the
+    member's normal framing. Falls back to db.get_ad_typical_utterances
+    (most recent unflagged) when there is no baseline or index yet.
+    """
+    baseline = db.get_latest_ad_baseline(member_id)
+    index = get_member_index(member_id) if baseline else None
+    if not index:
+        return db.get_ad_typical_utterances(member_id, exclude_utterance_id, limit)
+
+    exclude = db.get_ad_flagged_utterance_ids(member_id)
+    if exclude_utterance_id:
+        exclude.add(exclude_utterance_id)
+    hits = index.search(baseline["vec_mean"], k=limit, exclude=exclude)
+    return _with_content(hits)
+
+
+def similar_to_utterance(utterance_id: str, member_id: str, k: int = 10) -> list[dict] | None:
+    """Member utterances most similar to ``utterance_id`` (None if not indexed)."""
+    index = get_member_index(member_id)
+    vec = index.vector(utterance_id)
+    if vec is None:
+        return None
+    return _with_content(index.search(vec, k=k, exclude=[utterance_id]))
+
+
+def similar_to_vector(member_id: str, vec, k: int = 10) -> list[dict]:
+    """Member utterances most similar to an arbitrary embedding vector."""
+    return _with_content(get_member_index(member_id).search(vec, k=k))
+
+
+def _with_content(hits: list[SimilarUtterance]) -> list[dict]:
+    rows = db.get_ad_utterances_by_ids([h.utterance_id for h in hits])
+    by_id = {r["utterance_id"]: r for r in rows}
+    return [
+        {**by_id[h.utterance_id], "similarity": round(h.similarity, 4)}
+        for h in hits
+        if h.utterance_id in by_id
+    ]
+
+
+_model = None
+_model_lock = threading.Lock()
+
+
+def encode_text(text: str) -> np.ndarray:
+    """Embed free text with the same model embed_utterances uses.
+
+    Raises RuntimeError if sentence-transformers is not installed.
+    """
+    global _model
+    with _model_lock:
+        if _model is None:
+            try:
+                from sentence_transformers import SentenceTransformer
+            except ImportError as e:
+                raise RuntimeError("sentence-transformers not installed") from e
+            from .embed_utterances import DEFAULT_MODEL
+
+            _model = SentenceTransformer(os.environ.get("AD_EMBED_MODEL", DEFAULT_MODEL))
+    return _model.encode([text], convert_to_numpy=True)[0]
@@ -15,6 +15,7 @@ from .audit import (
     export_audit_logs_csv,
     get_audit_logs,
     get_audit_stats,
+    iter_audit_logs_csv,
     log_audit,
 )
 from .firebase_config import init_firebase, verify_firebase_token
@@ -57,6 +58,7 @@ __all__ = [
     "get_audit_logs",
     "get_audit_stats",
     "export_audit_logs_csv",
+    "iter_audit_logs_csv",
     # Router
     "auth_router",
 ]
@@ -17,6 +17,7 @@ from datetime import UTC, datetime
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 
+from .cache import invalidate_user_role
 from .firebase_config import (
     create_session_token,
     verify_firebase_token,
@@ -241,6 +242,8 @@ def _create_or_update_user(user_id: str, email: str, display_name: str = None) -
                 "display_name": display_name,
             },
         )
+        # user_id may have been relinked to this email
+        invalidate_user_role(user_id=user_id, email=email)
         return _get_user_by_email(email)
     else:
         # Create new user with viewer role
@@ -254,6 +257,7 @@ def _create_or_update_user(user_id: str, email: str, display_name: str = None) -
                 "now": datetime.now(UTC).isoformat(),
             },
         )
+        invalidate_user_role(user_id=user_id, email=email)
         return _get_user_by_email(email)
 
 
@@ -659,6 +663,7 @@ async def create_user(
             "created_by": user.user_id,
         },
     )
+    invalidate_user_role(email=body.email)
 
     new_user = _get_user_by_email(body.email)
 
@@ -696,6 +701,7 @@ async def update_user(
 
     if updates:
         _execute_write(f"UPDATE users SET {', '.join(updates)} WHERE user_id = :user_id", params)
+        invalidate_user_role(user_id=target_user_id, email=target["email"])
 
     updated_user = _get_user_by_id(target_user_id)
     return {"status": "updated", "user": updated_user}
@@ -722,6 +728,7 @@ async def deactivate_user(
     _execute_write(
         "UPDATE users SET is_active = FALSE WHERE user_id = :user_id", {"user_id": target_user_id}
     )
+    invalidate_user_role(user_id=target_user_id, email=target["email"])
 
     return {"status": "deactivated", "user_id": target_user_id}
 
@@ -805,21 +812,16 @@ async def export_audit_logs(
     """
     Export audit logs to CSV (commander only).
 
-    Returns CSV file for download.
+    Returns CSV file for download, streamed a page of rows at a time.
     """
-    import io
     from datetime import timedelta
 
     from fastapi.responses import StreamingResponse
 
-    from .audit import export_audit_logs_csv
+    from .audit import iter_audit_logs_csv
 
     start_date = datetime.now(UTC) - timedelta(days=days)
-    csv_content = export_audit_logs_csv(start_date=start_date)
-
-    # Create streaming response
-    output = io.BytesIO(csv_content.encode("utf-8"))
-    output.seek(0)
+    output = iter_audit_logs_csv(start_date=start_date)
 
     filename = f"audit_log_{datetime.now(UTC).strftime('%Y%m%d_%H%M%S')}.csv"
 
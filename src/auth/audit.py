@@ -6,16 +6,36 @@ Provides:
 - Async logging to avoid request delays
 - Audit trail for compliance
 - Query interface for audit records
+
+Entries are queued by log_audit() and written by a background worker in
+batches: it drains up to AUDIT_BATCH_SIZE entries, or whatever arrives
+within AUDIT_FLUSH_INTERVAL_MS of the first one, and inserts them with one
+executemany per transaction. If that transaction fails it is rolled back
+and bisected, so one bad entry does not cost the whole batch. The queue is
+bounded. When it is full, the "drop" policy discards the new entry
+immediately, and the "block" policy waits up to AUDIT_ENQUEUE_TIMEOUT_MS for
+room before discarding it.
+log_audit() runs on the event loop, so it must never block for long.
+
+Configuration:
+    AUDIT_QUEUE_MAX_SIZE: queued entries before the full policy applies (default 10000)
+    AUDIT_QUEUE_FULL_POLICY: "drop" or "block" (default "drop")
+    AUDIT_ENQUEUE_TIMEOUT_MS: wait for room under "block" (default 50)
+    AUDIT_BATCH_SIZE: max entries per write (default 500)
+    AUDIT_FLUSH_INTERVAL_MS: max wait to fill a batch (default 200)
 """
 
 from __future__ import annotations
 
 import json
 import logging
+import os
+import threading
 import time
 import uuid
+from collections.abc import Iterator
 from datetime import UTC, datetime, timedelta
-from queue import Queue
+from queue import Empty, Full, Queue
 from threading import Thread
 from typing import Any
 
@@ -26,9 +46,56 @@ from .models import AuthContext
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_QUEUE_MAX_SIZE = 10_000
+DEFAULT_BATCH_SIZE = 500
+DEFAULT_FLUSH_INTERVAL_MS = 200
+DEFAULT_ENQUEUE_TIMEOUT_MS = 50
+QUEUE_FULL_POLICIES = ("drop", "block")
+
+# Failed transactions allowed while bisecting one batch before the rest of
+# it is dropped, so a locked or unreachable database is not retried per row
+MAX_BISECT_FAILURES = 16
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.environ.get(name, "") or default)
+    except ValueError:
+        logger.warning("Invalid %s, using default %s", name, default)
+        return default
+
+
+def _queue_full_policy() -> str:
+    policy = os.environ.get("AUDIT_QUEUE_FULL_POLICY", "").strip().lower() or "drop"
+    if policy not in QUEUE_FULL_POLICIES:
+        logger.warning("Invalid AUDIT_QUEUE_FULL_POLICY %r, using 'drop'", policy)
+        return "drop"
+    return policy
+
+
 # Async queue for audit logs
-_audit_queue: Queue = Queue()
-_audit_worker_started = False
+_audit_queue: Queue = Queue(
+    maxsize=max(1, _env_int("AUDIT_QUEUE_MAX_SIZE", DEFAULT_QUEUE_MAX_SIZE))
+)
+_audit_worker: Thread | None = None
+_audit_worker_lock = threading.Lock()
+
+# Shutdown signal for the worker
+_STOP = None
+
+_metrics_lock = threading.Lock()
+_metrics = {
+    "enqueued": 0,
+    "dropped": 0,
+    "written": 0,
+    "skipped_contaminated": 0,
+    "write_errors": 0,
+    "batches": 0,
+    "last_batch_size": 0,
+    "last_flush_ms": 0.0,
+    "max_flush_ms": 0.0,
+    "total_flush_ms": 0.0,
+}
 
 
 # --- Audit Log Entry ---
@@ -81,58 +148,183 @@ def _is_contaminated(entry: dict) -> bool:
     return False
 
 
-def _audit_worker():
-    """Background worker that writes audit logs to database."""
-    from ..db import connect, execute
+_INSERT_AUDIT_LOG = """INSERT INTO audit_log (
+    log_id, timestamp, user_id, user_email, action,
+    resource, resource_id, request_method, request_path,
+    request_body, response_status, ip_address, user_agent,
+    duration_ms, success
+) VALUES (
+    :log_id, :timestamp, :user_id, :user_email, :action,
+    :resource, :resource_id, :request_method, :request_path,
+    :request_body, :response_status, :ip_address, :user_agent,
+    :duration_ms, :success
+)"""
 
-    while True:
-        try:
-            # Block until we get an entry
-            entry = _audit_queue.get()
 
-            if entry is None:
-                # Shutdown signal
-                break
+def _collect_batch(queue: Queue, batch_size: int, flush_interval: float) -> tuple[list[dict], bool]:
+    """
+    Block for the next entry, then take more until the batch is full or
+    ``flush_interval`` seconds have passed since the first one.
 
-            if _is_contaminated(entry):
-                logger.warning("Skipping contaminated audit entry: ip=%s", entry.get("ip_address"))
-                _audit_queue.task_done()
-                continue
+    Returns (entries, stop) where stop is True once the shutdown signal
+    has been seen.
+    """
+    entry = queue.get()
+    if entry is _STOP:
+        return [], True
+
+    batch = [entry]
+    deadline = time.monotonic() + flush_interval
+    while len(batch) < batch_size:
+        remaining = deadline - time.monotonic()
+        try:
+            entry = queue.get(timeout=remaining) if remaining > 0 else queue.get_nowait()
+        except Empty:
+            break
+        if entry is _STOP:
+            return batch, True
+        batch.append(entry)
+    return batch, False
 
-            con = connect()
-            execute(
-                con,
-                """INSERT INTO audit_log (
-                    log_id, timestamp, user_id, user_email, action,
-                    resource, resource_id, request_method, request_path,
-                    request_body, response_status, ip_address, user_agent,
-                    duration_ms, success
-                ) VALUES (
-                    :log_id, :timestamp, :user_id, :user_email, :action,
-                    :resource, :resource_id, :request_method, :request_path,
-                    :request_body, :response_status, :ip_address, :user_agent,
-                    :duration_ms, :success
-                )""",
-                entry,
-            )
-            con.commit()
-            con.close()
 
-            _audit_queue.task_done()
+def _write_entries(con, entries: list[dict]) -> int:
+    """
+    Insert entries and bump their rollups in one transaction, bisecting on failure.
+
+    A failed transaction is rolled back and its two halves are retried
+    separately, so only entries that fail on their own are dropped. Each
+    committed part bumps the rollups for exactly its own rows. Returns the
+    number of entries written.
+    """
+    from ..db import executemany
+    from .audit_rollups import bump_audit_rollups
 
+    pending = [entries]
+    written = failures = 0
+    while pending:
+        part = pending.pop()
+        try:
+            executemany(con, _INSERT_AUDIT_LOG, part)
+            bump_audit_rollups(con, part)
+            con.commit()
+            written += len(part)
+            continue
+        except Exception as e:
+            con.rollback()
+            failures += 1
+            error = e
+        if len(part) == 1:
+            logger.error(f"Audit worker error: dropped entry {part[0].get('log_id')}: {error}")
+        elif failures > MAX_BISECT_FAILURES:
+            dropped = len(part) + sum(len(rest) for rest in pending)
+            logger.error(f"Audit worker error: dropped {dropped} entries: {error}")
+            break
+        else:
+            mid = len(part) // 2
+            pending += [part[mid:], part[:mid]]
+    return written
+
+
+def _write_batch(entries: list[dict]) -> None:
+    """Write a batch of audit entries, dropping only the ones that cannot be inserted."""
+    from ..db import connect
+
+    clean = [entry for entry in entries if not _is_contaminated(entry)]
+    skipped = len(entries) - len(clean)
+    if skipped:
+        logger.warning("Skipping %d contaminated audit entries", skipped)
+
+    started = time.perf_counter()
+    written = 0
+    try:
+        if clean:
+            con = connect()
+            try:
+                written = _write_entries(con, clean)
+            finally:
+                con.close()
+    except Exception as e:
+        logger.error(f"Audit worker error: dropped {len(clean)} entries: {e}")
+    flush_ms = (time.perf_counter() - started) * 1000
+
+    with _metrics_lock:
+        _metrics["skipped_contaminated"] += skipped
+        _metrics["written"] += written
+        _metrics["write_errors"] += len(clean) - written
+        if clean:
+            _metrics["batches"] += 1
+            _metrics["last_batch_size"] = len(clean)
+            _metrics["last_flush_ms"] = flush_ms
+            _metrics["max_flush_ms"] = max(_metrics["max_flush_ms"], flush_ms)
+            _metrics["total_flush_ms"] += flush_ms
+
+
+def _run_audit_worker():
+    """Background worker that writes audit logs to database in batches."""
+    batch_size = max(1, _env_int("AUDIT_BATCH_SIZE", DEFAULT_BATCH_SIZE))
+    flush_interval = max(0, _env_int("AUDIT_FLUSH_INTERVAL_MS", DEFAULT_FLUSH_INTERVAL_MS)) / 1000
+
+    stop = False
+    while not stop:
+        batch: list[dict] = []
+        try:
+            batch, stop = _collect_batch(_audit_queue, batch_size, flush_interval)
+            if batch:
+                _write_batch(batch)
         except Exception as e:
             logger.error(f"Audit worker error: {e}")
+        finally:
+            for _ in range(len(batch) + stop):
+                _audit_queue.task_done()
 
 
 def _start_audit_worker():
     """Start the background audit worker if not already running."""
-    global _audit_worker_started
+    global _audit_worker
+
+    if _audit_worker is not None and _audit_worker.is_alive():
+        return
+    with _audit_worker_lock:
+        if _audit_worker is None or not _audit_worker.is_alive():
+            _audit_worker = Thread(target=_run_audit_worker, name="audit-writer", daemon=True)
+            _audit_worker.start()
+            logger.info("Audit worker started")
 
-    if not _audit_worker_started:
-        worker = Thread(target=_audit_worker, daemon=True)
-        worker.start()
-        _audit_worker_started = True
-        logger.info("Audit worker started")
+
+def _enqueue(entry: dict) -> bool:
+    """Queue an entry under the configured full-queue policy. Returns False if dropped."""
+    try:
+        if _queue_full_policy() == "block":
+            timeout = _env_int("AUDIT_ENQUEUE_TIMEOUT_MS", DEFAULT_ENQUEUE_TIMEOUT_MS) / 1000
+            _audit_queue.put(entry, timeout=max(0, timeout))
+        else:
+            _audit_queue.put_nowait(entry)
+    except Full:
+        with _metrics_lock:
+            _metrics["dropped"] += 1
+        return False
+    with _metrics_lock:
+        _metrics["enqueued"] += 1
+    return True
+
+
+def get_audit_writer_stats() -> dict[str, Any]:
+    """Queue depth, drop counts and flush latency of the audit writer."""
+    with _metrics_lock:
+        metrics = dict(_metrics)
+    total_flush_ms = metrics.pop("total_flush_ms")
+    return {
+        "running": _audit_worker is not None and _audit_worker.is_alive(),
+        "queue_depth": _audit_queue.qsize(),
+        "queue_max_size": _audit_queue.maxsize,
+        "queue_full_policy": _queue_full_policy(),
+        **metrics,
+        "avg_flush_ms": round(total_flush_ms / metrics["batches"], 3)
+        if metrics["batches"]
+        else 0.0,
+        "last_flush_ms": round(metrics["last_flush_ms"], 3),
+        "max_flush_ms": round(metrics["max_flush_ms"], 3),
+    }
 
 
 def log_audit(
@@ -175,7 +367,8 @@ def log_audit(
         "success": success,
     }
 
-    _audit_queue.put(entry)
+    if not _enqueue(entry):
+        logger.debug("Audit queue full, dropped entry for %s", request_path)
 
 
 # --- Audit Middleware ---
@@ -389,127 +582,176 @@ def get_audit_stats(days: int = 7) -> dict:
     - Total requests
     - Requests by action
     - Requests by user
+    - Requests by response status
     - Error rate
-    - Average duration
+    - Average duration and a duration histogram
+
+    Reads the hourly audit_log_rollups, plus the raw rows of the period's
+    first, partial hour.
     """
-    from ..db import connect, execute
+    from collections import Counter
+
+    from ..db import connect
+    from .audit_rollups import DURATION_BUCKETS_MS, read_audit_period
 
     start_date = (datetime.now(UTC) - timedelta(days=days)).isoformat()
 
     con = connect()
-
-    # Total requests
-    cur = execute(
-        con,
-        "SELECT COUNT(*) FROM audit_log WHERE timestamp >= :start_date",
-        {"start_date": start_date},
-    )
-    total_requests = cur.fetchone()[0]
-
-    # Requests by action
-    cur = execute(
-        con,
-        """SELECT action, COUNT(*) as count
-           FROM audit_log
-           WHERE timestamp >= :start_date
-           GROUP BY action
-           ORDER BY count DESC
-           LIMIT 20""",
-        {"start_date": start_date},
-    )
-    by_action = {row[0]: row[1] for row in cur.fetchall()}
-
-    # Requests by user
-    cur = execute(
-        con,
-        """SELECT user_email, COUNT(*) as count
-           FROM audit_log
-           WHERE timestamp >= :start_date AND user_email IS NOT NULL
-           GROUP BY user_email
-           ORDER BY count DESC
-           LIMIT 10""",
-        {"start_date": start_date},
-    )
-    by_user = {row[0]: row[1] for row in cur.fetchall()}
-
-    # Error rate
-    cur = execute(
-        con,
-        """SELECT
-             SUM(CASE WHEN success = 0 THEN 1 ELSE 0 END) as errors,
-             COUNT(*) as total
-           FROM audit_log
-           WHERE timestamp >= :start_date""",
-        {"start_date": start_date},
-    )
-    row = cur.fetchone()
-    errors = row[0] or 0
-    total = row[1] or 1
-    error_rate = (errors / total) * 100
-
-    # Average duration
-    cur = execute(
-        con,
-        """SELECT AVG(duration_ms)
-           FROM audit_log
-           WHERE timestamp >= :start_date AND duration_ms IS NOT NULL""",
-        {"start_date": start_date},
-    )
-    avg_duration = cur.fetchone()[0] or 0
-
-    con.close()
+    try:
+        rollups = read_audit_period(con, since=start_date)
+    finally:
+        con.close()
+
+    by_action: Counter = Counter()
+    by_user: Counter = Counter()
+    by_status: Counter = Counter()
+    histogram = [0] * (len(DURATION_BUCKETS_MS) + 1)
+    total_requests = errors = duration_count = duration_sum = 0
+    for (_hour, action, user_email, response_status, success), values in rollups.items():
+        count = values[0]
+        total_requests += count
+        by_action[action] += count
+        if user_email:
+            by_user[user_email] += count
+        by_status[str(response_status) if response_status else "unknown"] += count
+        if not success:
+            errors += count
+        duration_count += values[1]
+        duration_sum += values[2]
+        histogram = [a + b for a, b in zip(histogram, values[3:])]
+
+    error_rate = (errors / (total_requests or 1)) * 100
+    avg_duration = duration_sum / duration_count if duration_count else 0
+    bucket_labels = [f"<={bound}" for bound in DURATION_BUCKETS_MS] + [
+        f">{DURATION_BUCKETS_MS[-1]}"
+    ]
 
     return {
         "period_days": days,
         "total_requests": total_requests,
-        "by_action": by_action,
-        "by_user": by_user,
+        "by_action": dict(by_action.most_common(20)),
+        "by_user": dict(by_user.most_common(10)),
+        "by_status": dict(by_status.most_common()),
         "error_count": errors,
         "error_rate_percent": round(error_rate, 2),
         "avg_duration_ms": round(avg_duration, 2),
+        "duration_histogram_ms": dict(zip(bucket_labels, histogram)),
     }
 
 
-def export_audit_logs_csv(
+AUDIT_LOG_COLUMNS = [
+    "log_id",
+    "timestamp",
+    "user_id",
+    "user_email",
+    "action",
+    "resource",
+    "resource_id",
+    "request_method",
+    "request_path",
+    "request_body",
+    "response_status",
+    "ip_address",
+    "user_agent",
+    "duration_ms",
+    "success",
+]
+
+NO_AUDIT_LOGS_MESSAGE = "No audit logs found for the specified period."
+
+
+def iter_audit_logs_csv(
     start_date: datetime | None = None,
     end_date: datetime | None = None,
-) -> str:
+    page_size: int = 1000,
+) -> Iterator[str]:
     """
-    Export audit logs to CSV format.
+    Export audit logs as CSV, one chunk per page of rows.
 
-    Returns CSV string.
+    Pages through audit_log newest first by keyset on (timestamp, log_id),
+    with a fresh connection per page, so memory stays bounded by
+    ``page_size`` however long the period is.
     """
     import csv
     import io
 
-    logs = get_audit_logs(
-        start_date=start_date,
-        end_date=end_date,
-        limit=10000,
-    )
+    from ..db import connect, execute
 
-    if not logs:
-        return "No audit logs found for the specified period."
+    base_query = f"SELECT {', '.join(AUDIT_LOG_COLUMNS)} FROM audit_log WHERE 1=1"
+    params: dict[str, Any] = {"page_size": page_size}
+    if start_date:
+        base_query += " AND timestamp >= :start_date"
+        params["start_date"] = start_date.isoformat()
+    if end_date:
+        base_query += " AND timestamp <= :end_date"
+        params["end_date"] = end_date.isoformat()
+
+    cursor: tuple | None = None
+    while True:
+        query = base_query
+        if cursor is not None:
+            query += (
+                " AND (timestamp < :after_ts OR (timestamp = :after_ts AND log_id < :after_id))"
+            )
+            params["after_ts"], params["after_id"] = cursor
+        query += " ORDER BY timestamp DESC, log_id DESC LIMIT :page_size"
+
+        con = connect()
+        try:
+            rows = execute(con, query, params).fetchall()
+        finally:
+            con.close()
+
+        if not rows:
+            if cursor is None:
+                yield NO_AUDIT_LOGS_MESSAGE
+            return
 
-    output = io.StringIO()
-    writer = csv.DictWriter(output, fieldnames=logs[0].keys())
-    writer.writeheader()
-    writer.writerows(logs)
+        output = io.StringIO()
+        writer = csv.writer(output)
+        if cursor is None:
+            writer.writerow(AUDIT_LOG_COLUMNS)
+        writer.writerows(rows)
+        yield output.getvalue()
 
-    return output.getvalue()
+        if len(rows) < page_size:
+            return
+        cursor = (rows[-1][1], rows[-1][0])
+
+
+def export_audit_logs_csv(
+    start_date: datetime | None = None,
+    end_date: datetime | None = None,
+) -> str:
+    """
+    Export audit logs to CSV format.
+
+    Returns CSV string. Prefer iter_audit_logs_csv for large periods.
+    """
+    return "".join(iter_audit_logs_csv(start_date=start_date, end_date=end_date))
 
 
 # --- Cleanup ---
 
 
-def shutdown_audit_worker():
-    """Gracefully shutdown the audit worker."""
-    _audit_queue.put(None)
+def shutdown_audit_worker(timeout: float = 5.0):
+    """Gracefully shutdown the audit worker, flushing queued entries first."""
+    global _audit_worker
 
+    worker = _audit_worker
+    if worker is None or not worker.is_alive():
+        return
+    try:
+        # Wait for room rather than dropping the shutdown signal
+        _audit_queue.put(_STOP, timeout=timeout)
+    except Full:
+        logger.warning("Audit queue still full after %ss, worker not stopped", timeout)
+        return
+    worker.join(timeout)
+    _audit_worker = None
 
-# --- Log Retention ---
 
-import os
+# --- Log Retention ---
 
 # Default retention period in days (configurable via LOG_RETENTION_DAYS env var)
 DEFAULT_RETENTION_DAYS = 90
@@ -535,6 +777,7 @@ def cleanup_old_audit_logs(retention_days: int | None = None, dry_run: bool = Fa
         Dict with cleanup stats: {deleted: int, retention_days: int, cutoff_date: str}
     """
     from ..db import connect, execute
+    from .audit_rollups import trim_audit_rollups
 
     if retention_days is None:
         retention_days = get_retention_days()
@@ -558,6 +801,7 @@ def cleanup_old_audit_logs(retention_days: int | None = None, dry_run: bool = Fa
             "DELETE FROM audit_log WHERE timestamp < :cutoff_date",
             {"cutoff_date": cutoff_date},
         )
+        trim_audit_rollups(con, cutoff_date)
         con.commit()
         deleted = count_to_delete
         logger.info(f"Deleted {deleted} audit log entries older than {retention_days} days")
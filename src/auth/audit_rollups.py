@@ -0,0 +1,219 @@
+"""audit_log_rollups: hourly audit counts maintained by the audit writer.
+
+The batched audit writer (audit._write_batch) bumps one row per (hour,
+action, user_email, response_status, success) in the same transaction as
+the audit_log rows themselves. Each row holds a request count, the count
+and sum of known durations, and a duration histogram. get_audit_stats reads
+these O(hours x actions x users) rows instead of aggregating every audit_log
+row in the period. The rollups can be rebuilt from audit_log (e.g. after
+rows are written or deleted outside the writer) and checked against it.
+
+Hours are UTC and formatted "YYYY-MM-DDTHH". Anonymous requests are stored
+with user_email '' and unknown status codes as response_status 0, since
+both are part of the primary key.
+"""
+
+from collections.abc import Iterable
+from datetime import UTC, datetime, timedelta
+
+from ..db import connect, execute, executemany
+
+# Upper bounds (inclusive) of the duration histogram buckets; anything
+# slower lands in the overflow bucket
+DURATION_BUCKETS_MS = (50, 100, 250, 500, 1000, 2500)
+
+DURATION_COLUMNS = [f"duration_le_{bound}" for bound in DURATION_BUCKETS_MS] + [
+    f"duration_gt_{DURATION_BUCKETS_MS[-1]}"
+]
+
+_KEY_COLUMNS = ["hour", "action", "user_email", "response_status", "success"]
+_VALUE_COLUMNS = ["request_count", "duration_count", "duration_sum_ms", *DURATION_COLUMNS]
+
+_BUMP_ROLLUP_SQL = f"""INSERT INTO audit_log_rollups({", ".join(_KEY_COLUMNS + _VALUE_COLUMNS)})
+   VALUES ({", ".join(f":{c}" for c in _KEY_COLUMNS + _VALUE_COLUMNS)})
+   ON CONFLICT({", ".join(_KEY_COLUMNS)}) DO UPDATE SET
+       {", ".join(f"{c} = audit_log_rollups.{c} + excluded.{c}" for c in _VALUE_COLUMNS)}"""
+
+_SCAN_BATCH_SIZE = 5000
+
+
+def rollup_hour(timestamp) -> str:
+    """UTC hour ("YYYY-MM-DDTHH") of an audit timestamp (ISO string or datetime)."""
+    if isinstance(timestamp, datetime):
+        dt = timestamp
+    else:
+        try:
+            dt = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+        except (AttributeError, ValueError):
+            return (timestamp or "")[:13].replace(" ", "T")
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(UTC)
+    return dt.strftime("%Y-%m-%dT%H")
+
+
+def hour_start(hour: str) -> str:
+    """ISO timestamp of the first instant of a rollup hour, as the writer formats it."""
+    return f"{hour}:00:00+00:00"
+
+
+def next_hour(hour: str) -> str:
+    """The rollup hour after ``hour``."""
+    return (datetime.strptime(hour, "%Y-%m-%dT%H") + timedelta(hours=1)).strftime("%Y-%m-%dT%H")
+
+
+def _duration_bucket(duration_ms: int) -> int:
+    for idx, bound in enumerate(DURATION_BUCKETS_MS):
+        if duration_ms <= bound:
+            return idx
+    return len(DURATION_BUCKETS_MS)
+
+
+def _rollup_key(entry: dict) -> tuple:
+    success = entry.get("success")
+    return (
+        rollup_hour(entry.get("timestamp")),
+        entry.get("action") or "",
+        entry.get("user_email") or "",
+        entry.get("response_status") or 0,
+        # Only an explicit failure counts as an error, as in get_audit_stats
+        0 if success is not None and not success else 1,
+    )
+
+
+def aggregate_audit_entries(entries: Iterable[dict]) -> dict[tuple, list[int]]:
+    """Rollup values per rollup key for a set of audit entries."""
+    rollups: dict[tuple, list[int]] = {}
+    for entry in entries:
+        values = rollups.get(key := _rollup_key(entry))
+        if values is None:
+            values = rollups[key] = [0] * len(_VALUE_COLUMNS)
+        values[0] += 1
+        duration_ms = entry.get("duration_ms")
+        if duration_ms is not None:
+            values[1] += 1
+            values[2] += duration_ms
+            values[3 + _duration_bucket(duration_ms)] += 1
+    return rollups
+
+
+def _rollup_params(rollups: dict[tuple, list[int]]) -> list[dict]:
+    return [
+        dict(zip(_KEY_COLUMNS, key)) | dict(zip(_VALUE_COLUMNS, values))
+        for key, values in rollups.items()
+    ]
+
+
+def bump_audit_rollups(con, entries: list[dict]) -> None:
+    """Count a batch of audit entries in their rollup rows; the caller commits."""
+    rollups = aggregate_audit_entries(entries)
+    if rollups:
+        executemany(con, _BUMP_ROLLUP_SQL, _rollup_params(rollups))
+
+
+def _iter_raw_entries(con, since: str | None = None, until: str | None = None):
+    columns = ["timestamp", "action", "user_email", "response_status", "success", "duration_ms"]
+    query = f"SELECT {', '.join(columns)} FROM audit_log WHERE 1=1"
+    params = {}
+    if since is not None:
+        query += " AND timestamp >= :since"
+        params["since"] = since
+    if until is not None:
+        query += " AND timestamp < :until"
+        params["until"] = until
+    cur = execute(con, query, params)
+    while True:
+        rows = cur.fetchmany(_SCAN_BATCH_SIZE)
+        if not rows:
+            return
+        for row in rows:
+            yield dict(zip(columns, row))
+
+
+def read_audit_rollups(con, since_hour: str | None = None) -> dict[tuple, list[int]]:
+    """Rollup values per key, for every hour from ``since_hour`` on if given."""
+    query = f"SELECT {', '.join(_KEY_COLUMNS + _VALUE_COLUMNS)} FROM audit_log_rollups"
+    params = {}
+    if since_hour is not None:
+        query += " WHERE hour >= :since_hour"
+        params["since_hour"] = since_hour
+    cur = execute(con, query, params)
+    width = len(_KEY_COLUMNS)
+    return {tuple(row[:width]): list(row[width:]) for row in cur.fetchall()}
+
+
+def rebuild_audit_rollups() -> int:
+    """Recompute every rollup row from audit_log. Returns the number of rows written."""
+    con = connect()
+    try:
+        rollups = aggregate_audit_entries(_iter_raw_entries(con))
+        execute(con, "DELETE FROM audit_log_rollups")
+        if rollups:
+            executemany(con, _BUMP_ROLLUP_SQL, _rollup_params(rollups))
+        con.commit()
+        return len(rollups)
+    except Exception:
+        con.rollback()
+        raise
+    finally:
+        con.close()
+
+
+def trim_audit_rollups(con, cutoff: str) -> None:
+    """
+    Drop rollups for audit rows deleted before ``cutoff``; the caller commits.
+
+    Hours entirely before the cutoff are deleted. The cutoff's own hour is
+    recomputed from the audit_log rows that remain in it.
+    """
+    hour = rollup_hour(cutoff)
+    execute(con, "DELETE FROM audit_log_rollups WHERE hour <= :hour", {"hour": hour})
+    remaining = _iter_raw_entries(con, since=cutoff, until=hour_start(next_hour(hour)))
+    rollups = aggregate_audit_entries(remaining)
+    if rollups:
+        executemany(con, _BUMP_ROLLUP_SQL, _rollup_params(rollups))
+
+
+def check_audit_rollups() -> list[dict]:
+    """
+    Compare rollups against values recomputed from audit_log.
+
+    Returns one dict per mismatched rollup key with the expected (raw) and
+    actual (rollup) values; an empty list means consistent.
+    """
+    con = connect()
+    try:
+        expected = aggregate_audit_entries(_iter_raw_entries(con))
+        actual = read_audit_rollups(con)
+    finally:
+        con.close()
+    empty = [0] * len(_VALUE_COLUMNS)
+    mismatches = []
+    for key in sorted(expected.keys() | actual.keys()):
+        want, have = expected.get(key, empty), actual.get(key, empty)
+        if want != have:
+            mismatches.append(
+                {
+                    **dict(zip(_KEY_COLUMNS, key)),
+                    "expected": dict(zip(_VALUE_COLUMNS, want)),
+                    "actual": dict(zip(_VALUE_COLUMNS, have)),
+                }
+            )
+    return mismatches
+
+
+def read_audit_period(con, since: str) -> dict[tuple, list[int]]:
+    """
+    Rollup values per key for audit rows with timestamp >= ``since``.
+
+    Whole hours come from the rollups. The first, partial hour is
+    aggregated from the audit_log rows after ``since``, so the result
+    matches a scan of audit_log itself.
+    """
+    first_hour = rollup_hour(since)
+    partial = aggregate_audit_entries(
+        _iter_raw_entries(con, since=since, until=hour_start(next_hour(first_hour)))
+    )
+    for key, values in read_audit_rollups(con, since_hour=next_hour(first_hour)).items():
+        current = partial.get(key)
+        partial[key] = values if current is None else [a + b for a, b in zip(current, values)]
+    return partial
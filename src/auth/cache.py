@@ -0,0 +1,174 @@
+"""
+Request-path caches for authentication and tenant resolution.
+
+AuthMiddleware looks up the caller's role on every authenticated request.
+The role is cached here for a short TTL, so a warm request resolves it with
+a dictionary lookup. Writes that change a role (auth/api.py) invalidate the
+affected entries explicitly. The TTL only bounds staleness for changes made
+outside the API, e.g. directly in the users table.
+
+A lookup that misses reads the database and then caches the result. To keep
+an invalidation that lands during that read from being undone, callers take
+the cache's generation() before the read and pass it to set(); any
+invalidation bumps the generation, and a set() from an older generation is
+skipped.
+
+Configuration:
+    AUTH_CACHE_TTL_SECONDS: entry lifetime (default 60)
+    AUTH_CACHE_MAX_ENTRIES: LRU bound per cache (default 10000)
+"""
+
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL_SECONDS = 60.0
+DEFAULT_MAX_ENTRIES = 10_000
+
+# Returned by TTLCache.get() on a miss, so None can be cached as a value
+MISS = object()
+
+
+def _env_number(name: str, default, cast):
+    try:
+        return cast(os.environ.get(name, "") or default)
+    except ValueError:
+        logger.warning("Invalid %s, using default %s", name, default)
+        return default
+
+
+class TTLCache:
+    """Thread-safe LRU cache whose entries also expire after ``ttl_seconds``.
+
+    Tracks hits, misses, expirations, evictions, invalidations and skipped
+    stale sets for the health endpoint.
+    """
+
+    def __init__(self, name: str, ttl_seconds: float | None = None, max_entries: int | None = None):
+        self.name = name
+        if ttl_seconds is None:
+            ttl_seconds = _env_number("AUTH_CACHE_TTL_SECONDS", DEFAULT_TTL_SECONDS, float)
+        if max_entries is None:
+            max_entries = _env_number("AUTH_CACHE_MAX_ENTRIES", DEFAULT_MAX_ENTRIES, int)
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max(1, max_entries)
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._metrics = {
+            "hits": 0,
+            "misses": 0,
+            "expirations": 0,
+            "evictions": 0,
+            "invalidations": 0,
+            "stale_sets": 0,
+        }
+
+    def generation(self) -> int:
+        """Current invalidation generation; take it before reading the value to cache."""
+        with self._lock:
+            return self._generation
+
+    def get(self, key: Hashable) -> Any:
+        """Return the cached value, or ``MISS`` if absent or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if time.monotonic() < expires_at:
+                    self._entries.move_to_end(key)
+                    self._metrics["hits"] += 1
+                    return value
+                del self._entries[key]
+                self._metrics["expirations"] += 1
+            self._metrics["misses"] += 1
+            return MISS
+
+    def set(self, key: Hashable, value: Any, generation: int | None = None) -> bool:
+        """Cache ``value``, unless an invalidation happened since ``generation`` was taken.
+
+        Returns whether the value was stored.
+        """
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                self._metrics["stale_sets"] += 1
+                return False
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._metrics["evictions"] += 1
+            return True
+
+    def invalidate_where(self, predicate: Callable[[Hashable], bool]) -> int:
+        """Drop every entry whose key matches ``predicate``. Returns the count dropped."""
+        with self._lock:
+            # Even with nothing cached, a lookup may be about to store a stale value
+            self._generation += 1
+            stale = [key for key in self._entries if predicate(key)]
+            for key in stale:
+                del self._entries[key]
+            self._metrics["invalidations"] += len(stale)
+            return len(stale)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._metrics["invalidations"] += len(self._entries)
+            self._entries.clear()
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            metrics = dict(self._metrics)
+            size = len(self._entries)
+        lookups = metrics["hits"] + metrics["misses"]
+        return {
+            "name": self.name,
+            "size": size,
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            **metrics,
+            "hit_rate": round(metrics["hits"] / lookups, 4) if lookups else 0.0,
+        }
+
+
+# (user_id, email) -> UserRole, as resolved by AuthMiddleware._get_user_role
+role_cache = TTLCache("user_role")
+
+
+def invalidate_user_role(user_id: str | None = None, email: str | None = None) -> int:
+    """Forget cached roles for a user, matched on user_id or email."""
+
+    def matches(key) -> bool:
+        cached_user_id, cached_email = key
+        return (user_id is not None and cached_user_id == user_id) or (
+            email is not None and cached_email == email
+        )
+
+    return role_cache.invalidate_where(matches)
+
+
+_registered_caches: list[TTLCache] = [role_cache]
+
+
+def register_cache(cache: TTLCache) -> TTLCache:
+    """Include a cache in get_auth_cache_stats()."""
+    _registered_caches.append(cache)
+    return cache
+
+
+def get_auth_cache_stats() -> list[dict[str, Any]]:
+    """Size, TTL and hit/miss counters for each registered cache."""
+    return [cache.stats() for cache in _registered_caches]
+
+
+def clear_auth_caches() -> None:
+    """Empty every registered cache (e.g. after pointing at a different DB)."""
+    for cache in _registered_caches:
+        cache.clear()
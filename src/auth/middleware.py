@@ -17,6 +17,7 @@ from fastapi import HTTPException, Request, Response
 from fastapi.security import HTTPBearer
 from starlette.middleware.base import BaseHTTPMiddleware
 
+from .cache import MISS, role_cache
 from .firebase_config import (
     init_firebase,
     verify_firebase_token,
@@ -169,32 +170,36 @@ class AuthMiddleware(BaseHTTPMiddleware):
         )
 
     async def _get_user_role(self, user_id: str | None, email: str | None) -> UserRole:
-        """Look up user role from database."""
+        """Look up user role, from role_cache when warm, else the database."""
         if not user_id and not email:
             return UserRole.VIEWER
 
+        key = (user_id, email)
+        cached = role_cache.get(key)
+        if cached is not MISS:
+            return cached
+
+        # Taken before the read: a role change invalidated mid-lookup is not re-cached
+        generation = role_cache.generation()
         try:
-            from ..db import connect, execute
+            from ..db import fetch_one
 
-            con = connect()
-            cur = execute(
-                con,
+            # Awaited on the async DB path so the lookup never blocks the loop
+            row = await fetch_one(
                 """SELECT role FROM users
                    WHERE user_id = :user_id OR email = :email
                    LIMIT 1""",
                 {"user_id": user_id, "email": email},
             )
-            row = cur.fetchone()
-            con.close()
-
-            if row:
-                return UserRole(row[0])
-
+            # Default to viewer if not found
+            role = UserRole(row[0]) if row else UserRole.VIEWER
         except Exception as e:
+            # Not cached: a transient DB error must not pin the default role
             logger.debug(f"Could not look up user role: {e}")
+            return UserRole.VIEWER
 
-        # Default to viewer if not found
-        return UserRole.VIEWER
+        role_cache.set(key, role, generation)
+        return role
 
     def _verify_csrf(self, request: Request) -> bool:
         """Verify CSRF token matches cookie."""
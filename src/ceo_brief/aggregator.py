@@ -5,9 +5,10 @@ Queries all source tables for the last 7 days, identifies new/changed items,
 classifies by issue area, and ranks by potential impact.
 """
 
-import re
 from datetime import date, datetime, timedelta
 
+from src.keyword_taxonomy import RegexTaxonomy
+
 from .db_helpers import get_all_deltas
 from .schema import AggregatedDelta, AggregationResult, IssueArea, SourceType
 
@@ -122,6 +123,7 @@ ISSUE_PATTERNS = {
         r"\bcounty\b.*\bveteran",
     ],
 }
+_ISSUE_TAXONOMY = RegexTaxonomy(ISSUE_PATTERNS)
 
 # Impact scoring weights
 IMPACT_WEIGHTS = {
@@ -176,17 +178,7 @@ def classify_issue_area(title: str, content: str | None = None) -> IssueArea:
 
     Returns the issue area with the most matches, or OTHER if none match.
     """
-    text = (title + " " + (content or "")).lower()
-
-    scores = {}
-    for area, patterns in ISSUE_PATTERNS.items():
-        score = 0
-        for pattern in patterns:
-            if re.search(pattern, text, re.IGNORECASE):
-                score += 1
-        if score > 0:
-            scores[area] = score
-
+    scores = _ISSUE_TAXONOMY.counts((title + " " + (content or "")).lower())
     if not scores:
         return IssueArea.OTHER
 
@@ -23,8 +23,10 @@ from .auth.audit import AuditMiddleware
 from .auth.middleware import AuthMiddleware
 from .battlefield.api import router as battlefield_router
 from .ceo_brief.api import router as ceo_brief_router
+from .db import close_async_db
 from .evidence.dashboard_routes import router as evidence_router
 from .ml.api import router as ml_router
+from .notify_email import smtp_prober
 from .resilience.api import router as resilience_router
 from .routers.agenda_drift import router as agenda_drift_router
 from .routers.compound import router as compound_router
@@ -235,9 +237,9 @@ async def log_metrics_snapshot():
     while True:
         try:
             # Collect metrics
-            runs_stats = get_runs_stats()
-            state_stats = get_state_stats_endpoint()
-            oversight_stats = get_oversight_stats_endpoint()
+            runs_stats = await get_runs_stats()
+            state_stats = await get_state_stats_endpoint()
+            oversight_stats = await get_oversight_stats_endpoint()
 
             metrics_data = {
                 "event": "metrics_snapshot",
@@ -271,6 +273,13 @@ async def log_metrics_snapshot():
 @app.on_event("startup")
 async def startup_event():
     asyncio.create_task(log_metrics_snapshot())
+    # Start the first SMTP probe so /api/health has a result early
+    smtp_prober.status()
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    await close_async_db()
 
 
 # --- Main entry point ---
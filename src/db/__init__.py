@@ -5,14 +5,21 @@ imports (``from src.db import connect, execute, ...``) continue to work.
 """
 
 from .ad import (
+    EMBEDDING_FORMAT_VERSION,
     bulk_insert_ad_utterances,
+    bulk_upsert_ad_embeddings,
+    decode_embedding,
+    encode_embedding,
     get_ad_deviation_events,
     get_ad_deviations_without_notes,
     get_ad_embeddings_for_member,
+    get_ad_embeddings_since,
+    get_ad_flagged_utterance_ids,
     get_ad_member_deviation_history,
     get_ad_recent_deviations_for_hearing,
     get_ad_typical_utterances,
     get_ad_utterance_by_id,
+    get_ad_utterances_by_ids,
     get_ad_utterances_for_member,
     get_latest_ad_baseline,
     insert_ad_baseline,
@@ -21,6 +28,13 @@ from .ad import (
     upsert_ad_embedding,
     upsert_ad_member,
 )
+from .aio import (
+    close_async_db,
+    fetch_all,
+    fetch_one,
+    get_db_executor,
+    run_db,
+)
 from .authority import (
     fetch_unrouted_authority_docs,
     get_authority_doc,
@@ -44,8 +58,11 @@ from .compound import (
     get_compound_signal,
     get_compound_signals,
     get_compound_stats,
+    get_compound_watermarks,
     insert_compound_signal,
+    insert_compound_signals,
     resolve_compound_signal,
+    set_compound_watermarks,
 )
 from .core import (
     DB_PATH,
@@ -69,6 +86,7 @@ from .core import (
 from .fr import (
     bulk_insert_fr_seen,
     get_existing_fr_doc_ids,
+    insert_new_fr_seen,
     update_fr_seen_dates,
     upsert_ecfr_seen,
     upsert_fr_seen,
@@ -94,3 +112,14 @@ from .lda import (
     insert_lda_alert,
     upsert_lda_filing,
 )
+from .pool import (
+    close_pool,
+    get_pool_stats,
+)
+from .runs import (
+    bump_source_run_rollup,
+    check_source_run_rollups,
+    get_source_run_rollups,
+    rebuild_source_run_rollups,
+    rollup_day,
+)
@@ -1,10 +1,66 @@
 """Agenda Drift database functions."""
 
 import json
+import sys
+from array import array
+from collections.abc import Iterable, Sequence
 
-from .core import _count_inserted_rows, connect, execute, insert_returning_id
+from .core import _count_inserted_rows, connect, execute, executemany, insert_returning_id
 from .helpers import _utc_now_iso
 
+try:
+    import numpy as np
+except ImportError:  # Dashboard image ships without numpy
+    np = None
+
+# Packed embedding format: 4-byte header (magic "VEC" + version byte) followed
+# by little-endian float32 values. 384 dims -> 1540 bytes instead of ~8KB JSON.
+EMBEDDING_MAGIC = b"VEC"
+EMBEDDING_FORMAT_VERSION = 1
+EMBEDDING_HEADER = EMBEDDING_MAGIC + bytes([EMBEDDING_FORMAT_VERSION])
+EMBEDDING_HEADER_SIZE = len(EMBEDDING_HEADER)
+
+
+def encode_embedding(vec: Sequence[float]) -> bytes:
+    """Pack a vector into the versioned float32 BLOB format."""
+    if np is not None:
+        payload = np.asarray(vec, dtype="<f4").tobytes()
+    else:
+        packed = array("f", vec)
+        if sys.byteorder == "big":
+            packed.byteswap()
+        payload = packed.tobytes()
+    return EMBEDDING_HEADER + payload
+
+
+def is_packed_embedding(raw) -> bool:
+    """True if ``raw`` is in the versioned packed format."""
+    if not isinstance(raw, (bytes, bytearray, memoryview)):
+        return False
+    return bytes(raw[:EMBEDDING_HEADER_SIZE]) == EMBEDDING_HEADER
+
+
+def decode_embedding(raw):
+    """Decode a stored embedding.
+
+    Packed rows decode to a read-only float32 ``np.ndarray`` viewing the row
+    bytes (zero-copy), or a list when numpy is unavailable. Legacy JSON rows
+    (text or bytes) decode to a list of floats.
+    """
+    if is_packed_embedding(raw):
+        if np is not None:
+            return np.frombuffer(raw, dtype="<f4", offset=EMBEDDING_HEADER_SIZE)
+        values = array("f")
+        values.frombytes(bytes(raw[EMBEDDING_HEADER_SIZE:]))
+        if sys.byteorder == "big":
+            values.byteswap()
+        return values.tolist()
+    if isinstance(raw, (bytes, bytearray, memoryview)):
+        raw = bytes(raw).decode("utf-8")
+    if isinstance(raw, str) and raw[:1] == "[":
+        return json.loads(raw)
+    raise ValueError(f"Unrecognized embedding encoding: {raw[:16]!r}")
+
 
 def upsert_ad_member(member_id: str, name: str, party: str = None, committee: str = None) -> bool:
     """Insert or update member. Returns True if new."""
@@ -92,8 +148,8 @@ def get_ad_utterances_for_member(member_id: str, limit: int = 500) -> list[dict]
     ]
 
 
-def upsert_ad_embedding(utterance_id: str, vec: list[float], model_id: str) -> bool:
-    """Store embedding vector as JSON. Returns True if new."""
+def upsert_ad_embedding(utterance_id: str, vec: Sequence[float], model_id: str) -> bool:
+    """Store embedding vector in the packed float32 format. Returns True if new."""
     con = connect()
     cur = execute(
         con,
@@ -101,7 +157,7 @@ def upsert_ad_embedding(utterance_id: str, vec: list[float], model_id: str) -> b
         {"utterance_id": utterance_id},
     )
     exists = cur.fetchone() is not None
-    vec_json = json.dumps(vec)
+    vec_blob = encode_embedding(vec)
     now = _utc_now_iso()
     if not exists:
         execute(
@@ -110,7 +166,7 @@ def upsert_ad_embedding(utterance_id: str, vec: list[float], model_id: str) -> b
                VALUES(:utterance_id, :vec, :model_id, :embedded_at)""",
             {
                 "utterance_id": utterance_id,
-                "vec": vec_json,
+                "vec": vec_blob,
                 "model_id": model_id,
                 "embedded_at": now,
             },
@@ -123,7 +179,7 @@ def upsert_ad_embedding(utterance_id: str, vec: list[float], model_id: str) -> b
                WHERE utterance_id=:utterance_id""",
             {
                 "utterance_id": utterance_id,
-                "vec": vec_json,
+                "vec": vec_blob,
                 "model_id": model_id,
                 "embedded_at": now,
             },
@@ -133,11 +189,50 @@ def upsert_ad_embedding(utterance_id: str, vec: list[float], model_id: str) -> b
     return not exists
 
 
+def bulk_upsert_ad_embeddings(
+    embeddings: Iterable[tuple[str, Sequence[float]]], model_id: str
+) -> int:
+    """
+    Insert or replace many embeddings in one executemany transaction.
+    Each item is (utterance_id, vec). Returns count written.
+    """
+    now = _utc_now_iso()
+    payload = [
+        {
+            "utterance_id": utterance_id,
+            "vec": encode_embedding(vec),
+            "model_id": model_id,
+            "embedded_at": now,
+        }
+        for utterance_id, vec in embeddings
+    ]
+    if not payload:
+        return 0
+    con = connect()
+    try:
+        executemany(
+            con,
+            """INSERT INTO ad_embeddings(utterance_id, vec, model_id, embedded_at)
+               VALUES(:utterance_id, :vec, :model_id, :embedded_at)
+               ON CONFLICT(utterance_id) DO UPDATE SET
+                 vec = excluded.vec,
+                 model_id = excluded.model_id,
+                 embedded_at = excluded.embedded_at""",
+            payload,
+        )
+        con.commit()
+    finally:
+        con.close()
+    return len(payload)
+
+
 def get_ad_embeddings_for_member(
     member_id: str, min_content_length: int = 100
-) -> list[tuple[str, list[float]]]:
+) -> list[tuple[str, Sequence[float]]]:
     """Get all embeddings for a member's utterances. Returns [(utterance_id, vec), ...].
 
+    Packed rows come back as zero-copy float32 arrays (see decode_embedding).
+
     Filters out short utterances (< min_content_length chars) to exclude
     procedural statements that would skew the baseline.
     """
@@ -152,7 +247,40 @@ def get_ad_embeddings_for_member(
     )
     rows = cur.fetchall()
     con.close()
-    return [(r[0], json.loads(r[1])) for r in rows]
+    return [(r[0], decode_embedding(r[1])) for r in rows]
+
+
+def get_ad_embeddings_since(
+    since: str | None = None, member_id: str | None = None, min_content_length: int = 100
+) -> list[tuple[str, str, Sequence[float], str]]:
+    """Get embeddings written at or after ``since`` (all when None).
+
+    Returns [(member_id, utterance_id, vec, embedded_at), ...] ordered by
+    embedded_at, for incremental nearest-neighbour index refreshes. The same
+    content-length filter as get_ad_embeddings_for_member applies.
+    """
+    clauses = ["LENGTH(u.content) >= :min_content_length"]
+    params: dict = {"min_content_length": min_content_length}
+    if since is not None:
+        clauses.append("e.embedded_at >= :since")
+        params["since"] = since
+    if member_id is not None:
+        clauses.append("u.member_id = :member_id")
+        params["member_id"] = member_id
+
+    con = connect()
+    cur = execute(
+        con,
+        f"""SELECT u.member_id, e.utterance_id, e.vec, e.embedded_at
+           FROM ad_embeddings e
+           JOIN ad_utterances u ON e.utterance_id = u.utterance_id
+           WHERE {" AND ".join(clauses)}
+           ORDER BY e.embedded_at, e.utterance_id""",
+        params,
+    )
+    rows = cur.fetchall()
+    con.close()
+    return [(r[0], r[1], decode_embedding(r[2]), r[3]) for r in rows]
 
 
 def insert_ad_baseline(
@@ -330,6 +458,47 @@ def get_ad_utterance_by_id(utterance_id: str) -> dict | None:
     }
 
 
+def get_ad_utterances_by_ids(utterance_ids: Sequence[str]) -> list[dict]:
+    """Get utterances by ID, returned in the order of ``utterance_ids``."""
+    if not utterance_ids:
+        return []
+    placeholders = ", ".join(f":id{i}" for i in range(len(utterance_ids)))
+    con = connect()
+    cur = execute(
+        con,
+        f"""SELECT u.utterance_id, u.member_id, u.hearing_id, u.content, u.spoken_at
+           FROM ad_utterances u
+           WHERE u.utterance_id IN ({placeholders})""",
+        {f"id{i}": uid for i, uid in enumerate(utterance_ids)},
+    )
+    rows = cur.fetchall()
+    con.close()
+    by_id = {
+        r[0]: {
+            "utterance_id": r[0],
+            "member_id": r[1],
+            "hearing_id": r[2],
+            "content": r[3],
+            "spoken_at": r[4],
+        }
+        for r in rows
+    }
+    return [by_id[uid] for uid in utterance_ids if uid in by_id]
+
+
+def get_ad_flagged_utterance_ids(member_id: str) -> set[str]:
+    """Get IDs of a member's utterances that have deviation events."""
+    con = connect()
+    cur = execute(
+        con,
+        "SELECT DISTINCT utterance_id FROM ad_deviation_events WHERE member_id = :member_id",
+        {"member_id": member_id},
+    )
+    rows = cur.fetchall()
+    con.close()
+    return {r[0] for r in rows}
+
+
 def get_ad_typical_utterances(
     member_id: str, exclude_utterance_id: str = None, limit: int = 5
 ) -> list[dict]:
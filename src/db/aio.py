@@ -0,0 +1,160 @@
+"""Async data access for request handlers and middleware.
+
+Sync ``def`` route handlers share Starlette's default threadpool, and DB
+calls made inside ``async`` middleware block the event loop outright. Async
+callers use this module instead:
+
+- Postgres: a ``psycopg_pool.AsyncConnectionPool`` per event loop; queries
+  are awaited without holding a thread.
+- SQLite (or Postgres without ``psycopg_pool``): a dedicated, bounded
+  ``ThreadPoolExecutor``. Its worker threads keep their pooled SQLite
+  connections from :mod:`src.db.pool` between calls.
+
+``run_db()`` runs any sync DB helper on the same executor, so existing
+helpers can be awaited without touching the shared threadpool.
+
+Settings (environment):
+    DB_ASYNC_WORKERS  Threads in the DB executor (default 8)
+    DB_POOL_*         Postgres async pool sizing, shared with pool.py
+"""
+
+import asyncio
+import contextvars
+import functools
+import logging
+import os
+import threading
+import weakref
+from collections.abc import Callable, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, TypeVar
+
+from .core import _is_postgres, _normalize_db_url, _prepare_query, connect, execute
+from .pool import get_pool_settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+Params = Mapping[str, Any] | Sequence[Any] | None
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+# event loop -> {conninfo: task resolving to an open AsyncConnectionPool}
+_async_pg_pools: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+_async_pg_unavailable = False
+
+
+def get_db_executor() -> ThreadPoolExecutor:
+    """The bounded executor that runs blocking DB work for async callers."""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=get_pool_settings().async_workers,
+                    thread_name_prefix="db-async",
+                )
+    return _executor
+
+
+async def run_db(fn: Callable[..., T], *args, **kwargs) -> T:
+    """Run a blocking DB callable on the DB executor and await its result.
+
+    The caller's context variables (e.g. the current tenant) are visible to
+    ``fn``.
+    """
+    ctx = contextvars.copy_context()
+    call = functools.partial(ctx.run, fn, *args, **kwargs)
+    return await asyncio.get_running_loop().run_in_executor(get_db_executor(), call)
+
+
+def _fetch_sync(sql: str, params: Params, one: bool):
+    con = connect()
+    try:
+        cur = execute(con, sql, params)
+        return cur.fetchone() if one else cur.fetchall()
+    finally:
+        con.close()
+
+
+async def _open_async_pg_pool(conninfo: str):
+    from psycopg_pool import AsyncConnectionPool
+
+    settings = get_pool_settings()
+    pool = AsyncConnectionPool(
+        conninfo,
+        min_size=settings.min_size,
+        max_size=settings.max_size,
+        timeout=settings.timeout_seconds,
+        open=False,
+    )
+    await pool.open()
+    return pool
+
+
+async def _get_async_pg_pool():
+    """The running loop's async Postgres pool, or None to use the executor."""
+    global _async_pg_unavailable
+    if _async_pg_unavailable:
+        return None
+    db_url = os.environ.get("DATABASE_URL", "").strip()
+    if not db_url:
+        raise RuntimeError("DATABASE_URL must be set for Postgres backend.")
+    conninfo = _normalize_db_url(db_url)
+
+    loop = asyncio.get_running_loop()
+    pools = _async_pg_pools.setdefault(loop, {})
+    task = pools.get(conninfo)
+    if task is None:
+        try:
+            import psycopg_pool  # noqa: F401
+        except ImportError:
+            logger.warning("psycopg_pool not installed; async Postgres queries use the executor")
+            _async_pg_unavailable = True
+            return None
+        task = loop.create_task(_open_async_pg_pool(conninfo))
+        pools[conninfo] = task
+    try:
+        return await task
+    except Exception:
+        pools.pop(conninfo, None)
+        raise
+
+
+async def _fetch(sql: str, params: Params, one: bool):
+    if _is_postgres():
+        pool = await _get_async_pg_pool()
+        if pool is not None:
+            sql, params = _prepare_query(sql, params)
+            async with pool.connection() as con:
+                cur = await con.execute(sql, params)
+                return await (cur.fetchone() if one else cur.fetchall())
+    return await run_db(_fetch_sync, sql, params, one)
+
+
+async def fetch_all(sql: str, params: Params = None) -> list[tuple]:
+    """Run a read query without blocking the event loop; return all rows."""
+    return await _fetch(sql, params, one=False)
+
+
+async def fetch_one(sql: str, params: Params = None) -> tuple | None:
+    """Run a read query without blocking the event loop; return the first row."""
+    return await _fetch(sql, params, one=True)
+
+
+async def close_async_db() -> None:
+    """Close the running loop's async Postgres pools and stop the DB executor."""
+    global _executor
+    pools = _async_pg_pools.pop(asyncio.get_running_loop(), {})
+    for task in pools.values():
+        try:
+            pool = await task
+            await pool.close()
+        except Exception:
+            logger.warning("Error closing async Postgres pool", exc_info=True)
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=False)
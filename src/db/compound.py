@@ -2,7 +2,7 @@
 
 import json
 
-from .core import connect, execute
+from .core import connect, execute, executemany
 from .helpers import _utc_now_iso
 
 
@@ -40,6 +40,84 @@ def insert_compound_signal(data: dict) -> str | None:
         con.close()
 
 
+def insert_compound_signals(signals: list[dict]) -> list[str]:
+    """
+    Insert compound signals in one batch, skipping compound_ids that already exist.
+
+    Returns:
+        compound_ids actually inserted, in input order.
+    """
+    unique: dict[str, dict] = {}
+    for data in signals:
+        unique.setdefault(data["compound_id"], data)
+    if not unique:
+        return []
+
+    con = connect()
+    try:
+        existing: set[str] = set()
+        ids = list(unique)
+        for start in range(0, len(ids), 500):
+            params = {f"id{i}": cid for i, cid in enumerate(ids[start : start + 500])}
+            placeholders = ", ".join(f":{name}" for name in params)
+            cur = execute(
+                con,
+                f"SELECT compound_id FROM compound_signals WHERE compound_id IN ({placeholders})",
+                params,
+            )
+            existing.update(row[0] for row in cur.fetchall())
+
+        new_rows = [data for cid, data in unique.items() if cid not in existing]
+        executemany(
+            con,
+            """INSERT INTO compound_signals (
+                compound_id, rule_id, severity_score, narrative,
+                temporal_window_hours, member_events, topics, created_at
+            ) VALUES (
+                :compound_id, :rule_id, :severity_score, :narrative,
+                :temporal_window_hours, :member_events, :topics, :created_at
+            ) ON CONFLICT(compound_id) DO NOTHING""",
+            new_rows,
+        )
+        con.commit()
+        return [data["compound_id"] for data in new_rows]
+    finally:
+        con.close()
+
+
+def get_compound_watermarks() -> dict[str, str]:
+    """Get the incremental correlator's per-source watermarks."""
+    con = connect()
+    cur = execute(con, "SELECT source_type, watermark FROM compound_watermarks")
+    rows = cur.fetchall()
+    con.close()
+    return dict(rows)
+
+
+def set_compound_watermarks(watermarks: dict[str, str]) -> None:
+    """Upsert the incremental correlator's per-source watermarks."""
+    if not watermarks:
+        return
+    now = _utc_now_iso()
+    con = connect()
+    try:
+        executemany(
+            con,
+            """INSERT INTO compound_watermarks (source_type, watermark, updated_at)
+               VALUES (:source_type, :watermark, :updated_at)
+               ON CONFLICT(source_type) DO UPDATE SET
+                   watermark = excluded.watermark,
+                   updated_at = excluded.updated_at""",
+            [
+                {"source_type": st, "watermark": mark, "updated_at": now}
+                for st, mark in watermarks.items()
+            ],
+        )
+        con.commit()
+    finally:
+        con.close()
+
+
 def get_compound_signal(compound_id: str) -> dict | None:
     """Get a single compound signal by ID."""
     con = connect()
@@ -3,12 +3,13 @@
 import logging
 import os
 import re
-import sqlite3
 from collections.abc import Iterable, Mapping, Sequence
 from pathlib import Path
 from typing import Any
 from urllib.parse import urlparse, urlunparse
 
+from .pool import acquire_postgres, acquire_sqlite
+
 logger = logging.getLogger(__name__)
 
 ROOT = Path(__file__).resolve().parents[2]
@@ -154,21 +155,23 @@ def get_schema_path() -> Path:
 
 
 def connect():
+    """Check out a connection for the active backend.
+
+    Connections come from the pool in :mod:`src.db.pool`; ``close()`` on the
+    returned object releases it back to the pool.
+    """
     if _is_postgres():
         db_url = os.environ.get("DATABASE_URL", "").strip()
         if not db_url:
             raise RuntimeError("DATABASE_URL must be set for Postgres backend.")
         db_url = _normalize_db_url(db_url)
         try:
-            import psycopg
+            import psycopg  # noqa: F401
         except ImportError as exc:
             raise RuntimeError("psycopg is required for Postgres support.") from exc
-        return psycopg.connect(db_url)
+        return acquire_postgres(db_url)
 
-    DB_PATH.parent.mkdir(parents=True, exist_ok=True)
-    con = sqlite3.connect(DB_PATH, timeout=30)
-    con.execute("PRAGMA journal_mode=WAL")
-    return con
+    return acquire_sqlite(DB_PATH)
 
 
 def init_db():
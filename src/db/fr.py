@@ -1,6 +1,8 @@
 """Federal Register + eCFR database functions."""
 
-from .core import _count_inserted_rows, connect, execute
+from .core import _count_inserted_rows, connect, execute, executemany
+
+_IN_BATCH_SIZE = 900  # Stay under SQLite's ~999 bound-parameter limit
 
 
 def upsert_fr_seen(
@@ -97,11 +99,15 @@ def get_existing_fr_doc_ids(doc_ids: list[str]) -> set[str]:
     if not doc_ids:
         return set()
     con = connect()
+    existing = _select_existing_doc_ids(con, doc_ids)
+    con.close()
+    return existing
+
+
+def _select_existing_doc_ids(con, doc_ids: list[str]) -> set[str]:
     existing: set[str] = set()
-    # SQLite parameter limit is ~999, batch if needed
-    batch_size = 900
-    for i in range(0, len(doc_ids), batch_size):
-        batch = doc_ids[i : i + batch_size]
+    for i in range(0, len(doc_ids), _IN_BATCH_SIZE):
+        batch = doc_ids[i : i + _IN_BATCH_SIZE]
         placeholders = ",".join(f":doc_id_{idx}" for idx in range(len(batch)))
         params = {f"doc_id_{idx}": value for idx, value in enumerate(batch)}
         cur = execute(
@@ -110,10 +116,70 @@ def get_existing_fr_doc_ids(doc_ids: list[str]) -> set[str]:
             params,
         )
         existing.update(row[0] for row in cur.fetchall())
-    con.close()
     return existing
 
 
+def insert_new_fr_seen(packages: list[dict], first_seen_at: str) -> list[dict]:
+    """
+    Bulk equivalent of calling upsert_fr_seen() for each package.
+
+    Loads the doc_ids already seen in the packages' published_date window with
+    one range query, diffs in memory, and inserts only the unseen packages in a
+    single executemany transaction. Candidates missing from the window (e.g. a
+    doc whose stored published_date differs) are re-checked by doc_id before
+    insert, so the result matches the per-row path exactly.
+
+    Each package needs doc_id, published_date and source_url. Returns the newly
+    inserted packages in input order (first occurrence wins for duplicates),
+    each with first_seen_at added.
+    """
+    if not packages:
+        return []
+
+    candidates: dict[str, dict] = {}
+    for pkg in packages:
+        candidates.setdefault(pkg["doc_id"], pkg)
+
+    dates = [pkg["published_date"] for pkg in candidates.values()]
+    con = connect()
+    try:
+        cur = execute(
+            con,
+            "SELECT doc_id FROM fr_seen WHERE published_date BETWEEN :start AND :end",
+            {"start": min(dates), "end": max(dates)},
+        )
+        seen = {row[0] for row in cur.fetchall()}
+        unseen = [doc_id for doc_id in candidates if doc_id not in seen]
+        if unseen:
+            seen |= _select_existing_doc_ids(con, unseen)
+
+        new_docs = [
+            {**pkg, "first_seen_at": first_seen_at}
+            for doc_id, pkg in candidates.items()
+            if doc_id not in seen
+        ]
+        if new_docs:
+            executemany(
+                con,
+                """INSERT INTO fr_seen(doc_id, published_date, first_seen_at, source_url)
+                   VALUES(:doc_id, :published_date, :first_seen_at, :source_url)
+                   ON CONFLICT(doc_id) DO NOTHING""",
+                [
+                    {
+                        "doc_id": doc["doc_id"],
+                        "published_date": doc["published_date"],
+                        "first_seen_at": first_seen_at,
+                        "source_url": doc["source_url"],
+                    }
+                    for doc in new_docs
+                ],
+            )
+            con.commit()
+    finally:
+        con.close()
+    return new_docs
+
+
 def bulk_insert_fr_seen(docs: list[dict]) -> int:
     """
     Insert multiple fr_seen records in a single transaction.
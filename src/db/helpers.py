@@ -5,6 +5,7 @@ import logging
 from datetime import UTC
 
 from .core import connect, execute
+from .runs import bump_source_run_rollup
 
 logger = logging.getLogger(__name__)
 
@@ -48,8 +49,11 @@ def insert_source_run(run_record: dict) -> int | None:
                 "errors_json": json.dumps(run_record["errors"]),
             },
         )
-        con.commit()
         row_id = cur.lastrowid
+        bump_source_run_rollup(
+            con, run_record["source_id"], run_record["ended_at"], run_record["status"]
+        )
+        con.commit()
 
         # Post-write verification: confirm the row exists
         verify_cur = execute(
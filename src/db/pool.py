@@ -0,0 +1,422 @@
+"""Connection pooling behind ``connect()``.
+
+``connect()`` hands out a :class:`PooledConnection` wrapper. Callers keep the
+existing ``con = connect(); ...; con.close()`` contract -- ``close()`` returns
+the underlying connection to its pool instead of tearing it down.
+
+- Postgres: a shared ``psycopg_pool.ConnectionPool`` (thread-safe, bounded).
+- SQLite: per-thread stacks of idle ``sqlite3`` connections. Pragmas run once
+  when a connection is opened, not on every checkout.
+
+Settings (environment):
+    DB_POOL_ENABLED          "0" disables pooling (plain connect/close per call)
+    DB_POOL_MIN_SIZE         Postgres pool minimum connections (default 1)
+    DB_POOL_MAX_SIZE         Postgres pool maximum connections (default 10)
+    DB_POOL_TIMEOUT          Seconds to wait for a free Postgres connection (default 30)
+    DB_POOL_SQLITE_MAX_IDLE  Idle SQLite connections kept per thread (default 4)
+    DB_ASYNC_WORKERS         Threads in the async DB executor (default 8, see aio.py)
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+import weakref
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+SQLITE_TIMEOUT_SECONDS = 30
+
+
+@dataclass(frozen=True)
+class PoolSettings:
+    """Pool configuration resolved from the environment."""
+
+    enabled: bool = True
+    min_size: int = 1
+    max_size: int = 10
+    timeout_seconds: float = 30.0
+    sqlite_max_idle: int = 4
+    async_workers: int = 8
+
+    @classmethod
+    def from_env(cls) -> "PoolSettings":
+        def _int(name: str, default: int) -> int:
+            try:
+                return int(os.environ.get(name, "") or default)
+            except ValueError:
+                logger.warning("Invalid %s, using default %s", name, default)
+                return default
+
+        def _float(name: str, default: float) -> float:
+            try:
+                return float(os.environ.get(name, "") or default)
+            except ValueError:
+                logger.warning("Invalid %s, using default %s", name, default)
+                return default
+
+        enabled = os.environ.get("DB_POOL_ENABLED", "1").strip().lower() not in (
+            "0",
+            "false",
+            "no",
+        )
+        max_size = max(1, _int("DB_POOL_MAX_SIZE", cls.max_size))
+        return cls(
+            enabled=enabled,
+            min_size=min(max(0, _int("DB_POOL_MIN_SIZE", cls.min_size)), max_size),
+            max_size=max_size,
+            timeout_seconds=_float("DB_POOL_TIMEOUT", cls.timeout_seconds),
+            sqlite_max_idle=max(0, _int("DB_POOL_SQLITE_MAX_IDLE", cls.sqlite_max_idle)),
+            async_workers=max(1, _int("DB_ASYNC_WORKERS", cls.async_workers)),
+        )
+
+
+@dataclass
+class PoolStats:
+    """Counters describing pool activity since process start (or last reset)."""
+
+    backend: str = "sqlite"
+    enabled: bool = True
+    connections_opened: int = 0
+    connections_closed: int = 0
+    checkouts: int = 0
+    reuses: int = 0
+    in_use: int = 0
+    idle: int = 0
+    max_size: int | None = None
+    wait_timeouts: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+class PooledConnection:
+    """Proxy around a DB-API connection whose ``close()`` releases it to a pool.
+
+    Attribute access and assignment (``cursor``, ``commit``, ``row_factory``,
+    ...) are forwarded to the underlying connection. Cursors created through
+    the proxy are closed on release so no open statement keeps a stale read
+    snapshot alive on a reused SQLite connection.
+    """
+
+    __slots__ = ("_raw", "_release", "_cursors", "_closed", "__weakref__")
+
+    def __init__(self, raw, release):
+        object.__setattr__(self, "_raw", raw)
+        object.__setattr__(self, "_release", release)
+        object.__setattr__(self, "_cursors", weakref.WeakSet())
+        object.__setattr__(self, "_closed", False)
+
+    @property
+    def raw(self):
+        """The underlying driver connection."""
+        return self._raw
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def cursor(self, *args, **kwargs):
+        if self._closed:
+            raise sqlite3.ProgrammingError("Cannot operate on a closed database.")
+        cur = self._raw.cursor(*args, **kwargs)
+        try:
+            self._cursors.add(cur)
+        except TypeError:
+            pass  # Driver cursor type without weakref support
+        return cur
+
+    def execute(self, *args, **kwargs):
+        cur = self.cursor()
+        cur.execute(*args, **kwargs)
+        return cur
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        object.__setattr__(self, "_closed", True)
+        for cur in list(self._cursors):
+            try:
+                cur.close()
+            except Exception:
+                pass
+        self._release(self._raw)
+
+    def __getattr__(self, name):
+        if name in PooledConnection.__slots__:
+            raise AttributeError(name)
+        return getattr(self._raw, name)
+
+    def __setattr__(self, name, value):
+        setattr(self._raw, name, value)
+
+    def __enter__(self):
+        self._raw.__enter__()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return self._raw.__exit__(exc_type, exc, tb)
+
+    def __del__(self):
+        # Connections dropped without close() still go back to the pool.
+        try:
+            self.close()
+        except Exception:
+            pass
+
+
+def _reset_sqlite(con: sqlite3.Connection) -> bool:
+    """Return a SQLite connection to a clean state. False if it is unusable."""
+    try:
+        if con.in_transaction:
+            con.rollback()
+        con.row_factory = None
+        return True
+    except sqlite3.Error:
+        return False
+
+
+class SQLitePool:
+    """Per-thread cache of idle SQLite connections keyed by database path.
+
+    ``sqlite3`` connections are bound to their creating thread, so each thread
+    keeps its own idle stack. A stack is discarded when the thread asks for a
+    different database path (e.g. tests pointing ``DB_PATH`` at a temp file).
+    """
+
+    def __init__(self, max_idle: int = 4):
+        self.max_idle = max_idle
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._stats = PoolStats(backend="sqlite")
+        # Every thread's idle stack, so close_all() can reach them.
+        self._stacks: list[tuple[weakref.ref, list[sqlite3.Connection]]] = []
+
+    def _thread_state(self, path: str) -> list[sqlite3.Connection]:
+        state = getattr(self._local, "state", None)
+        if state is None or state[0] != path:
+            if state is not None:
+                self._discard(state[1])
+            idle: list[sqlite3.Connection] = []
+            self._local.state = (path, idle)
+            with self._lock:
+                self._stacks = [(t, s) for t, s in self._stacks if t() is not None]
+                self._stacks.append((weakref.ref(threading.current_thread()), idle))
+            return idle
+        return state[1]
+
+    def _discard(self, idle: list[sqlite3.Connection]) -> None:
+        while idle:
+            con = idle.pop()
+            try:
+                con.close()
+            except sqlite3.Error:
+                pass
+            with self._lock:
+                self._stats.connections_closed += 1
+                self._stats.idle -= 1
+
+    def _open(self, path: Path) -> sqlite3.Connection:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        con = sqlite3.connect(path, timeout=SQLITE_TIMEOUT_SECONDS)
+        con.execute("PRAGMA journal_mode=WAL")
+        with self._lock:
+            self._stats.connections_opened += 1
+        return con
+
+    def acquire(self, path: Path) -> PooledConnection:
+        key = str(path)
+        idle = self._thread_state(key)
+        reused = bool(idle)
+        con = idle.pop() if reused else self._open(path)
+        with self._lock:
+            self._stats.checkouts += 1
+            self._stats.in_use += 1
+            if reused:
+                self._stats.reuses += 1
+                self._stats.idle -= 1
+
+        def release(raw: sqlite3.Connection) -> None:
+            self._release(raw, key, idle)
+
+        return PooledConnection(con, release)
+
+    def _release(self, con: sqlite3.Connection, key: str, idle: list) -> None:
+        state = getattr(self._local, "state", None)
+        same_thread_stack = state is not None and state[0] == key and state[1] is idle
+        keep = same_thread_stack and len(idle) < self.max_idle and _reset_sqlite(con)
+        with self._lock:
+            self._stats.in_use -= 1
+            if keep:
+                self._stats.idle += 1
+            else:
+                self._stats.connections_closed += 1
+        if keep:
+            idle.append(con)
+            return
+        try:
+            con.close()
+        except sqlite3.Error:
+            pass
+
+    def close_all(self) -> None:
+        """Close every idle connection in every thread's stack.
+
+        SQLite forbids closing a connection from another thread unless it was
+        opened with ``check_same_thread=False``; those stacks are dropped and
+        left for their owning threads to discard.
+        """
+        with self._lock:
+            stacks, self._stacks = self._stacks, []
+        for _, idle in stacks:
+            self._discard(idle)
+        self._local = threading.local()
+
+    def stats(self) -> PoolStats:
+        with self._lock:
+            return PoolStats(**{**asdict(self._stats), "max_size": self.max_idle})
+
+
+class PostgresPool:
+    """Thin wrapper over ``psycopg_pool.ConnectionPool`` with counters."""
+
+    def __init__(self, conninfo: str, settings: PoolSettings):
+        from psycopg_pool import ConnectionPool
+
+        self._settings = settings
+        self._lock = threading.Lock()
+        self._stats = PoolStats(backend="postgres", max_size=settings.max_size)
+        self._pool = ConnectionPool(
+            conninfo,
+            min_size=settings.min_size,
+            max_size=settings.max_size,
+            timeout=settings.timeout_seconds,
+            open=True,
+        )
+
+    def acquire(self) -> PooledConnection:
+        from psycopg_pool import PoolTimeout
+
+        try:
+            con = self._pool.getconn()
+        except PoolTimeout:
+            with self._lock:
+                self._stats.wait_timeouts += 1
+            raise
+        with self._lock:
+            self._stats.checkouts += 1
+            self._stats.in_use += 1
+        return PooledConnection(con, self._release)
+
+    def _release(self, con) -> None:
+        with self._lock:
+            self._stats.in_use -= 1
+        # putconn() rolls back any open transaction and discards broken connections.
+        self._pool.putconn(con)
+
+    def close_all(self) -> None:
+        self._pool.close()
+
+    def stats(self) -> PoolStats:
+        pool_stats = self._pool.get_stats()
+        with self._lock:
+            stats = PoolStats(**asdict(self._stats))
+        stats.connections_opened = pool_stats.get("connections_num", 0)
+        stats.connections_closed = pool_stats.get("connections_lost", 0)
+        stats.idle = pool_stats.get("pool_available", 0)
+        stats.reuses = max(0, stats.checkouts - stats.connections_opened)
+        return stats
+
+
+_settings: PoolSettings | None = None
+_sqlite_pool: SQLitePool | None = None
+_pg_pools: dict[str, PostgresPool] = {}
+_init_lock = threading.Lock()
+
+
+def get_pool_settings() -> PoolSettings:
+    global _settings
+    if _settings is None:
+        _settings = PoolSettings.from_env()
+    return _settings
+
+
+def _get_sqlite_pool() -> SQLitePool:
+    global _sqlite_pool
+    if _sqlite_pool is None:
+        with _init_lock:
+            if _sqlite_pool is None:
+                _sqlite_pool = SQLitePool(max_idle=get_pool_settings().sqlite_max_idle)
+    return _sqlite_pool
+
+
+def _get_pg_pool(conninfo: str) -> PostgresPool | None:
+    pool = _pg_pools.get(conninfo)
+    if pool is not None:
+        return pool
+    with _init_lock:
+        pool = _pg_pools.get(conninfo)
+        if pool is None:
+            try:
+                pool = PostgresPool(conninfo, get_pool_settings())
+            except ImportError:
+                logger.warning("psycopg_pool not installed; Postgres connections are unpooled")
+                return None
+            _pg_pools[conninfo] = pool
+    return pool
+
+
+def acquire_sqlite(path: Path):
+    """Check out a SQLite connection for ``path``."""
+    if not get_pool_settings().enabled:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        con = sqlite3.connect(path, timeout=SQLITE_TIMEOUT_SECONDS)
+        con.execute("PRAGMA journal_mode=WAL")
+        return con
+    return _get_sqlite_pool().acquire(path)
+
+
+def acquire_postgres(conninfo: str):
+    """Check out a Postgres connection for ``conninfo``."""
+    if get_pool_settings().enabled:
+        pool = _get_pg_pool(conninfo)
+        if pool is not None:
+            return pool.acquire()
+    import psycopg
+
+    return psycopg.connect(conninfo)
+
+
+def get_pool_stats() -> dict[str, Any]:
+    """Snapshot of pool counters for every backend that has been used."""
+    settings = get_pool_settings()
+    pools: list[dict[str, Any]] = []
+    if _sqlite_pool is not None:
+        pools.append(_sqlite_pool.stats().to_dict())
+    for pool in list(_pg_pools.values()):
+        pools.append(pool.stats().to_dict())
+    return {
+        "enabled": settings.enabled,
+        "settings": asdict(settings),
+        "pools": pools,
+    }
+
+
+def close_pool() -> None:
+    """Close all pooled connections and forget cached settings."""
+    global _sqlite_pool, _settings
+    with _init_lock:
+        sqlite_pool, _sqlite_pool = _sqlite_pool, None
+        pg_pools = list(_pg_pools.values())
+        _pg_pools.clear()
+        _settings = None
+    if sqlite_pool is not None:
+        sqlite_pool.close_all()
+    for pool in pg_pools:
+        try:
+            pool.close_all()
+        except Exception:
+            logger.warning("Error closing Postgres pool", exc_info=True)
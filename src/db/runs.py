@@ -0,0 +1,122 @@
+"""source_run_rollups: per source/day/status run counts maintained on insert.
+
+insert_source_run bumps the matching rollup row in the same transaction as
+the run itself, so run statistics can be read from O(days x sources x
+statuses) rollup rows instead of the full source_runs history. The rollups
+can be rebuilt from source_runs (e.g. after rows are deleted outside
+insert_source_run) and checked against it.
+"""
+
+from collections import Counter
+from datetime import UTC, datetime
+
+from .core import connect, execute, executemany
+
+_BUMP_ROLLUP_SQL = """INSERT INTO source_run_rollups(source_id, day, status, run_count)
+   VALUES (:source_id, :day, :status, 1)
+   ON CONFLICT(source_id, day, status) DO UPDATE SET
+       run_count = source_run_rollups.run_count + 1"""
+
+_SCAN_BATCH_SIZE = 5000
+
+
+def rollup_day(ended_at: str) -> str:
+    """UTC calendar day (YYYY-MM-DD) of a run's ended_at, like SQLite DATE()."""
+    try:
+        dt = datetime.fromisoformat(ended_at.replace("Z", "+00:00"))
+    except (AttributeError, ValueError):
+        return (ended_at or "")[:10]
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(UTC)
+    return dt.date().isoformat()
+
+
+def bump_source_run_rollup(con, source_id: str, ended_at: str, status: str) -> None:
+    """Count one run in its rollup row; the caller commits."""
+    execute(
+        con,
+        _BUMP_ROLLUP_SQL,
+        {"source_id": source_id, "day": rollup_day(ended_at), "status": status},
+    )
+
+
+def _count_raw_runs(con) -> Counter:
+    counts: Counter = Counter()
+    cur = execute(con, "SELECT source_id, ended_at, status FROM source_runs")
+    while True:
+        rows = cur.fetchmany(_SCAN_BATCH_SIZE)
+        if not rows:
+            return counts
+        for source_id, ended_at, status in rows:
+            counts[(source_id, rollup_day(ended_at), status)] += 1
+
+
+def _read_rollups(con) -> Counter:
+    cur = execute(con, "SELECT source_id, day, status, run_count FROM source_run_rollups")
+    return Counter({(row[0], row[1], row[2]): row[3] for row in cur.fetchall()})
+
+
+def rebuild_source_run_rollups() -> int:
+    """Recompute every rollup row from source_runs. Returns the number of rows written."""
+    con = connect()
+    try:
+        counts = _count_raw_runs(con)
+        execute(con, "DELETE FROM source_run_rollups")
+        executemany(
+            con,
+            """INSERT INTO source_run_rollups(source_id, day, status, run_count)
+               VALUES (:source_id, :day, :status, :run_count)""",
+            [
+                {"source_id": source_id, "day": day, "status": status, "run_count": n}
+                for (source_id, day, status), n in counts.items()
+            ],
+        )
+        con.commit()
+        return len(counts)
+    except Exception:
+        con.rollback()
+        raise
+    finally:
+        con.close()
+
+
+def check_source_run_rollups() -> list[dict]:
+    """
+    Compare rollups against counts recomputed from source_runs.
+
+    Returns one dict per mismatched (source_id, day, status) with the
+    expected (raw) and actual (rollup) counts; an empty list means consistent.
+    """
+    con = connect()
+    try:
+        expected = _count_raw_runs(con)
+        actual = _read_rollups(con)
+    finally:
+        con.close()
+    mismatches = []
+    for key in sorted(expected.keys() | actual.keys()):
+        if expected[key] != actual[key]:
+            source_id, day, status = key
+            mismatches.append(
+                {
+                    "source_id": source_id,
+                    "day": day,
+                    "status": status,
+                    "expected": expected[key],
+                    "actual": actual[key],
+                }
+            )
+    return mismatches
+
+
+def get_source_run_rollups(con=None) -> list[tuple[str, str, str, int]]:
+    """All (source_id, day, status, run_count) rollup rows."""
+    own = con is None
+    if own:
+        con = connect()
+    try:
+        cur = execute(con, "SELECT source_id, day, status, run_count FROM source_run_rollups")
+        return [(row[0], row[1], row[2], row[3]) for row in cur.fetchall()]
+    finally:
+        if own:
+            con.close()
@@ -6,16 +6,34 @@ Default model: all-MiniLM-L6-v2 (384 dimensions, fast, good quality)
 
 Usage:
     python -m src.embed_utterances [--batch-size N] [--model MODEL]
+    python -m src.embed_utterances --stream [--page-size N] [--checkpoint PATH]
+
+--stream runs a resumable backfill: pending utterances are paged by keyset
+cursor, and DB reads, model.encode and bulk writes overlap in a bounded
+pipeline. Progress is checkpointed after every committed page.
 """
 
 import argparse
+import json
+import os
+import queue
 import sys
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
 
 from . import db
+from .agenda_drift_index import refresh_member_indexes
 
 # Default model - good balance of speed and quality
 DEFAULT_MODEL = "all-MiniLM-L6-v2"
 
+ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_CHECKPOINT = ROOT / "data" / "embed_backfill.checkpoint.json"
+DEFAULT_PAGE_SIZE = 512
+PIPELINE_DEPTH = 2  # Pages buffered between each pipeline stage
+
 
 def get_utterances_without_embeddings(limit: int = 1000) -> list[dict]:
     """Get utterances that don't have embeddings yet."""
@@ -34,6 +52,40 @@ def get_utterances_without_embeddings(limit: int = 1000) -> list[dict]:
     return [{"utterance_id": r[0], "member_id": r[1], "content": r[2]} for r in rows]
 
 
+def get_pending_page(after: str | None, page_size: int) -> list[dict]:
+    """Next page of pending utterances with utterance_id > ``after`` (keyset)."""
+    con = db.connect()
+    cur = db.execute(
+        con,
+        """SELECT u.utterance_id, u.member_id, u.content
+           FROM ad_utterances u
+           LEFT JOIN ad_embeddings e ON u.utterance_id = e.utterance_id
+           WHERE e.utterance_id IS NULL AND u.utterance_id > :after
+           ORDER BY u.utterance_id
+           LIMIT :limit""",
+        {"after": after or "", "limit": page_size},
+    )
+    rows = cur.fetchall()
+    con.close()
+    return [{"utterance_id": r[0], "member_id": r[1], "content": r[2]} for r in rows]
+
+
+def count_pending(after: str | None = None) -> int:
+    """Count pending utterances with utterance_id > ``after``."""
+    con = db.connect()
+    cur = db.execute(
+        con,
+        """SELECT COUNT(*)
+           FROM ad_utterances u
+           LEFT JOIN ad_embeddings e ON u.utterance_id = e.utterance_id
+           WHERE e.utterance_id IS NULL AND u.utterance_id > :after""",
+        {"after": after or ""},
+    )
+    total = cur.fetchone()[0]
+    con.close()
+    return total
+
+
 def get_embedding_stats() -> dict:
     """Get statistics about embeddings."""
     con = db.connect()
@@ -106,21 +158,13 @@ def generate_embeddings(
         convert_to_numpy=True,
     )
 
-    # Convert to list of floats for JSON storage
-    results = []
-    for i, emb in enumerate(embeddings):
-        results.append((ids[i], emb.tolist()))
-
-    return results
+    # Keep rows as float32 arrays; they are packed straight into BLOBs
+    return list(zip(ids, embeddings))
 
 
 def store_embeddings(embeddings: list[tuple[str, list[float]]], model_id: str) -> int:
-    """Store embeddings in database. Returns count stored."""
-    stored = 0
-    for utterance_id, vec in embeddings:
-        db.upsert_ad_embedding(utterance_id, vec, model_id)
-        stored += 1
-    return stored
+    """Store embeddings in database in one bulk transaction. Returns count stored."""
+    return db.bulk_upsert_ad_embeddings(embeddings, model_id)
 
 
 def embed_pending(
@@ -153,12 +197,221 @@ def embed_pending(
 
     print(f"Stored {stored} embeddings")
 
+    # Fold the new rows into the affected members' nearest-neighbour indexes
+    member_ids = sorted({u["member_id"] for u in utterances})
+    refresh_member_indexes(member_ids)
+    print(f"Refreshed similarity indexes for {len(member_ids)} members")
+
     return {
         "embedded": stored,
         "model": model_name,
     }
 
 
+# -----------------------------------------------------------------------------
+# Streaming backfill
+# -----------------------------------------------------------------------------
+
+
+@dataclass
+class BackfillCheckpoint:
+    """Resume point for a streaming backfill, stored as JSON."""
+
+    model: str
+    cursor: str | None = None  # Last utterance_id whose page was committed
+    embedded: int = 0
+
+    @classmethod
+    def load(cls, path: Path, model: str) -> "BackfillCheckpoint":
+        """Load a checkpoint for ``model``; start fresh if absent or for another model."""
+        try:
+            data = json.loads(path.read_text())
+        except FileNotFoundError:
+            return cls(model=model)
+        if data.get("model") != model:
+            print(f"Ignoring checkpoint for model {data.get('model')!r}")
+            return cls(model=model)
+        return cls(model=model, cursor=data.get("cursor"), embedded=data.get("embedded", 0))
+
+    def save(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_text(
+            json.dumps({"model": self.model, "cursor": self.cursor, "embedded": self.embedded})
+        )
+        os.replace(tmp, path)
+
+
+class _ProgressReporter:
+    """Throughput (utterances/sec) and ETA for the streaming backfill."""
+
+    def __init__(self, total: int):
+        self.total = total
+        self.done = 0
+        self.started = time.monotonic()
+
+    def update(self, n: int) -> dict:
+        self.done += n
+        elapsed = max(time.monotonic() - self.started, 1e-9)
+        rate = self.done / elapsed
+        remaining = max(self.total - self.done, 0)
+        eta = remaining / rate if rate > 0 else None
+        print(f"  {self.done}/{self.total} embedded | {rate:.1f} utt/s | ETA {_format_eta(eta)}")
+        return {"done": self.done, "rate": rate, "eta_seconds": eta}
+
+
+def _format_eta(seconds: float | None) -> str:
+    if seconds is None:
+        return "--"
+    minutes, secs = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}h{minutes:02d}m{secs:02d}s" if hours else f"{minutes}m{secs:02d}s"
+
+
+_DONE = object()
+
+
+def _put(q: queue.Queue, item, stop: threading.Event) -> bool:
+    """Blocking put that gives up once the pipeline is stopping."""
+    while not stop.is_set():
+        try:
+            q.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _get(q: queue.Queue, stop: threading.Event):
+    while True:
+        try:
+            return q.get(timeout=0.1)
+        except queue.Empty:
+            if stop.is_set():
+                return _DONE
+
+
+def stream_backfill(
+    model_name: str = DEFAULT_MODEL,
+    batch_size: int = 32,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    limit: int | None = None,
+    checkpoint_path: Path | None = DEFAULT_CHECKPOINT,
+    resume: bool = True,
+    model=None,
+) -> dict:
+    """
+    Embed every pending utterance in a bounded, resumable pipeline.
+
+    A reader thread pages pending utterances by keyset cursor, the calling
+    thread runs model.encode, and a writer thread bulk-upserts each page and
+    then advances the checkpoint. Each stage buffers at most PIPELINE_DEPTH
+    pages, so memory stays flat however large the backlog. After a crash,
+    the run resumes from the last committed page; the checkpoint is removed
+    once nothing is pending past the cursor.
+
+    Returns stats dict.
+    """
+    checkpoint = BackfillCheckpoint(model=model_name)
+    if checkpoint_path is not None and resume:
+        checkpoint = BackfillCheckpoint.load(checkpoint_path, model_name)
+        if checkpoint.cursor:
+            print(f"Resuming after {checkpoint.cursor} ({checkpoint.embedded} already embedded)")
+
+    total = count_pending(checkpoint.cursor)
+    if limit is not None:
+        total = min(total, limit)
+    if total == 0:
+        print("No pending utterances to embed.")
+        return {"embedded": 0, "model": model_name, "rate": 0.0}
+
+    print(f"Found {total} utterances without embeddings")
+    if model is None:
+        model = load_model(model_name)
+
+    read_q: queue.Queue = queue.Queue(maxsize=PIPELINE_DEPTH)
+    write_q: queue.Queue = queue.Queue(maxsize=PIPELINE_DEPTH)
+    stop = threading.Event()
+    errors: list[BaseException] = []
+    member_ids: set[str] = set()
+    progress = _ProgressReporter(total)
+    stats: dict = {}
+
+    def reader():
+        try:
+            cursor, remaining = checkpoint.cursor, total
+            while remaining > 0 and not stop.is_set():
+                page = get_pending_page(cursor, min(page_size, remaining))
+                if not page:
+                    break
+                cursor = page[-1]["utterance_id"]
+                remaining -= len(page)
+                if not _put(read_q, page, stop):
+                    return
+        except BaseException as e:
+            errors.append(e)
+            stop.set()
+        finally:
+            _put(read_q, _DONE, stop)
+
+    def writer():
+        try:
+            while True:
+                item = _get(write_q, stop)
+                if item is _DONE:
+                    return
+                page, embeddings = item
+                db.bulk_upsert_ad_embeddings(embeddings, model_name)
+                member_ids.update(u["member_id"] for u in page)
+                checkpoint.cursor = page[-1]["utterance_id"]
+                checkpoint.embedded += len(page)
+                if checkpoint_path is not None:
+                    checkpoint.save(checkpoint_path)
+                stats.update(progress.update(len(page)))
+        except BaseException as e:
+            errors.append(e)
+            stop.set()
+
+    threads = [
+        threading.Thread(target=reader, name="embed-reader", daemon=True),
+        threading.Thread(target=writer, name="embed-writer", daemon=True),
+    ]
+    for t in threads:
+        t.start()
+
+    try:
+        while True:
+            page = _get(read_q, stop)
+            if page is _DONE:
+                break
+            embeddings = generate_embeddings(
+                model, page, batch_size=batch_size, show_progress=False
+            )
+            if not _put(write_q, (page, embeddings), stop):
+                break
+    except BaseException as e:
+        errors.append(e)
+        stop.set()
+    finally:
+        _put(write_q, _DONE, stop)
+        for t in threads:
+            t.join()
+
+    if errors:
+        raise errors[0]
+
+    if member_ids:
+        refresh_member_indexes(sorted(member_ids))
+    if checkpoint_path is not None and count_pending(checkpoint.cursor) == 0:
+        checkpoint_path.unlink(missing_ok=True)  # Backfill complete
+
+    return {
+        "embedded": progress.done,
+        "model": model_name,
+        "rate": stats.get("rate", 0.0),
+    }
+
+
 def main():
     parser = argparse.ArgumentParser(description="Generate embeddings for utterances")
     parser.add_argument(
@@ -175,8 +428,30 @@ def main():
     parser.add_argument(
         "--limit",
         type=int,
-        default=1000,
-        help="Max utterances to embed (default: 1000)",
+        default=None,
+        help="Max utterances to embed (default: 1000, or all with --stream)",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Resumable streaming backfill of all pending utterances",
+    )
+    parser.add_argument(
+        "--page-size",
+        type=int,
+        default=DEFAULT_PAGE_SIZE,
+        help=f"Utterances per DB page in --stream mode (default: {DEFAULT_PAGE_SIZE})",
+    )
+    parser.add_argument(
+        "--checkpoint",
+        type=Path,
+        default=DEFAULT_CHECKPOINT,
+        help="Checkpoint file for --stream mode",
+    )
+    parser.add_argument(
+        "--no-resume",
+        action="store_true",
+        help="Ignore any existing checkpoint in --stream mode",
     )
     parser.add_argument(
         "--stats",
@@ -199,17 +474,29 @@ def main():
         print(f"Members with embeddings: {stats['members_with_embeddings']}")
         return
 
-    stats = embed_pending(
-        model_name=args.model,
-        batch_size=args.batch_size,
-        limit=args.limit,
-    )
+    if args.stream:
+        stats = stream_backfill(
+            model_name=args.model,
+            batch_size=args.batch_size,
+            page_size=args.page_size,
+            limit=args.limit,
+            checkpoint_path=args.checkpoint,
+            resume=not args.no_resume,
+        )
+    else:
+        stats = embed_pending(
+            model_name=args.model,
+            batch_size=args.batch_size,
+            limit=args.limit or 1000,
+        )
 
     print("\n" + "=" * 40)
     print("SUMMARY")
     print("=" * 40)
     print(f"Embeddings generated: {stats['embedded']}")
     print(f"Model used:           {stats['model']}")
+    if "rate" in stats:
+        print(f"Throughput:           {stats['rate']:.1f} utterances/sec")
 
     # Show overall stats
     overall = get_embedding_stats()
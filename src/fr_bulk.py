@@ -5,14 +5,18 @@ from datetime import UTC, datetime
 from typing import Any
 
 import requests
-from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+from src.http_cache import CachingHTTPAdapter, ParsedCache
+
 HEADERS_JSON = {"Accept": "application/json"}
 
 # Thread-local session with retry/backoff for connection reuse and resilience
 _session_local = threading.local()
 
+# Parsed listings by URL; an unchanged (304) listing is not parsed again
+_listings = ParsedCache()
+
 
 def _get_session() -> requests.Session:
     """Return a thread-local session with retry strategy."""
@@ -25,7 +29,8 @@ def _get_session() -> requests.Session:
             status_forcelist=[429, 500, 502, 503, 504],
             allowed_methods=["HEAD", "GET"],
         )
-        adapter = HTTPAdapter(max_retries=retry)
+        # Conditional GETs: unchanged listings/documents come back 304 and are served from disk
+        adapter = CachingHTTPAdapter(max_retries=retry)
         session.mount("https://", adapter)
         session.mount("http://", adapter)
         session.headers.update(HEADERS_JSON)
@@ -53,7 +58,7 @@ def fetch_bulk_listing_json(bulk_url: str, timeout: int = 30) -> dict[str, Any]:
     url = _to_json_listing_url(bulk_url)
     r = _get_session().get(url, timeout=timeout)
     r.raise_for_status()
-    return r.json()
+    return _listings.json(r)
 
 
 def list_folder_children(bulk_url: str, timeout: int = 30) -> list[dict[str, Any]]:
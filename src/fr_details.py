@@ -15,9 +15,10 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Any
 
 import requests
-from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+from src.http_cache import CachingHTTPAdapter, ParsedCache
+
 logger = logging.getLogger(__name__)
 
 FR_API_BASE = "https://www.federalregister.gov/api/v1"
@@ -33,6 +34,9 @@ FR_FIELDS = [
 # Thread-local session with retry/backoff
 _session: requests.Session | None = None
 
+# Parsed API responses by URL; an unchanged (304) document is not parsed again
+_documents = ParsedCache(max_entries=1024)
+
 
 def _get_session() -> requests.Session:
     """Return a session with retry strategy."""
@@ -45,7 +49,8 @@ def _get_session() -> requests.Session:
             status_forcelist=[429, 500, 502, 503, 504],
             allowed_methods=["HEAD", "GET"],
         )
-        adapter = HTTPAdapter(max_retries=retry)
+        # Conditional GETs: unchanged listings/documents come back 304 and are served from disk
+        adapter = CachingHTTPAdapter(max_retries=retry)
         _session.mount("https://", adapter)
         _session.mount("http://", adapter)
         _session.headers.update({"Accept": "application/json"})
@@ -72,7 +77,7 @@ def fetch_fr_document_details(document_number: str, timeout: int = 30) -> dict[s
             logger.warning(f"FR document not found: {document_number}")
             return None
         response.raise_for_status()
-        return response.json()
+        return _documents.json(response)
     except requests.RequestException as e:
         logger.error(f"Error fetching FR document {document_number}: {e}")
         return None
@@ -107,7 +112,7 @@ def fetch_fr_documents_by_date(
     try:
         response = _get_session().get(url, params=params, timeout=timeout)
         response.raise_for_status()
-        data = response.json()
+        data = _documents.json(response)
         return data.get("results", [])
     except requests.RequestException as e:
         logger.error(f"Error fetching FR documents for {publication_date}: {e}")
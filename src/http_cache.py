@@ -0,0 +1,342 @@
+"""On-disk conditional HTTP cache for the fetchers.
+
+Cron fetchers re-download the same listings and pages every run. The cache
+keeps the last 200 body of each GET URL that came with a validator (ETag or
+Last-Modified) and revalidates it with If-None-Match / If-Modified-Since. A
+304 is served from disk as a 200 response with ``response.from_cache`` set,
+and any validators it refreshes are written back to the entry. ParsedCache
+uses the flag to hand back the value parsed from an unchanged body instead
+of parsing it again.
+
+Mount CachingHTTPAdapter on a requests.Session in place of HTTPAdapter (it
+takes the same arguments, e.g. ``max_retries``). Entries are evicted least
+recently used first once the cache exceeds its byte budget; recency survives
+restarts via the body files' mtimes.
+
+Configuration:
+    HTTP_CACHE_DIR: cache directory (default data/http_cache)
+    HTTP_CACHE_MAX_MB: byte budget in MiB (default 256)
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, replace
+from pathlib import Path
+from typing import Any
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+logger = logging.getLogger(__name__)
+
+ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_CACHE_DIR = ROOT / "data" / "http_cache"
+DEFAULT_MAX_MB = 256
+
+# Headers replayed on a cached response; transfer headers describe the
+# original wire encoding, not the decoded body we store.
+_STORED_HEADERS = ("Content-Type", "ETag", "Last-Modified")
+_VALIDATOR_HEADERS = ("ETag", "Last-Modified")
+
+
+@dataclass
+class CacheEntry:
+    url: str
+    etag: str | None
+    last_modified: str | None
+    headers: dict[str, str]
+    size: int
+
+
+class HTTPCache:
+    """Size-bounded LRU store of response bodies plus their validators."""
+
+    def __init__(self, directory: Path | None = None, max_bytes: int | None = None):
+        self.directory = Path(directory or os.environ.get("HTTP_CACHE_DIR", DEFAULT_CACHE_DIR))
+        if max_bytes is None:
+            max_bytes = int(os.environ.get("HTTP_CACHE_MAX_MB", DEFAULT_MAX_MB)) * 1024 * 1024
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._total_bytes = 0
+        self._metrics = {"hits": 0, "misses": 0, "bytes_saved": 0, "stores": 0, "evictions": 0}
+        self._load()
+
+    @staticmethod
+    def _key(url: str) -> str:
+        return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+    def _paths(self, key: str) -> tuple[Path, Path]:
+        return self.directory / f"{key}.json", self.directory / f"{key}.body"
+
+    def _load(self) -> None:
+        """Index existing entries, least recently used first."""
+        if not self.directory.exists():
+            return
+        found = []
+        for meta_path in self.directory.glob("*.json"):
+            body_path = meta_path.with_suffix(".body")
+            try:
+                entry = CacheEntry(**json.loads(meta_path.read_text()))
+                found.append((body_path.stat().st_mtime, meta_path.stem, entry))
+            except (OSError, ValueError, TypeError):
+                continue
+        for _, key, entry in sorted(found, key=lambda item: item[0]):
+            self._entries[key] = entry
+            self._total_bytes += entry.size
+
+    def lookup(self, url: str) -> CacheEntry | None:
+        with self._lock:
+            return self._entries.get(self._key(url))
+
+    def read_body(self, entry: CacheEntry) -> bytes | None:
+        """Return the cached body and mark the entry recently used (None if it vanished)."""
+        key = self._key(entry.url)
+        _, body_path = self._paths(key)
+        try:
+            body = body_path.read_bytes()
+            os.utime(body_path)
+        except OSError:
+            self._drop(key)
+            return None
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+        return body
+
+    def store(self, url: str, body: bytes, headers) -> None:
+        """Store a 200 body with its validators; bodies over the budget are skipped."""
+        if len(body) > self.max_bytes:
+            return
+        entry = CacheEntry(
+            url=url,
+            etag=headers.get("ETag"),
+            last_modified=headers.get("Last-Modified"),
+            headers={h: headers[h] for h in _STORED_HEADERS if h in headers},
+            size=len(body),
+        )
+        key = self._key(url)
+        meta_path, body_path = self._paths(key)
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            _write_atomic(body_path, body)
+            _write_atomic(meta_path, json.dumps(asdict(entry)).encode("utf-8"))
+        except OSError as e:
+            logger.warning("HTTP cache write failed for %s: %s", url, e)
+            return
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._total_bytes -= previous.size
+            self._entries[key] = entry
+            self._total_bytes += entry.size
+            self._metrics["stores"] += 1
+            evicted = []
+            while self._total_bytes > self.max_bytes and self._entries:
+                old_key, old = self._entries.popitem(last=False)
+                self._total_bytes -= old.size
+                self._metrics["evictions"] += 1
+                evicted.append(old_key)
+        for old_key in evicted:
+            self._unlink(old_key)
+
+    def refresh_validators(self, entry: CacheEntry, headers) -> CacheEntry:
+        """Record validators a 304 sent for an entry; returns the up-to-date entry."""
+        refreshed = {h: headers[h] for h in _VALIDATOR_HEADERS if h in headers}
+        updated = replace(
+            entry,
+            etag=refreshed.get("ETag", entry.etag),
+            last_modified=refreshed.get("Last-Modified", entry.last_modified),
+            headers={**entry.headers, **refreshed},
+        )
+        if updated == entry:
+            return entry
+        key = self._key(entry.url)
+        meta_path, _ = self._paths(key)
+        try:
+            _write_atomic(meta_path, json.dumps(asdict(updated)).encode("utf-8"))
+        except OSError as e:
+            logger.warning("HTTP cache write failed for %s: %s", entry.url, e)
+            return entry
+        with self._lock:
+            if key in self._entries:
+                self._entries[key] = updated
+        return updated
+
+    def _drop(self, key: str) -> None:
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._total_bytes -= entry.size
+        self._unlink(key)
+
+    def _unlink(self, key: str) -> None:
+        for path in self._paths(key):
+            path.unlink(missing_ok=True)
+
+    def record_hit(self, size: int) -> None:
+        with self._lock:
+            self._metrics["hits"] += 1
+            self._metrics["bytes_saved"] += size
+
+    def record_miss(self) -> None:
+        with self._lock:
+            self._metrics["misses"] += 1
+
+    def stats(self) -> dict[str, int]:
+        """Hit/miss/bytes-saved counters since start, plus current size."""
+        with self._lock:
+            return {**self._metrics, "entries": len(self._entries), "bytes": self._total_bytes}
+
+    def clear(self) -> None:
+        with self._lock:
+            keys = list(self._entries)
+            self._entries.clear()
+            self._total_bytes = 0
+        for key in keys:
+            self._unlink(key)
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+_shared_cache: HTTPCache | None = None
+_shared_lock = threading.Lock()
+
+
+def get_http_cache() -> HTTPCache:
+    """Return the process-wide cache, created on first use."""
+    global _shared_cache
+    with _shared_lock:
+        if _shared_cache is None:
+            _shared_cache = HTTPCache()
+        return _shared_cache
+
+
+class CachingHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter that revalidates GETs against an HTTPCache.
+
+    Streaming requests and requests that already carry their own validators
+    pass straight through.
+    """
+
+    def __init__(self, *args, cache: HTTPCache | None = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._cache = cache
+
+    @property
+    def cache(self) -> HTTPCache:
+        return self._cache or get_http_cache()
+
+    def send(self, request, stream=False, **kwargs):
+        if (
+            request.method != "GET"
+            or stream
+            or "If-None-Match" in request.headers
+            or "If-Modified-Since" in request.headers
+        ):
+            return super().send(request, stream=stream, **kwargs)
+
+        cache = self.cache
+        entry = cache.lookup(request.url)
+        if entry is not None:
+            if entry.etag:
+                request.headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                request.headers["If-Modified-Since"] = entry.last_modified
+
+        response = super().send(request, stream=stream, **kwargs)
+
+        if response.status_code == 304 and entry is not None:
+            body = cache.read_body(entry)
+            _ = response.content  # drain the empty body so the connection is reused
+            if body is not None:
+                cache.record_hit(len(body))
+                entry = cache.refresh_validators(entry, response.headers)
+                return self._cached_response(request, response, entry, body)
+            # Body evicted between lookup and 304: fetch it unconditionally
+            request.headers.pop("If-None-Match", None)
+            request.headers.pop("If-Modified-Since", None)
+            response = super().send(request, stream=stream, **kwargs)
+
+        response.from_cache = False
+        if response.status_code == 200:
+            cache.record_miss()
+            if "ETag" in response.headers or "Last-Modified" in response.headers:
+                cache.store(request.url, response.content, response.headers)
+        return response
+
+    def _cached_response(self, request, not_modified, entry: CacheEntry, body: bytes):
+        response = requests.Response()
+        response.status_code = 200
+        response.reason = "OK"
+        # entry already carries any validators the 304 refreshed
+        headers = CaseInsensitiveDict(entry.headers)
+        for name in ("Date", "Cache-Control"):
+            if name in not_modified.headers:
+                headers[name] = not_modified.headers[name]
+        headers["Content-Length"] = str(len(body))
+        response.headers = headers
+        response.encoding = get_encoding_from_headers(headers)
+        response._content = body
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        response.elapsed = not_modified.elapsed
+        response.from_cache = True
+        return response
+
+
+class ParsedCache:
+    """Bounded per-URL memo of values parsed from response bodies.
+
+    ``parse(response, fn)`` runs ``fn(response)`` on a fresh body and keeps the
+    result when the response carries validators. When the response was
+    served from the HTTP cache with the same validators, the kept value is
+    returned without parsing. Callers must treat returned values as
+    read-only, since later calls share them.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._values: OrderedDict[str, tuple[tuple, Any]] = OrderedDict()
+        self._metrics = {"hits": 0, "misses": 0}
+
+    def parse(self, response: requests.Response, fn: Callable[[requests.Response], Any]) -> Any:
+        version = tuple(response.headers.get(h) for h in _VALIDATOR_HEADERS)
+        if getattr(response, "from_cache", False) is True:
+            with self._lock:
+                kept = self._values.get(response.url)
+                if kept is not None and kept[0] == version:
+                    self._values.move_to_end(response.url)
+                    self._metrics["hits"] += 1
+                    return kept[1]
+        value = fn(response)
+        with self._lock:
+            self._metrics["misses"] += 1
+            if any(version):
+                self._values[response.url] = (version, value)
+                self._values.move_to_end(response.url)
+                while len(self._values) > self.max_entries:
+                    self._values.popitem(last=False)
+        return value
+
+    def json(self, response: requests.Response) -> Any:
+        """``response.json()``, reusing the value parsed from an unchanged body."""
+        return self.parse(response, lambda r: r.json())
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {**self._metrics, "entries": len(self._values)}
@@ -0,0 +1,139 @@
+"""Compiled keyword taxonomies for topic, theme and severity tagging.
+
+A taxonomy maps labels (topics, themes, severities) to keyword lists. Several
+modules tag text this way; instead of running ``kw in text`` (or one regex)
+per keyword per label, a KeywordTaxonomy folds every keyword into a single
+alternation regex built once at import time and finds all hits in one scan.
+
+Two details keep results identical to the per-keyword loops:
+- The scan restarts one character after each match start, so overlapping
+  keywords starting at different positions are all seen.
+- Keywords starting at the same position are prefixes of the longest one
+  matched there; every keyword occurring inside a matched keyword is
+  precomputed, so those hits are added without re-scanning.
+
+RegexTaxonomy covers taxonomies written as arbitrary regex patterns (spans
+like ``\\bdecision\\b.*\\bcourt\\b``), which cannot be folded that way. Its
+patterns are compiled once and each label is gated by one combined regex.
+"""
+
+import re
+from collections.abc import Mapping, Sequence
+
+
+def _is_word(ch: str) -> bool:
+    return ch.isalnum() or ch == "_"
+
+
+def _occurs_within(inner: str, outer: str, whole_words: bool) -> bool:
+    """True if ``inner`` matches somewhere inside an occurrence of ``outer``.
+
+    For whole-word taxonomies the boundaries of ``inner`` must hold inside
+    ``outer``; at the ends of ``outer`` they are inherited from its own match.
+    """
+    start = outer.find(inner)
+    while start != -1:
+        if not whole_words:
+            return True
+        end = start + len(inner)
+        starts_ok = start == 0 or _is_word(outer[start - 1]) != _is_word(outer[start])
+        ends_ok = end == len(outer) or _is_word(outer[end - 1]) != _is_word(outer[end])
+        if starts_ok and ends_ok:
+            return True
+        start = outer.find(inner, start + 1)
+    return False
+
+
+class KeywordTaxonomy:
+    """Label -> keywords, matched case-insensitively in a single regex scan.
+
+    With ``whole_words=True`` keywords only match on word boundaries (like
+    ``\\bkw\\b``); otherwise any substring occurrence counts.
+    """
+
+    __slots__ = ("labels", "_keywords", "_label_keywords", "_pattern", "_contained")
+
+    def __init__(self, taxonomy: Mapping[str, Sequence[str]], whole_words: bool = False):
+        self.labels = tuple(taxonomy)
+        self._label_keywords: dict[str, tuple[str, ...]] = {}
+        keywords: set[str] = set()
+        for label, label_keywords in taxonomy.items():
+            lowered = tuple(kw.lower() for kw in label_keywords)
+            if not all(lowered):
+                raise ValueError(f"Empty keyword in taxonomy label {label!r}")
+            self._label_keywords[label] = lowered
+            keywords.update(lowered)
+
+        # Longest first, so each match is the longest keyword at its position
+        ordered = sorted(keywords, key=lambda kw: (-len(kw), kw))
+        body = "|".join(re.escape(kw) for kw in ordered)
+        self._pattern = re.compile(rf"\b(?:{body})\b" if whole_words else body)
+        self._keywords = frozenset(ordered)
+        self._contained = {
+            kw: frozenset(other for other in ordered if _occurs_within(other, kw, whole_words))
+            for kw in ordered
+        }
+
+    def keywords(self, text: str) -> frozenset[str]:
+        """Return every (lowercased) keyword that occurs in ``text``."""
+        text = text.lower()
+        search = self._pattern.search
+        contained = self._contained
+        found: set[str] = set()
+        match = search(text)
+        while match:
+            found |= contained[match.group()]
+            match = search(text, match.start() + 1)
+        return frozenset(found)
+
+    def matches(self, text: str) -> dict[str, list[str]]:
+        """Label -> keywords hit (in declared order), for labels with any hit."""
+        hits = self.keywords(text)
+        if not hits:
+            return {}
+        result = {}
+        for label, label_keywords in self._label_keywords.items():
+            matched = [kw for kw in label_keywords if kw in hits]
+            if matched:
+                result[label] = matched
+        return result
+
+    def tag(self, text: str) -> list[str]:
+        """Labels with at least one keyword in ``text``, in taxonomy order."""
+        hits = self.keywords(text)
+        if not hits:
+            return []
+        return [
+            label
+            for label, label_keywords in self._label_keywords.items()
+            if not hits.isdisjoint(label_keywords)
+        ]
+
+
+class RegexTaxonomy:
+    """Label -> regex patterns; counts how many distinct patterns match per label."""
+
+    __slots__ = ("labels", "_patterns", "_gates", "_any")
+
+    def __init__(self, taxonomy: Mapping[str, Sequence[str]], flags: int = re.IGNORECASE):
+        self.labels = tuple(taxonomy)
+        self._patterns = {
+            label: tuple(re.compile(p, flags) for p in patterns)
+            for label, patterns in taxonomy.items()
+        }
+        self._gates = {
+            label: re.compile("|".join(f"(?:{p})" for p in patterns), flags)
+            for label, patterns in taxonomy.items()
+            if patterns
+        }
+        self._any = re.compile("|".join(f"(?:{g.pattern})" for g in self._gates.values()), flags)
+
+    def counts(self, text: str) -> dict[str, int]:
+        """Label -> number of its patterns found in ``text``, for labels with any hit."""
+        if not self._gates or not self._any.search(text):
+            return {}
+        result = {}
+        for label, gate in self._gates.items():
+            if gate.search(text):
+                result[label] = sum(1 for p in self._patterns[label] if p.search(text))
+        return result
@@ -8,7 +8,8 @@ Provides:
 - Risk classification
 """
 
-from .features import FeatureExtractor
+from .cache import ScoreCache, get_score_cache
+from .features import FeatureExtractor, FeatureMatrix
 from .models import PredictionConfig, PredictionResult
 from .scoring import ScoringResult, SignalScorer
 
@@ -16,6 +17,9 @@ __all__ = [
     "SignalScorer",
     "ScoringResult",
     "FeatureExtractor",
+    "FeatureMatrix",
     "PredictionConfig",
     "PredictionResult",
+    "ScoreCache",
+    "get_score_cache",
 ]
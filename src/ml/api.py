@@ -3,15 +3,17 @@ API endpoints for predictive scoring.
 """
 
 import logging
+from typing import Any
 
 from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel
 
 from ..auth.models import UserRole
 from ..auth.rbac import RoleChecker
-from ..db import connect, execute
+from ..db import connect, execute, run_db
+from .cache import get_score_cache
 from .models import BatchPredictionRequest, PredictionConfig
-from .scoring import SignalScorer
+from .scoring import ScoringResult, SignalScorer
 
 logger = logging.getLogger(__name__)
 
@@ -42,6 +44,119 @@ class ScoreResponse(BaseModel):
     recommendations: list[str]
 
 
+class BatchScoreItem(ScoreResponse):
+    """Scoring response for one signal of a batch."""
+
+    features: dict[str, Any] | None = None
+
+
+class BatchScoreResponse(BaseModel):
+    """Batch scoring response."""
+
+    results: list[BatchScoreItem]
+    count: int
+    not_found: list[str]
+    prediction_types: list[str]
+
+
+# signal_type -> SELECT for that signal table, and the id column to filter on.
+# Each row is (id, title, content, date columns..., source_type); see
+# _row_to_signal.
+_SIGNAL_QUERIES = {
+    "fr": (
+        """
+        SELECT f.doc_id, f.title, s.summary, f.effective_date,
+               f.comments_close_date, 'federal_register' as source_type
+        FROM fr_seen f
+        LEFT JOIN fr_summaries s ON f.doc_id = s.doc_id
+        """,
+        "f.doc_id",
+    ),
+    "state": (
+        """
+        SELECT s.signal_id, s.title, s.content, s.pub_date,
+               ss.source_type
+        FROM state_signals s
+        JOIN state_sources ss ON s.source_id = ss.source_id
+        """,
+        "s.signal_id",
+    ),
+    "oversight": (
+        """
+        SELECT event_id, title, summary, pub_timestamp, primary_source_type
+        FROM om_events
+        """,
+        "event_id",
+    ),
+    "battlefield": (
+        """
+        SELECT vehicle_id, title, attack_surface, status_date, source_type
+        FROM bf_vehicles
+        """,
+        "vehicle_id",
+    ),
+}
+
+# Keep IN (...) lists well under SQLite's bound-parameter limit
+_IN_BATCH_SIZE = 500
+
+
+def _row_to_signal(signal_type: str, row) -> dict:
+    if signal_type == "fr":
+        return {
+            "signal_id": row[0],
+            "title": row[1],
+            "content": row[2],
+            "effective_date": row[3],
+            "comments_close_date": row[4],
+            "source_type": row[5],
+        }
+    signal = {
+        "signal_id": row[0],
+        "title": row[1],
+        "content": row[2],
+        "pub_date": row[3],
+        "source_type": row[4],
+    }
+    if signal_type == "battlefield":
+        signal["source_type"] = row[4] or "battlefield"
+    return signal
+
+
+def _load_signals(signal_type: str, signal_ids: list[str]) -> dict[str, dict]:
+    """Fetch signals of one type by id; returns {signal_id: signal_data}."""
+    if signal_type not in _SIGNAL_QUERIES:
+        raise HTTPException(status_code=400, detail=f"Unknown signal type: {signal_type}")
+    query, id_column = _SIGNAL_QUERIES[signal_type]
+
+    signals: dict[str, dict] = {}
+    con = connect()
+    try:
+        for i in range(0, len(signal_ids), _IN_BATCH_SIZE):
+            batch = signal_ids[i : i + _IN_BATCH_SIZE]
+            placeholders = ",".join(f":signal_id_{idx}" for idx in range(len(batch)))
+            params = {f"signal_id_{idx}": value for idx, value in enumerate(batch)}
+            cur = execute(con, f"{query} WHERE {id_column} IN ({placeholders})", params)
+            for row in cur.fetchall():
+                signals[row[0]] = _row_to_signal(signal_type, row)
+    finally:
+        con.close()
+    return signals
+
+
+def _to_response(result: ScoringResult) -> ScoreResponse:
+    return ScoreResponse(
+        signal_id=result.signal_id,
+        importance_score=result.importance_score,
+        impact_score=result.impact_score,
+        urgency_score=result.urgency_score,
+        overall_risk=result.overall_risk.value,
+        overall_score=result.overall_score,
+        confidence=result.confidence,
+        recommendations=result.recommendations,
+    )
+
+
 @router.post("/score", response_model=ScoreResponse)
 async def score_signal(
     request: ScoreRequest,
@@ -66,16 +181,7 @@ async def score_signal(
 
     result = scorer.score(signal_data)
 
-    return ScoreResponse(
-        signal_id=result.signal_id,
-        importance_score=result.importance_score,
-        impact_score=result.impact_score,
-        urgency_score=result.urgency_score,
-        overall_risk=result.overall_risk.value,
-        overall_score=result.overall_score,
-        confidence=result.confidence,
-        recommendations=result.recommendations,
-    )
+    return _to_response(result)
 
 
 @router.get("/score/{signal_type}/{signal_id}", response_model=ScoreResponse)
@@ -90,100 +196,7 @@ async def score_existing_signal(
     Supported signal types: fr, state, oversight, battlefield
     Requires ANALYST role.
     """
-    con = connect()
-    signal_data = None
-
-    try:
-        if signal_type == "fr":
-            cur = execute(
-                con,
-                """
-                SELECT f.doc_id, f.title, s.summary, f.effective_date,
-                       f.comments_close_date, 'federal_register' as source_type
-                FROM fr_seen f
-                LEFT JOIN fr_summaries s ON f.doc_id = s.doc_id
-                WHERE f.doc_id = :signal_id
-                """,
-                {"signal_id": signal_id},
-            )
-            row = cur.fetchone()
-            if row:
-                signal_data = {
-                    "signal_id": row[0],
-                    "title": row[1],
-                    "content": row[2],
-                    "effective_date": row[3],
-                    "comments_close_date": row[4],
-                    "source_type": row[5],
-                }
-
-        elif signal_type == "state":
-            cur = execute(
-                con,
-                """
-                SELECT s.signal_id, s.title, s.content, s.pub_date,
-                       ss.source_type
-                FROM state_signals s
-                JOIN state_sources ss ON s.source_id = ss.source_id
-                WHERE s.signal_id = :signal_id
-                """,
-                {"signal_id": signal_id},
-            )
-            row = cur.fetchone()
-            if row:
-                signal_data = {
-                    "signal_id": row[0],
-                    "title": row[1],
-                    "content": row[2],
-                    "pub_date": row[3],
-                    "source_type": row[4],
-                }
-
-        elif signal_type == "oversight":
-            cur = execute(
-                con,
-                """
-                SELECT event_id, title, summary, pub_timestamp, primary_source_type
-                FROM om_events
-                WHERE event_id = :signal_id
-                """,
-                {"signal_id": signal_id},
-            )
-            row = cur.fetchone()
-            if row:
-                signal_data = {
-                    "signal_id": row[0],
-                    "title": row[1],
-                    "content": row[2],
-                    "pub_date": row[3],
-                    "source_type": row[4],
-                }
-
-        elif signal_type == "battlefield":
-            cur = execute(
-                con,
-                """
-                SELECT vehicle_id, title, attack_surface, status_date, source_type
-                FROM bf_vehicles
-                WHERE vehicle_id = :signal_id
-                """,
-                {"signal_id": signal_id},
-            )
-            row = cur.fetchone()
-            if row:
-                signal_data = {
-                    "signal_id": row[0],
-                    "title": row[1],
-                    "content": row[2],
-                    "pub_date": row[3],
-                    "source_type": row[4] or "battlefield",
-                }
-
-        else:
-            raise HTTPException(status_code=400, detail=f"Unknown signal type: {signal_type}")
-
-    finally:
-        con.close()
+    signal_data = _load_signals(signal_type, [signal_id]).get(signal_id)
 
     if not signal_data:
         raise HTTPException(status_code=404, detail=f"Signal not found: {signal_id}")
@@ -191,19 +204,10 @@ async def score_existing_signal(
     scorer = SignalScorer()
     result = scorer.score(signal_data)
 
-    return ScoreResponse(
-        signal_id=result.signal_id,
-        importance_score=result.importance_score,
-        impact_score=result.impact_score,
-        urgency_score=result.urgency_score,
-        overall_risk=result.overall_risk.value,
-        overall_score=result.overall_score,
-        confidence=result.confidence,
-        recommendations=result.recommendations,
-    )
+    return _to_response(result)
 
 
-@router.post("/score/batch")
+@router.post("/score/batch", response_model=BatchScoreResponse)
 async def score_batch_signals(
     request: BatchPredictionRequest,
     _: None = Depends(RoleChecker(UserRole.ANALYST)),
@@ -211,19 +215,40 @@ async def score_batch_signals(
     """
     Score multiple signals in batch.
 
-    Provide signal IDs and optional prediction types.
+    Provide a signal type and signal IDs. All found signals are scored in
+    one vectorized pass; results below ``min_confidence`` are left out.
     Requires ANALYST role.
     """
     if len(request.signal_ids) > 100:
         raise HTTPException(status_code=400, detail="Maximum 100 signals per batch")
 
-    # For now, just return a placeholder
-    # In production, this would query signals and score them
-    return {
-        "message": "Batch scoring not yet implemented",
-        "signal_count": len(request.signal_ids),
-        "prediction_types": [pt.value for pt in request.prediction_types],
-    }
+    found = await run_db(_load_signals, request.signal_type, request.signal_ids)
+    signal_ids = [sid for sid in dict.fromkeys(request.signal_ids) if sid in found]
+    signals = [found[sid] for sid in signal_ids]
+
+    scorer = SignalScorer()
+    results = scorer.score_batch(signals)
+    features = (
+        scorer.feature_extractor.extract_batch(signals).to_feature_sets()
+        if request.include_features
+        else [None] * len(signals)
+    )
+
+    scored = [
+        BatchScoreItem(
+            **_to_response(result).model_dump(),
+            features=feature_set.model_dump() if feature_set else None,
+        )
+        for result, feature_set in zip(results, features)
+        if result.confidence >= request.min_confidence
+    ]
+
+    return BatchScoreResponse(
+        results=scored,
+        count=len(scored),
+        not_found=[sid for sid in request.signal_ids if sid not in found],
+        prediction_types=[pt.value for pt in request.prediction_types],
+    )
 
 
 @router.get("/config")
@@ -246,7 +271,7 @@ async def get_scoring_config(_: None = Depends(RoleChecker(UserRole.ANALYST))):
 
 @router.get("/stats")
 async def get_scoring_stats(_: None = Depends(RoleChecker(UserRole.VIEWER))):
-    """Get scoring statistics."""
+    """Get scoring statistics, including score cache hit rate."""
     # In production, this would aggregate from scored signals
     return {
         "total_scored": 0,
@@ -261,4 +286,5 @@ async def get_scoring_stats(_: None = Depends(RoleChecker(UserRole.VIEWER))):
             "minimal": 0,
         },
         "model_version": PredictionConfig().version,
+        "score_cache": get_score_cache().stats(),
     }
@@ -0,0 +1,268 @@
+"""
+Score memoization for SignalScorer.
+
+A signal's scores depend only on its searchable text (title, summary and
+content, lowercased), its source_type, the whole days until its effective
+date and comment deadline, and the scoring configuration. ScoreCache keys
+results by a SHA-256 hash of exactly those inputs. Rescoring an unchanged
+signal is then a lookup, without feature extraction. Because the day counts
+are part of the key, a cached score never outlives the day it was computed
+for.
+
+The configuration fingerprint covers PredictionConfig and the scoring rules
+version. Changing either makes every older entry unreachable. Persisted
+rows from other fingerprints are deleted the first time a process writes
+under a new one.
+
+Entries are kept in an in-process LRU. Optionally, they are also kept in
+the ml_score_cache table, so separate runs (re-ingests, backfills) share
+them.
+
+Configuration:
+    ML_SCORE_CACHE_MAX_ENTRIES: in-process LRU bound (default 10000)
+    ML_SCORE_CACHE_PERSIST: also read/write ml_score_cache (default off)
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable, Sequence
+from datetime import UTC, datetime
+from typing import Any, NamedTuple
+
+from .models import PredictionConfig
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 10_000
+
+# Keep IN (...) lists well under SQLite's bound-parameter limit
+_IN_BATCH_SIZE = 500
+
+
+class CachedScore(NamedTuple):
+    """The signal-independent part of a ScoringResult."""
+
+    importance_score: float
+    impact_score: float
+    urgency_score: float
+    overall_risk: str
+    overall_score: float
+    confidence: float
+    recommendations: tuple[str, ...]
+
+
+def config_fingerprint(config: PredictionConfig, rules_version: str) -> str:
+    """Hash of everything besides the signal that scoring depends on."""
+    payload = json.dumps([rules_version, config.model_dump(mode="json")], sort_keys=True)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def score_cache_key(
+    config_hash: str,
+    text: str,
+    source_type: str,
+    days_until_effective: int | None,
+    days_until_deadline: int | None,
+) -> str:
+    """Cache key for one signal's scoring inputs (see module docstring)."""
+    text_hash = hashlib.sha256(text.encode("utf-8", "surrogatepass")).hexdigest()
+    payload = json.dumps(
+        [config_hash, text_hash, source_type, days_until_effective, days_until_deadline]
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def _env_flag(name: str) -> bool:
+    return os.environ.get(name, "").strip().lower() in ("1", "true", "yes", "on")
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.environ.get(name, "") or default)
+    except ValueError:
+        logger.warning("Invalid %s, using default %s", name, default)
+        return default
+
+
+class ScoreCache:
+    """Thread-safe LRU of CachedScore by cache key, optionally backed by ml_score_cache."""
+
+    def __init__(self, max_entries: int | None = None, persist: bool | None = None):
+        if max_entries is None:
+            max_entries = _env_int("ML_SCORE_CACHE_MAX_ENTRIES", DEFAULT_MAX_ENTRIES)
+        if persist is None:
+            persist = _env_flag("ML_SCORE_CACHE_PERSIST")
+        self.max_entries = max(1, max_entries)
+        self.persist = persist
+        self._entries: OrderedDict[str, CachedScore] = OrderedDict()
+        self._lock = threading.Lock()
+        self._purged_configs: set[str] = set()
+        self._metrics = {
+            "hits": 0,
+            "persisted_hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "persist_errors": 0,
+        }
+
+    def get(self, key: str) -> CachedScore | None:
+        return self.get_many([key]).get(key)
+
+    def get_many(self, keys: Sequence[str]) -> dict[str, CachedScore]:
+        """Cached scores for whichever of ``keys`` are known."""
+        found: dict[str, CachedScore] = {}
+        missing: list[str] = []
+        with self._lock:
+            for key in dict.fromkeys(keys):
+                entry = self._entries.get(key)
+                if entry is None:
+                    missing.append(key)
+                else:
+                    self._entries.move_to_end(key)
+                    found[key] = entry
+            self._metrics["hits"] += len(found)
+
+        persisted = self._load_persisted(missing) if missing else {}
+        if persisted:
+            self._remember(persisted.items())
+            found.update(persisted)
+        with self._lock:
+            self._metrics["persisted_hits"] += len(persisted)
+            self._metrics["misses"] += len(missing) - len(persisted)
+        return found
+
+    def put(self, key: str, config_hash: str, score: CachedScore) -> None:
+        self.put_many([(key, score)], config_hash)
+
+    def put_many(self, items: Sequence[tuple[str, CachedScore]], config_hash: str) -> None:
+        """Remember freshly computed scores (and persist them if enabled)."""
+        if not items:
+            return
+        self._remember(items)
+        if self.persist:
+            self._store_persisted(items, config_hash)
+
+    def clear(self) -> None:
+        """Empty the in-process LRU (persisted rows are kept)."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            metrics = dict(self._metrics)
+            size = len(self._entries)
+        hits = metrics["hits"] + metrics["persisted_hits"]
+        lookups = hits + metrics["misses"]
+        return {
+            "size": size,
+            "max_entries": self.max_entries,
+            "persist": self.persist,
+            **metrics,
+            "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+        }
+
+    def _remember(self, items: Iterable[tuple[str, CachedScore]]) -> None:
+        with self._lock:
+            for key, score in items:
+                self._entries[key] = score
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._metrics["evictions"] += 1
+
+    def _load_persisted(self, keys: list[str]) -> dict[str, CachedScore]:
+        if not self.persist:
+            return {}
+        from ..db import connect, execute
+
+        found: dict[str, CachedScore] = {}
+        try:
+            con = connect()
+            try:
+                for i in range(0, len(keys), _IN_BATCH_SIZE):
+                    batch = keys[i : i + _IN_BATCH_SIZE]
+                    placeholders = ",".join(f":key_{idx}" for idx in range(len(batch)))
+                    params = {f"key_{idx}": key for idx, key in enumerate(batch)}
+                    cur = execute(
+                        con,
+                        f"""SELECT cache_key, importance_score, impact_score, urgency_score,
+                                   overall_risk, overall_score, confidence, recommendations_json
+                            FROM ml_score_cache WHERE cache_key IN ({placeholders})""",
+                        params,
+                    )
+                    for row in cur.fetchall():
+                        found[row[0]] = CachedScore(
+                            *row[1:7], recommendations=tuple(json.loads(row[7]))
+                        )
+            finally:
+                con.close()
+        except Exception as e:
+            logger.debug(f"Could not read ml_score_cache: {e}")
+            with self._lock:
+                self._metrics["persist_errors"] += 1
+        return found
+
+    def _store_persisted(self, items: Sequence[tuple[str, CachedScore]], config_hash: str) -> None:
+        from ..db import connect, execute, executemany
+
+        created_at = datetime.now(UTC).isoformat()
+        try:
+            con = connect()
+            try:
+                if config_hash not in self._purged_configs:
+                    # Rows scored under another config can never be hit again
+                    execute(
+                        con,
+                        "DELETE FROM ml_score_cache WHERE config_hash != :config_hash",
+                        {"config_hash": config_hash},
+                    )
+                    self._purged_configs.add(config_hash)
+                executemany(
+                    con,
+                    """
+                    INSERT INTO ml_score_cache(
+                        cache_key, config_hash, importance_score, impact_score,
+                        urgency_score, overall_risk, overall_score, confidence,
+                        recommendations_json, created_at
+                    ) VALUES (
+                        :cache_key, :config_hash, :importance_score, :impact_score,
+                        :urgency_score, :overall_risk, :overall_score, :confidence,
+                        :recommendations_json, :created_at
+                    )
+                    ON CONFLICT(cache_key) DO NOTHING
+                    """,
+                    [
+                        {
+                            "cache_key": key,
+                            "config_hash": config_hash,
+                            "importance_score": score.importance_score,
+                            "impact_score": score.impact_score,
+                            "urgency_score": score.urgency_score,
+                            "overall_risk": score.overall_risk,
+                            "overall_score": score.overall_score,
+                            "confidence": score.confidence,
+                            "recommendations_json": json.dumps(list(score.recommendations)),
+                            "created_at": created_at,
+                        }
+                        for key, score in items
+                    ],
+                )
+                con.commit()
+            finally:
+                con.close()
+        except Exception as e:
+            logger.debug(f"Could not write ml_score_cache: {e}")
+            with self._lock:
+                self._metrics["persist_errors"] += 1
+
+
+# Shared by every SignalScorer unless one is given its own
+score_cache = ScoreCache()
+
+
+def get_score_cache() -> ScoreCache:
+    return score_cache
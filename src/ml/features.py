@@ -3,13 +3,23 @@ Feature extraction for ML predictions.
 
 Extracts numerical and categorical features from signals
 for use in predictive models.
+
+FeatureExtractor.extract() builds one FeatureSet per signal.
+FeatureExtractor.extract_batch() builds a FeatureMatrix for many signals at
+once: each text is scanned in a single loop, repeated date strings are parsed
+once, and the temporal and derived features are computed as NumPy columns.
+Both paths produce identical values.
 """
 
 import logging
 import re
-from datetime import UTC, datetime
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
 from typing import Any
 
+import numpy as np
+
 from .models import FeatureSet
 
 logger = logging.getLogger(__name__)
@@ -66,6 +76,132 @@ SOURCE_RELIABILITY = {
     "other": 0.50,
 }
 
+# Organization mentions, counted case-insensitively
+ORGANIZATION_PATTERNS = [
+    r"\bVA\b",
+    r"\bDOD\b",
+    r"\bCongress\b",
+    r"\bSenate\b",
+    r"\bHouse\b",
+    r"\bCommittee\b",
+    r"\bAgency\b",
+    r"\bDepartment\b",
+]
+
+# Regulation citations (e.g., 38 CFR, 42 U.S.C.), counted case-insensitively
+REGULATION_PATTERNS = [
+    r"\d+\s*CFR\s*\d+",
+    r"\d+\s*U\.?S\.?C\.?\s*\d+",
+    r"Public Law\s*\d+-\d+",
+    r"P\.?L\.?\s*\d+-\d+",
+]
+
+# One match per non-blank sentence, i.e. per piece of re.split(r"[.!?]+", text)
+# that is not all whitespace; counting matches avoids building the pieces.
+_SENTENCE_RE = re.compile(r"[^.!?\s][^.!?]*")
+
+_ORG_RES = tuple(re.compile(p, re.IGNORECASE) for p in ORGANIZATION_PATTERNS)
+_REG_RES = tuple(re.compile(p, re.IGNORECASE) for p in REGULATION_PATTERNS)
+
+# Extraction lowercases the text. Lowercased ASCII text has nothing for
+# IGNORECASE to fold, so lowercase case-sensitive patterns find the same
+# matches, and they are several times faster. The organization patterns only
+# match whole, distinct words, so they cannot overlap and one alternation
+# counts the same hits. Citation patterns can share digits, so they stay
+# separate; each only runs if the text contains one of the literals any of
+# its matches must contain. Non-ASCII text uses the original patterns,
+# because IGNORECASE folds e.g. "\u017f" to "s".
+_ORG_ASCII_RE = re.compile("|".join(p.lower() for p in ORGANIZATION_PATTERNS))
+_REG_ASCII_GATES = (("cfr",), ("us", "u.s"), ("public law",), ("pl", "p.l"))
+_REG_ASCII_RES = tuple(
+    (gates, re.compile(p.lower())) for gates, p in zip(_REG_ASCII_GATES, REGULATION_PATTERNS)
+)
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_ONE_MICROSECOND = timedelta(microseconds=1)
+_MICROSECONDS_PER_DAY = 86_400_000_000
+
+# Numeric FeatureSet fields, in FeatureMatrix column order. Unset
+# days_until_* values are NaN; is_retroactive is 0.0 or 1.0.
+MATRIX_COLUMNS = (
+    "text_length",
+    "word_count",
+    "sentence_count",
+    "avg_word_length",
+    "keyword_matches",
+    "keyword_density",
+    "high_priority_keywords",
+    "source_reliability_score",
+    "source_historical_accuracy",
+    "days_until_effective",
+    "days_until_deadline",
+    "is_retroactive",
+    "entity_count",
+    "organization_mentions",
+    "regulation_citations",
+    "similar_signal_count",
+    "historical_impact_avg",
+    "author_track_record",
+    "complexity_score",
+    "specificity_score",
+)
+_COLUMN_INDEX = {name: i for i, name in enumerate(MATRIX_COLUMNS)}
+_INT_COLUMNS = frozenset(
+    name for name, field in FeatureSet.model_fields.items() if field.annotation is int
+)
+_OPTIONAL_INT_COLUMNS = frozenset(("days_until_effective", "days_until_deadline"))
+
+
+def _count_entities(text: str) -> tuple[int, int]:
+    """Return (organization mentions, regulation citations) in lowercased text."""
+    if text.isascii():
+        org_count = len(_ORG_ASCII_RE.findall(text))
+        reg_count = sum(
+            len(pattern.findall(text))
+            for gates, pattern in _REG_ASCII_RES
+            if any(gate in text for gate in gates)
+        )
+    else:
+        org_count = sum(len(pattern.findall(text)) for pattern in _ORG_RES)
+        reg_count = sum(len(pattern.findall(text)) for pattern in _REG_RES)
+    return org_count, reg_count
+
+
+@dataclass
+class FeatureMatrix:
+    """Features for a batch of signals, one row per signal.
+
+    ``values`` has one float64 column per name in MATRIX_COLUMNS;
+    ``source_types`` holds the categorical source_type per row.
+    """
+
+    values: np.ndarray
+    source_types: list[str]
+
+    def __len__(self) -> int:
+        return self.values.shape[0]
+
+    def column(self, name: str) -> np.ndarray:
+        """View of one feature column."""
+        return self.values[:, _COLUMN_INDEX[name]]
+
+    def to_feature_sets(self) -> list[FeatureSet]:
+        """Rebuild per-signal FeatureSets (as FeatureExtractor.extract returns)."""
+        feature_sets = []
+        for row, source_type in zip(self.values.tolist(), self.source_types):
+            fields: dict[str, Any] = {"source_type": source_type}
+            for name, value in zip(MATRIX_COLUMNS, row):
+                if name in _OPTIONAL_INT_COLUMNS:
+                    fields[name] = None if value != value else int(value)
+                elif name == "is_retroactive":
+                    fields[name] = bool(value)
+                elif name in _INT_COLUMNS:
+                    fields[name] = int(value)
+                else:
+                    fields[name] = value
+            feature_sets.append(FeatureSet(**fields))
+        return feature_sets
+
 
 class FeatureExtractor:
     """
@@ -118,6 +254,93 @@ class FeatureExtractor:
 
         return features
 
+    def extract_batch(self, signals: Sequence[dict[str, Any]]) -> FeatureMatrix:
+        """
+        Extract features for many signals into a FeatureMatrix.
+
+        Row i holds the same values extract(signals[i]) would produce; the
+        temporal features are measured against a single "now" for the batch.
+        """
+        n = len(signals)
+        now_us = (datetime.now(UTC) - _EPOCH) // _ONE_MICROSECOND
+        date_cache: dict[Any, int | None] = {}
+
+        # One pass over the signals for everything that needs the text or
+        # per-row Python values; the rest is computed column-wise below.
+        text_rows = []
+        source_types = []
+        reliability = []
+        effective_us = []
+        deadline_us = []
+        for signal in signals:
+            text = self._get_text(signal)
+            words = text.split()
+            word_count = len(words)
+            hp_matches = sum(1 for kw in HIGH_PRIORITY_KEYWORDS if kw in text)
+            org_count, reg_count = _count_entities(text)
+            text_rows.append(
+                (
+                    len(text),
+                    word_count,
+                    len(_SENTENCE_RE.findall(text)),
+                    sum(map(len, words)) / word_count if words else 0.0,
+                    hp_matches,
+                    org_count,
+                    reg_count,
+                )
+            )
+
+            source_type = self.source_type(signal)
+            source_types.append(source_type)
+            reliability.append(SOURCE_RELIABILITY.get(source_type, 0.5))
+
+            effective_us.append(self._parse_date_cached(signal.get("effective_date"), date_cache))
+            deadline_us.append(
+                self._parse_date_cached(signal.get("comments_close_date"), date_cache)
+            )
+
+        values = np.zeros((n, len(MATRIX_COLUMNS)), dtype=np.float64)
+        if n == 0:
+            return FeatureMatrix(values=values, source_types=source_types)
+
+        def put(name: str, column) -> None:
+            values[:, _COLUMN_INDEX[name]] = column
+
+        text_cols = np.array(text_rows, dtype=np.float64)
+        word_count = text_cols[:, 1]
+        hp_matches = text_cols[:, 4]
+        org_count = text_cols[:, 5]
+        reg_count = text_cols[:, 6]
+        put("text_length", text_cols[:, 0])
+        put("word_count", word_count)
+        put("sentence_count", text_cols[:, 2])
+        put("avg_word_length", text_cols[:, 3])
+        put("high_priority_keywords", hp_matches)
+        put("keyword_matches", hp_matches)
+        keyword_density = np.zeros(n)
+        np.divide(hp_matches, word_count, out=keyword_density, where=word_count > 0)
+        put("keyword_density", keyword_density)
+
+        put("source_reliability_score", reliability)
+        put("source_historical_accuracy", reliability)
+
+        days_effective = self._days_until(effective_us, now_us)
+        put("days_until_effective", days_effective)
+        put("days_until_deadline", self._days_until(deadline_us, now_us))
+        put("is_retroactive", days_effective < 0)
+
+        put("organization_mentions", org_count)
+        put("regulation_citations", reg_count)
+        put("entity_count", org_count + reg_count)
+
+        # Historical features: the _extract_historical_features placeholders
+        # when a DB is attached, else the FeatureSet defaults
+        put("historical_impact_avg", 0.5 if self.db else 0.0)
+        put("author_track_record", 0.5)
+
+        self._calculate_derived_columns(values)
+        return FeatureMatrix(values=values, source_types=source_types)
+
     def _get_text(self, signal: dict) -> str:
         """Combine title and content into searchable text."""
         title = signal.get("title", "") or ""
@@ -134,12 +357,11 @@ class FeatureExtractor:
         features.word_count = len(words)
 
         # Sentence count (rough)
-        sentences = re.split(r"[.!?]+", text)
-        features.sentence_count = len([s for s in sentences if s.strip()])
+        features.sentence_count = len(_SENTENCE_RE.findall(text))
 
         # Average word length
         if words:
-            features.avg_word_length = sum(len(w) for w in words) / len(words)
+            features.avg_word_length = sum(map(len, words)) / len(words)
 
         return features
 
@@ -156,10 +378,14 @@ class FeatureExtractor:
 
         return features
 
+    @staticmethod
+    def source_type(signal: dict) -> str:
+        """The signal's normalized source_type feature."""
+        return (signal.get("source_type", "other") or "other").lower()
+
     def _extract_source_features(self, signal: dict, features: FeatureSet) -> FeatureSet:
         """Extract source-related features."""
-        source_type = signal.get("source_type", "other") or "other"
-        features.source_type = source_type.lower()
+        features.source_type = self.source_type(signal)
 
         # Look up reliability score
         features.source_reliability_score = SOURCE_RELIABILITY.get(features.source_type, 0.5)
@@ -171,32 +397,40 @@ class FeatureExtractor:
 
     def _extract_temporal_features(self, signal: dict, features: FeatureSet) -> FeatureSet:
         """Extract time-related features."""
-        now = datetime.now(UTC)
+        days_until_effective, days_until_deadline = self.temporal_days(signal)
 
         # Days until effective date
-        effective_date = signal.get("effective_date")
-        if effective_date:
-            try:
-                eff_dt = self._parse_date(effective_date)
-                if eff_dt:
-                    delta = (eff_dt - now).days
-                    features.days_until_effective = delta
-                    features.is_retroactive = delta < 0
-            except Exception:
-                pass
+        if days_until_effective is not None:
+            features.days_until_effective = days_until_effective
+            features.is_retroactive = days_until_effective < 0
 
         # Days until comment deadline
-        comments_close = signal.get("comments_close_date")
-        if comments_close:
-            try:
-                close_dt = self._parse_date(comments_close)
-                if close_dt:
-                    features.days_until_deadline = (close_dt - now).days
-            except Exception:
-                pass
+        if days_until_deadline is not None:
+            features.days_until_deadline = days_until_deadline
 
         return features
 
+    def temporal_days(self, signal: dict) -> tuple[int | None, int | None]:
+        """Whole days until the effective date and the comment deadline.
+
+        Either is None when the field is missing or unparseable. These are
+        the only features that change without the signal changing.
+        """
+        now = datetime.now(UTC)
+        return (
+            self._days_until_date(signal.get("effective_date"), now),
+            self._days_until_date(signal.get("comments_close_date"), now),
+        )
+
+    def _days_until_date(self, value: Any, now: datetime) -> int | None:
+        if not value:
+            return None
+        try:
+            dt = self._parse_date(value)
+        except Exception:
+            return None
+        return (dt - now).days if dt else None
+
     def _parse_date(self, date_str: str) -> datetime | None:
         """Parse various date formats."""
         if not date_str:
@@ -219,30 +453,40 @@ class FeatureExtractor:
 
         return None
 
+    def _parse_date_cached(self, value: Any, cache: dict[Any, int | None]) -> int | None:
+        """Parse a date field to epoch microseconds, once per distinct value."""
+        if not value:
+            return None
+        try:
+            return cache[value]
+        except KeyError:
+            cacheable = True
+        except TypeError:  # unhashable; parse without caching
+            cacheable = False
+        try:
+            dt = self._parse_date(value)
+        except Exception:
+            dt = None
+        parsed = None if dt is None else (dt - _EPOCH) // _ONE_MICROSECOND
+        if cacheable:
+            cache[value] = parsed
+        return parsed
+
+    @staticmethod
+    def _days_until(timestamps_us: list[int | None], now_us: int) -> np.ndarray:
+        """Whole days from now to each timestamp, floored like timedelta.days; NaN if unset."""
+        present = np.array([ts is not None for ts in timestamps_us], dtype=bool)
+        days = np.full(len(timestamps_us), np.nan)
+        if present.any():
+            stamps = np.array([ts for ts in timestamps_us if ts is not None], dtype=np.int64)
+            days[present] = (stamps - now_us) // _MICROSECONDS_PER_DAY
+        return days
+
     def _extract_entity_features(self, text: str, features: FeatureSet) -> FeatureSet:
         """Extract entity-related features."""
-        # Count organization mentions (simple pattern matching)
-        org_patterns = [
-            r"\bVA\b",
-            r"\bDOD\b",
-            r"\bCongress\b",
-            r"\bSenate\b",
-            r"\bHouse\b",
-            r"\bCommittee\b",
-            r"\bAgency\b",
-            r"\bDepartment\b",
-        ]
-        org_count = sum(len(re.findall(p, text, re.IGNORECASE)) for p in org_patterns)
+        # Count organization mentions and regulation citations
+        org_count, reg_count = _count_entities(text)
         features.organization_mentions = org_count
-
-        # Count regulation citations (e.g., 38 CFR, 42 U.S.C.)
-        reg_patterns = [
-            r"\d+\s*CFR\s*\d+",
-            r"\d+\s*U\.?S\.?C\.?\s*\d+",
-            r"Public Law\s*\d+-\d+",
-            r"P\.?L\.?\s*\d+-\d+",
-        ]
-        reg_count = sum(len(re.findall(p, text, re.IGNORECASE)) for p in reg_patterns)
         features.regulation_citations = reg_count
 
         # Total entity count
@@ -292,8 +536,34 @@ class FeatureExtractor:
 
         return features
 
+    def _calculate_derived_columns(self, values: np.ndarray) -> None:
+        """Column-wise _calculate_derived_features, written into ``values``."""
+
+        def col(name: str) -> np.ndarray:
+            return values[:, _COLUMN_INDEX[name]]
+
+        text_length = col("text_length")
+        regulation_citations = col("regulation_citations")
+        entity_count = col("entity_count")
+
+        # Complexity score (0-1)
+        complexity = np.zeros(len(values))
+        complexity += np.where(text_length > 5000, 0.3, np.where(text_length > 1000, 0.2, 0.0))
+        complexity += np.where(
+            regulation_citations > 3, 0.3, np.where(regulation_citations > 0, 0.15, 0.0)
+        )
+        complexity += np.where(col("avg_word_length") > 6, 0.2, 0.0)
+        values[:, _COLUMN_INDEX["complexity_score"]] = np.minimum(1.0, complexity)
+
+        # Specificity score (0-1)
+        specificity = np.zeros(len(values))
+        specificity += np.where(entity_count > 5, 0.3, np.where(entity_count > 2, 0.15, 0.0))
+        specificity += np.where(regulation_citations > 0, 0.3, 0.0)
+        specificity += np.where(np.isnan(col("days_until_effective")), 0.0, 0.2)
+        specificity += np.where(np.isnan(col("days_until_deadline")), 0.0, 0.2)
+        values[:, _COLUMN_INDEX["specificity_score"]] = np.minimum(1.0, specificity)
+
 
 def extract_features_batch(signals: list[dict]) -> list[FeatureSet]:
     """Extract features for multiple signals."""
-    extractor = FeatureExtractor()
-    return [extractor.extract(signal) for signal in signals]
+    return FeatureExtractor().extract_batch(signals).to_feature_sets()
@@ -176,6 +176,7 @@ class TrainingRequest(BaseModel):
 class BatchPredictionRequest(BaseModel):
     """Request for batch predictions."""
 
+    signal_type: str = "fr"  # fr, state, oversight, battlefield
     signal_ids: list[str]
     prediction_types: list[PredictionType] = [PredictionType.IMPORTANCE]
     include_features: bool = False
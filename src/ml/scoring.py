@@ -3,14 +3,25 @@ Predictive scoring for signals.
 
 Provides importance, impact, and urgency predictions
 using rule-based and ML ensemble approaches.
+
+SignalScorer.score_batch() scores many signals from one FeatureMatrix, with
+each rule applied to whole NumPy columns. Its results equal score() per
+signal.
+
+Both consult a ScoreCache (see cache.py) first, so rescoring an unchanged
+signal skips feature extraction.
 """
 
 import logging
+from collections.abc import Sequence
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import Any
 
-from .features import FeatureExtractor
+import numpy as np
+
+from .cache import CachedScore, ScoreCache, config_fingerprint, get_score_cache, score_cache_key
+from .features import FeatureExtractor, FeatureMatrix
 from .models import (
     FeatureSet,
     PredictionConfig,
@@ -21,6 +32,15 @@ from .models import (
 
 logger = logging.getLogger(__name__)
 
+# Part of the score cache fingerprint: bump when the scoring rules below
+# change, so scores computed by the old rules are no longer served.
+SCORING_RULES_VERSION = "1"
+
+
+def _optional_int(value: float) -> int | None:
+    """FeatureMatrix day count (NaN when unset) as the FeatureSet value."""
+    return None if value != value else int(value)
+
 
 @dataclass
 class ScoringResult:
@@ -50,10 +70,22 @@ class SignalScorer:
     These are combined into an overall risk score.
     """
 
-    def __init__(self, config: PredictionConfig = None):
-        """Initialize scorer with optional config."""
+    def __init__(
+        self,
+        config: PredictionConfig = None,
+        cache: ScoreCache | None = None,
+        use_cache: bool = True,
+    ):
+        """Initialize scorer with optional config and score cache.
+
+        Uses the shared score cache unless ``cache`` is given or
+        ``use_cache`` is False. The config is fingerprinted here, so
+        changes to it after construction are not seen by the cache.
+        """
         self.config = config or PredictionConfig()
         self.feature_extractor = FeatureExtractor()
+        self.cache = (cache if cache is not None else get_score_cache()) if use_cache else None
+        self._config_hash = config_fingerprint(self.config, SCORING_RULES_VERSION)
 
     def score(self, signal: dict[str, Any]) -> ScoringResult:
         """
@@ -65,7 +97,33 @@ class SignalScorer:
         Returns:
             ScoringResult with all scores and recommendations
         """
-        signal_id = signal.get("signal_id", signal.get("doc_id", "unknown"))
+        if self.cache is None:
+            return self._score_uncached(signal)[0]
+
+        text = self.feature_extractor._get_text(signal)
+        key = self._cache_key(
+            text,
+            self.feature_extractor.source_type(signal),
+            *self.feature_extractor.temporal_days(signal),
+        )
+        cached = self.cache.get(key)
+        if cached is not None:
+            return self._from_cached(signal, cached, datetime.now(UTC))
+
+        result, features = self._score_uncached(signal)
+        # Keyed by the features actually used, in case a day boundary
+        # passed since the lookup
+        store_key = self._cache_key(
+            text,
+            features.source_type,
+            features.days_until_effective,
+            features.days_until_deadline,
+        )
+        self.cache.put(store_key, self._config_hash, self._to_cached(result))
+        return result
+
+    def _score_uncached(self, signal: dict[str, Any]) -> tuple[ScoringResult, FeatureSet]:
+        signal_id = self._signal_id(signal)
 
         # Extract features
         features = self.feature_extractor.extract(signal)
@@ -89,7 +147,7 @@ class SignalScorer:
             signal, features, importance, impact, urgency
         )
 
-        return ScoringResult(
+        result = ScoringResult(
             signal_id=signal_id,
             importance_score=round(importance, 3),
             impact_score=round(impact, 3),
@@ -100,6 +158,155 @@ class SignalScorer:
             recommendations=recommendations,
             scored_at=datetime.now(UTC),
         )
+        return result, features
+
+    def score_batch(self, signals: Sequence[dict[str, Any]]) -> list[ScoringResult]:
+        """
+        Score many signals at once.
+
+        Cached scores are looked up in one pass. The remaining distinct
+        signals have their features extracted into a FeatureMatrix, and the
+        importance, impact, urgency and confidence rules run column-wise.
+        Each result equals score(signal) for the same signal.
+        """
+        if self.cache is None:
+            return self._score_batch_uncached(signals)[0]
+
+        extractor = self.feature_extractor
+        texts = [extractor._get_text(signal) for signal in signals]
+        keys = [
+            self._cache_key(text, extractor.source_type(signal), *extractor.temporal_days(signal))
+            for text, signal in zip(texts, signals)
+        ]
+        cached = self.cache.get_many(keys)
+
+        # Score each distinct uncached signal once
+        first_miss: dict[str, int] = {}
+        for i, key in enumerate(keys):
+            if key not in cached:
+                first_miss.setdefault(key, i)
+        computed: dict[int, ScoringResult] = {}
+        if first_miss:
+            indices = list(first_miss.values())
+            results, matrix = self._score_batch_uncached([signals[i] for i in indices])
+            days_effective = matrix.column("days_until_effective").tolist()
+            days_deadline = matrix.column("days_until_deadline").tolist()
+            fresh = []
+            for row, (i, result) in enumerate(zip(indices, results)):
+                computed[i] = result
+                score = self._to_cached(result)
+                cached[keys[i]] = score
+                # Keyed by the features actually used (see score())
+                store_key = self._cache_key(
+                    texts[i],
+                    matrix.source_types[row],
+                    _optional_int(days_effective[row]),
+                    _optional_int(days_deadline[row]),
+                )
+                fresh.append((store_key, score))
+            self.cache.put_many(fresh, self._config_hash)
+
+        scored_at = datetime.now(UTC)
+        return [
+            computed[i] if i in computed else self._from_cached(signal, cached[key], scored_at)
+            for i, (signal, key) in enumerate(zip(signals, keys))
+        ]
+
+    def _score_batch_uncached(
+        self, signals: Sequence[dict[str, Any]]
+    ) -> tuple[list[ScoringResult], FeatureMatrix]:
+        matrix = self.feature_extractor.extract_batch(signals)
+        if not len(matrix):
+            return [], matrix
+
+        importance = self._score_importance_batch(matrix)
+        impact = self._score_impact_batch(matrix)
+        urgency = self._score_urgency_batch(matrix)
+        overall = (importance * 0.35) + (impact * 0.40) + (urgency * 0.25)
+        confidence = self._calculate_confidence_batch(matrix)
+
+        days_until_deadline = matrix.column("days_until_deadline").tolist()
+        is_retroactive = matrix.column("is_retroactive").tolist()
+        regulation_citations = matrix.column("regulation_citations").tolist()
+        source_reliability = matrix.column("source_reliability_score").tolist()
+
+        scored_at = datetime.now(UTC)
+        results = []
+        for i, (imp, imc, urg, ovr, conf) in enumerate(
+            zip(
+                importance.tolist(),
+                impact.tolist(),
+                urgency.tolist(),
+                overall.tolist(),
+                confidence.tolist(),
+            )
+        ):
+            signal = signals[i]
+            recommendations = self._recommend(
+                imp,
+                imc,
+                urg,
+                days_until_deadline=_optional_int(days_until_deadline[i]),
+                is_retroactive=bool(is_retroactive[i]),
+                regulation_citations=int(regulation_citations[i]),
+                source_reliability_score=source_reliability[i],
+            )
+            results.append(
+                ScoringResult(
+                    signal_id=self._signal_id(signal),
+                    importance_score=round(imp, 3),
+                    impact_score=round(imc, 3),
+                    urgency_score=round(urg, 3),
+                    overall_risk=self._determine_risk_level(ovr),
+                    overall_score=round(ovr, 3),
+                    confidence=round(conf, 3),
+                    recommendations=recommendations,
+                    scored_at=scored_at,
+                )
+            )
+        return results, matrix
+
+    @staticmethod
+    def _signal_id(signal: dict[str, Any]) -> str:
+        return signal.get("signal_id", signal.get("doc_id", "unknown"))
+
+    def _cache_key(
+        self,
+        text: str,
+        source_type: str,
+        days_until_effective: int | None,
+        days_until_deadline: int | None,
+    ) -> str:
+        return score_cache_key(
+            self._config_hash, text, source_type, days_until_effective, days_until_deadline
+        )
+
+    @staticmethod
+    def _to_cached(result: ScoringResult) -> CachedScore:
+        return CachedScore(
+            importance_score=result.importance_score,
+            impact_score=result.impact_score,
+            urgency_score=result.urgency_score,
+            overall_risk=result.overall_risk.value,
+            overall_score=result.overall_score,
+            confidence=result.confidence,
+            recommendations=tuple(result.recommendations),
+        )
+
+    def _from_cached(
+        self, signal: dict[str, Any], cached: CachedScore, scored_at: datetime
+    ) -> ScoringResult:
+        return ScoringResult(
+            signal_id=self._signal_id(signal),
+            importance_score=cached.importance_score,
+            impact_score=cached.impact_score,
+            urgency_score=cached.urgency_score,
+            overall_risk=RiskLevel(cached.overall_risk),
+            overall_score=cached.overall_score,
+            confidence=cached.confidence,
+            recommendations=list(cached.recommendations),
+            scored_at=scored_at,
+        )
 
     def score_importance(self, signal: dict[str, Any]) -> PredictionResult:
         """Score signal importance only."""
@@ -227,6 +434,66 @@ class SignalScorer:
 
         return min(1.0, score)
 
+    # Column-wise versions of the rules above, for score_batch(). Each adds
+    # the same terms in the same order, so the float results are identical.
+
+    def _score_importance_batch(self, m: FeatureMatrix) -> np.ndarray:
+        score = np.zeros(len(m))
+        score += np.minimum(0.25, m.column("keyword_density") * 50)
+        score += m.column("source_reliability_score") * 0.20
+        score += np.minimum(1.0, m.column("high_priority_keywords") / 5) * 0.25
+        score += m.column("complexity_score") * 0.15
+        refs = m.column("entity_count") + m.column("regulation_citations")
+        score += np.minimum(1.0, refs / 10) * 0.15
+        return np.minimum(1.0, score)
+
+    def _score_impact_batch(self, m: FeatureMatrix) -> np.ndarray:
+        citations = m.column("regulation_citations")
+        score = np.zeros(len(m))
+        score += m.column("source_reliability_score") * 0.25
+        score += np.where(citations > 0, np.minimum(0.25, citations * 0.05), 0.0)
+        score += m.column("specificity_score") * 0.20
+        score += np.where(m.column("is_retroactive") > 0, 0.15, 0.0)
+        score += np.minimum(0.15, m.column("organization_mentions") * 0.03)
+        return np.minimum(1.0, score)
+
+    def _score_urgency_batch(self, m: FeatureMatrix) -> np.ndarray:
+        deadline = m.column("days_until_deadline")
+        effective = m.column("days_until_effective")
+        has_deadline = ~np.isnan(deadline)
+        has_effective = ~np.isnan(effective)
+
+        score = np.zeros(len(m))
+        deadline_score = np.select(
+            [deadline <= 0, deadline <= 7, deadline <= 30, deadline <= 60],
+            [0.4, 0.35, 0.25, 0.15],
+            0.05,
+        )
+        score += np.where(has_deadline, deadline_score, 0.0)
+        effective_score = np.select(
+            [effective <= 0, effective <= 30, effective <= 90], [0.3, 0.25, 0.15], 0.05
+        )
+        score += np.where(has_effective, effective_score, 0.0)
+        score += np.where(m.column("is_retroactive") > 0, 0.2, 0.0)
+        no_dates = ~has_deadline & ~has_effective
+        score += np.where(no_dates & (m.column("high_priority_keywords") > 3), 0.2, 0.0)
+        return np.minimum(1.0, score)
+
+    def _calculate_confidence_batch(self, m: FeatureMatrix) -> np.ndarray:
+        text_length = m.column("text_length")
+        primary = np.array(
+            [st in ("federal_register", "congress_gov", "va_gov") for st in m.source_types]
+        )
+        known = np.array([st != "other" for st in m.source_types])
+
+        confidence = np.full(len(m), 0.3)
+        confidence += np.where(text_length > 500, 0.15, np.where(text_length > 100, 0.10, 0.0))
+        confidence += np.where(primary, 0.20, np.where(known, 0.10, 0.0))
+        confidence += np.where(np.isnan(m.column("days_until_effective")), 0.0, 0.15)
+        confidence += np.where(np.isnan(m.column("days_until_deadline")), 0.0, 0.10)
+        confidence += np.where(m.column("regulation_citations") > 0, 0.10, 0.0)
+        return np.minimum(1.0, confidence)
+
     def _determine_risk_level(self, overall_score: float) -> RiskLevel:
         """Determine risk level from overall score."""
         if overall_score >= 0.85:
@@ -272,15 +539,36 @@ class SignalScorer:
         self, signal: dict, features: FeatureSet, importance: float, impact: float, urgency: float
     ) -> list[str]:
         """Generate actionable recommendations based on scores."""
+        return self._recommend(
+            importance,
+            impact,
+            urgency,
+            days_until_deadline=features.days_until_deadline,
+            is_retroactive=features.is_retroactive,
+            regulation_citations=features.regulation_citations,
+            source_reliability_score=features.source_reliability_score,
+        )
+
+    def _recommend(
+        self,
+        importance: float,
+        impact: float,
+        urgency: float,
+        days_until_deadline: int | None,
+        is_retroactive: bool,
+        regulation_citations: int,
+        source_reliability_score: float,
+    ) -> list[str]:
+        """Recommendations from scores and the few features they depend on."""
         recommendations = []
 
         # Urgency-based recommendations
         if urgency > 0.7:
-            if features.days_until_deadline is not None and features.days_until_deadline <= 7:
+            if days_until_deadline is not None and days_until_deadline <= 7:
                 recommendations.append(
-                    f"⚠️ URGENT: Comment deadline in {features.days_until_deadline} days. Prioritize review."
+                    f"⚠️ URGENT: Comment deadline in {days_until_deadline} days. Prioritize review."
                 )
-            elif features.is_retroactive:
+            elif is_retroactive:
                 recommendations.append(
                     "⚠️ URGENT: Retroactive changes detected. Assess immediate impact."
                 )
@@ -290,7 +578,7 @@ class SignalScorer:
         # Impact-based recommendations
         if impact > 0.6:
             recommendations.append("📊 High impact potential. Brief leadership team.")
-            if features.regulation_citations > 2:
+            if regulation_citations > 2:
                 recommendations.append(
                     "📋 Multiple regulatory references. Legal review recommended."
                 )
@@ -300,7 +588,7 @@ class SignalScorer:
             recommendations.append("🎯 High importance signal. Add to battlefield tracking.")
 
         # Source-based recommendations
-        if features.source_reliability_score < 0.6:
+        if source_reliability_score < 0.6:
             recommendations.append("⚡ Verify with authoritative source before action.")
 
         # Default recommendation
@@ -334,5 +622,4 @@ class SignalScorer:
 
 def score_batch(signals: list[dict], config: PredictionConfig = None) -> list[ScoringResult]:
     """Score multiple signals."""
-    scorer = SignalScorer(config)
-    return [scorer.score(signal) for signal in signals]
+    return SignalScorer(config).score_batch(signals)
@@ -11,6 +11,8 @@ Required env vars for email sending:
 import os
 import smtplib
 import ssl
+import threading
+import time
 from datetime import UTC
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
@@ -112,6 +114,57 @@ def check_smtp_health() -> dict:
     return result
 
 
+# How long a background SMTP probe result is served before re-probing
+SMTP_PROBE_TTL_SECONDS = 300.0
+
+
+class SMTPHealthProber:
+    """
+    Serves SMTP reachability from a cached background probe.
+
+    status() never waits on SMTP: it returns the last probe result and, once
+    that is older than the TTL (or on first use), starts a new probe on a
+    daemon thread. Until the first probe finishes it reports "pending".
+    """
+
+    def __init__(self, ttl_seconds: float = SMTP_PROBE_TTL_SECONDS):
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._result: dict | None = None
+        self._probed_at = 0.0
+        self._probing = False
+
+    def status(self) -> dict:
+        """Latest known SMTP health: dict with keys configured, reachable, error."""
+        if not is_configured():
+            # No network involved; answer directly
+            return check_smtp_health()
+
+        with self._lock:
+            result = self._result
+            stale = result is None or time.monotonic() - self._probed_at >= self.ttl_seconds
+            if stale and not self._probing:
+                self._probing = True
+                threading.Thread(target=self._probe, name="smtp-prober", daemon=True).start()
+
+        if result is None:
+            return {"configured": True, "reachable": False, "error": "SMTP check pending"}
+        return dict(result)
+
+    def _probe(self) -> None:
+        try:
+            result = check_smtp_health()
+        except Exception as exc:
+            result = {"configured": True, "reachable": False, "error": str(exc)}
+        with self._lock:
+            self._result = result
+            self._probed_at = time.monotonic()
+            self._probing = False
+
+
+smtp_prober = SMTPHealthProber()
+
+
 def _base_html_template(title: str, content: str, footer: str = "") -> str:
     """Generate base HTML email template with responsive styling."""
     return f"""<!DOCTYPE html>
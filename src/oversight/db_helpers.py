@@ -3,13 +3,41 @@
 import json
 from datetime import UTC, datetime
 
-from src.db import connect, execute, insert_returning_id
+from src.db import connect, execute, executemany, insert_returning_id
 
 
 def _utc_now_iso() -> str:
     return datetime.now(UTC).strftime("%Y-%m-%dT%H:%M:%SZ")
 
 
+def entity_ref_rows(event_id: str, refs: dict | None) -> list[dict]:
+    """Flatten canonical_refs into om_entity_refs rows.
+
+    Only string values (and strings inside list values) are indexed; flags
+    such as ``is_precedential`` are not identifiers and never matched.
+    """
+    rows = []
+    seen = set()
+    for entity_type, value in (refs or {}).items():
+        values = value if isinstance(value, list) else [value]
+        for item in values:
+            if not isinstance(item, str) or not item or (entity_type, item) in seen:
+                continue
+            seen.add((entity_type, item))
+            rows.append({"entity_type": entity_type, "entity_value": item, "event_id": event_id})
+    return rows
+
+
+def _insert_entity_refs(con, event_id: str, refs: dict | None) -> None:
+    executemany(
+        con,
+        """INSERT INTO om_entity_refs (entity_type, entity_value, event_id)
+           VALUES (:entity_type, :entity_value, :event_id)
+           ON CONFLICT(entity_value, entity_type, event_id) DO NOTHING""",
+        entity_ref_rows(event_id, refs),
+    )
+
+
 def insert_om_event(event: dict) -> None:
     """Insert a canonical event."""
     con = connect()
@@ -63,6 +91,7 @@ def insert_om_event(event: dict) -> None:
             "fetched_at": event["fetched_at"],
         },
     )
+    _insert_entity_refs(con, event["event_id"], event.get("canonical_refs"))
     con.commit()
     con.close()
 
@@ -385,6 +414,8 @@ def update_canonical_refs(event_id: str, refs: dict) -> None:
             "event_id": event_id,
         },
     )
+    execute(con, "DELETE FROM om_entity_refs WHERE event_id = :event_id", {"event_id": event_id})
+    _insert_entity_refs(con, event_id, existing)
     con.commit()
     con.close()
 
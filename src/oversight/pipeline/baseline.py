@@ -2,6 +2,8 @@
 
 import json
 import re
+import threading
+import weakref
 from collections import Counter
 from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
@@ -22,6 +24,73 @@ class BaselineSummary:
     topic_distribution: dict = field(default_factory=dict)
 
 
+def _summary_from_row(row: dict) -> BaselineSummary:
+    """Build a BaselineSummary from a get_latest_baseline() row."""
+    topic_dist = row.get("topic_distribution", "{}")
+    if isinstance(topic_dist, str):
+        topic_dist = json.loads(topic_dist)
+    return BaselineSummary(
+        source_type=row["source_type"],
+        theme=row.get("theme"),
+        window_start=row["window_start"],
+        window_end=row["window_end"],
+        event_count=row["event_count"],
+        summary=row["summary"],
+        topic_distribution=topic_dist,
+    )
+
+
+# Live BaselineCache instances, invalidated by _save_baseline
+_live_caches: "weakref.WeakSet[BaselineCache]" = weakref.WeakSet()
+_live_caches_lock = threading.Lock()
+
+
+class BaselineCache:
+    """
+    Run-scoped cache of the latest baseline per (source_type, theme).
+
+    A missing baseline is cached too. Entries are dropped whenever
+    _save_baseline writes a new baseline for the same key, so a run
+    never scores against a stale one. Thread-safe; hit/miss counts show
+    how many om_baselines queries the cache saved.
+    """
+
+    def __init__(self):
+        self._entries: dict[tuple[str, str | None], BaselineSummary | None] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        with _live_caches_lock:
+            _live_caches.add(self)
+
+    def get(self, source_type: str, theme: str | None = None) -> BaselineSummary | None:
+        key = (source_type, theme)
+        with self._lock:
+            if key in self._entries:
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+            row = get_latest_baseline(source_type, theme)
+            summary = _summary_from_row(row) if row else None
+            self._entries[key] = summary
+            return summary
+
+    def invalidate(self, source_type: str, theme: str | None = None) -> None:
+        with self._lock:
+            self._entries.pop((source_type, theme), None)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses}
+
+
+def _invalidate_cached_baselines(source_type: str, theme: str | None) -> None:
+    with _live_caches_lock:
+        caches = list(_live_caches)
+    for cache in caches:
+        cache.invalidate(source_type, theme)
+
+
 def _get_events_in_window(
     source_type: str,
     theme: str | None,
@@ -210,6 +279,7 @@ def _save_baseline(baseline: BaselineSummary) -> int:
     )
     con.commit()
     con.close()
+    _invalidate_cached_baselines(baseline.source_type, baseline.theme)
     return row_id
 
 
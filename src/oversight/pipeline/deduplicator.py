@@ -80,6 +80,10 @@ def find_canonical_event(entities: dict, source_type: str) -> dict | None:
     """
     Find an existing canonical event matching the extracted entities.
 
+    All entity values are resolved in one lookup against the om_entity_refs
+    index. When several events match, the first entity (in extraction order)
+    wins, then the oldest event.
+
     Args:
         entities: Dict of entity type -> identifier
         source_type: Source type of the new event
@@ -87,41 +91,46 @@ def find_canonical_event(entities: dict, source_type: str) -> dict | None:
     Returns:
         Matching canonical event dict or None
     """
-    if not entities:
+    values = []
+    for entity_value in entities.values():
+        if isinstance(entity_value, str) and entity_value and entity_value not in values:
+            values.append(entity_value)
+    if not values:
         return None
 
+    params = {f"v{i}": value for i, value in enumerate(values)}
+    placeholders = ", ".join(f":{name}" for name in params)
+
     con = connect()
+    cur = execute(
+        con,
+        f"""
+        SELECT DISTINCT r.entity_value, e.event_id, e.event_type, e.theme,
+               e.primary_source_type, e.primary_url, e.title, e.canonical_refs,
+               e.created_at
+        FROM om_entity_refs r
+        JOIN om_events e ON e.event_id = r.event_id
+        WHERE r.entity_value IN ({placeholders})
+        """,
+        params,
+    )
+    rows = cur.fetchall()
+    con.close()
 
-    # Build query to find events with matching canonical_refs
-    for _entity_type, entity_value in entities.items():
-        # Search for events with this entity in canonical_refs JSON
-        cur = execute(
-            con,
-            """
-            SELECT event_id, event_type, theme, primary_source_type, primary_url,
-                   title, canonical_refs
-            FROM om_events
-            WHERE canonical_refs LIKE :canonical_match
-            LIMIT 1
-            """,
-            {"canonical_match": f'%"{entity_value}"%'},
-        )
-        row = cur.fetchone()
-
-        if row:
-            con.close()
-            return {
-                "event_id": row[0],
-                "event_type": row[1],
-                "theme": row[2],
-                "primary_source_type": row[3],
-                "primary_url": row[4],
-                "title": row[5],
-                "canonical_refs": json.loads(row[6]) if row[6] else None,
-            }
+    if not rows:
+        return None
 
-    con.close()
-    return None
+    rank = {value: i for i, value in enumerate(values)}
+    row = min(rows, key=lambda r: (rank[r[0]], r[8] or "", r[1]))
+    return {
+        "event_id": row[1],
+        "event_type": row[2],
+        "theme": row[3],
+        "primary_source_type": row[4],
+        "primary_url": row[5],
+        "title": row[6],
+        "canonical_refs": json.loads(row[7]) if row[7] else None,
+    }
 
 
 def link_related_coverage(
@@ -2,9 +2,17 @@
 
 import hashlib
 import logging
+import os
+import threading
+import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 
+from src.keyword_taxonomy import KeywordTaxonomy
+
 from .agents.base import RawEvent
 from .agents.bva import BVAAgent
 from .agents.cafc import CAFCAgent
@@ -25,8 +33,8 @@ from .db_helpers import (
     update_canonical_refs,
 )
 from .output.formatters import format_weekly_digest
-from .pipeline.baseline import BaselineSummary, get_latest_baseline
-from .pipeline.deduplicator import deduplicate_event, extract_entities
+from .pipeline.baseline import BaselineCache
+from .pipeline.deduplicator import extract_entities, find_canonical_event, link_related_coverage
 from .pipeline.deviation import check_deviation_simple
 from .pipeline.escalation import check_escalation
 from .pipeline.quality_gate import check_quality_gate
@@ -50,6 +58,17 @@ AGENT_REGISTRY = {
 }
 
 
+# Per-agent event processing concurrency. Events are processed in chunks:
+# the read-mostly pipeline stages run on a worker pool, then inserts and
+# signal routing run serially in fetch order.
+DEFAULT_EVENT_WORKERS = int(os.environ.get("OVERSIGHT_EVENT_WORKERS", "4"))
+EVENT_CHUNK_SIZE = 64
+
+# Process-wide cap on concurrent pipeline DB calls (dedup, escalation
+# signals) across all agents running under run_all_agents.
+_DB_SLOTS = threading.BoundedSemaphore(int(os.environ.get("OVERSIGHT_DB_CONCURRENCY", "8")))
+
+
 @dataclass
 class OversightRunResult:
     """Result of running an oversight agent."""
@@ -61,6 +80,34 @@ class OversightRunResult:
     escalations: int = 0
     deviations: int = 0
     errors: list = field(default_factory=list)
+    # Seconds per stage. Per-event stages are summed across worker threads;
+    # "fetch" and "ingest" are wall-clock.
+    stage_timings: dict = field(default_factory=dict)
+    baseline_cache: dict = field(default_factory=dict)  # {"hits": n, "misses": n}
+
+
+class StageTimings:
+    """Thread-safe accumulator of time spent per pipeline stage."""
+
+    def __init__(self):
+        self._totals: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def measure(self, stage: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(stage, time.perf_counter() - start)
+
+    def add(self, stage: str, seconds: float) -> None:
+        with self._lock:
+            self._totals[stage] = self._totals.get(stage, 0.0) + seconds
+
+    def as_dict(self) -> dict[str, float]:
+        with self._lock:
+            return {stage: round(total, 4) for stage, total in self._totals.items()}
 
 
 _THEME_KEYWORDS = {
@@ -80,6 +127,7 @@ _THEME_KEYWORDS = {
     "healthcare_operations": ["hospital", "clinic", "wait time", "staffing", "facility"],
     "benefits_claims": ["claim", "benefit", "disability", "compensation", "pension"],
 }
+_THEME_TAXONOMY = KeywordTaxonomy(_THEME_KEYWORDS)
 
 _SOURCE_TYPE_THEME_MAP = {
     "gao": "oversight_report",
@@ -93,11 +141,9 @@ _SOURCE_TYPE_THEME_MAP = {
 
 def _extract_theme(title: str, source_type: str) -> str | None:
     """Extract theme from title keywords, falling back to source_type mapping."""
-    lower_title = title.lower()
-    for theme, keywords in _THEME_KEYWORDS.items():
-        for kw in keywords:
-            if kw in lower_title:
-                return theme
+    themes = _THEME_TAXONOMY.tag(title)
+    if themes:
+        return themes[0]
     return _SOURCE_TYPE_THEME_MAP.get(source_type)
 
 
@@ -111,67 +157,74 @@ def _process_raw_event(
     raw: RawEvent,
     agent,
     source_type: str,
-) -> tuple[dict | None, str | None]:
+    baseline_cache: BaselineCache | None = None,
+    timings: StageTimings | None = None,
+) -> tuple[dict | None, str | None, dict | None]:
     """
     Process a raw event through the pipeline.
 
+    Batch callers pass a run-scoped ``baseline_cache`` and a shared
+    ``timings`` accumulator. Only reads the database: a duplicate of an
+    existing event is returned with the link_related_coverage arguments
+    for the caller to write.
+
     Returns:
-        (event_dict, rejection_reason) - event_dict is None if rejected
+        (event_dict, rejection_reason, coverage_link) - event_dict is None if
+        rejected; coverage_link is set for duplicates of an existing event
     """
+    timings = timings or StageTimings()
+    baseline_cache = baseline_cache or BaselineCache()
+
     # Extract timestamps
-    timestamps = agent.extract_timestamps(raw)
+    with timings.measure("timestamps"):
+        timestamps = agent.extract_timestamps(raw)
 
     # Quality gate
-    qg_result = check_quality_gate(timestamps, raw.url)
+    with timings.measure("quality_gate"):
+        qg_result = check_quality_gate(timestamps, raw.url)
     if not qg_result.passed:
-        return None, qg_result.rejection_reason
+        return None, qg_result.rejection_reason, None
 
     # Extract entities for deduplication
-    entities = extract_entities(raw.title, raw.raw_html, raw.url)
-    canonical_refs = agent.extract_canonical_refs(raw)
-    entities.update(canonical_refs)
-
-    # Check for duplicates
-    dedup_result = deduplicate_event(
-        title=raw.title,
-        content=raw.raw_html,
-        url=raw.url,
-        source_type=source_type,
-        pub_timestamp=timestamps.pub_timestamp,
-    )
-
-    if dedup_result.is_duplicate:
-        return None, "duplicate"
+    with timings.measure("entities"):
+        dedup_entities = extract_entities(raw.title, raw.raw_html, raw.url)
+        entities = dict(dedup_entities)
+        entities.update(agent.extract_canonical_refs(raw))
+
+    # Check for duplicates; the coverage link is written by the serial commit loop
+    canonical = None
+    with timings.measure("dedup"):
+        if dedup_entities:
+            with _DB_SLOTS:
+                canonical = find_canonical_event(dedup_entities, source_type)
+    if canonical:
+        coverage_link = {
+            "event_id": canonical["event_id"],
+            "source_type": source_type,
+            "url": raw.url,
+            "title": raw.title,
+            "pub_timestamp": timestamps.pub_timestamp,
+        }
+        return None, "duplicate", coverage_link
 
-    # Check for escalation signals
-    esc_result = check_escalation(raw.title, raw.raw_html)
+    # Check for escalation signals (keyword match + ML score)
+    with timings.measure("escalation"):
+        with _DB_SLOTS:
+            esc_result = check_escalation(raw.title, raw.raw_html)
 
     # Heuristic deviation pre-filter (cheap, no LLM call)
     is_deviation = 0
     deviation_reason = None
-    try:
-        baseline_row = get_latest_baseline(source_type)
-        if baseline_row:
-            import json as _json
-
-            topic_dist = baseline_row.get("topic_distribution", "{}")
-            if isinstance(topic_dist, str):
-                topic_dist = _json.loads(topic_dist)
-            baseline_obj = BaselineSummary(
-                source_type=baseline_row["source_type"],
-                theme=baseline_row.get("theme"),
-                window_start=baseline_row["window_start"],
-                window_end=baseline_row["window_end"],
-                event_count=baseline_row["event_count"],
-                summary=baseline_row["summary"],
-                topic_distribution=topic_dist,
-            )
-            dev_result = check_deviation_simple(raw.title, raw.raw_html or "", baseline_obj)
-            if dev_result.is_deviation:
-                is_deviation = 1
-                deviation_reason = dev_result.explanation
-    except Exception as e:
-        logger.debug("Deviation pre-filter skipped: %s", e)
+    with timings.measure("deviation"):
+        try:
+            baseline_obj = baseline_cache.get(source_type)
+            if baseline_obj:
+                dev_result = check_deviation_simple(raw.title, raw.raw_html or "", baseline_obj)
+                if dev_result.is_deviation:
+                    is_deviation = 1
+                    deviation_reason = dev_result.explanation
+        except Exception as e:
+            logger.debug("Deviation pre-filter skipped: %s", e)
 
     # Generate event ID
     event_id = _generate_event_id(source_type, raw.url)
@@ -202,19 +255,162 @@ def _process_raw_event(
         "fetched_at": raw.fetched_at,
     }
 
-    return event, None
+    return event, None, None
 
 
-def run_agent(agent_name: str, since: datetime | None = None) -> OversightRunResult:
+@dataclass
+class _IngestStats:
+    processed: int = 0
+    escalations: int = 0
+    deviations: int = 0
+    errors: list = field(default_factory=list)
+
+
+def _process_chunk(
+    chunk: list[RawEvent],
+    agent,
+    source_type: str,
+    baseline_cache: BaselineCache,
+    timings: StageTimings,
+    executor: ThreadPoolExecutor | None,
+) -> list[tuple[dict | None, str | None, dict | None, Exception | None]]:
+    """Run _process_raw_event over a chunk, returning outcomes in input order."""
+
+    def process(raw: RawEvent):
+        try:
+            return *_process_raw_event(raw, agent, source_type, baseline_cache, timings), None
+        except Exception as e:
+            return None, None, None, e
+
+    if executor is None:
+        return [process(raw) for raw in chunk]
+    return list(executor.map(process, chunk))
+
+
+def _ingest_events(
+    raw_events: list[RawEvent],
+    agent,
+    agent_name: str,
+    workers: int,
+    timings: StageTimings,
+    baseline_cache: BaselineCache,
+    record_rejections: bool = True,
+) -> _IngestStats:
+    """
+    Run fetched events through the pipeline and persist the new ones.
+
+    Chunks of events go through the pipeline stages on up to ``workers``
+    threads. The threads only read the database. Each chunk is then
+    committed serially in fetch order, so om_events inserts, related
+    coverage links and signal routing are deterministic and never written
+    concurrently. Events in one chunk cannot see each other through the
+    canonical-event lookup, so a later event sharing a canonical entity
+    with one inserted earlier in the run is linked as related coverage
+    here too.
+    """
+    from src.oversight.pipeline.signal_bridge import route_oversight_event
+
+    stats = _IngestStats()
+    inserted_entities: dict[str, str] = {}  # entity value -> event_id inserted this run
+    executor = ThreadPoolExecutor(max_workers=workers) if workers > 1 else None
+    try:
+        for offset in range(0, len(raw_events), EVENT_CHUNK_SIZE):
+            chunk = raw_events[offset : offset + EVENT_CHUNK_SIZE]
+            outcomes = _process_chunk(chunk, agent, agent_name, baseline_cache, timings, executor)
+
+            for raw, (event, rejection_reason, coverage_link, error) in zip(chunk, outcomes):
+                try:
+                    if error is not None:
+                        raise error
+
+                    if coverage_link:
+                        with timings.measure("persist"):
+                            link_related_coverage(**coverage_link)
+
+                    if event and not rejection_reason:
+                        dedup_entities = extract_entities(raw.title, raw.raw_html, raw.url)
+                        canonical_id = next(
+                            (
+                                inserted_entities[v]
+                                for v in dedup_entities.values()
+                                if v in inserted_entities
+                            ),
+                            None,
+                        )
+                        if canonical_id:
+                            with timings.measure("persist"):
+                                link_related_coverage(
+                                    event_id=canonical_id,
+                                    source_type=agent_name,
+                                    url=raw.url,
+                                    title=raw.title,
+                                    pub_timestamp=event["pub_timestamp"],
+                                    pub_precision=event["pub_precision"] or "unknown",
+                                )
+                            event, rejection_reason = None, "duplicate"
+
+                    if rejection_reason:
+                        if record_rejections:
+                            with timings.measure("persist"):
+                                insert_om_rejected(
+                                    {
+                                        "source_type": agent_name,
+                                        "url": raw.url,
+                                        "title": raw.title,
+                                        "pub_timestamp": None,
+                                        "rejection_reason": rejection_reason,
+                                        "fetched_at": raw.fetched_at,
+                                    }
+                                )
+                        continue
+
+                    # Check if already exists, then insert
+                    with timings.measure("persist"):
+                        if get_om_event(event["event_id"]):
+                            continue
+                        insert_om_event(event)
+                    stats.processed += 1
+                    for value in (event.get("canonical_refs") or {}).values():
+                        if isinstance(value, str):
+                            inserted_entities.setdefault(value, event["event_id"])
+
+                    # Route through signals bridge (non-fatal)
+                    try:
+                        with timings.measure("routing"):
+                            bridge_result = route_oversight_event(event)
+                        if bridge_result.surfaced:
+                            logger.info(f"[{agent_name}] Event surfaced: {event['event_id']}")
+                    except Exception as e:
+                        logger.warning(f"[{agent_name}] Signal bridge error (non-fatal): {e}")
+
+                    if event.get("is_escalation"):
+                        stats.escalations += 1
+                    if event.get("is_deviation"):
+                        stats.deviations += 1
+
+                except Exception as e:
+                    stats.errors.append(f"Error processing {raw.url}: {str(e)}")
+                    logger.error(f"Error processing event: {e}")
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    return stats
+
+
+def run_agent(
+    agent_name: str, since: datetime | None = None, workers: int | None = None
+) -> OversightRunResult:
     """
     Run a single oversight agent.
 
     Args:
         agent_name: Name of agent to run
         since: Only fetch events since this time
+        workers: Event processing threads (default OVERSIGHT_EVENT_WORKERS)
 
     Returns:
-        OversightRunResult with stats
+        OversightRunResult with stats and per-stage timings
     """
     if agent_name not in AGENT_REGISTRY:
         return OversightRunResult(
@@ -223,13 +419,16 @@ def run_agent(agent_name: str, since: datetime | None = None) -> OversightRunRes
             errors=[f"Unknown agent: {agent_name}"],
         )
 
+    timings = StageTimings()
+    baseline_cache = BaselineCache()
     try:
         # Initialize agent
         agent_class = AGENT_REGISTRY[agent_name]
         agent = agent_class()
 
         # Fetch events
-        raw_events = agent.fetch_new(since=since)
+        with timings.measure("fetch"):
+            raw_events = agent.fetch_new(since=since)
         logger.info(f"[{agent_name}] Fetched {len(raw_events)} events")
 
         if not raw_events:
@@ -237,64 +436,30 @@ def run_agent(agent_name: str, since: datetime | None = None) -> OversightRunRes
                 agent=agent_name,
                 status="NO_DATA",
                 events_fetched=0,
+                stage_timings=timings.as_dict(),
             )
 
         # Process events
-        processed = 0
-        escalations = 0
-        errors = []
-
-        for raw in raw_events:
-            try:
-                event, rejection_reason = _process_raw_event(raw, agent, agent_name)
-
-                if rejection_reason:
-                    insert_om_rejected(
-                        {
-                            "source_type": agent_name,
-                            "url": raw.url,
-                            "title": raw.title,
-                            "pub_timestamp": None,
-                            "rejection_reason": rejection_reason,
-                            "fetched_at": raw.fetched_at,
-                        }
-                    )
-                    continue
-
-                # Check if already exists
-                existing = get_om_event(event["event_id"])
-                if existing:
-                    continue
-
-                # Insert event
-                insert_om_event(event)
-                processed += 1
-
-                # Route through signals bridge (non-fatal)
-                try:
-                    from src.oversight.pipeline.signal_bridge import route_oversight_event
-
-                    bridge_result = route_oversight_event(event)
-                    if bridge_result.surfaced:
-                        logger.info(f"[{agent_name}] Event surfaced: {event['event_id']}")
-                except Exception as e:
-                    logger.warning(f"[{agent_name}] Signal bridge error (non-fatal): {e}")
-
-                if event.get("is_escalation"):
-                    escalations += 1
-
-            except Exception as e:
-                errors.append(f"Error processing {raw.url}: {str(e)}")
-                logger.error(f"Error processing event: {e}")
+        with timings.measure("ingest"):
+            stats = _ingest_events(
+                raw_events,
+                agent,
+                agent_name,
+                workers or DEFAULT_EVENT_WORKERS,
+                timings,
+                baseline_cache,
+            )
 
         return OversightRunResult(
             agent=agent_name,
-            status="SUCCESS" if processed > 0 else "NO_DATA",
+            status="SUCCESS" if stats.processed > 0 else "NO_DATA",
             events_fetched=len(raw_events),
-            events_processed=processed,
-            escalations=escalations,
-            deviations=0,
-            errors=errors,
+            events_processed=stats.processed,
+            escalations=stats.escalations,
+            deviations=stats.deviations,
+            errors=stats.errors,
+            stage_timings=timings.as_dict(),
+            baseline_cache=baseline_cache.stats(),
         )
 
     except Exception as e:
@@ -303,6 +468,7 @@ def run_agent(agent_name: str, since: datetime | None = None) -> OversightRunRes
             agent=agent_name,
             status="ERROR",
             errors=[str(e)],
+            stage_timings=timings.as_dict(),
         )
 
 
@@ -393,6 +559,7 @@ def run_backfill(
     agent_name: str,
     start_date: str,
     end_date: str,
+    workers: int | None = None,
 ) -> OversightRunResult:
     """
     Backfill historical data for an agent.
@@ -401,9 +568,10 @@ def run_backfill(
         agent_name: Agent to backfill
         start_date: Start date (YYYY-MM-DD)
         end_date: End date (YYYY-MM-DD)
+        workers: Event processing threads (default OVERSIGHT_EVENT_WORKERS)
 
     Returns:
-        OversightRunResult with stats
+        OversightRunResult with stats and per-stage timings
     """
     if agent_name not in AGENT_REGISTRY:
         return OversightRunResult(
@@ -412,6 +580,8 @@ def run_backfill(
             errors=[f"Unknown agent: {agent_name}"],
         )
 
+    timings = StageTimings()
+    baseline_cache = BaselineCache()
     try:
         agent_class = AGENT_REGISTRY[agent_name]
         agent = agent_class()
@@ -419,32 +589,32 @@ def run_backfill(
         start = datetime.fromisoformat(start_date).replace(tzinfo=UTC)
         end = datetime.fromisoformat(end_date).replace(tzinfo=UTC)
 
-        raw_events = agent.backfill(start, end)
+        with timings.measure("fetch"):
+            raw_events = agent.backfill(start, end)
         logger.info(f"[{agent_name}] Backfill fetched {len(raw_events)} events")
 
-        # Process same as normal run
-        processed = 0
-        for raw in raw_events:
-            event, rejection_reason = _process_raw_event(raw, agent, agent_name)
-            if event:
-                existing = get_om_event(event["event_id"])
-                if not existing:
-                    insert_om_event(event)
-                    processed += 1
-
-                    # Route through signals bridge (non-fatal)
-                    try:
-                        from src.oversight.pipeline.signal_bridge import route_oversight_event
-
-                        route_oversight_event(event)
-                    except Exception as e:
-                        logger.warning(f"[{agent_name}] Signal bridge error (non-fatal): {e}")
+        # Process same as normal run, without recording rejections
+        with timings.measure("ingest"):
+            stats = _ingest_events(
+                raw_events,
+                agent,
+                agent_name,
+                workers or DEFAULT_EVENT_WORKERS,
+                timings,
+                baseline_cache,
+                record_rejections=False,
+            )
 
         return OversightRunResult(
             agent=agent_name,
-            status="SUCCESS" if processed > 0 else "NO_DATA",
+            status="SUCCESS" if stats.processed > 0 else "NO_DATA",
             events_fetched=len(raw_events),
-            events_processed=processed,
+            events_processed=stats.processed,
+            escalations=stats.escalations,
+            deviations=stats.deviations,
+            errors=stats.errors,
+            stage_timings=timings.as_dict(),
+            baseline_cache=baseline_cache.stats(),
         )
 
     except Exception as e:
@@ -452,6 +622,7 @@ def run_backfill(
             agent=agent_name,
             status="ERROR",
             errors=[str(e)],
+            stage_timings=timings.as_dict(),
         )
 
 
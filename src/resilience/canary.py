@@ -2,12 +2,22 @@
 
 Each canary check encodes a heuristic about what "healthy" pipeline output
 looks like.  Failures are advisory (logged as warnings), not fatal.
+
+Table-level checks are run-scoped by default. pre_run_check records a
+watermark per checked table: the MAX of an indexed column, such as
+first_seen_at or source_runs.id. After the run, each check looks only at
+rows at or past that watermark, i.e. the rows the run wrote. Those rows are
+found by index instead of scanning the whole table. run_canaries(...,
+full_scan=True) checks the whole table instead (see scripts/run_canary_sweep.py
+for the nightly sweep).
 """
 
 import logging
+import time
 from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import UTC, datetime
+from typing import Any
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +29,9 @@ class CanaryResult:
     passed: bool
     message: str
     severity: str = "warning"  # "warning" or "critical"
+    check: str = ""
+    scope: str = "run"  # "run" (rows written by this run) or "full" (whole table)
+    duration_ms: float | None = None
 
 
 # ---------------------------------------------------------------------------
@@ -45,19 +58,37 @@ def weekday_has_documents(source_id: str, run_record: dict | None = None) -> Can
     return CanaryResult(passed=True, message=f"{source_id}: {records_fetched} documents fetched")
 
 
-def no_duplicate_ids(table: str, id_column: str) -> CanaryResult:
-    """Verify no duplicate values exist in the specified column."""
+def no_duplicate_ids(
+    table: str, id_column: str, since_column: str | None = None, since: Any = None
+) -> CanaryResult:
+    """Verify no duplicate values exist in the specified column.
+
+    With *since_column* and *since*, only ids of rows whose *since_column*
+    is >= *since* are checked, each looked up by the id column's index.
+    """
     try:
         from src.db import connect, execute
 
+        if since_column is not None and since is not None:
+            sql = (
+                f"SELECT {id_column}, COUNT(*) FROM {table} "  # noqa: S608
+                f"WHERE {id_column} IN "
+                f"(SELECT {id_column} FROM {table} WHERE {since_column} >= :since) "
+                f"GROUP BY {id_column} HAVING COUNT(*) > 1 LIMIT 5"
+            )
+            params = {"since": since}
+        else:
+            sql = (
+                f"SELECT {id_column}, COUNT(*) FROM {table} "  # noqa: S608
+                f"GROUP BY {id_column} HAVING COUNT(*) > 1 LIMIT 5"
+            )
+            params = None
+
         con = connect()
-        cur = execute(
-            con,
-            f"SELECT {id_column}, COUNT(*) AS cnt FROM {table} "  # noqa: S608
-            f"GROUP BY {id_column} HAVING cnt > 1 LIMIT 5",
-        )
-        dupes = cur.fetchall()
-        con.close()
+        try:
+            dupes = execute(con, sql, params).fetchall()
+        finally:
+            con.close()
 
         if dupes:
             dupe_ids = [str(row[0]) for row in dupes]
@@ -75,25 +106,43 @@ def no_duplicate_ids(table: str, id_column: str) -> CanaryResult:
         )
 
 
-def timestamps_monotonic(table: str, ts_column: str) -> CanaryResult:
-    """Verify that the last 10 rows have non-decreasing timestamps."""
+def timestamps_monotonic(
+    table: str, ts_column: str, order_column: str = "id", since: Any = None
+) -> CanaryResult:
+    """Verify that timestamps do not decrease in insertion (*order_column*) order.
+
+    Checks the last 10 rows, or with *since*, every row whose *order_column*
+    is >= *since*.
+    """
     try:
         from src.db import connect, execute
 
+        if since is not None:
+            sql = (
+                f"SELECT {ts_column} FROM {table} "  # noqa: S608
+                f"WHERE {order_column} >= :since ORDER BY {order_column}"
+            )
+            params = {"since": since}
+        else:
+            sql = (
+                f"SELECT {ts_column} FROM {table} "  # noqa: S608
+                f"ORDER BY {order_column} DESC LIMIT 10"
+            )
+            params = None
+
         con = connect()
-        cur = execute(
-            con,
-            f"SELECT {ts_column} FROM {table} "  # noqa: S608
-            f"ORDER BY rowid DESC LIMIT 10",
-        )
-        rows = cur.fetchall()
-        con.close()
+        try:
+            rows = execute(con, sql, params).fetchall()
+        finally:
+            con.close()
 
         if len(rows) < 2:
             return CanaryResult(passed=True, message=f"Not enough rows in {table} to check")
 
-        # Rows come in DESC order from DB; reverse to get chronological
-        timestamps = [row[0] for row in reversed(rows) if row[0] is not None]
+        if since is None:
+            # Rows come in DESC order from DB; reverse to get chronological
+            rows = list(reversed(rows))
+        timestamps = [row[0] for row in rows if row[0] is not None]
 
         for i in range(1, len(timestamps)):
             if timestamps[i] < timestamps[i - 1]:
@@ -122,71 +171,158 @@ def timestamps_monotonic(table: str, ts_column: str) -> CanaryResult:
 CanaryCheck = Callable[[str, dict | None], CanaryResult]
 
 
-def _wrap_table_check(
-    fn: Callable[..., CanaryResult], *args: str
-) -> Callable[[str, dict | None], CanaryResult]:
-    """Wrap a table-level check so it conforms to the (source_id, run_record) signature."""
+@dataclass(frozen=True)
+class TableCheck:
+    """A table-level check, run-scoped by the table's *watermark_column*.
+
+    Calls ``fn(table, column, watermark_column, since)``; ``since=None``
+    checks the whole table.
+    """
 
-    def _check(_source_id: str, _run_record: dict | None = None) -> CanaryResult:
-        return fn(*args)
+    fn: Callable[..., CanaryResult]
+    table: str
+    column: str
+    watermark_column: str
 
-    return _check
+    @property
+    def name(self) -> str:
+        return f"{self.fn.__name__}({self.table}.{self.column})"
+
+    @property
+    def watermark_key(self) -> str:
+        return f"{self.table}.{self.watermark_column}"
+
+    def __call__(
+        self, _source_id: str, _run_record: dict | None = None, since: Any = None
+    ) -> CanaryResult:
+        return self.fn(self.table, self.column, self.watermark_column, since)
+
+
+def _wrap_table_check(
+    fn: Callable[..., CanaryResult], table: str, column: str, watermark_column: str
+) -> TableCheck:
+    """Wrap a table-level check so it conforms to the (source_id, run_record) signature."""
+    return TableCheck(fn, table, column, watermark_column)
 
 
 CANARY_REGISTRY: dict[str, list[CanaryCheck]] = {
     "govinfo_fr_bulk": [
         weekday_has_documents,
-        _wrap_table_check(no_duplicate_ids, "fr_seen", "doc_id"),
-        _wrap_table_check(timestamps_monotonic, "source_runs", "ended_at"),
+        _wrap_table_check(no_duplicate_ids, "fr_seen", "doc_id", "first_seen_at"),
+        _wrap_table_check(timestamps_monotonic, "source_runs", "ended_at", "id"),
     ],
     "ecfr_delta": [
-        _wrap_table_check(no_duplicate_ids, "ecfr_seen", "doc_id"),
-        _wrap_table_check(timestamps_monotonic, "source_runs", "ended_at"),
+        _wrap_table_check(no_duplicate_ids, "ecfr_seen", "doc_id", "first_seen_at"),
+        _wrap_table_check(timestamps_monotonic, "source_runs", "ended_at", "id"),
     ],
     "congress_bills": [
-        _wrap_table_check(no_duplicate_ids, "bills", "bill_id"),
-        _wrap_table_check(timestamps_monotonic, "source_runs", "ended_at"),
+        _wrap_table_check(no_duplicate_ids, "bills", "bill_id", "updated_at"),
+        _wrap_table_check(timestamps_monotonic, "source_runs", "ended_at", "id"),
     ],
     "congress_hearings": [
-        _wrap_table_check(no_duplicate_ids, "hearings", "event_id"),
-        _wrap_table_check(timestamps_monotonic, "source_runs", "ended_at"),
+        _wrap_table_check(no_duplicate_ids, "hearings", "event_id", "updated_at"),
+        _wrap_table_check(timestamps_monotonic, "source_runs", "ended_at", "id"),
     ],
     "oversight": [
-        _wrap_table_check(no_duplicate_ids, "om_events", "event_id"),
-        _wrap_table_check(timestamps_monotonic, "source_runs", "ended_at"),
+        _wrap_table_check(no_duplicate_ids, "om_events", "event_id", "fetched_at"),
+        _wrap_table_check(timestamps_monotonic, "source_runs", "ended_at", "id"),
     ],
     "lda_gov": [
-        _wrap_table_check(no_duplicate_ids, "lda_filings", "filing_uuid"),
-        _wrap_table_check(timestamps_monotonic, "source_runs", "ended_at"),
+        _wrap_table_check(no_duplicate_ids, "lda_filings", "filing_uuid", "first_seen_at"),
+        _wrap_table_check(timestamps_monotonic, "source_runs", "ended_at", "id"),
     ],
     "authority_aggregate": [
-        _wrap_table_check(timestamps_monotonic, "source_runs", "ended_at"),
+        _wrap_table_check(timestamps_monotonic, "source_runs", "ended_at", "id"),
     ],
     "battlefield_sync": [
-        _wrap_table_check(timestamps_monotonic, "source_runs", "ended_at"),
+        _wrap_table_check(timestamps_monotonic, "source_runs", "ended_at", "id"),
     ],
     "signals_routing": [
-        _wrap_table_check(timestamps_monotonic, "source_runs", "ended_at"),
+        _wrap_table_check(timestamps_monotonic, "source_runs", "ended_at", "id"),
     ],
 }
 
 
-def run_canaries(source_id: str, run_record: dict | None = None) -> list[CanaryResult]:
+def capture_watermarks(source_id: str) -> dict[str, Any]:
+    """Current watermark of every table checked for *source_id*, before a run.
+
+    Keys are ``"table.column"``. A value of None means the table was empty.
+    Tables whose watermark cannot be read are left out, so their checks fall
+    back to a full scan.
+    """
+    checks = [c for c in CANARY_REGISTRY.get(source_id, []) if isinstance(c, TableCheck)]
+    if not checks:
+        return {}
+
+    from src.db import connect, execute
+
+    watermarks: dict[str, Any] = {}
+    con = connect()
+    try:
+        for check in checks:
+            if check.watermark_key in watermarks:
+                continue
+            try:
+                cur = execute(
+                    con,
+                    f"SELECT MAX({check.watermark_column}) FROM {check.table}",  # noqa: S608
+                )
+                watermarks[check.watermark_key] = cur.fetchone()[0]
+            except Exception as e:
+                logger.debug(f"No canary watermark for {check.watermark_key}: {e}")
+    finally:
+        con.close()
+    return watermarks
+
+
+def run_canaries(
+    source_id: str,
+    run_record: dict | None = None,
+    watermarks: dict[str, Any] | None = None,
+    full_scan: bool = False,
+) -> list[CanaryResult]:
     """Run all registered canary checks for *source_id*.
 
+    Table checks are limited to the rows written since *watermarks* (from
+    :func:`capture_watermarks`). Without a watermark for a table, or with
+    *full_scan*, they check the whole table. Each result records the check
+    name, its scope and how long it took.
+
     Returns a (possibly empty) list of :class:`CanaryResult` objects.
     """
     checks = CANARY_REGISTRY.get(source_id, [])
+    watermarks = watermarks or {}
     results: list[CanaryResult] = []
     for check in checks:
+        name = getattr(check, "name", None) or getattr(check, "__name__", repr(check))
+        scope = "run"
+        started = time.perf_counter()
         try:
-            results.append(check(source_id, run_record))
+            if isinstance(check, TableCheck):
+                if not full_scan and check.watermark_key in watermarks:
+                    result = check(source_id, run_record, since=watermarks[check.watermark_key])
+                else:
+                    scope = "full"
+                    result = check(source_id, run_record)
+            else:
+                result = check(source_id, run_record)
         except Exception as e:
-            results.append(
-                CanaryResult(
-                    passed=False,
-                    message=f"Canary check raised: {e}",
-                    severity="warning",
-                )
+            result = CanaryResult(
+                passed=False,
+                message=f"Canary check raised: {e}",
+                severity="warning",
             )
+        result.check = name
+        result.scope = scope
+        result.duration_ms = round((time.perf_counter() - started) * 1000, 3)
+        logger.debug(
+            "CANARY_TIMING",
+            extra={
+                "source_id": source_id,
+                "check": name,
+                "scope": scope,
+                "duration_ms": result.duration_ms,
+            },
+        )
+        results.append(result)
     return results
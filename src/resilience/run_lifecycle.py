@@ -37,6 +37,10 @@ class RunContext:
     preconditions_passed: bool = True
     postcondition_failures: list[str] = field(default_factory=list)
     canary_failures: list[str] = field(default_factory=list)
+    # "table.column" -> value before the run; scopes canaries to rows it wrote
+    canary_watermarks: dict[str, Any] = field(default_factory=dict)
+    # check name -> milliseconds, from the post-run canaries
+    canary_timings: dict[str, float] = field(default_factory=dict)
 
 
 def pre_run_check(source_id: str) -> RunContext:
@@ -80,6 +84,17 @@ def pre_run_check(source_id: str) -> RunContext:
             extra={"source_id": source_id},
         )
 
+    # Record canary watermarks so post-run canaries only check this run's rows
+    try:
+        from src.resilience.canary import capture_watermarks
+
+        ctx.canary_watermarks = capture_watermarks(source_id)
+    except Exception as e:
+        logger.warning(
+            "PRE_RUN_WARNING: Canary watermarks unavailable, canaries will scan full tables",
+            extra={"source_id": source_id, "error": str(e)},
+        )
+
     return ctx
 
 
@@ -113,8 +128,9 @@ def post_run_check(ctx: RunContext, run_record: dict | None = None) -> RunContex
     try:
         from src.resilience.canary import run_canaries
 
-        canary_results = run_canaries(ctx.source_id, run_record)
+        canary_results = run_canaries(ctx.source_id, run_record, watermarks=ctx.canary_watermarks)
         for result in canary_results:
+            ctx.canary_timings[result.check] = result.duration_ms
             if not result.passed:
                 ctx.canary_failures.append(result.message)
                 logger.warning(
@@ -206,6 +222,14 @@ def with_lifecycle(source_id: str) -> Callable:
                         "failures": ctx.canary_failures,
                     },
                 )
+            if ctx.canary_timings:
+                logger.info(
+                    "LIFECYCLE_CANARY_TIMINGS",
+                    extra={
+                        "source_id": source_id,
+                        "timings_ms": ctx.canary_timings,
+                    },
+                )
 
             return result
 
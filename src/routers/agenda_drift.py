@@ -3,11 +3,12 @@
 import logging
 
 from fastapi import APIRouter, Depends, HTTPException, Query
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
+from .. import agenda_drift_index
 from ..auth.models import UserRole
 from ..auth.rbac import RoleChecker
-from ..db import connect, execute, table_exists
+from ..db import connect, execute, get_ad_utterance_by_id, table_exists
 from ._helpers import utc_now_iso
 
 logger = logging.getLogger(__name__)
@@ -42,6 +43,26 @@ class ADMemberStats(BaseModel):
     avg_zscore: float
 
 
+class ADSimilarUtterance(BaseModel):
+    utterance_id: str
+    member_id: str
+    hearing_id: str
+    content: str
+    spoken_at: str
+    similarity: float
+
+
+class ADSimilarResponse(BaseModel):
+    member_id: str
+    results: list[ADSimilarUtterance]
+    count: int
+
+
+class ADSimilarTextRequest(BaseModel):
+    text: str = Field(..., min_length=1, max_length=10000)
+    k: int = Field(10, ge=1, le=100)
+
+
 # --- Endpoints ---
 
 
@@ -232,3 +253,63 @@ def get_ad_member_history(
         "events": events,
         "count": total,
     }
+
+
+def _similar_response(member_id: str, results: list[dict]) -> ADSimilarResponse:
+    return ADSimilarResponse(
+        member_id=member_id,
+        results=[ADSimilarUtterance(**r) for r in results],
+        count=len(results),
+    )
+
+
+@router.get("/api/agenda-drift/members/{member_id}/typical", response_model=ADSimilarResponse)
+def get_ad_member_typical(
+    member_id: str,
+    k: int = Query(5, ge=1, le=50, description="Number of utterances to return"),
+    _: None = Depends(RoleChecker(UserRole.ANALYST)),
+):
+    """Get the member's utterances closest to their baseline centroid."""
+    results = agenda_drift_index.typical_utterances(member_id, limit=k)
+    # Without a baseline typical_utterances falls back to unranked recent rows
+    results = [r for r in results if "similarity" in r]
+    return _similar_response(member_id, results)
+
+
+@router.get("/api/agenda-drift/utterances/{utterance_id}/similar", response_model=ADSimilarResponse)
+def get_ad_similar_utterances(
+    utterance_id: str,
+    k: int = Query(10, ge=1, le=100, description="Number of utterances to return"),
+    _: None = Depends(RoleChecker(UserRole.ANALYST)),
+):
+    """Get the same member's utterances most similar to a stored utterance."""
+    utterance = get_ad_utterance_by_id(utterance_id)
+    if not utterance:
+        raise HTTPException(status_code=404, detail="Utterance not found")
+
+    member_id = utterance["member_id"]
+    results = agenda_drift_index.similar_to_utterance(utterance_id, member_id, k=k)
+    if results is None:
+        raise HTTPException(status_code=404, detail="Utterance has no embedding")
+    return _similar_response(member_id, results)
+
+
+@router.post("/api/agenda-drift/members/{member_id}/similar-text", response_model=ADSimilarResponse)
+def post_ad_similar_text(
+    member_id: str,
+    body: ADSimilarTextRequest,
+    _: None = Depends(RoleChecker(UserRole.ANALYST)),
+):
+    """Get the member's utterances most similar to arbitrary text."""
+    try:
+        vec = agenda_drift_index.encode_text(body.text)
+    except RuntimeError as e:
+        logger.warning("Similar-text search unavailable: %s", e)
+        raise HTTPException(status_code=503, detail="Text embedding model unavailable")
+
+    try:
+        results = agenda_drift_index.similar_to_vector(member_id, vec, k=body.k)
+    except ValueError as e:
+        # Query model dimension differs from the stored embeddings
+        raise HTTPException(status_code=409, detail=str(e))
+    return _similar_response(member_id, results)
@@ -13,7 +13,7 @@ from ..db.compound import (
     get_compound_stats,
     resolve_compound_signal,
 )
-from ..signals.correlator import CorrelationEngine
+from ..signals.correlator import CorrelationEngine, get_shared_engine
 from ._helpers import utc_now_iso
 
 logger = logging.getLogger(__name__)
@@ -127,10 +127,13 @@ def compound_stats(
 
 @router.post("/api/compound/run")
 def run_correlation_engine(
+    incremental: bool = Query(False, description="Only correlate events changed since last run"),
     _: None = Depends(RoleChecker(UserRole.ANALYST)),
 ):
     """Trigger correlation engine evaluation manually. Requires ANALYST role."""
     try:
+        if incremental:
+            return get_shared_engine().run(incremental=True)
         engine = CorrelationEngine()
         result = engine.run()
         return result
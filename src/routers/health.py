@@ -6,10 +6,12 @@ from datetime import UTC, datetime
 from fastapi import APIRouter, Depends, Query
 from pydantic import BaseModel
 
+from ..auth.audit import get_audit_writer_stats
+from ..auth.cache import get_auth_cache_stats
 from ..auth.models import UserRole
 from ..auth.rbac import RoleChecker
-from ..db import connect, execute, table_exists
-from ..notify_email import check_smtp_health
+from ..db import connect, execute, fetch_all, get_pool_stats, table_exists
+from ..notify_email import smtp_prober
 from ..resilience.circuit_breaker import (
     congress_api_cb,
     database_cb,
@@ -29,6 +31,37 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(tags=["Health"])
 
+# Latest run status and last success per source, by index seeks only: the
+# recursive CTE walks the distinct source_ids through idx_source_runs_source
+# (one seek per source, not a scan of every run), then each source's latest
+# run comes from idx_source_runs_source (source_id, ended_at) and its last
+# success from idx_source_runs_source_status_ended (source_id, status, ended_at).
+# Both indexes exist in schema.sql and schema.postgres.sql (migration 014).
+LATEST_SOURCE_RUNS_SQL = """
+    WITH RECURSIVE sources(source_id) AS (
+        SELECT MIN(source_id) FROM source_runs
+        UNION ALL
+        SELECT (
+            SELECT MIN(r.source_id) FROM source_runs r WHERE r.source_id > sources.source_id
+        )
+        FROM sources WHERE sources.source_id IS NOT NULL
+    )
+    SELECT
+        s.source_id,
+        (
+            SELECT r.status FROM source_runs r
+            WHERE r.source_id = s.source_id
+            ORDER BY r.ended_at DESC, r.id DESC
+            LIMIT 1
+        ) AS last_status,
+        (
+            SELECT MAX(r.ended_at) FROM source_runs r
+            WHERE r.source_id = s.source_id AND r.status = 'SUCCESS'
+        ) AS last_success_at
+    FROM sources s
+    WHERE s.source_id IS NOT NULL
+"""
+
 
 # --- Pydantic Models ---
 
@@ -75,75 +108,100 @@ class DeadManResponse(BaseModel):
     checked_at: str
 
 
-# --- Endpoints ---
+class DBPoolStats(BaseModel):
+    backend: str
+    enabled: bool
+    connections_opened: int
+    connections_closed: int
+    checkouts: int
+    reuses: int
+    in_use: int
+    idle: int
+    max_size: int | None
+    wait_timeouts: int
 
 
-@router.get("/api/health", response_model=HealthResponse)
-def get_health(_: None = Depends(RoleChecker(UserRole.VIEWER))):
-    """Get health status for each source. Requires VIEWER role."""
-    con = connect()
+class DBPoolResponse(BaseModel):
+    enabled: bool
+    settings: dict
+    pools: list[DBPoolStats]
+    checked_at: str
 
-    try:
-        # Get distinct source IDs
-        cur = execute(con, "SELECT DISTINCT source_id FROM source_runs")
-        source_ids = [row[0] for row in cur.fetchall()]
 
-        now = datetime.now(UTC)
-        sources: list[SourceHealth] = []
+class AuthCacheStats(BaseModel):
+    name: str
+    size: int
+    max_entries: int
+    ttl_seconds: float
+    hits: int
+    misses: int
+    expirations: int
+    evictions: int
+    invalidations: int
+    stale_sets: int
+    hit_rate: float
+
+
+class AuthCacheResponse(BaseModel):
+    caches: list[AuthCacheStats]
+    checked_at: str
 
-        for source_id in source_ids:
-            # Last successful run
-            cur = execute(
-                con,
-                """
-                SELECT ended_at FROM source_runs
-                WHERE source_id = :source_id AND status = 'SUCCESS'
-                ORDER BY ended_at DESC LIMIT 1
-                """,
-                {"source_id": source_id},
-            )
-            success_row = cur.fetchone()
 
-            # Last run (any status)
-            cur = execute(
-                con,
-                """
-                SELECT status FROM source_runs
-                WHERE source_id = :source_id
-                ORDER BY ended_at DESC LIMIT 1
-                """,
-                {"source_id": source_id},
-            )
-            last_row = cur.fetchone()
+class AuditWriterResponse(BaseModel):
+    running: bool
+    queue_depth: int
+    queue_max_size: int
+    queue_full_policy: str
+    enqueued: int
+    dropped: int
+    written: int
+    skipped_contaminated: int
+    write_errors: int
+    batches: int
+    last_batch_size: int
+    last_flush_ms: float
+    avg_flush_ms: float
+    max_flush_ms: float
+    checked_at: str
 
-            last_success_at = success_row[0] if success_row else None
-            hours_since_success = None
 
-            if last_success_at:
-                try:
-                    # Handle both ISO formats
-                    ts = last_success_at.replace("Z", "+00:00")
-                    last_dt = datetime.fromisoformat(ts)
-                    if last_dt.tzinfo is None:
-                        last_dt = last_dt.replace(tzinfo=UTC)
-                    delta = now - last_dt
-                    hours_since_success = round(delta.total_seconds() / 3600, 2)
-                except (ValueError, TypeError):
-                    pass
+# --- Endpoints ---
 
-            sources.append(
-                SourceHealth(
-                    source_id=source_id,
-                    last_success_at=last_success_at,
-                    hours_since_success=hours_since_success,
-                    last_run_status=last_row[0] if last_row else None,
-                )
+
+@router.get("/api/health", response_model=HealthResponse)
+async def get_health(_: None = Depends(RoleChecker(UserRole.VIEWER))):
+    """Get health status for each source. Requires VIEWER role."""
+    rows = await fetch_all(LATEST_SOURCE_RUNS_SQL)
+
+    now = datetime.now(UTC)
+    sources: list[SourceHealth] = []
+
+    for source_id, last_status, last_success_at in sorted(rows, key=lambda row: row[0]):
+        hours_since_success = None
+
+        if last_success_at:
+            try:
+                # Handle both ISO formats
+                ts = last_success_at.replace("Z", "+00:00")
+                last_dt = datetime.fromisoformat(ts)
+                if last_dt.tzinfo is None:
+                    last_dt = last_dt.replace(tzinfo=UTC)
+                delta = now - last_dt
+                hours_since_success = round(delta.total_seconds() / 3600, 2)
+            except (ValueError, TypeError):
+                pass
+
+        sources.append(
+            SourceHealth(
+                source_id=source_id,
+                last_success_at=last_success_at,
+                hours_since_success=hours_since_success,
+                last_run_status=last_status,
             )
-    finally:
-        con.close()
+        )
 
-    # Check email SMTP health
-    smtp_status = check_smtp_health()
+    # Email SMTP health from the background prober (never blocks on SMTP)
+    smtp_status = smtp_prober.status()
     email_health = EmailHealth(
         configured=smtp_status["configured"],
         reachable=smtp_status["reachable"],
@@ -283,6 +341,33 @@ def get_deadman_switch(_: None = Depends(RoleChecker(UserRole.VIEWER))):
     )
 
 
+@router.get("/api/health/db-pool", response_model=DBPoolResponse, tags=["Health"])
+def get_db_pool_health(_: None = Depends(RoleChecker(UserRole.VIEWER))):
+    """Connection pool settings and counters for each active DB backend."""
+    stats = get_pool_stats()
+    return DBPoolResponse(
+        enabled=stats["enabled"],
+        settings=stats["settings"],
+        pools=[DBPoolStats(**pool) for pool in stats["pools"]],
+        checked_at=utc_now_iso(),
+    )
+
+
+@router.get("/api/health/auth-cache", response_model=AuthCacheResponse, tags=["Health"])
+def get_auth_cache_health(_: None = Depends(RoleChecker(UserRole.VIEWER))):
+    """Hit rates and sizes of the role and tenant resolution caches."""
+    return AuthCacheResponse(
+        caches=[AuthCacheStats(**cache) for cache in get_auth_cache_stats()],
+        checked_at=utc_now_iso(),
+    )
+
+
+@router.get("/api/health/audit-writer", response_model=AuditWriterResponse, tags=["Health"])
+def get_audit_writer_health(_: None = Depends(RoleChecker(UserRole.VIEWER))):
+    """Queue depth, drops and flush latency of the batched audit log writer."""
+    return AuditWriterResponse(**get_audit_writer_stats(), checked_at=utc_now_iso())
+
+
 # --- Staleness Detection Models ---
 
 
@@ -7,7 +7,7 @@ from pydantic import BaseModel
 
 from ..auth.models import UserRole
 from ..auth.rbac import RoleChecker
-from ..db import connect, table_exists
+from ..db import connect, run_db, table_exists
 from ..oversight.db_helpers import get_escalation_queue, get_oversight_events, get_oversight_stats
 
 logger = logging.getLogger(__name__)
@@ -67,11 +67,10 @@ class OversightStatsResponse(BaseModel):
 
 
 @router.get("/api/oversight/stats", response_model=OversightStatsResponse)
-def get_oversight_stats_endpoint(_: None = Depends(RoleChecker(UserRole.VIEWER))):
+async def get_oversight_stats_endpoint(_: None = Depends(RoleChecker(UserRole.VIEWER))):
     """Get oversight monitor aggregate statistics."""
-    con = connect()
-    if not table_exists(con, "om_events"):
-        con.close()
+    stats = await run_db(_load_oversight_stats)
+    if stats is None:
         return OversightStatsResponse(
             total_events=0,
             escalations=0,
@@ -80,11 +79,20 @@ def get_oversight_stats_endpoint(_: None = Depends(RoleChecker(UserRole.VIEWER))
             last_event_at=None,
             by_source={},
         )
-    con.close()
-    stats = get_oversight_stats()
     return OversightStatsResponse(**stats)
 
 
+def _load_oversight_stats() -> dict | None:
+    """Oversight stats, or None before the om_events table exists."""
+    con = connect()
+    try:
+        if not table_exists(con, "om_events"):
+            return None
+    finally:
+        con.close()
+    return get_oversight_stats()
+
+
 @router.get("/api/oversight/events", response_model=OversightEventsResponse)
 def get_oversight_events_endpoint(
     limit: int = Query(50, ge=1, le=500, description="Max events to return"),
@@ -1,6 +1,12 @@
-"""Pipeline runs, documents, and errors endpoints."""
+"""Pipeline runs, documents, and errors endpoints.
 
+These are polled by every open dashboard, so they are async and read through
+the async DB path instead of occupying Starlette's shared threadpool.
+"""
+
+import asyncio
 import logging
+from collections import defaultdict
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
@@ -9,7 +15,7 @@ from pydantic import BaseModel
 
 from ..auth.models import UserRole
 from ..auth.rbac import RoleChecker
-from ..db import connect, execute
+from ..db import fetch_all, fetch_one, get_source_run_rollups, run_db
 from ._helpers import parse_errors_json
 
 logger = logging.getLogger(__name__)
@@ -101,33 +107,27 @@ class ErrorsResponse(BaseModel):
 
 
 @router.get("/api/runs", response_model=RunsResponse)
-def get_runs(
+async def get_runs(
     source_id: str | None = Query(None, description="Filter by source ID"),
     status: str | None = Query(None, description="Filter by status (SUCCESS, NO_DATA, ERROR)"),
     limit: int = Query(50, ge=1, le=500, description="Number of runs to return"),
     _: None = Depends(RoleChecker(UserRole.ANALYST)),
 ):
     """Get recent source runs with optional filters. Requires ANALYST role."""
-    con = connect()
-
-    try:
-        query = "SELECT id, source_id, started_at, ended_at, status, records_fetched, errors_json FROM source_runs WHERE 1=1"
-        params: dict[str, Any] = {}
+    query = "SELECT id, source_id, started_at, ended_at, status, records_fetched, errors_json FROM source_runs WHERE 1=1"
+    params: dict[str, Any] = {}
 
-        if source_id:
-            query += " AND source_id = :source_id"
-            params["source_id"] = source_id
-        if status:
-            query += " AND status = :status"
-            params["status"] = status
+    if source_id:
+        query += " AND source_id = :source_id"
+        params["source_id"] = source_id
+    if status:
+        query += " AND status = :status"
+        params["status"] = status
 
-        query += " ORDER BY ended_at DESC LIMIT :limit"
-        params["limit"] = limit
+    query += " ORDER BY ended_at DESC LIMIT :limit"
+    params["limit"] = limit
 
-        cur = execute(con, query, params)
-        rows = cur.fetchall()
-    finally:
-        con.close()
+    rows = await fetch_all(query, params)
 
     runs = [
         SourceRun(
@@ -146,66 +146,54 @@ def get_runs(
 
 
 @router.get("/api/runs/stats", response_model=StatsResponse)
-def get_runs_stats(_: None = Depends(RoleChecker(UserRole.VIEWER))):
+async def get_runs_stats(_: None = Depends(RoleChecker(UserRole.VIEWER))):
     """Get aggregated statistics for source runs. Requires VIEWER role."""
-    con = connect()
-
-    try:
-        # Total counts by status
-        cur = execute(con, "SELECT status, COUNT(*) FROM source_runs GROUP BY status")
-        status_counts = dict(cur.fetchall())
-
-        total_runs = sum(status_counts.values())
-        success_count = status_counts.get("SUCCESS", 0)
-        error_count = status_counts.get("ERROR", 0)
-        no_data_count = status_counts.get("NO_DATA", 0)
-
-        success_rate = (success_count / total_runs * 100) if total_runs > 0 else 0.0
-        error_rate = (error_count / total_runs * 100) if total_runs > 0 else 0.0
-        healthy_rate = (
-            ((success_count + no_data_count) / total_runs * 100) if total_runs > 0 else 0.0
-        )
-
-        # Runs by source
-        cur = execute(
-            con,
-            "SELECT source_id, COUNT(*) FROM source_runs GROUP BY source_id ORDER BY COUNT(*) DESC",
-        )
-        runs_by_source = [RunsBySource(source_id=row[0], count=row[1]) for row in cur.fetchall()]
-
-        # Runs by day (last 7 days)
-        seven_days_ago = (datetime.now(UTC) - timedelta(days=7)).strftime("%Y-%m-%d")
-        cur = execute(
-            con,
-            """
-            SELECT DATE(ended_at) as day, COUNT(*)
-            FROM source_runs
-            WHERE DATE(ended_at) >= :seven_days_ago
-            GROUP BY day
-            ORDER BY day DESC
-            """,
-            {"seven_days_ago": seven_days_ago},
-        )
-        runs_by_day = [RunsByDay(date=row[0], count=row[1]) for row in cur.fetchall()]
-
+    twenty_four_hours_ago = (datetime.now(UTC) - timedelta(hours=24)).isoformat()
+    rollups, runs_today_row, new_docs_row = await asyncio.gather(
+        run_db(get_source_run_rollups),
         # Runs in last 24 hours
-        twenty_four_hours_ago = (datetime.now(UTC) - timedelta(hours=24)).isoformat()
-        cur = execute(
-            con,
+        fetch_one(
             "SELECT COUNT(*) FROM source_runs WHERE ended_at >= :since",
             {"since": twenty_four_hours_ago},
-        )
-        runs_today = cur.fetchone()[0]
-
+        ),
         # New docs in last 24 hours
-        cur = execute(
-            con,
+        fetch_one(
             "SELECT COUNT(*) FROM fr_seen WHERE first_seen_at >= :since",
             {"since": twenty_four_hours_ago},
-        )
-        new_docs_today = cur.fetchone()[0]
-    finally:
-        con.close()
+        ),
+    )
+    runs_today = runs_today_row[0]
+    new_docs_today = new_docs_row[0]
+
+    # Status, per-source and per-day totals come from the maintained
+    # rollups: one row per (source, day, status) instead of every run.
+    status_counts: dict[str, int] = defaultdict(int)
+    source_counts: dict[str, int] = defaultdict(int)
+    day_counts: dict[str, int] = defaultdict(int)
+    seven_days_ago = (datetime.now(UTC) - timedelta(days=7)).strftime("%Y-%m-%d")
+    for source_id, day, status, count in rollups:
+        status_counts[status] += count
+        source_counts[source_id] += count
+        if day >= seven_days_ago:
+            day_counts[day] += count
+
+    total_runs = sum(status_counts.values())
+    success_count = status_counts.get("SUCCESS", 0)
+    error_count = status_counts.get("ERROR", 0)
+    no_data_count = status_counts.get("NO_DATA", 0)
+
+    success_rate = (success_count / total_runs * 100) if total_runs > 0 else 0.0
+    error_rate = (error_count / total_runs * 100) if total_runs > 0 else 0.0
+    healthy_rate = ((success_count + no_data_count) / total_runs * 100) if total_runs > 0 else 0.0
+
+    runs_by_source = [
+        RunsBySource(source_id=source_id, count=count)
+        for source_id, count in sorted(source_counts.items(), key=lambda kv: (-kv[1], kv[0]))
+    ]
+    # Runs by day (last 7 days)
+    runs_by_day = [
+        RunsByDay(date=day, count=count) for day, count in sorted(day_counts.items(), reverse=True)
+    ]
 
     return StatsResponse(
         total_runs=total_runs,
@@ -223,16 +211,13 @@ def get_runs_stats(_: None = Depends(RoleChecker(UserRole.VIEWER))):
 
 
 @router.get("/api/documents/fr", response_model=FRDocumentsResponse)
-def get_fr_documents(
+async def get_fr_documents(
     limit: int = Query(100, ge=1, le=1000, description="Number of documents to return"),
     _: None = Depends(RoleChecker(UserRole.ANALYST)),
 ):
     """Get recent Federal Register documents. Requires ANALYST role."""
-    con = connect()
-
-    try:
-        cur = execute(
-            con,
+    rows, count_row = await asyncio.gather(
+        fetch_all(
             """
             SELECT doc_id, published_date, first_seen_at, source_url
             FROM fr_seen
@@ -240,14 +225,11 @@ def get_fr_documents(
             LIMIT :limit
             """,
             {"limit": limit},
-        )
-        rows = cur.fetchall()
-
+        ),
         # Get total count
-        cur = execute(con, "SELECT COUNT(*) FROM fr_seen")
-        total_count = cur.fetchone()[0]
-    finally:
-        con.close()
+        fetch_one("SELECT COUNT(*) FROM fr_seen"),
+    )
+    total_count = count_row[0]
 
     documents = [
         FRDocument(
@@ -263,22 +245,15 @@ def get_fr_documents(
 
 
 @router.get("/api/documents/ecfr", response_model=ECFRDocumentsResponse)
-def get_ecfr_documents(_: None = Depends(RoleChecker(UserRole.ANALYST))):
+async def get_ecfr_documents(_: None = Depends(RoleChecker(UserRole.ANALYST))):
     """Get eCFR tracking status. Requires ANALYST role."""
-    con = connect()
-
-    try:
-        cur = execute(
-            con,
-            """
-            SELECT doc_id, last_modified, etag, first_seen_at, source_url
-            FROM ecfr_seen
-            ORDER BY first_seen_at DESC
-            """,
-        )
-        rows = cur.fetchall()
-    finally:
-        con.close()
+    rows = await fetch_all(
+        """
+        SELECT doc_id, last_modified, etag, first_seen_at, source_url
+        FROM ecfr_seen
+        ORDER BY first_seen_at DESC
+        """,
+    )
 
     documents = [
         ECFRDocument(
@@ -295,28 +270,21 @@ def get_ecfr_documents(_: None = Depends(RoleChecker(UserRole.ANALYST))):
 
 
 @router.get("/api/errors", response_model=ErrorsResponse)
-def get_errors(
+async def get_errors(
     limit: int = Query(20, ge=1, le=100, description="Number of error runs to return"),
     _: None = Depends(RoleChecker(UserRole.ANALYST)),
 ):
     """Get recent runs with errors. Requires ANALYST role."""
-    con = connect()
-
-    try:
-        cur = execute(
-            con,
-            """
-            SELECT id, source_id, ended_at, status, errors_json
-            FROM source_runs
-            WHERE status = 'ERROR' OR errors_json != '[]'
-            ORDER BY ended_at DESC
-            LIMIT :limit
-            """,
-            {"limit": limit},
-        )
-        rows = cur.fetchall()
-    finally:
-        con.close()
+    rows = await fetch_all(
+        """
+        SELECT id, source_id, ended_at, status, errors_json
+        FROM source_runs
+        WHERE status = 'ERROR' OR errors_json != '[]'
+        ORDER BY ended_at DESC
+        LIMIT :limit
+        """,
+        {"limit": limit},
+    )
 
     error_runs = [
         ErrorRun(
@@ -1,5 +1,6 @@
 """State intelligence signals endpoints."""
 
+import asyncio
 import logging
 
 from fastapi import APIRouter, Depends, HTTPException, Query
@@ -7,6 +8,7 @@ from pydantic import BaseModel
 
 from ..auth.models import UserRole
 from ..auth.rbac import RoleChecker
+from ..db import run_db
 from ..state.db_helpers import (
     get_latest_run,
     get_recent_runs,
@@ -124,15 +126,19 @@ def get_state_runs_endpoint(
 
 
 @router.get("/api/state/stats", response_model=StateStatsResponse)
-def get_state_stats_endpoint(_: None = Depends(RoleChecker(UserRole.VIEWER))):
+async def get_state_stats_endpoint(_: None = Depends(RoleChecker(UserRole.VIEWER))):
     """Get state intelligence statistics."""
     try:
-        by_state = get_signal_count_by_state()
+        by_state, by_severity, last_run = await asyncio.gather(
+            run_db(get_signal_count_by_state),
+            run_db(get_signal_count_by_severity),
+            run_db(get_latest_run),
+        )
         return StateStatsResponse(
             total_signals=sum(by_state.values()),
             by_state=by_state,
-            by_severity=get_signal_count_by_severity(),
-            last_run=get_latest_run(),
+            by_severity=by_severity,
+            last_run=last_run,
         )
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
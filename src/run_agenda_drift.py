@@ -8,10 +8,16 @@ Usage:
 """
 
 import argparse
-import json
 
 from . import db
-from .agenda_drift import DEVIATION_THRESHOLD_Z, build_baseline, detect_deviation, explain_deviation
+from .agenda_drift import (
+    DEVIATION_THRESHOLD_Z,
+    build_baseline,
+    cosine_distances,
+    detect_deviation,
+    explain_deviation,
+    to_matrix,
+)
 from .resilience.run_lifecycle import with_lifecycle
 
 MIN_EMBEDDINGS_FOR_BASELINE = 5
@@ -92,7 +98,7 @@ def get_utterances_for_detection(member_id: str = None, limit: int = 500) -> lis
             "member_id": r[1],
             "hearing_id": r[2],
             "content": r[3],
-            "vec": json.loads(r[4]),
+            "vec": db.decode_embedding(r[4]),
         }
         for r in rows
     ]
@@ -203,13 +209,24 @@ def run_detection(limit: int = 500, generate_explanations: bool = True) -> dict:
             stats["no_baseline"] += len(member_utterances)
             continue
 
-        for u in member_utterances:
+        # Score all of this member's utterances against the baseline at once
+        try:
+            distances = cosine_distances(
+                to_matrix([u["vec"] for u in member_utterances]), baseline["vec_mean"]
+            ).tolist()
+        except ValueError as e:
+            stats["errors"].append(f"Error scoring utterances for {member_id}: {e}")
+            continue
+
+        for u, dist in zip(member_utterances, distances):
             try:
                 result = detect_deviation(
                     member_id=member_id,
                     utterance_id=u["utterance_id"],
                     vec=u["vec"],
                     hearing_id=u["hearing_id"],
+                    baseline=baseline,
+                    dist=dist,
                 )
 
                 stats["utterances_checked"] += 1
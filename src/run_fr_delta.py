@@ -13,7 +13,7 @@ if __name__ == "__main__" and __package__ is None:
     sys.path.append(str(Path(__file__).resolve().parent.parent))
     __package__ = "src"
 
-from .db import init_db, insert_source_run, upsert_fr_seen
+from .db import init_db, insert_new_fr_seen, insert_source_run
 from .fr_bulk import list_latest_month_folders, list_month_packages
 from .notify_email import send_error_alert, send_new_docs_alert
 from .provenance import utc_now_iso
@@ -59,22 +59,20 @@ def run_fr_delta(max_months: int = 3) -> dict[str, Any]:
         if not month_folders:
             status = "NO_DATA"
         else:
+            packages: list[dict[str, str]] = []
             for _, month_url in month_folders:
-                for pkg in list_month_packages(month_url):
-                    doc_id = pkg["doc_id"]
-                    published_date = pkg["published_date"]
-                    records_fetched += 1
-                    first_seen_at = utc_now_iso()
-                    source_url = pkg["source_url"]
-                    if upsert_fr_seen(doc_id, published_date, first_seen_at, source_url):
-                        new_docs.append(
-                            {
-                                "doc_id": doc_id,
-                                "published_date": published_date,
-                                "source_url": source_url,
-                                "retrieved_at": first_seen_at,
-                            }
-                        )
+                packages.extend(list_month_packages(month_url))
+            records_fetched = len(packages)
+            first_seen_at = utc_now_iso()
+            for doc in insert_new_fr_seen(packages, first_seen_at):
+                new_docs.append(
+                    {
+                        "doc_id": doc["doc_id"],
+                        "published_date": doc["published_date"],
+                        "source_url": doc["source_url"],
+                        "retrieved_at": first_seen_at,
+                    }
+                )
     except Exception as e:
         status = "ERROR"
         errors.append(f"EXCEPTION: {repr(e)}")
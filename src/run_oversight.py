@@ -34,6 +34,15 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def _print_stage_timings(result) -> None:
+    if result.stage_timings:
+        timings = ", ".join(f"{k}={v:.2f}s" for k, v in result.stage_timings.items())
+        print(f"  Timings: {timings}")
+    if result.baseline_cache:
+        cache = result.baseline_cache
+        print(f"  Baseline cache: {cache['hits']} hits, {cache['misses']} misses")
+
+
 @with_lifecycle("oversight")
 def cmd_run(args):
     """Run agents."""
@@ -45,11 +54,12 @@ def cmd_run(args):
         since = datetime.fromisoformat(args.since).replace(tzinfo=UTC)
 
     if args.agent:
-        result = run_agent(args.agent, since=since)
+        result = run_agent(args.agent, since=since, workers=args.workers)
         print(f"\n{result.agent}: {result.status}")
         print(f"  Fetched: {result.events_fetched}")
         print(f"  Processed: {result.events_processed}")
         print(f"  Escalations: {result.escalations}")
+        _print_stage_timings(result)
         if result.errors:
             print(f"  Errors: {result.errors}")
     else:
@@ -71,11 +81,15 @@ def cmd_backfill(args):
         agent_name=args.agent,
         start_date=args.start,
         end_date=args.end,
+        workers=args.workers,
     )
 
     print(f"\nBackfill {args.agent}: {result.status}")
     print(f"  Fetched: {result.events_fetched}")
     print(f"  Processed: {result.events_processed}")
+    _print_stage_timings(result)
+    if result.errors:
+        print(f"  Errors: {len(result.errors)}")
 
 
 def cmd_digest(args):
@@ -207,12 +221,16 @@ def main():
     run_parser = subparsers.add_parser("run", help="Run oversight agents")
     run_parser.add_argument("--agent", "-a", help="Run specific agent")
     run_parser.add_argument("--since", help="Only fetch events since (ISO date)")
+    run_parser.add_argument(
+        "--workers", type=int, help="Event processing threads per agent (single agent only)"
+    )
 
     # Backfill command
     backfill_parser = subparsers.add_parser("backfill", help="Backfill historical data")
     backfill_parser.add_argument("--agent", "-a", required=True, help="Agent to backfill")
     backfill_parser.add_argument("--start", required=True, help="Start date (YYYY-MM-DD)")
     backfill_parser.add_argument("--end", required=True, help="End date (YYYY-MM-DD)")
+    backfill_parser.add_argument("--workers", type=int, help="Event processing threads")
 
     # Digest command
     digest_parser = subparsers.add_parser("digest", help="Generate weekly digest")
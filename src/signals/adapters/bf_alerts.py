@@ -1,5 +1,6 @@
 """Battlefield gate alerts adapter - transforms gate alerts to normalized envelopes."""
 
+from src.keyword_taxonomy import KeywordTaxonomy
 from src.signals.envelope import Envelope
 
 # Alert type → severity mapping
@@ -38,6 +39,7 @@ BATTLEFIELD_TOPIC_KEYWORDS = {
     "oversight": ["oversight", "investigation", "inspector general", "gao"],
     "rule": ["rule", "regulation", "federal register", "effective date"],
 }
+BATTLEFIELD_TOPICS = KeywordTaxonomy(BATTLEFIELD_TOPIC_KEYWORDS)
 
 
 class BattlefieldAlertsAdapter:
@@ -98,9 +100,4 @@ class BattlefieldAlertsAdapter:
 
     def _extract_topics(self, title: str, body_text: str) -> list[str]:
         """Extract topics from alert content."""
-        combined = f"{title} {body_text}".lower()
-        topics = []
-        for topic, keywords in BATTLEFIELD_TOPIC_KEYWORDS.items():
-            if any(kw in combined for kw in keywords):
-                topics.append(topic)
-        return topics
+        return BATTLEFIELD_TOPICS.tag(f"{title} {body_text}")
@@ -1,7 +1,19 @@
 """Bills adapter - transforms bill records to normalized envelopes."""
 
+from src.keyword_taxonomy import KeywordTaxonomy
 from src.signals.envelope import Envelope
 
+_TOPICS = KeywordTaxonomy(
+    {
+        "disability_benefits": ["disability", "benefits", "compensation"],
+        "rating": ["rating", "vasrd", "schedule for rating"],
+        "exam_quality": ["exam", "c&p", "medical examination"],
+        "claims_backlog": ["backlog", "processing", "wait time", "claims processing"],
+        "appeals": ["appeal", "bva", "board of veterans"],
+        "vasrd": ["vasrd", "schedule for rating disabilities"],
+    }
+)
+
 
 class BillsAdapter:
     """Adapts bill records to normalized envelopes."""
@@ -50,23 +62,7 @@ class BillsAdapter:
 
     def _extract_topics(self, title: str, policy_area: str) -> list[str]:
         """Extract topics from title and policy area."""
-        combined = f"{title} {policy_area}".lower()
-        topics = []
-
-        topic_keywords = {
-            "disability_benefits": ["disability", "benefits", "compensation"],
-            "rating": ["rating", "vasrd", "schedule for rating"],
-            "exam_quality": ["exam", "c&p", "medical examination"],
-            "claims_backlog": ["backlog", "processing", "wait time", "claims processing"],
-            "appeals": ["appeal", "bva", "board of veterans"],
-            "vasrd": ["vasrd", "schedule for rating disabilities"],
-        }
-
-        for topic, keywords in topic_keywords.items():
-            if any(kw in combined for kw in keywords):
-                topics.append(topic)
-
-        return topics
+        return _TOPICS.tag(f"{title} {policy_area}")
 
     def _get_committee_from_committees(self, committees_json: str | None) -> str | None:
         """Extract VA committee from committees JSON if present."""
@@ -1,5 +1,6 @@
 """Hearings adapter - transforms hearing records to normalized envelopes."""
 
+from src.keyword_taxonomy import KeywordTaxonomy
 from src.signals.envelope import Envelope
 
 # Committee code to standard committee mapping
@@ -14,6 +15,16 @@ AUTHORITY_SOURCE_MAP = {
     "SSVA": "senate_veterans",
 }
 
+_TOPICS = KeywordTaxonomy(
+    {
+        "disability_benefits": ["disability", "benefits", "claims"],
+        "rating": ["rating", "vasrd", "schedule"],
+        "exam_quality": ["exam", "c&p", "medical examination"],
+        "claims_backlog": ["backlog", "processing", "wait time"],
+        "appeals": ["appeal", "bva", "board"],
+    }
+)
+
 
 class HearingsAdapter:
     """Adapts hearing records to normalized envelopes."""
@@ -65,22 +76,7 @@ class HearingsAdapter:
 
     def _extract_topics(self, title: str) -> list[str]:
         """Extract topics from title keywords."""
-        title_lower = title.lower()
-        topics = []
-
-        topic_keywords = {
-            "disability_benefits": ["disability", "benefits", "claims"],
-            "rating": ["rating", "vasrd", "schedule"],
-            "exam_quality": ["exam", "c&p", "medical examination"],
-            "claims_backlog": ["backlog", "processing", "wait time"],
-            "appeals": ["appeal", "bva", "board"],
-        }
-
-        for topic, keywords in topic_keywords.items():
-            if any(kw in title_lower for kw in keywords):
-                topics.append(topic)
-
-        return topics
+        return _TOPICS.tag(title)
 
     def _build_event_time(self, hearing: dict) -> str | None:
         """Build ISO timestamp from hearing date/time."""
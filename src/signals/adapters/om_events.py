@@ -1,5 +1,6 @@
 """OM Events adapter - transforms oversight monitor events to normalized envelopes."""
 
+from src.keyword_taxonomy import KeywordTaxonomy
 from src.signals.envelope import Envelope
 
 # Source type to authority source mapping
@@ -25,6 +26,16 @@ EVENT_TYPE_MAP = {
     "news": "press_release",
 }
 
+_TOPICS = KeywordTaxonomy(
+    {
+        "disability_benefits": ["disability", "benefits", "compensation", "veteran benefits"],
+        "rating": ["rating", "vasrd", "schedule for rating"],
+        "exam_quality": ["exam", "c&p", "medical examination", "contractor exam"],
+        "claims_backlog": ["backlog", "processing", "wait time"],
+        "appeals": ["appeal", "bva", "board of veterans"],
+    }
+)
+
 
 class OMEventsAdapter:
     """Adapts oversight monitor events to normalized envelopes."""
@@ -74,19 +85,4 @@ class OMEventsAdapter:
 
     def _extract_topics(self, title: str, summary: str, theme: str) -> list[str]:
         """Extract topics from content and theme."""
-        combined = f"{title} {summary} {theme}".lower()
-        topics = []
-
-        topic_keywords = {
-            "disability_benefits": ["disability", "benefits", "compensation", "veteran benefits"],
-            "rating": ["rating", "vasrd", "schedule for rating"],
-            "exam_quality": ["exam", "c&p", "medical examination", "contractor exam"],
-            "claims_backlog": ["backlog", "processing", "wait time"],
-            "appeals": ["appeal", "bva", "board of veterans"],
-        }
-
-        for topic, keywords in topic_keywords.items():
-            if any(kw in combined for kw in keywords):
-                topics.append(topic)
-
-        return topics
+        return _TOPICS.tag(f"{title} {summary} {theme}")
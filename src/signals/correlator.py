@@ -3,11 +3,20 @@
 Evaluates declarative rules against recent events from multiple data sources
 (oversight, bills, hearings, federal register, state signals) and generates
 compound signals when correlated activity is detected.
+
+Two evaluation modes share the rule set:
+- Full: re-fetch every event in the rule windows and compare whole source
+  lists pair-wise (one compound per rule and source pair).
+- Incremental: keep a sliding CorrelationWindow of MemberEvents indexed by
+  topic and title word, fetch only rows changed since a persisted watermark,
+  and correlate each new event against the window (one compound per new
+  event and partner source).
 """
 
 import hashlib
 import json
 import re
+import threading
 from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
@@ -15,6 +24,8 @@ from typing import Any
 
 import yaml
 
+from src.keyword_taxonomy import KeywordTaxonomy
+
 ROOT = Path(__file__).resolve().parents[2]
 DEFAULT_RULES_PATH = ROOT / "config" / "correlation_rules.yaml"
 
@@ -27,9 +38,53 @@ TOPIC_KEYWORDS = {
     "appeals": ["appeal", "bva", "board of veterans"],
     "vasrd": ["vasrd", "schedule for rating disabilities"],
 }
+TOPIC_TAXONOMY = KeywordTaxonomy(TOPIC_KEYWORDS)
 
 TITLE_SIMILARITY_THRESHOLD = 0.85
 
+# Incremental mode keeps at most this many partner events per compound,
+# newest first; full mode compounds carry the whole source list.
+MAX_PARTNER_EVENTS = 20
+
+_STOPWORDS = frozenset(
+    {"the", "a", "an", "of", "on", "in", "to", "for", "and", "or", "is", "at", "by"}
+)
+
+# source_type -> (table, columns, changed-at column, published-at column)
+_SOURCE_TABLES = {
+    "oversight": (
+        "om_events",
+        "event_id, event_type, theme, primary_source_type, pub_timestamp, title, summary, "
+        "is_escalation",
+        "created_at",
+        "pub_timestamp",
+    ),
+    "bill": (
+        "bills",
+        "bill_id, title, policy_area, introduced_date, latest_action_date",
+        "updated_at",
+        "introduced_date",
+    ),
+    "hearing": (
+        "hearings",
+        "event_id, title, hearing_date, committee_name, status",
+        "updated_at",
+        "hearing_date",
+    ),
+    "federal_register": (
+        "fr_seen",
+        "doc_id, title, published_date, document_type",
+        "first_seen_at",
+        "published_date",
+    ),
+    "state": (
+        "state_signals",
+        "signal_id, state, title, content, pub_date",
+        "fetched_at",
+        "pub_date",
+    ),
+}
+
 
 # ---------------------------------------------------------------------------
 # Dataclasses
@@ -57,6 +112,11 @@ class MemberEvent:
     timestamp: str | None
     topics: list[str]
     metadata: dict[str, Any]
+    seen_at: str | None = None  # changed-at column value, drives watermarks
+
+    @property
+    def key(self) -> tuple[str, str]:
+        return (self.source_type, self.event_id)
 
     def to_dict(self) -> dict:
         return {
@@ -91,6 +151,142 @@ class CompoundSignal:
         }
 
 
+def _parse_time(value: str | None) -> datetime | None:
+    """Parse an ISO date/datetime column value as an aware UTC datetime."""
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=UTC)
+
+
+def _event_anchor(event: MemberEvent) -> datetime | None:
+    """Latest of the event's published and changed-at times.
+
+    Mirrors the full-mode fetch, which keeps a row when either column falls
+    inside the window.
+    """
+    times = [t for t in (_parse_time(event.timestamp), _parse_time(event.seen_at)) if t]
+    return max(times) if times else None
+
+
+def _title_words(title: str) -> frozenset[str]:
+    return frozenset(re.findall(r"[a-z]+", title.lower())) - _STOPWORDS
+
+
+# ---------------------------------------------------------------------------
+# Sliding window
+# ---------------------------------------------------------------------------
+
+
+class CorrelationWindow:
+    """Sliding window of MemberEvents indexed by source, topic and title word.
+
+    Topic postings keep insertion order, so events added oldest-first can be
+    walked newest-first without sorting.
+    """
+
+    def __init__(self):
+        self._events: dict[tuple[str, str], MemberEvent] = {}
+        self._anchors: dict[tuple[str, str], datetime] = {}
+        self._words: dict[tuple[str, str], frozenset[str]] = {}
+        self._topic_index: dict[str, dict[str, dict[tuple[str, str], None]]] = {}
+        self._word_index: dict[str, dict[str, set[tuple[str, str]]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def get(self, key: tuple[str, str]) -> MemberEvent | None:
+        return self._events.get(key)
+
+    def anchor(self, key: tuple[str, str]) -> datetime:
+        return self._anchors[key]
+
+    def add(self, event: MemberEvent, anchor: datetime) -> None:
+        key = event.key
+        if key in self._events:
+            self.remove(key)
+        words = _title_words(event.title)
+        self._events[key] = event
+        self._anchors[key] = anchor
+        self._words[key] = words
+        topics = self._topic_index.setdefault(event.source_type, {})
+        for topic in event.topics:
+            topics.setdefault(topic, {})[key] = None
+        index = self._word_index.setdefault(event.source_type, {})
+        for word in words:
+            index.setdefault(word, set()).add(key)
+
+    def remove(self, key: tuple[str, str]) -> None:
+        event = self._events.pop(key, None)
+        if event is None:
+            return
+        del self._anchors[key]
+        topics = self._topic_index[event.source_type]
+        for topic in event.topics:
+            postings = topics.get(topic)
+            if postings is not None:
+                postings.pop(key, None)
+        index = self._word_index[event.source_type]
+        for word in self._words.pop(key):
+            postings = index.get(word)
+            if postings is not None:
+                postings.discard(key)
+                if not postings:
+                    del index[word]
+
+    def evict(self, before: datetime) -> int:
+        """Drop events anchored before ``before``. Returns the number dropped."""
+        expired = [key for key, anchor in self._anchors.items() if anchor < before]
+        for key in expired:
+            self.remove(key)
+        return len(expired)
+
+    def with_topic(
+        self, source_type: str, topic: str, since: datetime, limit: int | None = None
+    ) -> list[MemberEvent]:
+        """Events of ``source_type`` tagged ``topic`` anchored at/after ``since``, newest first."""
+        postings = self._topic_index.get(source_type, {}).get(topic, {})
+        matched = []
+        for key in reversed(postings):
+            if self._anchors[key] >= since:
+                matched.append(self._events[key])
+                if limit is not None and len(matched) >= limit:
+                    break
+        return matched
+
+    def similar_titles(
+        self, source_type: str, title: str, threshold: float, since: datetime
+    ) -> list[MemberEvent]:
+        """Events whose title word-set Jaccard similarity to ``title`` is >= threshold.
+
+        Uses prefix filtering: a set B with Jaccard(A, B) >= t must contain at
+        least one of any |A| - floor(t * |A|) + 1 words of A, so only the
+        postings of that many of A's rarest words are probed.
+        """
+        words = _title_words(title)
+        index = self._word_index.get(source_type)
+        if not words or not index:
+            return []
+        prefix_len = len(words) - int(threshold * len(words)) + 1
+        probe = sorted(words, key=lambda w: len(index.get(w, ())))[:prefix_len]
+        candidates: set[tuple[str, str]] = set()
+        for word in probe:
+            candidates |= index.get(word, set())
+
+        matched = []
+        for key in candidates:
+            if self._anchors[key] < since:
+                continue
+            other = self._words[key]
+            if len(words & other) / len(words | other) >= threshold:
+                matched.append(key)
+        matched.sort(key=lambda k: self._anchors[k], reverse=True)
+        return [self._events[k] for k in matched]
+
+
 # ---------------------------------------------------------------------------
 # Engine
 # ---------------------------------------------------------------------------
@@ -101,6 +297,10 @@ class CorrelationEngine:
 
     def __init__(self, rules_path: Path | None = None):
         self.rules = self._load_rules(rules_path or DEFAULT_RULES_PATH)
+        # Incremental-mode state; the window survives across runs on a reused engine
+        self._window: CorrelationWindow | None = None
+        self._watermarks: dict[str, str] = {}
+        self._lock = threading.Lock()
 
     # -- Rule loading -------------------------------------------------------
 
@@ -133,163 +333,120 @@ class CorrelationEngine:
     # -- Event fetching -----------------------------------------------------
 
     def _extract_topics(self, title: str, extra: str = "") -> list[str]:
-        combined = f"{title} {extra}".lower()
-        topics = []
-        for topic, keywords in TOPIC_KEYWORDS.items():
-            if any(kw in combined for kw in keywords):
-                topics.append(topic)
-        return topics
-
-    def _fetch_recent_events(self, hours: int) -> dict[str, list[MemberEvent]]:
-        from src.db import connect, execute
-
-        cutoff = (datetime.now(UTC) - timedelta(hours=hours)).isoformat()
-        result: dict[str, list[MemberEvent]] = {
-            "oversight": [],
-            "bill": [],
-            "hearing": [],
-            "federal_register": [],
-            "state": [],
-        }
-        con = connect()
-        try:
-            # Oversight events
-            cur = execute(
-                con,
-                """
-                SELECT event_id, event_type, theme, primary_source_type,
-                       pub_timestamp, title, summary, is_escalation
-                FROM om_events
-                WHERE created_at >= :cutoff OR pub_timestamp >= :cutoff
-                ORDER BY pub_timestamp DESC
-            """,
-                {"cutoff": cutoff},
+        return TOPIC_TAXONOMY.tag(f"{title} {extra}")
+
+    def _row_to_event(self, source_type: str, row) -> MemberEvent:
+        """Build a MemberEvent from a _SOURCE_TABLES row (changed-at column last)."""
+        seen_at = row[-1]
+        if source_type == "oversight":
+            return MemberEvent(
+                source_type="oversight",
+                event_id=row[0],
+                title=row[5] or "",
+                timestamp=row[4],
+                topics=self._extract_topics(row[5] or "", f"{row[6] or ''} {row[2] or ''}"),
+                metadata={
+                    "event_type": row[1],
+                    "theme": row[2],
+                    "primary_source_type": row[3],
+                    "is_escalation": bool(row[7]),
+                },
+                seen_at=seen_at,
             )
-            for row in cur.fetchall():
-                topics = self._extract_topics(row[5] or "", f"{row[6] or ''} {row[2] or ''}")
-                result["oversight"].append(
-                    MemberEvent(
-                        source_type="oversight",
-                        event_id=row[0],
-                        title=row[5] or "",
-                        timestamp=row[4],
-                        topics=topics,
-                        metadata={
-                            "event_type": row[1],
-                            "theme": row[2],
-                            "primary_source_type": row[3],
-                            "is_escalation": bool(row[7]),
-                        },
-                    )
-                )
-
-            # Bills
-            cur = execute(
-                con,
-                """
-                SELECT bill_id, title, policy_area, introduced_date, latest_action_date
-                FROM bills
-                WHERE updated_at >= :cutoff OR introduced_date >= :cutoff
-                ORDER BY introduced_date DESC
-            """,
-                {"cutoff": cutoff},
+        if source_type == "bill":
+            return MemberEvent(
+                source_type="bill",
+                event_id=row[0],
+                title=row[1] or "",
+                timestamp=row[3],
+                topics=self._extract_topics(row[1] or "", row[2] or ""),
+                metadata={"policy_area": row[2]},
+                seen_at=seen_at,
             )
-            for row in cur.fetchall():
-                topics = self._extract_topics(row[1] or "", row[2] or "")
-                result["bill"].append(
-                    MemberEvent(
-                        source_type="bill",
-                        event_id=row[0],
-                        title=row[1] or "",
-                        timestamp=row[3],
-                        topics=topics,
-                        metadata={"policy_area": row[2]},
-                    )
-                )
-
-            # Hearings
-            cur = execute(
-                con,
-                """
-                SELECT event_id, title, hearing_date, committee_name, status
-                FROM hearings
-                WHERE updated_at >= :cutoff OR hearing_date >= :cutoff
-                ORDER BY hearing_date DESC
-            """,
-                {"cutoff": cutoff},
+        if source_type == "hearing":
+            return MemberEvent(
+                source_type="hearing",
+                event_id=row[0],
+                title=row[1] or "",
+                timestamp=row[2],
+                topics=self._extract_topics(row[1] or "", row[3] or ""),
+                metadata={"committee_name": row[3], "status": row[4]},
+                seen_at=seen_at,
             )
-            for row in cur.fetchall():
-                topics = self._extract_topics(row[1] or "", row[3] or "")
-                result["hearing"].append(
-                    MemberEvent(
-                        source_type="hearing",
-                        event_id=row[0],
-                        title=row[1] or "",
-                        timestamp=row[2],
-                        topics=topics,
-                        metadata={"committee_name": row[3], "status": row[4]},
-                    )
-                )
-
-            # Federal Register
-            cur = execute(
-                con,
-                """
-                SELECT doc_id, title, published_date, document_type
-                FROM fr_seen
-                WHERE first_seen_at >= :cutoff OR published_date >= :cutoff
-                ORDER BY published_date DESC
-            """,
-                {"cutoff": cutoff},
+        if source_type == "federal_register":
+            return MemberEvent(
+                source_type="federal_register",
+                event_id=row[0],
+                title=row[1] or "",
+                timestamp=row[2],
+                topics=self._extract_topics(row[1] or "", row[3] or ""),
+                metadata={"document_type": row[3]},
+                seen_at=seen_at,
             )
-            for row in cur.fetchall():
-                topics = self._extract_topics(row[1] or "", row[3] or "")
-                result["federal_register"].append(
-                    MemberEvent(
-                        source_type="federal_register",
-                        event_id=row[0],
-                        title=row[1] or "",
-                        timestamp=row[2],
-                        topics=topics,
-                        metadata={"document_type": row[3]},
-                    )
-                )
+        return MemberEvent(
+            source_type="state",
+            event_id=row[0],
+            title=row[2] or "",
+            timestamp=row[4],
+            topics=self._extract_topics(row[2] or "", row[3] or ""),
+            metadata={"state": row[1]},
+            seen_at=seen_at,
+        )
+
+    def _fetch_events(
+        self, where: str, params_by_source: dict[str, dict]
+    ) -> dict[str, list[MemberEvent]]:
+        """Run one SELECT per source table.
+
+        ``where`` may reference ``{changed}`` and ``{published}``, which are
+        filled in with that table's columns. Sources missing from
+        ``params_by_source`` are skipped but still present in the result.
+        """
+        from src.db import connect, execute
 
-            # State signals
-            cur = execute(
-                con,
-                """
-                SELECT signal_id, state, title, content, pub_date
-                FROM state_signals
-                WHERE fetched_at >= :cutoff OR pub_date >= :cutoff
-                ORDER BY pub_date DESC
-            """,
-                {"cutoff": cutoff},
-            )
-            for row in cur.fetchall():
-                topics = self._extract_topics(row[2] or "", row[3] or "")
-                result["state"].append(
-                    MemberEvent(
-                        source_type="state",
-                        event_id=row[0],
-                        title=row[2] or "",
-                        timestamp=row[4],
-                        topics=topics,
-                        metadata={"state": row[1]},
-                    )
+        result: dict[str, list[MemberEvent]] = {st: [] for st in _SOURCE_TABLES}
+        con = connect()
+        try:
+            for source_type, params in params_by_source.items():
+                table, columns, changed, published = _SOURCE_TABLES[source_type]
+                cur = execute(
+                    con,
+                    f"""
+                    SELECT {columns}, {changed}
+                    FROM {table}
+                    WHERE {where.format(changed=changed, published=published)}
+                    ORDER BY {published} DESC
+                    """,
+                    params,
                 )
-
+                result[source_type] = [self._row_to_event(source_type, r) for r in cur.fetchall()]
         finally:
             con.close()
-
         return result
 
+    def _fetch_recent_events(self, hours: int) -> dict[str, list[MemberEvent]]:
+        cutoff = (datetime.now(UTC) - timedelta(hours=hours)).isoformat()
+        return self._fetch_events(
+            "{changed} >= :cutoff OR {published} >= :cutoff",
+            {st: {"cutoff": cutoff} for st in _SOURCE_TABLES},
+        )
+
+    def _fetch_changed_events(self, watermarks: dict[str, str]) -> dict[str, list[MemberEvent]]:
+        """Fetch rows whose changed-at column is at or after each source's watermark.
+
+        Rows equal to the watermark are re-read so that writes sharing the
+        last-seen timestamp are not lost; unchanged re-reads are skipped by
+        the caller.
+        """
+        return self._fetch_events(
+            "{changed} >= :since",
+            {st: {"since": since} for st, since in watermarks.items() if st in _SOURCE_TABLES},
+        )
+
     # -- Topic overlap ------------------------------------------------------
 
     def _title_word_set(self, title: str) -> set[str]:
-        stopwords = {"the", "a", "an", "of", "on", "in", "to", "for", "and", "or", "is", "at", "by"}
-        words = set(re.findall(r"[a-z]+", title.lower()))
-        return words - stopwords
+        return set(_title_words(title))
 
     def _title_similarity(self, titles_a: list[str], titles_b: list[str]) -> float:
         words_a: set[str] = set()
@@ -490,39 +647,264 @@ class CorrelationEngine:
 
         return signals
 
-    def evaluate_rules(self) -> list[CompoundSignal]:
-        """Evaluate all rules against recent events."""
-        # Determine the max window across all rules
-        max_hours = max((r.temporal_window_hours for r in self.rules), default=168)
-        events_by_source = self._fetch_recent_events(max_hours)
-
+    def _max_window_hours(self) -> int:
+        return max((r.temporal_window_hours for r in self.rules), default=168)
+
+    def _within_window(
+        self, events_by_source: dict[str, list[MemberEvent]], since: datetime
+    ) -> dict[str, list[MemberEvent]]:
+        """Keep events anchored at/after ``since``; undated events are kept."""
+        filtered = {}
+        for source_type, events in events_by_source.items():
+            kept = []
+            for ev in events:
+                anchor = _event_anchor(ev)
+                if anchor is None or anchor >= since:
+                    kept.append(ev)
+            filtered[source_type] = kept
+        return filtered
+
+    def evaluate_rules(self, incremental: bool = False) -> list[CompoundSignal]:
+        """Evaluate all rules against recent events.
+
+        Full mode fetches the largest rule window once and evaluates each rule
+        over the events inside its own temporal window. ``incremental=True``
+        correlates only rows changed since the last run (see
+        _evaluate_incremental).
+        """
+        if incremental:
+            return self._evaluate_incremental()
+
+        now = datetime.now(UTC)
+        events_by_source = self._fetch_recent_events(self._max_window_hours())
+        return self._evaluate_full(events_by_source, now)
+
+    def _evaluate_full(
+        self, events_by_source: dict[str, list[MemberEvent]], now: datetime
+    ) -> list[CompoundSignal]:
         all_signals: list[CompoundSignal] = []
         for rule in self.rules:
+            in_window = self._within_window(
+                events_by_source, now - timedelta(hours=rule.temporal_window_hours)
+            )
             if rule.rule_id == "state_divergence":
-                all_signals.extend(self._evaluate_divergence_rule(rule, events_by_source))
+                all_signals.extend(self._evaluate_divergence_rule(rule, in_window))
             else:
-                all_signals.extend(self._evaluate_cross_source_rule(rule, events_by_source))
+                all_signals.extend(self._evaluate_cross_source_rule(rule, in_window))
 
         return all_signals
 
+    # -- Incremental evaluation ---------------------------------------------
+
+    def _new_signal(
+        self, rule: CorrelationRule, matched: list[MemberEvent], topics: list[str], cid: str
+    ) -> CompoundSignal:
+        return CompoundSignal(
+            compound_id=cid,
+            rule_id=rule.rule_id,
+            severity_score=self._compute_severity(rule, matched, topics),
+            narrative=self._generate_narrative(rule, matched, topics),
+            temporal_window_hours=rule.temporal_window_hours,
+            member_events=matched,
+            topics=topics,
+            created_at=datetime.now(UTC).isoformat(),
+        )
+
+    def _correlate_new_event(
+        self,
+        rule: CorrelationRule,
+        event: MemberEvent,
+        window: CorrelationWindow,
+        since: datetime,
+    ) -> list[CompoundSignal]:
+        """Correlate one new event with each partner source of a cross-source rule."""
+        signals = []
+        for partner_type in rule.source_types:
+            if partner_type == event.source_type:
+                continue
+
+            partners: dict[tuple[str, str], MemberEvent] = {}
+            topics = []
+            for topic in event.topics:
+                matched = window.with_topic(partner_type, topic, since, MAX_PARTNER_EVENTS)
+                if matched:
+                    topics.append(topic)
+                    for partner in matched:
+                        partners.setdefault(partner.key, partner)
+
+            # Title similarity fallback, as in _find_topic_overlap
+            if not topics:
+                matched = window.similar_titles(
+                    partner_type, event.title, TITLE_SIMILARITY_THRESHOLD, since
+                )
+                if matched:
+                    topics = ["title_match"]
+                    partners = {partner.key: partner for partner in matched}
+
+            if not partners or len(topics) < rule.min_topic_overlap:
+                continue
+
+            ranked = sorted(partners.values(), key=lambda e: window.anchor(e.key), reverse=True)
+            matched_events = [event] + ranked[:MAX_PARTNER_EVENTS]
+            topics = sorted(topics)
+            cid = self._make_compound_id(rule.rule_id, [e.event_id for e in matched_events])
+            signals.append(self._new_signal(rule, matched_events, topics, cid))
+        return signals
+
+    def _divergence_for_topic(
+        self,
+        rule: CorrelationRule,
+        topic: str,
+        window: CorrelationWindow,
+        since: datetime,
+    ) -> CompoundSignal | None:
+        """state_divergence for one topic, keeping the latest event per state."""
+        latest_by_state: dict[str | None, MemberEvent] = {}
+        for ev in window.with_topic(rule.source_types[0], topic, since):
+            latest_by_state.setdefault(ev.metadata.get("state"), ev)
+        if len(latest_by_state) < rule.min_source_count:
+            return None
+
+        matched = list(latest_by_state.values())
+        topics = [topic]
+        cid = self._make_compound_id(rule.rule_id, [e.event_id for e in matched], topics)
+        return self._new_signal(rule, matched, topics, cid)
+
+    def _evaluate_incremental(self) -> list[CompoundSignal]:
+        """Correlate rows changed since the watermarks against the sliding window.
+
+        A cold engine loads the largest rule window once and treats rows
+        changed after the persisted watermarks as new; with no watermarks at
+        all it bootstraps with a full evaluation instead of correlating the
+        whole window event by event. A warm engine only
+        fetches rows changed since its in-memory watermarks and evicts events
+        that aged out. Each new event is correlated against the window before
+        it is added, so every pair of events is considered once, when the
+        later of the two arrives.
+        """
+        from src.db.compound import get_compound_watermarks
+
+        now = datetime.now(UTC)
+        max_hours = self._max_window_hours()
+        window_start = now - timedelta(hours=max_hours)
+
+        window = self._window
+        bootstrap = False
+        if window is None:
+            window = CorrelationWindow()
+            marks = get_compound_watermarks()
+            fetched = self._fetch_recent_events(max_hours)
+            bootstrap = not marks
+        else:
+            marks = self._watermarks
+            fetched = self._fetch_changed_events(
+                {st: marks.get(st) or window_start.isoformat() for st in _SOURCE_TABLES}
+            )
+        window.evict(window_start)
+
+        known: list[tuple[datetime, MemberEvent]] = []
+        new_events: list[tuple[datetime, MemberEvent]] = []
+        for events in fetched.values():
+            for ev in events:
+                anchor = _event_anchor(ev) or now
+                if anchor < window_start:
+                    continue
+                previous = window.get(ev.key)
+                if previous is not None and previous.seen_at == ev.seen_at:
+                    continue
+                # On a cold start, rows up to the persisted watermark were
+                # correlated by an earlier run; only seed the window with them
+                mark = marks.get(ev.source_type)
+                if bootstrap or (previous is None and mark and ev.seen_at and ev.seen_at <= mark):
+                    known.append((anchor, ev))
+                else:
+                    new_events.append((anchor, ev))
+
+        def _order(item):
+            return (item[0], item[1].key)
+
+        rule_windows = [(r, now - timedelta(hours=r.temporal_window_hours)) for r in self.rules]
+        signals = self._evaluate_full(fetched, now) if bootstrap else []
+        seen_ids: set[str] = set()
+        touched: dict[str, set[str]] = {}
+
+        try:
+            for anchor, ev in sorted(known, key=_order):
+                window.add(ev, anchor)
+
+            for anchor, ev in sorted(new_events, key=_order):
+                for rule, since in rule_windows:
+                    if ev.source_type not in rule.source_types or anchor < since:
+                        continue
+                    if rule.rule_id == "state_divergence":
+                        touched.setdefault(rule.rule_id, set()).update(ev.topics)
+                        continue
+                    for sig in self._correlate_new_event(rule, ev, window, since):
+                        if sig.compound_id not in seen_ids:
+                            seen_ids.add(sig.compound_id)
+                            signals.append(sig)
+                window.add(ev, anchor)
+
+            for rule, since in rule_windows:
+                for topic in sorted(touched.get(rule.rule_id, ())):
+                    sig = self._divergence_for_topic(rule, topic, window, since)
+                    if sig is not None and sig.compound_id not in seen_ids:
+                        seen_ids.add(sig.compound_id)
+                        signals.append(sig)
+        except Exception:
+            # A half-updated window would hide these rows from the next run
+            self._window = None
+            raise
+
+        marks = dict(marks)
+        for events in fetched.values():
+            for ev in events:
+                if ev.seen_at and ev.seen_at > marks.get(ev.source_type, ""):
+                    marks[ev.source_type] = ev.seen_at
+        self._window = window
+        self._watermarks = marks
+        return signals
+
     # -- Main entry ---------------------------------------------------------
 
-    def run(self) -> dict:
-        """Evaluate rules, store results, return summary."""
-        from src.db.compound import insert_compound_signal
+    def run(self, incremental: bool = False) -> dict:
+        """Evaluate rules, store results in one batch, return summary.
 
-        signals = self.evaluate_rules()
-        stored = 0
-        by_rule: dict[str, int] = {}
+        In incremental mode the source watermarks are persisted only after
+        the signals are stored.
+        """
+        from src.db.compound import insert_compound_signals, set_compound_watermarks
+
+        with self._lock:
+            try:
+                signals = self.evaluate_rules(incremental=incremental)
+                stored_ids = insert_compound_signals([sig.to_db_dict() for sig in signals])
+                if incremental:
+                    set_compound_watermarks(self._watermarks)
+            except Exception:
+                self._window = None
+                raise
 
+        by_rule: dict[str, int] = {}
         for sig in signals:
-            result = insert_compound_signal(sig.to_db_dict())
-            if result is not None:
-                stored += 1
             by_rule[sig.rule_id] = by_rule.get(sig.rule_id, 0) + 1
 
         return {
+            "mode": "incremental" if incremental else "full",
             "total_signals": len(signals),
-            "stored": stored,
+            "stored": len(stored_ids),
             "by_rule": by_rule,
         }
+
+
+_shared_engine: CorrelationEngine | None = None
+_shared_engine_lock = threading.Lock()
+
+
+def get_shared_engine() -> CorrelationEngine:
+    """Process-wide engine, so incremental runs keep their window warm."""
+    global _shared_engine
+    with _shared_engine_lock:
+        if _shared_engine is None:
+            _shared_engine = CorrelationEngine()
+        return _shared_engine
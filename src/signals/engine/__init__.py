@@ -1,6 +1,12 @@
 """Signals evaluation engine."""
 
-from .evaluator import EvaluationResult, ExpressionEvaluator, evaluate_expression
+from .compiler import CategoryPlan, CompiledExpression, compile_category_plan, compile_expression
+from .evaluator import (
+    EvaluationResult,
+    ExpressionEvaluator,
+    evaluate_compiled,
+    evaluate_expression,
+)
 from .parser import (
     AllOfNode,
     AnyOfNode,
@@ -22,4 +28,9 @@ __all__ = [
     "evaluate_expression",
     "EvaluationResult",
     "ExpressionEvaluator",
+    "compile_expression",
+    "compile_category_plan",
+    "evaluate_compiled",
+    "CompiledExpression",
+    "CategoryPlan",
 ]
@@ -0,0 +1,178 @@
+"""Compile trigger conditions into immutable evaluation plans.
+
+Parsing an expression dict, resolving evaluators from the registry and
+preparing their arguments happens once per schema load instead of once per
+envelope. Node paths and evidence ids are precomputed so evaluation only
+walks the tree and calls the bound evaluators.
+"""
+
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from typing import Any
+
+from src.signals.engine.parser import (
+    AllOfNode,
+    AnyOfNode,
+    EvaluatorNode,
+    ExpressionNode,
+    NoneOfNode,
+    parse_expression,
+)
+from src.signals.envelope import Envelope
+from src.signals.evaluators.registry import EvaluatorRegistry
+
+
+@dataclass(frozen=True)
+class CompiledEvaluatorNode:
+    """Leaf node bound to a prepared evaluator callable."""
+
+    evaluator_name: str
+    evaluate: Callable[[Envelope], dict]
+    eval_id: str  # "{trigger_id}:{path}:{evaluator_name}"
+    eval_label: str  # "{evaluator_name}({field})"
+    is_root: bool
+    label: str | None = None
+
+
+@dataclass(frozen=True)
+class CompiledAllOfNode:
+    children: tuple
+    label: str | None = None
+
+
+@dataclass(frozen=True)
+class CompiledAnyOfNode:
+    children: tuple
+    label: str | None = None
+
+
+@dataclass(frozen=True)
+class CompiledNoneOfNode:
+    children: tuple
+    label: str | None = None
+
+
+@dataclass(frozen=True)
+class CompiledExpression:
+    """A condition compiled for one trigger id."""
+
+    trigger_id: str
+    root: Any
+
+
+@dataclass(frozen=True)
+class CompiledTrigger:
+    trigger_id: str
+    condition: CompiledExpression
+    routing: Mapping | None
+
+
+@dataclass(frozen=True)
+class CompiledIndicator:
+    indicator_id: str
+    condition: CompiledExpression | None
+    triggers: tuple[CompiledTrigger, ...]
+
+
+@dataclass(frozen=True)
+class CategoryPlan:
+    """All indicator and trigger conditions of a category, compiled."""
+
+    category_id: str
+    indicators: tuple[CompiledIndicator, ...]
+
+
+_default_registry: EvaluatorRegistry | None = None
+
+
+def _get_registry() -> EvaluatorRegistry:
+    global _default_registry
+    if _default_registry is None:
+        _default_registry = EvaluatorRegistry()
+    return _default_registry
+
+
+def _compile_node(node: ExpressionNode, trigger_id: str, path: str, registry: EvaluatorRegistry):
+    if isinstance(node, EvaluatorNode):
+        evaluator = registry.get(node.evaluator_name)
+        return CompiledEvaluatorNode(
+            evaluator_name=node.evaluator_name,
+            evaluate=evaluator.compile(**node.args),
+            eval_id=f"{trigger_id}:{path}:{node.evaluator_name}",
+            eval_label=f"{node.evaluator_name}({node.args.get('field', '')})",
+            is_root=path == "root",
+            label=node.label,
+        )
+    if isinstance(node, AllOfNode):
+        children = tuple(
+            _compile_node(child, trigger_id, f"{path}.all_of[{i}]", registry)
+            for i, child in enumerate(node.children)
+        )
+        return CompiledAllOfNode(children=children, label=node.label)
+    if isinstance(node, AnyOfNode):
+        children = tuple(
+            _compile_node(child, trigger_id, f"{path}.any_of[{i}]", registry)
+            for i, child in enumerate(node.children)
+        )
+        return CompiledAnyOfNode(children=children, label=node.label)
+    if isinstance(node, NoneOfNode):
+        children = tuple(
+            _compile_node(child, trigger_id, f"{path}.none_of[{i}]", registry)
+            for i, child in enumerate(node.children)
+        )
+        return CompiledNoneOfNode(children=children, label=node.label)
+    raise ValueError(f"Invalid expression node: {node}")
+
+
+def compile_expression(
+    expr: dict, trigger_id: str, registry: EvaluatorRegistry | None = None
+) -> CompiledExpression:
+    """Parse and compile a condition expression for ``trigger_id``."""
+    registry = registry or _get_registry()
+    root = _compile_node(parse_expression(expr), trigger_id, "root", registry)
+    return CompiledExpression(trigger_id=trigger_id, root=root)
+
+
+def compile_category_plan(
+    category_id: str,
+    indicators: list[dict],
+    routing: list[dict],
+    registry: EvaluatorRegistry | None = None,
+) -> CategoryPlan:
+    """Compile every indicator_condition and trigger condition of a category.
+
+    Triggers without a condition are dropped (the router skips them), and each
+    trigger's routing rule is resolved up front.
+    """
+    registry = registry or _get_registry()
+    routing_by_trigger: dict[str, dict] = {}
+    for rule in routing:
+        routing_by_trigger.setdefault(rule.get("trigger_id"), rule)
+
+    compiled_indicators = []
+    for indicator in indicators:
+        condition = None
+        if "indicator_condition" in indicator:
+            condition = compile_expression(
+                indicator["indicator_condition"],
+                f"{category_id}:indicator_condition",
+                registry,
+            )
+        triggers = tuple(
+            CompiledTrigger(
+                trigger_id=trigger["trigger_id"],
+                condition=compile_expression(trigger["condition"], trigger["trigger_id"], registry),
+                routing=routing_by_trigger.get(trigger["trigger_id"]),
+            )
+            for trigger in indicator.get("triggers", [])
+            if trigger.get("condition")
+        )
+        compiled_indicators.append(
+            CompiledIndicator(
+                indicator_id=indicator["indicator_id"],
+                condition=condition,
+                triggers=triggers,
+            )
+        )
+
+    return CategoryPlan(category_id=category_id, indicators=tuple(compiled_indicators))
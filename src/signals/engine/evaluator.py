@@ -3,6 +3,13 @@
 from dataclasses import dataclass, field
 from typing import Any
 
+from src.signals.engine.compiler import (
+    CompiledAllOfNode,
+    CompiledAnyOfNode,
+    CompiledEvaluatorNode,
+    CompiledExpression,
+    CompiledNoneOfNode,
+)
 from src.signals.engine.parser import (
     AllOfNode,
     AnyOfNode,
@@ -162,3 +169,62 @@ def evaluate_expression(
     """Evaluate an expression tree against an envelope."""
     evaluator = ExpressionEvaluator()
     return evaluator.evaluate(expr, envelope, trigger_id)
+
+
+def evaluate_compiled(compiled: CompiledExpression, envelope: Envelope) -> EvaluationResult:
+    """Evaluate a compiled expression against an envelope.
+
+    Produces the same EvaluationResult as ``evaluate_expression`` on the source
+    expression dict, without re-parsing or re-resolving evaluators.
+    """
+    result = EvaluationResult(passed=False)
+    _evaluate_compiled_node(compiled.root, envelope, result)
+    return result
+
+
+def _evaluate_compiled_node(node, envelope: Envelope, result: EvaluationResult) -> bool:
+    # Mirrors ExpressionEvaluator._evaluate_node, including how result.passed
+    # is overwritten by nested groups.
+    if isinstance(node, CompiledEvaluatorNode):
+        eval_result = node.evaluate(envelope)
+        result.evidence_map[node.eval_id] = eval_result
+        if eval_result["passed"]:
+            result.passed_evaluators.append(node.eval_label)
+            if "matched_terms" in eval_result.get("evidence", {}):
+                result.matched_terms.extend(eval_result["evidence"]["matched_terms"])
+            passed = True
+        else:
+            result.failed_evaluators.append(node.eval_label)
+            passed = False
+        if node.is_root:
+            result.passed = passed
+        return passed
+
+    if isinstance(node, CompiledAllOfNode):
+        for child in node.children:
+            if not _evaluate_compiled_node(child, envelope, result):
+                result.passed = False
+                return False
+        result.passed = True
+        return True
+
+    if isinstance(node, CompiledAnyOfNode):
+        passed_any = False
+        for child in node.children:
+            if _evaluate_compiled_node(child, envelope, result):
+                passed_any = True
+                if node.label and isinstance(child, CompiledEvaluatorNode):
+                    result.matched_discriminators.append(child.eval_label)
+        if passed_any:
+            result.passed = True
+        return passed_any
+
+    if isinstance(node, CompiledNoneOfNode):
+        for child in node.children:
+            if _evaluate_compiled_node(child, envelope, result):
+                result.passed = False
+                return False
+        result.passed = True
+        return True
+
+    return False
@@ -5,6 +5,7 @@ from .comparison import EqualsEvaluator, GtEvaluator
 from .existence import FieldExistsEvaluator, NestedFieldInEvaluator
 from .field_match import FieldInEvaluator, FieldIntersectsEvaluator
 from .registry import EVALUATOR_WHITELIST, EvaluatorRegistry
+from .term_matcher import AhoCorasickAutomaton, TermMatcher
 from .text import ContainsAnyEvaluator
 
 __all__ = [
@@ -12,6 +13,8 @@ __all__ = [
     "get_field_value",
     "ALLOWED_TOP_LEVEL_FIELDS",
     "ContainsAnyEvaluator",
+    "TermMatcher",
+    "AhoCorasickAutomaton",
     "FieldInEvaluator",
     "FieldIntersectsEvaluator",
     "EqualsEvaluator",
@@ -1,6 +1,7 @@
 """Base class for evaluators."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Callable
 from typing import Any
 
 from src.signals.envelope import Envelope
@@ -56,3 +57,19 @@ class Evaluator(ABC):
             }
         """
         pass
+
+    def compile(self, **args) -> Callable[[Envelope], dict]:
+        """
+        Bind args once and return a callable that evaluates an envelope.
+
+        Used by the compiled signal plans so per-node argument preparation
+        happens at schema-load time. The default binds args unchanged;
+        subclasses override to precompute (e.g. normalize terms). The compiled
+        callable must return exactly what ``evaluate(envelope, **args)`` would.
+        """
+        evaluate = self.evaluate
+
+        def compiled(envelope: Envelope) -> dict:
+            return evaluate(envelope, **args)
+
+        return compiled
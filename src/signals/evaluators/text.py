@@ -1,7 +1,15 @@
 """Text-based evaluators."""
 
+from collections.abc import Callable
+from functools import lru_cache
+
 from src.signals.envelope import Envelope, normalize_text
 from src.signals.evaluators.base import Evaluator, get_field_value
+from src.signals.evaluators.term_matcher import TermMatcher
+
+# Several contains_any nodes usually read the same field of the same envelope;
+# normalize each distinct value once.
+_normalize_cached = lru_cache(maxsize=256)(normalize_text)
 
 
 class ContainsAnyEvaluator(Evaluator):
@@ -32,3 +40,22 @@ class ContainsAnyEvaluator(Evaluator):
             "passed": len(matched_terms) > 0,
             "evidence": {"matched_terms": matched_terms},
         }
+
+    def compile(self, **args) -> Callable[[Envelope], dict]:
+        """Build the term matcher once instead of re-normalizing terms per envelope."""
+        field = args.get("field")
+        matcher = TermMatcher(args.get("terms", []))
+
+        def compiled(envelope: Envelope) -> dict:
+            value = get_field_value(envelope, field)
+            if value is None:
+                return {"passed": False, "evidence": {"matched_terms": []}}
+
+            matched_terms = matcher.find(_normalize_cached(str(value)))
+
+            return {
+                "passed": len(matched_terms) > 0,
+                "evidence": {"matched_terms": matched_terms},
+            }
+
+        return compiled
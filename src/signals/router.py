@@ -2,9 +2,9 @@
 
 from dataclasses import dataclass
 
-from src.signals.engine.evaluator import EvaluationResult, evaluate_expression
+from src.signals.engine.evaluator import EvaluationResult, evaluate_compiled
 from src.signals.envelope import Envelope
-from src.signals.schema.loader import get_routing_rule, load_category_schema
+from src.signals.schema.loader import load_category_schema
 from src.signals.suppression import SuppressionManager
 
 
@@ -27,40 +27,31 @@ class SignalsRouter:
 
     def __init__(self, categories: list[str]):
         self.schemas = {cat: load_category_schema(cat) for cat in categories}
+        self.plans = {cat: schema.plan for cat, schema in self.schemas.items()}
         self.suppression = SuppressionManager()
 
     def route(self, envelope: Envelope) -> list[RouteResult]:
         """Route an envelope through all loaded categories."""
         results = []
 
-        for category_id, schema in self.schemas.items():
-            for indicator in schema.indicators:
+        for plan in self.plans.values():
+            for indicator in plan.indicators:
                 # Check indicator condition
-                if "indicator_condition" in indicator:
-                    ind_result = evaluate_expression(
-                        indicator["indicator_condition"],
-                        envelope,
-                        f"{category_id}:indicator_condition",
-                    )
+                if indicator.condition is not None:
+                    ind_result = evaluate_compiled(indicator.condition, envelope)
                     if not ind_result.passed:
                         continue
 
                 # Evaluate each trigger
-                for trigger in indicator.get("triggers", []):
-                    trigger_id = trigger["trigger_id"]
-                    condition = trigger.get("condition")
-
-                    if not condition:
-                        continue
-
-                    eval_result = evaluate_expression(condition, envelope, trigger_id)
+                for trigger in indicator.triggers:
+                    eval_result = evaluate_compiled(trigger.condition, envelope)
 
                     if eval_result.passed:
-                        routing = get_routing_rule(schema, trigger_id)
+                        routing = trigger.routing
                         if routing:
                             # Check suppression
                             supp = self.suppression.check_suppression(
-                                trigger_id=trigger_id,
+                                trigger_id=trigger.trigger_id,
                                 authority_id=envelope.authority_id,
                                 version=envelope.version,
                                 cooldown_minutes=routing.get("suppression", {}).get(
@@ -73,8 +64,8 @@ class SignalsRouter:
 
                             results.append(
                                 RouteResult(
-                                    indicator_id=indicator["indicator_id"],
-                                    trigger_id=trigger_id,
+                                    indicator_id=indicator.indicator_id,
+                                    trigger_id=trigger.trigger_id,
                                     severity=routing.get("severity", "medium"),
                                     actions=routing.get("actions", []),
                                     human_review_required=routing.get(
@@ -5,6 +5,7 @@ from pathlib import Path
 
 import yaml
 
+from src.signals.engine.compiler import CategoryPlan, compile_category_plan
 from src.signals.engine.parser import validate_expression
 
 
@@ -20,6 +21,7 @@ class CategorySchema:
     evaluator_whitelist: list[str]
     field_access: dict
     raw: dict = field(default_factory=dict)
+    plan: CategoryPlan | None = None  # Compiled conditions, built at load time
 
 
 def _get_schema_path(category_id: str) -> Path:
@@ -46,15 +48,20 @@ def load_category_schema(category_id: str) -> CategorySchema:
             if "condition" in trigger:
                 validate_expression(trigger["condition"])
 
+    indicators = raw.get("indicators", [])
+    routing = raw.get("routing", [])
+
     return CategorySchema(
         category_id=raw.get("category_id", category_id),
         description=raw.get("description", ""),
         priority=raw.get("priority", "medium"),
-        indicators=raw.get("indicators", []),
-        routing=raw.get("routing", []),
+        indicators=indicators,
+        routing=routing,
         evaluator_whitelist=raw.get("evaluator_whitelist", []),
         field_access=raw.get("field_access", {}),
         raw=raw,
+        # Keyed by the requested id, which the router uses in evidence ids
+        plan=compile_category_plan(category_id, indicators, routing),
     )
 
 
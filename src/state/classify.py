@@ -2,9 +2,9 @@
 
 import json
 import logging
-import re
 from dataclasses import dataclass, field
 
+from src.keyword_taxonomy import KeywordTaxonomy
 from src.llm_config import HAIKU_MODEL
 from src.resilience.circuit_breaker import CircuitBreakerOpen, anthropic_cb
 from src.resilience.wiring import circuit_breaker_sync
@@ -123,19 +123,11 @@ MEDIUM_SEVERITY_KEYWORDS = [
 ]
 
 
-# Pre-compile patterns with word boundaries
-def _compile_keyword_patterns(keywords: list[str]) -> list[tuple[str, re.Pattern]]:
-    """Compile keywords to regex patterns with word boundaries."""
-    patterns = []
-    for kw in keywords:
-        # Use word boundaries for whole words/phrases
-        pattern = re.compile(r"\b" + re.escape(kw) + r"\b", re.IGNORECASE)
-        patterns.append((kw, pattern))
-    return patterns
-
-
-_HIGH_PATTERNS = _compile_keyword_patterns(HIGH_SEVERITY_KEYWORDS)
-_MEDIUM_PATTERNS = _compile_keyword_patterns(MEDIUM_SEVERITY_KEYWORDS)
+# Both severity lists in one whole-word matcher: a single scan per signal
+_SEVERITY_TAXONOMY = KeywordTaxonomy(
+    {"high": HIGH_SEVERITY_KEYWORDS, "medium": MEDIUM_SEVERITY_KEYWORDS},
+    whole_words=True,
+)
 
 
 def classify_by_keywords(title: str, content: str | None = None) -> ClassificationResult:
@@ -145,10 +137,10 @@ def classify_by_keywords(title: str, content: str | None = None) -> Classificati
     Used for official sources where content is structured.
     Uses word boundaries to prevent false positives from substrings.
     """
-    text = f"{title} {content or ''}"
+    matches = _SEVERITY_TAXONOMY.matches(f"{title} {content or ''}")
 
     # Check high-severity keywords
-    high_matches = [kw for kw, pattern in _HIGH_PATTERNS if pattern.search(text)]
+    high_matches = matches.get("high")
     if high_matches:
         return ClassificationResult(
             severity="high",
@@ -157,7 +149,7 @@ def classify_by_keywords(title: str, content: str | None = None) -> Classificati
         )
 
     # Check medium-severity keywords
-    medium_matches = [kw for kw, pattern in _MEDIUM_PATTERNS if pattern.search(text)]
+    medium_matches = matches.get("medium")
     if medium_matches:
         return ClassificationResult(
             severity="medium",
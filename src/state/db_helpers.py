@@ -2,7 +2,7 @@
 
 from datetime import UTC, datetime
 
-from src.db import connect, execute, insert_returning_id
+from src.db import connect, execute, executemany, insert_returning_id
 
 # Default sources for TX, CA, FL, PA, OH, NY, NC, GA, VA, AZ
 DEFAULT_SOURCES = [
@@ -276,6 +276,28 @@ def get_sources_by_state(state: str, enabled_only: bool = True) -> list[dict]:
 # --- Signal helpers ---
 
 
+_INSERT_SIGNAL_SQL = """INSERT INTO state_signals(
+       signal_id, state, source_id, program, title, content, url, pub_date, event_date, fetched_at
+   ) VALUES (
+       :signal_id, :state, :source_id, :program, :title, :content, :url, :pub_date, :event_date, :fetched_at
+   ) ON CONFLICT(signal_id) DO NOTHING"""
+
+
+def _signal_params(signal: dict, fetched_at: str) -> dict:
+    return {
+        "signal_id": signal["signal_id"],
+        "state": signal["state"],
+        "source_id": signal["source_id"],
+        "program": signal.get("program"),
+        "title": signal["title"],
+        "content": signal.get("content"),
+        "url": signal["url"],
+        "pub_date": signal.get("pub_date"),
+        "event_date": signal.get("event_date"),
+        "fetched_at": fetched_at,
+    }
+
+
 def insert_state_signal(signal: dict) -> None:
     """
     Insert a state signal (idempotent - skips if already exists).
@@ -283,26 +305,7 @@ def insert_state_signal(signal: dict) -> None:
     Optional: program, content, pub_date, event_date.
     """
     con = connect()
-    execute(
-        con,
-        """INSERT INTO state_signals(
-               signal_id, state, source_id, program, title, content, url, pub_date, event_date, fetched_at
-           ) VALUES (
-               :signal_id, :state, :source_id, :program, :title, :content, :url, :pub_date, :event_date, :fetched_at
-           ) ON CONFLICT(signal_id) DO NOTHING""",
-        {
-            "signal_id": signal["signal_id"],
-            "state": signal["state"],
-            "source_id": signal["source_id"],
-            "program": signal.get("program"),
-            "title": signal["title"],
-            "content": signal.get("content"),
-            "url": signal["url"],
-            "pub_date": signal.get("pub_date"),
-            "event_date": signal.get("event_date"),
-            "fetched_at": _utc_now_iso(),
-        },
-    )
+    execute(con, _INSERT_SIGNAL_SQL, _signal_params(signal, _utc_now_iso()))
     con.commit()
     con.close()
 
@@ -348,6 +351,31 @@ def signal_exists(signal_id: str) -> bool:
     return exists
 
 
+# Keeps IN-lists well under the SQLite/Postgres bound-parameter limits
+_EXISTS_CHUNK_SIZE = 500
+
+
+def existing_signal_ids(signal_ids: list[str]) -> set[str]:
+    """Return the subset of ``signal_ids`` already stored, in one query per 500 ids."""
+    found: set[str] = set()
+    if not signal_ids:
+        return found
+    con = connect()
+    try:
+        for start in range(0, len(signal_ids), _EXISTS_CHUNK_SIZE):
+            chunk = signal_ids[start : start + _EXISTS_CHUNK_SIZE]
+            placeholders = ", ".join(f":id{i}" for i in range(len(chunk)))
+            cur = execute(
+                con,
+                f"SELECT signal_id FROM state_signals WHERE signal_id IN ({placeholders})",
+                {f"id{i}": sid for i, sid in enumerate(chunk)},
+            )
+            found.update(row[0] for row in cur.fetchall())
+    finally:
+        con.close()
+    return found
+
+
 def get_signals_by_state(
     state: str | None = None,
     severity: str | None = None,
@@ -423,6 +451,24 @@ def get_signals_by_state(
 # --- Classification helpers ---
 
 
+_INSERT_CLASSIFICATION_SQL = """INSERT INTO state_classifications(
+       signal_id, severity, classification_method, keywords_matched, llm_reasoning, classified_at
+   ) VALUES (
+       :signal_id, :severity, :classification_method, :keywords_matched, :llm_reasoning, :classified_at
+   ) ON CONFLICT(signal_id) DO NOTHING"""
+
+
+def _classification_params(classification: dict, classified_at: str) -> dict:
+    return {
+        "signal_id": classification["signal_id"],
+        "severity": classification["severity"],
+        "classification_method": classification["classification_method"],
+        "keywords_matched": classification.get("keywords_matched"),
+        "llm_reasoning": classification.get("llm_reasoning"),
+        "classified_at": classified_at,
+    }
+
+
 def insert_state_classification(classification: dict) -> None:
     """
     Insert a classification for a signal (idempotent - skips if already exists).
@@ -430,26 +476,37 @@ def insert_state_classification(classification: dict) -> None:
     Optional: keywords_matched, llm_reasoning.
     """
     con = connect()
-    execute(
-        con,
-        """INSERT INTO state_classifications(
-               signal_id, severity, classification_method, keywords_matched, llm_reasoning, classified_at
-           ) VALUES (
-               :signal_id, :severity, :classification_method, :keywords_matched, :llm_reasoning, :classified_at
-           ) ON CONFLICT(signal_id) DO NOTHING""",
-        {
-            "signal_id": classification["signal_id"],
-            "severity": classification["severity"],
-            "classification_method": classification["classification_method"],
-            "keywords_matched": classification.get("keywords_matched"),
-            "llm_reasoning": classification.get("llm_reasoning"),
-            "classified_at": _utc_now_iso(),
-        },
-    )
+    execute(con, _INSERT_CLASSIFICATION_SQL, _classification_params(classification, _utc_now_iso()))
     con.commit()
     con.close()
 
 
+def insert_classified_signals(signals: list[dict], classifications: list[dict]) -> None:
+    """
+    Insert state signals and their classifications in a single transaction.
+
+    Same keys and idempotency as insert_state_signal / insert_state_classification;
+    signals are written first so every classification has its parent row.
+    """
+    if not signals and not classifications:
+        return
+    now = _utc_now_iso()
+    con = connect()
+    try:
+        executemany(con, _INSERT_SIGNAL_SQL, [_signal_params(s, now) for s in signals])
+        executemany(
+            con,
+            _INSERT_CLASSIFICATION_SQL,
+            [_classification_params(c, now) for c in classifications],
+        )
+        con.commit()
+    except Exception:
+        con.rollback()
+        raise
+    finally:
+        con.close()
+
+
 def get_state_classification(signal_id: str) -> dict | None:
     """Get classification for a signal."""
     con = connect()
@@ -681,11 +738,14 @@ def get_latest_run() -> dict | None:
 # --- Source health tracking ---
 
 
-def update_source_health(source_id: str, success: bool, error: str = None) -> None:
+def update_source_health(
+    source_id: str, success: bool, error: str = None, latency_ms: int | None = None
+) -> None:
     """
     Update health tracking for a source using atomic UPSERT.
     On success: reset consecutive_failures, update last_success.
     On failure: increment consecutive_failures, update last_failure and last_error.
+    Either way, last_latency_ms is set to latency_ms when one is given.
     """
     con = connect()
     now = _utc_now_iso()
@@ -693,23 +753,27 @@ def update_source_health(source_id: str, success: bool, error: str = None) -> No
     if success:
         execute(
             con,
-            """INSERT INTO state_source_health(source_id, consecutive_failures, last_success)
-               VALUES(:source_id, 0, :now)
+            """INSERT INTO state_source_health(
+                   source_id, consecutive_failures, last_success, last_latency_ms
+               ) VALUES(:source_id, 0, :now, :latency_ms)
                ON CONFLICT(source_id) DO UPDATE SET
                    consecutive_failures = 0,
-                   last_success = :now""",
-            {"source_id": source_id, "now": now},
+                   last_success = :now,
+                   last_latency_ms = COALESCE(:latency_ms, state_source_health.last_latency_ms)""",
+            {"source_id": source_id, "now": now, "latency_ms": latency_ms},
         )
     else:
         execute(
             con,
-            """INSERT INTO state_source_health(source_id, consecutive_failures, last_failure, last_error)
-               VALUES(:source_id, 1, :now, :error)
+            """INSERT INTO state_source_health(
+                   source_id, consecutive_failures, last_failure, last_error, last_latency_ms
+               ) VALUES(:source_id, 1, :now, :error, :latency_ms)
                ON CONFLICT(source_id) DO UPDATE SET
                    consecutive_failures = state_source_health.consecutive_failures + 1,
                    last_failure = :now,
-                   last_error = :error""",
-            {"source_id": source_id, "now": now, "error": error},
+                   last_error = :error,
+                   last_latency_ms = COALESCE(:latency_ms, state_source_health.last_latency_ms)""",
+            {"source_id": source_id, "now": now, "error": error, "latency_ms": latency_ms},
         )
 
     con.commit()
@@ -721,7 +785,8 @@ def get_source_health(source_id: str) -> dict | None:
     con = connect()
     cur = execute(
         con,
-        """SELECT source_id, consecutive_failures, last_success, last_failure, last_error
+        """SELECT source_id, consecutive_failures, last_success, last_failure, last_error,
+                  last_latency_ms
            FROM state_source_health WHERE source_id = :source_id""",
         {"source_id": source_id},
     )
@@ -735,6 +800,7 @@ def get_source_health(source_id: str) -> dict | None:
         "last_success": row[2],
         "last_failure": row[3],
         "last_error": row[4],
+        "last_latency_ms": row[5],
     }
 
 
@@ -0,0 +1,99 @@
+"""Shared HTTP worker budget for state-source fetches.
+
+The state monitor fans out at several levels: up to 6 states at once, the
+official/NewsAPI/RSS sources of a state, and the feeds of an RSS source.
+Each unit of real HTTP work (an official or NewsAPI fetch, one RSS feed)
+holds a slot from one process-wide semaphore while it runs, so concurrent
+requests stay at STATE_HTTP_WORKERS however the fan-out multiplies. Code
+that only waits on other work (a state, an RSS source gathering its
+feeds) never holds a slot, so slot holders never wait on each other.
+
+A slot-holding call's deadline starts once it has its slot, so time spent
+queued behind other requests is not charged to the source. A call that
+cannot get a slot within its timeout never runs and is reported as a
+SlotTimeoutError rather than a fetch failure. Slot holders must set their
+own I/O timeouts: a call abandoned at its deadline keeps its slot until
+its request returns.
+"""
+
+import os
+import threading
+import time
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import TypeVar
+
+T = TypeVar("T")
+
+STATE_HTTP_WORKERS = int(os.environ.get("STATE_HTTP_WORKERS", "8"))
+
+_slots = threading.BoundedSemaphore(STATE_HTTP_WORKERS)
+
+
+class SlotTimeoutError(TimeoutError):
+    """A call (or a call nested in it) got no HTTP slot in time and never reached the network."""
+
+
+class _Call:
+    """One submitted call; ``ready`` is set once it has its slot or gave up waiting."""
+
+    def __init__(self, fn: Callable[[], object], timeout: float, hold_slot: bool):
+        self.fn = fn
+        self.timeout = timeout
+        self.hold_slot = hold_slot
+        self.ready = threading.Event()
+        self.started_at: float | None = None
+
+    def __call__(self) -> object:
+        try:
+            if self.hold_slot and not _slots.acquire(timeout=self.timeout):
+                return None
+            self.started_at = time.monotonic()
+        finally:
+            self.ready.set()
+        try:
+            return self.fn()
+        finally:
+            if self.hold_slot:
+                _slots.release()
+
+
+def run_with_timeouts(
+    calls: Sequence[tuple[Callable[[], T], float, bool]],
+) -> list[T | TimeoutError]:
+    """
+    Run ``(fn, timeout_seconds, hold_slot)`` calls concurrently; return results in call order.
+
+    Every call is submitted at once. With hold_slot, a call first waits up to
+    its timeout for an HTTP slot and holds it while it runs. Its deadline
+    starts when it begins running. A call that got no slot, or raised
+    SlotTimeoutError itself, is reported as a SlotTimeoutError in its result
+    position; a call still running at its deadline is abandoned and reported
+    as a TimeoutError (its thread finishes in the background). Other
+    exceptions raised by a call propagate.
+    """
+    if not calls:
+        return []
+    pending = [_Call(fn, timeout, hold_slot) for fn, timeout, hold_slot in calls]
+    executor = ThreadPoolExecutor(max_workers=len(pending), thread_name_prefix="state-fetch")
+    try:
+        futures = [executor.submit(call) for call in pending]
+        results: list[T | TimeoutError] = []
+        for future, call in zip(futures, pending, strict=True):
+            # Bounded: the slot wait itself times out
+            call.ready.wait()
+            if call.started_at is None:
+                results.append(SlotTimeoutError(f"no HTTP slot within {call.timeout:g}s"))
+                continue
+            remaining = max(0.0, call.started_at + call.timeout - time.monotonic())
+            try:
+                results.append(future.result(timeout=remaining))
+            except SlotTimeoutError as e:
+                # Before FutureTimeoutError, which is TimeoutError on 3.11+
+                results.append(e)
+            except FutureTimeoutError:
+                results.append(TimeoutError(f"no response within {call.timeout:g}s"))
+        return results
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
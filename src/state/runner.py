@@ -5,23 +5,25 @@ Orchestrates twice-daily monitoring runs for TX, CA, FL, PA, OH, NY, NC, GA, VA,
 
 import argparse
 import logging
+import time
 from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
+from functools import partial
 
 from src.notify_email import _send_email
 from src.notify_email import is_configured as email_configured
 from src.state.classify import ClassificationResult, classify_by_keywords, classify_by_llm
 from src.state.common import RawSignal, detect_program, generate_signal_id
 from src.state.db_helpers import (
+    existing_signal_ids,
     finish_state_run,
     get_unnotified_signals,
-    insert_state_classification,
-    insert_state_signal,
+    insert_classified_signals,
     mark_signal_notified,
-    signal_exists,
     start_state_run,
     update_source_health,
 )
+from src.state.http_budget import SlotTimeoutError, run_with_timeouts
 from src.state.sources.az_official import AZOfficialSource
 from src.state.sources.ca_official import CAOfficialSource
 from src.state.sources.fl_official import FLOfficialSource
@@ -40,6 +42,14 @@ logger = logging.getLogger(__name__)
 # States we monitor
 MONITORED_STATES = ["TX", "CA", "FL", "PA", "OH", "NY", "NC", "GA", "VA", "AZ"]
 
+# Max concurrent LLM classification calls per state (states themselves run 6 wide)
+LLM_CLASSIFY_CONCURRENCY = 4
+
+# Per-source fetch deadlines in seconds (CA official drives a headless browser).
+# RSS holds no slot and waits on its feeds, each of which may wait up to
+# FEED_TIMEOUT_S for a slot and then run for up to FEED_TIMEOUT_S.
+SOURCE_TIMEOUTS_S = {"official": 90.0, "newsapi": 45.0, "rss": 75.0}
+
 
 def _get_official_source(state: str):
     """Get the official source class for a state. Returns None if not supported."""
@@ -98,20 +108,55 @@ def _classify_signal(signal: RawSignal) -> ClassificationResult:
         return classify_by_llm(signal.title, signal.content, signal.state)
 
 
-def _fetch_from_source(source, source_name: str) -> tuple[list[RawSignal], bool, str | None]:
+def _classify_signals(signals: list[RawSignal]) -> list[ClassificationResult]:
+    """
+    Classify a batch of signals, returned in input order.
+
+    Keyword classification is cheap and runs inline; LLM-classified (news)
+    signals are sent concurrently, capped at LLM_CLASSIFY_CONCURRENCY.
+    """
+    results: list[ClassificationResult | None] = [None] * len(signals)
+    llm_indexes = []
+    for i, sig in enumerate(signals):
+        if _is_official_source(sig.source_id):
+            results[i] = _classify_signal(sig)
+        else:
+            llm_indexes.append(i)
+
+    if len(llm_indexes) == 1:
+        results[llm_indexes[0]] = _classify_signal(signals[llm_indexes[0]])
+    elif llm_indexes:
+        max_workers = min(len(llm_indexes), LLM_CLASSIFY_CONCURRENCY)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            classified = executor.map(_classify_signal, [signals[i] for i in llm_indexes])
+            for i, classification in zip(llm_indexes, classified, strict=True):
+                results[i] = classification
+    return results
+
+
+def _fetch_from_source(source, source_name: str) -> tuple[list[RawSignal], bool, str | None, int]:
     """
     Fetch signals from a source with error handling.
 
+    Runs inside run_with_timeouts, which holds the HTTP slot (if any) around
+    it, so latency excludes slot waits. A SlotTimeoutError from nested feeds
+    propagates so the source is not recorded as failed.
+
     Returns:
-        (signals, success, error_message)
+        (signals, success, error_message, latency_ms)
     """
+    started = time.perf_counter()
     try:
         signals = source.fetch()
-        return signals, True, None
+    except SlotTimeoutError:
+        raise
     except Exception as e:
+        latency_ms = int((time.perf_counter() - started) * 1000)
         error_msg = f"{type(e).__name__}: {str(e)}"
         logger.error(f"Failed to fetch from {source_name}: {error_msg}")
-        return [], False, error_msg
+        return [], False, error_msg, latency_ms
+    latency_ms = int((time.perf_counter() - started) * 1000)
+    return signals, True, None, latency_ms
 
 
 def _send_high_severity_notification(signal_data: dict) -> bool:
@@ -172,53 +217,57 @@ def _process_single_state(st: str, dry_run: bool = False) -> dict:
     # Collect all raw signals for this state
     raw_signals: list[RawSignal] = []
 
-    # 1. Fetch from official source
+    # 1. Official source, NewsAPI and RSS: (label, source, timeout, holds a slot)
+    jobs = []
     source_class = _get_official_source(st)
     if source_class is not None:
-        source = source_class()
-        signals, success, error = _fetch_from_source(source, f"{st} official")
-        update_source_health(source.source_id, success=success, error=error)
-        if success:
-            raw_signals.extend(signals)
-            source_successes += 1
-            logger.info(f"  {st} official: {len(signals)} signals")
-        else:
-            source_failures += 1
-            errors.append(f"{st} official: {error}")
+        jobs.append((f"{st} official", source_class(), SOURCE_TIMEOUTS_S["official"], True))
 
-    # 2. Fetch from NewsAPI
     try:
-        newsapi_source = NewsAPISource(st)
-        signals, success, error = _fetch_from_source(newsapi_source, f"{st} NewsAPI")
-        update_source_health(newsapi_source.source_id, success=success, error=error)
-        if success:
-            raw_signals.extend(signals)
-            source_successes += 1
-            logger.info(f"  {st} NewsAPI: {len(signals)} signals")
-        else:
-            source_failures += 1
-            errors.append(f"{st} NewsAPI: {error}")
+        jobs.append((f"{st} NewsAPI", NewsAPISource(st), SOURCE_TIMEOUTS_S["newsapi"], True))
     except ValueError as e:
         logger.warning(f"Could not initialize NewsAPI for {st}: {e}")
         source_failures += 1
         errors.append(f"{st} NewsAPI init: {str(e)}")
 
-    # 3. Fetch from RSS feeds
     try:
-        rss_source = RSSSource(st)
-        signals, success, error = _fetch_from_source(rss_source, f"{st} RSS")
-        update_source_health(rss_source.source_id, success=success, error=error)
+        # RSS holds no slot itself; each of its feeds takes one while parsing
+        jobs.append((f"{st} RSS", RSSSource(st), SOURCE_TIMEOUTS_S["rss"], False))
+    except ValueError as e:
+        logger.warning(f"Could not initialize RSS for {st}: {e}")
+        source_failures += 1
+        errors.append(f"{st} RSS init: {str(e)}")
+
+    # 2. Fetch all sources concurrently, each against its own deadline
+    outcomes = run_with_timeouts(
+        [
+            (partial(_fetch_from_source, source, label), timeout, hold_slot)
+            for label, source, timeout, hold_slot in jobs
+        ]
+    )
+
+    # 3. Record health and latency; collect signals in source order
+    for (label, source, timeout, _), outcome in zip(jobs, outcomes, strict=True):
+        if isinstance(outcome, SlotTimeoutError):
+            # Never reached the network: count it for this run, leave source health alone
+            logger.warning(f"Skipped {label}: {outcome}")
+            source_failures += 1
+            errors.append(f"{label}: SlotTimeoutError: {outcome}")
+            continue
+        if isinstance(outcome, TimeoutError):
+            signals, success, error = [], False, f"TimeoutError: {outcome}"
+            latency_ms = int(timeout * 1000)
+            logger.error(f"Failed to fetch from {label}: {error}")
+        else:
+            signals, success, error, latency_ms = outcome
+        update_source_health(source.source_id, success=success, error=error, latency_ms=latency_ms)
         if success:
             raw_signals.extend(signals)
             source_successes += 1
-            logger.info(f"  {st} RSS: {len(signals)} signals")
+            logger.info(f"  {label}: {len(signals)} signals ({latency_ms} ms)")
         else:
             source_failures += 1
-            errors.append(f"{st} RSS: {error}")
-    except ValueError as e:
-        logger.warning(f"Could not initialize RSS for {st}: {e}")
-        source_failures += 1
-        errors.append(f"{st} RSS init: {str(e)}")
+            errors.append(f"{label}: {error}")
 
     # 4. Deduplicate signals by signal_id (URL hash)
     seen_ids: set[str] = set()
@@ -232,22 +281,24 @@ def _process_single_state(st: str, dry_run: bool = False) -> dict:
     total_signals_found += len(unique_signals)
     logger.info(f"  {st} total unique signals: {len(unique_signals)}")
 
-    # 5. Process each signal
-    for sig in unique_signals:
-        sig_id = generate_signal_id(sig.url)
-
-        # Skip if already in database
-        if signal_exists(sig_id):
-            continue
-
-        new_signals_count += 1
-
-        # Detect program
-        text = f"{sig.title} {sig.content or ''}"
-        program = detect_program(text)
+    # 5. Skip signals already in the database (one query for the whole state)
+    sig_ids = [generate_signal_id(sig.url) for sig in unique_signals]
+    known_ids = existing_signal_ids(sig_ids)
+    new_ids = [sig_id for sig_id in sig_ids if sig_id not in known_ids]
+    new_signals = [sig for sig_id, sig in zip(sig_ids, unique_signals) if sig_id not in known_ids]
+    new_signals_count += len(new_signals)
+
+    # 6. Classify, then store signals and classifications in one transaction
+    signal_rows = []
+    classification_rows = []
+    classifications = _classify_signals(new_signals)
+    for sig_id, sig, classification in zip(new_ids, new_signals, classifications, strict=True):
+        # Detect program; fall back to the LLM-detected program if keywords missed
+        program = detect_program(f"{sig.title} {sig.content or ''}")
+        if program is None and classification.program is not None:
+            program = classification.program
 
-        # Store signal
-        insert_state_signal(
+        signal_rows.append(
             {
                 "signal_id": sig_id,
                 "state": sig.state,
@@ -260,28 +311,7 @@ def _process_single_state(st: str, dry_run: bool = False) -> dict:
                 "event_date": sig.event_date,
             }
         )
-
-        # Classify signal
-        classification = _classify_signal(sig)
-
-        # Fallback: if keyword-based program detection missed, use LLM program
-        if program is None and classification.program is not None:
-            program = classification.program
-            # Update the stored signal with the LLM-detected program
-            from src.db import connect as db_connect
-            from src.db import execute as db_execute
-
-            con = db_connect()
-            db_execute(
-                con,
-                "UPDATE state_signals SET program = :program WHERE signal_id = :signal_id",
-                {"program": program, "signal_id": sig_id},
-            )
-            con.commit()
-            con.close()
-
-        # Store classification
-        insert_state_classification(
+        classification_rows.append(
             {
                 "signal_id": sig_id,
                 "severity": classification.severity,
@@ -298,6 +328,8 @@ def _process_single_state(st: str, dry_run: bool = False) -> dict:
             high_severity_count += 1
             logger.info(f"  HIGH SEVERITY: {sig.title[:60]}...")
 
+    insert_classified_signals(signal_rows, classification_rows)
+
     return {
         "total_signals_found": total_signals_found,
         "high_severity_count": high_severity_count,
@@ -363,7 +395,7 @@ def run_state_monitor(
         source_failures += result["source_failures"]
         errors.extend(result["errors"])
 
-    # 6. Route notifications (sequential, after all states complete)
+    # 7. Route notifications (sequential, after all states complete)
     if not dry_run:
         # Get unnotified high-severity signals and send immediate Slack
         high_severity_signals = get_unnotified_signals(severity="high")
@@ -381,7 +413,7 @@ def run_state_monitor(
     else:
         logger.info("Dry run - skipping notifications")
 
-    # 7. Determine final status
+    # 8. Determine final status
     if source_successes == 0 and source_failures > 0:
         status = "ERROR"
     elif source_failures > 0:
@@ -389,7 +421,7 @@ def run_state_monitor(
     else:
         status = "SUCCESS"
 
-    # 8. Record run completion
+    # 9. Record run completion
     finish_state_run(
         run_id=run_id,
         status=status,
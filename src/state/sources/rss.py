@@ -2,16 +2,25 @@
 
 import logging
 from datetime import datetime
+from functools import partial
 from time import mktime
 from typing import TypedDict
 
 import feedparser
+import httpx
 
 from src.state.common import RawSignal, is_veteran_relevant
+from src.state.http_budget import SlotTimeoutError, run_with_timeouts
 from src.state.sources.base import StateSource
 
 logger = logging.getLogger(__name__)
 
+# Per-feed deadline, also the feed request's I/O timeout; a feed that
+# misses it is skipped for this run
+FEED_TIMEOUT_S = 30.0
+
+USER_AGENT = "VA-Signals-Monitor/2.0 (veteran-advocacy; +https://github.com/vetclaims)"
+
 
 class FeedInfo(TypedDict):
     name: str
@@ -147,12 +156,20 @@ class RSSSource(StateSource):
         return self._state
 
     def fetch(self) -> list[RawSignal]:
-        """Fetch news from all RSS feeds for this state."""
+        """Fetch news from all RSS feeds for this state, parsing the feeds concurrently."""
         all_signals = []
         seen_urls: set[str] = set()
 
-        for feed_info in RSS_FEEDS[self._state]:
-            signals = self._parse_feed(feed_info)
+        feeds = RSS_FEEDS[self._state]
+        results = run_with_timeouts(
+            [(partial(self._parse_feed, f), FEED_TIMEOUT_S, True) for f in feeds]
+        )
+        if results and all(isinstance(signals, SlotTimeoutError) for signals in results):
+            raise SlotTimeoutError(f"no HTTP slot for any {self._state} feed")
+        for feed_info, signals in zip(feeds, results, strict=True):
+            if isinstance(signals, TimeoutError):
+                logger.warning(f"Feed timed out for {feed_info['name']}: {signals}")
+                continue
             for signal in signals:
                 if signal.url not in seen_urls:
                     seen_urls.add(signal.url)
@@ -161,8 +178,19 @@ class RSSSource(StateSource):
         return all_signals
 
     def _parse_feed(self, feed_info: FeedInfo) -> list[RawSignal]:
-        """Parse a single RSS feed and filter for veteran relevance."""
-        feed = feedparser.parse(feed_info["url"])
+        """Fetch and parse a single RSS feed and filter for veteran relevance."""
+        try:
+            response = httpx.get(
+                feed_info["url"],
+                timeout=FEED_TIMEOUT_S,
+                follow_redirects=True,
+                headers={"User-Agent": USER_AGENT},
+            )
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            logger.warning(f"Feed fetch error for {feed_info['name']}: {e}")
+            return []
+        feed = feedparser.parse(response.content)
         if feed.bozo:
             logger.warning(
                 f"Feed parse error for {feed_info['name']}: {getattr(feed, 'bozo_exception', 'unknown error')}"
@@ -0,0 +1,19 @@
+"""
+Cached tenant resolution for TenantMiddleware.
+
+Resolving a tenant takes up to five tenant_manager queries per request. The
+resolved TenantContext (or None for a user with no tenant) is cached per user
+and tenant selector. TenantManager drops a user's entries whenever it changes
+that user's memberships. TTL and size come from the AUTH_CACHE_* settings in
+src.auth.cache.
+"""
+
+from ..auth.cache import TTLCache, register_cache
+
+# (user_id, X-Tenant-ID, X-Tenant-Slug, host) -> TenantContext | None
+tenant_context_cache = register_cache(TTLCache("tenant_context"))
+
+
+def invalidate_tenant_context(user_id: str) -> int:
+    """Forget every cached tenant resolution for ``user_id``."""
+    return tenant_context_cache.invalidate_where(lambda key: key[0] == user_id)
@@ -9,6 +9,7 @@ import uuid
 from datetime import UTC, datetime
 
 from ..db import connect, execute
+from .cache import invalidate_tenant_context
 from .models import (
     Tenant,
     TenantCreateRequest,
@@ -100,6 +101,7 @@ class TenantManager:
             )
 
             con.commit()
+            invalidate_tenant_context(owner_user_id)
             logger.info(f"Created tenant {tenant_id} ({request.name})")
 
             return Tenant(
@@ -381,6 +383,7 @@ class TenantManager:
                 },
             )
             con.commit()
+            invalidate_tenant_context(user_id)
             logger.info(f"Added user {user_id} to tenant {tenant_id} with role {role}")
 
             return TenantMember(
@@ -414,6 +417,7 @@ class TenantManager:
             con.commit()
             removed = cur.rowcount > 0
             if removed:
+                invalidate_tenant_context(user_id)
                 logger.info(f"Removed user {user_id} from tenant {tenant_id}")
             return removed
         finally:
@@ -433,7 +437,10 @@ class TenantManager:
                 {"tenant_id": tenant_id, "user_id": user_id, "role": new_role},
             )
             con.commit()
-            return cur.rowcount > 0
+            updated = cur.rowcount > 0
+            if updated:
+                invalidate_tenant_context(user_id)
+            return updated
         finally:
             con.close()
 
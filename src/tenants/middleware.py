@@ -9,8 +9,12 @@ import logging
 from contextvars import ContextVar
 
 from fastapi import HTTPException, Request
+from starlette.datastructures import Headers
 from starlette.middleware.base import BaseHTTPMiddleware
 
+from ..auth.cache import MISS
+from ..db import run_db
+from .cache import tenant_context_cache
 from .manager import tenant_manager
 from .models import TenantContext
 
@@ -118,13 +122,34 @@ class TenantMiddleware(BaseHTTPMiddleware):
             set_tenant_context(None)
 
     async def _resolve_tenant(self, request: Request, user_id: str) -> TenantContext | None:
-        """Resolve tenant from request headers or user's primary tenant."""
-
+        """Resolve tenant from request headers or user's primary tenant.
+
+        Served from tenant_context_cache when warm. On a miss the
+        tenant_manager lookups are blocking DB calls, so they run on the DB
+        executor rather than the event loop.
+        """
+        headers = request.headers
+        key = (
+            user_id,
+            headers.get("X-Tenant-ID"),
+            headers.get("X-Tenant-Slug"),
+            headers.get("host", ""),
+        )
+        cached = tenant_context_cache.get(key)
+        if cached is not MISS:
+            return cached
+        # Taken before the read: a membership change invalidated mid-lookup is not re-cached
+        generation = tenant_context_cache.generation()
+        context = await run_db(self._lookup_tenant, headers, user_id)
+        tenant_context_cache.set(key, context, generation)
+        return context
+
+    def _lookup_tenant(self, headers: Headers, user_id: str) -> TenantContext | None:
         tenant = None
         tenant_id = None
 
         # 1. Try X-Tenant-ID header
-        header_tenant_id = request.headers.get("X-Tenant-ID")
+        header_tenant_id = headers.get("X-Tenant-ID")
         if header_tenant_id:
             tenant = tenant_manager.get_tenant(header_tenant_id)
             if tenant:
@@ -132,7 +157,7 @@ class TenantMiddleware(BaseHTTPMiddleware):
 
         # 2. Try X-Tenant-Slug header
         if not tenant:
-            header_slug = request.headers.get("X-Tenant-Slug")
+            header_slug = headers.get("X-Tenant-Slug")
             if header_slug:
                 tenant = tenant_manager.get_tenant_by_slug(header_slug)
                 if tenant:
@@ -140,7 +165,7 @@ class TenantMiddleware(BaseHTTPMiddleware):
 
         # 3. Try subdomain (for custom domain support)
         if not tenant:
-            host = request.headers.get("host", "")
+            host = headers.get("host", "")
             # Check if it's a subdomain (e.g., acme.vasignals.com)
             if host and "." in host:
                 subdomain = host.split(".")[0]
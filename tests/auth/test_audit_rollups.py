@@ -0,0 +1,213 @@
+"""Tests for hourly audit rollups, rollup-backed stats and the streaming CSV export."""
+
+import csv
+import io
+import random
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from src.auth import audit
+from src.auth.audit_rollups import (
+    DURATION_BUCKETS_MS,
+    check_audit_rollups,
+    rebuild_audit_rollups,
+    rollup_hour,
+)
+from src.db import connect, execute
+
+ACTIONS = ["api:read", "api:create", "api:update", "auth:login", "user:read"]
+USERS = [None, "a@example.com", "b@example.com", "c@example.com"]
+STATUSES = [200, 201, 204, 400, 403, 404, 500]
+
+
+def _entries(count: int, now: datetime, seed: int = 3) -> list[dict]:
+    rng = random.Random(seed)
+    entries = []
+    for i in range(count):
+        status = rng.choice(STATUSES)
+        entries.append(
+            {
+                "log_id": f"AUDIT_R_{i:05d}",
+                "timestamp": (now - timedelta(minutes=rng.randint(0, 10 * 24 * 60))).isoformat(),
+                "user_id": None,
+                "user_email": rng.choice(USERS),
+                "action": rng.choice(ACTIONS),
+                "resource": "signals",
+                "resource_id": None,
+                "request_method": "GET",
+                "request_path": "/api/signals",
+                "request_body": None,
+                "response_status": status,
+                "ip_address": "10.0.0.1",
+                "user_agent": "pytest",
+                "duration_ms": rng.choice([None, rng.randint(0, 4000)]),
+                "success": 200 <= status < 400,
+            }
+        )
+    return entries
+
+
+def _raw_stats(days: int) -> dict:
+    """get_audit_stats as it was computed before the rollups, from audit_log."""
+    start_date = (datetime.now(UTC) - timedelta(days=days)).isoformat()
+    params = {"start_date": start_date}
+    con = connect()
+    total = execute(
+        con, "SELECT COUNT(*) FROM audit_log WHERE timestamp >= :start_date", params
+    ).fetchone()[0]
+    by_action = dict(
+        execute(
+            con,
+            "SELECT action, COUNT(*) FROM audit_log WHERE timestamp >= :start_date GROUP BY action",
+            params,
+        ).fetchall()
+    )
+    by_user = dict(
+        execute(
+            con,
+            """SELECT user_email, COUNT(*) FROM audit_log
+               WHERE timestamp >= :start_date AND user_email IS NOT NULL GROUP BY user_email""",
+            params,
+        ).fetchall()
+    )
+    errors = execute(
+        con,
+        "SELECT COUNT(*) FROM audit_log WHERE timestamp >= :start_date AND success = 0",
+        params,
+    ).fetchone()[0]
+    avg = execute(
+        con,
+        """SELECT AVG(duration_ms) FROM audit_log
+           WHERE timestamp >= :start_date AND duration_ms IS NOT NULL""",
+        params,
+    ).fetchone()[0]
+    con.close()
+    return {
+        "total_requests": total,
+        "by_action": by_action,
+        "by_user": by_user,
+        "error_count": errors,
+        "error_rate_percent": round(errors / (total or 1) * 100, 2),
+        "avg_duration_ms": round(avg or 0, 2),
+    }
+
+
+class TestRollupStats:
+    def test_matches_raw_audit_log(self):
+        audit._write_batch(_entries(2000, datetime.now(UTC)))
+
+        for days in (1, 7):
+            stats = audit.get_audit_stats(days=days)
+            expected = _raw_stats(days)
+            assert {key: stats[key] for key in expected} == expected
+            assert sum(stats["by_status"].values()) == stats["total_requests"]
+
+    def test_partial_first_hour_comes_from_audit_log(self):
+        now = datetime.now(UTC)
+        boundary = now - timedelta(days=1)
+        entries = _entries(2, now)
+        # Same rollup hour as the period start, one just before it and one after
+        entries[0]["timestamp"] = (boundary - timedelta(seconds=1)).isoformat()
+        entries[1]["timestamp"] = (boundary + timedelta(seconds=5)).isoformat()
+        if rollup_hour(entries[0]["timestamp"]) != rollup_hour(entries[1]["timestamp"]):
+            pytest.skip("period start is within a second of an hour boundary")
+        audit._write_batch(entries)
+
+        assert audit.get_audit_stats(days=1)["total_requests"] == 1
+
+    def test_duration_histogram(self):
+        now = datetime.now(UTC)
+        entries = _entries(6, now)
+        for entry, duration in zip(entries, [None, 0, 50, 51, 2500, 2501]):
+            entry.update(timestamp=now.isoformat(), duration_ms=duration)
+        audit._write_batch(entries)
+
+        stats = audit.get_audit_stats(days=1)
+
+        labels = [f"<={b}" for b in DURATION_BUCKETS_MS] + [f">{DURATION_BUCKETS_MS[-1]}"]
+        assert list(stats["duration_histogram_ms"]) == labels
+        assert stats["duration_histogram_ms"] == {
+            "<=50": 2,
+            "<=100": 1,
+            "<=250": 0,
+            "<=500": 0,
+            "<=1000": 0,
+            "<=2500": 1,
+            ">2500": 1,
+        }
+        assert stats["avg_duration_ms"] == round((0 + 50 + 51 + 2500 + 2501) / 5, 2)
+
+
+class TestRollupMaintenance:
+    def test_writer_keeps_rollups_consistent(self):
+        entries = _entries(300, datetime.now(UTC))
+        audit._write_batch(entries[:150])
+        audit._write_batch(entries[150:])
+
+        assert check_audit_rollups() == []
+
+    def test_check_and_rebuild(self):
+        audit._write_batch(_entries(50, datetime.now(UTC)))
+        con = connect()
+        execute(con, "DELETE FROM audit_log WHERE log_id = 'AUDIT_R_00000'")
+        con.commit()
+        con.close()
+
+        mismatches = check_audit_rollups()
+        assert len(mismatches) == 1
+        assert (
+            mismatches[0]["actual"]["request_count"] - mismatches[0]["expected"]["request_count"]
+        ) == 1
+
+        assert rebuild_audit_rollups() > 0
+        assert check_audit_rollups() == []
+
+    def test_cleanup_trims_rollups(self):
+        audit._write_batch(_entries(500, datetime.now(UTC)))
+
+        result = audit.cleanup_old_audit_logs(retention_days=5)
+
+        assert result["deleted"] > 0
+        assert check_audit_rollups() == []
+
+
+def _read_csv(text: str) -> list[list[str]]:
+    return list(csv.reader(io.StringIO(text)))
+
+
+class TestStreamingExport:
+    def test_pages_cover_every_row_in_order(self):
+        now = datetime.now(UTC)
+        entries = _entries(57, now)
+        # Force keyset ties on timestamp across page boundaries
+        for entry in entries[:20]:
+            entry["timestamp"] = now.isoformat()
+        audit._write_batch(entries)
+
+        chunks = list(audit.iter_audit_logs_csv(page_size=10))
+
+        assert len(chunks) == 6
+        rows = _read_csv("".join(chunks))
+        assert rows[0] == audit.AUDIT_LOG_COLUMNS
+        exported = [(row[1], row[0]) for row in rows[1:]]
+        assert exported == sorted(((e["timestamp"], e["log_id"]) for e in entries), reverse=True)
+
+    def test_date_filter(self):
+        now = datetime.now(UTC)
+        audit._write_batch(_entries(100, now))
+        start = now - timedelta(days=2)
+
+        rows = _read_csv(audit.export_audit_logs_csv(start_date=start))[1:]
+
+        con = connect()
+        expected = execute(
+            con,
+            "SELECT COUNT(*) FROM audit_log WHERE timestamp >= :start",
+            {"start": start.isoformat()},
+        ).fetchone()[0]
+        con.close()
+        assert len(rows) == expected
+
+    def test_empty_export(self):
+        assert audit.export_audit_logs_csv() == audit.NO_AUDIT_LOGS_MESSAGE
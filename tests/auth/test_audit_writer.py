@@ -0,0 +1,207 @@
+"""Tests for the batched audit log writer in src.auth.audit."""
+
+from queue import Queue
+
+import pytest
+
+import src.db as db
+from src.auth import audit
+from src.db import connect, execute
+
+
+@pytest.fixture(autouse=True)
+def fresh_writer(monkeypatch):
+    """Give each test its own queue, worker slot and counters."""
+    monkeypatch.setattr(audit, "_audit_queue", Queue(maxsize=100))
+    monkeypatch.setattr(audit, "_audit_worker", None)
+    monkeypatch.setattr(audit, "_metrics", dict.fromkeys(audit._metrics, 0))
+    yield
+    audit.shutdown_audit_worker()
+
+
+def _entry(i: int, **overrides) -> dict:
+    entry = {
+        "log_id": f"AUDIT_TEST_{i:04d}",
+        "timestamp": f"2026-03-14T15:{i % 60:02d}:00+00:00",
+        "user_id": "u1",
+        "user_email": "analyst@example.com",
+        "action": "api:read",
+        "resource": "signals",
+        "resource_id": None,
+        "request_method": "GET",
+        "request_path": "/api/signals",
+        "request_body": None,
+        "response_status": 200,
+        "ip_address": "10.0.0.1",
+        "user_agent": "pytest",
+        "duration_ms": 12,
+        "success": True,
+    }
+    entry.update(overrides)
+    return entry
+
+
+def _audit_log_ids() -> list[str]:
+    con = connect()
+    rows = execute(con, "SELECT log_id FROM audit_log ORDER BY log_id").fetchall()
+    con.close()
+    return [row[0] for row in rows]
+
+
+class TestCollectBatch:
+    def test_stops_at_batch_size(self):
+        queue = Queue()
+        for i in range(5):
+            queue.put(_entry(i))
+
+        batch, stop = audit._collect_batch(queue, batch_size=3, flush_interval=1.0)
+        assert [e["log_id"] for e in batch] == [f"AUDIT_TEST_{i:04d}" for i in range(3)]
+        assert not stop
+
+        batch, stop = audit._collect_batch(queue, batch_size=3, flush_interval=0.0)
+        assert len(batch) == 2
+        assert not stop
+
+    def test_shutdown_signal_returns_partial_batch(self):
+        queue = Queue()
+        queue.put(_entry(1))
+        queue.put(audit._STOP)
+        queue.put(_entry(2))
+
+        batch, stop = audit._collect_batch(queue, batch_size=10, flush_interval=1.0)
+        assert [e["log_id"] for e in batch] == ["AUDIT_TEST_0001"]
+        assert stop
+
+    def test_shutdown_signal_alone(self):
+        queue = Queue()
+        queue.put(audit._STOP)
+        assert audit._collect_batch(queue, batch_size=10, flush_interval=1.0) == ([], True)
+
+
+class TestWriteBatch:
+    def test_one_executemany_per_batch(self, monkeypatch):
+        calls = []
+        executemany = db.executemany
+
+        def counting_executemany(con, sql, rows):
+            if "INSERT INTO audit_log (" in sql:
+                calls.append(len(rows))
+            return executemany(con, sql, rows)
+
+        monkeypatch.setattr(db, "executemany", counting_executemany)
+
+        audit._write_batch([_entry(i) for i in range(25)])
+
+        assert calls == [25]
+        assert len(_audit_log_ids()) == 25
+        stats = audit.get_audit_writer_stats()
+        assert (stats["written"], stats["batches"], stats["last_batch_size"]) == (25, 1, 25)
+        assert stats["avg_flush_ms"] == stats["last_flush_ms"] > 0
+
+    def test_contaminated_entries_skipped(self):
+        audit._write_batch(
+            [
+                _entry(1),
+                _entry(2, ip_address="testclient"),
+                _entry(3, user_agent="<script>alert(1)</script>"),
+            ]
+        )
+
+        assert _audit_log_ids() == ["AUDIT_TEST_0001"]
+        assert audit.get_audit_writer_stats()["skipped_contaminated"] == 2
+
+    def test_write_failure_is_counted(self, monkeypatch):
+        def failing_executemany(con, sql, rows):
+            raise RuntimeError("database is locked")
+
+        monkeypatch.setattr(db, "executemany", failing_executemany)
+
+        audit._write_batch([_entry(i) for i in range(3)])
+
+        stats = audit.get_audit_writer_stats()
+        assert (stats["written"], stats["write_errors"], stats["batches"]) == (0, 3, 1)
+
+    def test_bad_entry_drops_only_itself(self):
+        from src.auth.audit_rollups import check_audit_rollups
+
+        audit._write_batch([_entry(7)])
+        # A duplicate log_id and a missing action each fail on their own
+        audit._write_batch([_entry(i) for i in range(20)] + [_entry(99, action=None)])
+
+        assert _audit_log_ids() == [f"AUDIT_TEST_{i:04d}" for i in range(20)]
+        stats = audit.get_audit_writer_stats()
+        assert (stats["written"], stats["write_errors"], stats["batches"]) == (20, 2, 2)
+        assert check_audit_rollups() == []
+
+    def test_bisect_gives_up_on_persistent_failure(self, monkeypatch):
+        calls = []
+
+        def failing_executemany(con, sql, rows):
+            calls.append(len(rows))
+            raise RuntimeError("database is locked")
+
+        monkeypatch.setattr(db, "executemany", failing_executemany)
+
+        audit._write_batch([_entry(i) for i in range(200)])
+
+        assert len(calls) == audit.MAX_BISECT_FAILURES + 1
+        assert audit.get_audit_writer_stats()["write_errors"] == 200
+
+
+class TestQueuePolicy:
+    def test_drop_when_full(self, monkeypatch):
+        monkeypatch.setattr(audit, "_audit_queue", Queue(maxsize=2))
+        monkeypatch.delenv("AUDIT_QUEUE_FULL_POLICY", raising=False)
+
+        assert [audit._enqueue(_entry(i)) for i in range(3)] == [True, True, False]
+
+        stats = audit.get_audit_writer_stats()
+        assert (stats["queue_depth"], stats["queue_max_size"]) == (2, 2)
+        assert (stats["enqueued"], stats["dropped"]) == (2, 1)
+        assert stats["queue_full_policy"] == "drop"
+
+    def test_block_waits_then_drops(self, monkeypatch):
+        monkeypatch.setattr(audit, "_audit_queue", Queue(maxsize=1))
+        monkeypatch.setenv("AUDIT_QUEUE_FULL_POLICY", "block")
+        monkeypatch.setenv("AUDIT_ENQUEUE_TIMEOUT_MS", "10")
+
+        assert audit._enqueue(_entry(1))
+        assert not audit._enqueue(_entry(2))
+        assert audit.get_audit_writer_stats()["dropped"] == 1
+
+    def test_invalid_policy_falls_back_to_drop(self, monkeypatch):
+        monkeypatch.setenv("AUDIT_QUEUE_FULL_POLICY", "spill")
+        assert audit._queue_full_policy() == "drop"
+
+
+def test_worker_flushes_queue_on_shutdown(monkeypatch):
+    monkeypatch.setenv("AUDIT_FLUSH_INTERVAL_MS", "50")
+
+    for i in range(30):
+        audit.log_audit(
+            user_id="u1",
+            user_email="analyst@example.com",
+            action="api:read",
+            request_path=f"/api/signals/{i}",
+            ip_address="10.0.0.1",
+        )
+    assert audit.get_audit_writer_stats()["running"]
+
+    audit.shutdown_audit_worker()
+
+    stats = audit.get_audit_writer_stats()
+    assert not stats["running"]
+    assert (stats["enqueued"], stats["written"], stats["queue_depth"]) == (30, 30, 0)
+    assert len(_audit_log_ids()) == 30
+
+
+def test_health_endpoint_reports_writer_stats():
+    from src.routers.health import get_audit_writer_health
+
+    audit._write_batch([_entry(1)])
+
+    response = get_audit_writer_health(_=None)
+
+    assert response.written == 1
+    assert response.queue_depth == 0
+    assert response.queue_full_policy == "drop"
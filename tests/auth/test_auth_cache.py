@@ -0,0 +1,149 @@
+"""Tests for the role/tenant resolution caches in src.auth.cache."""
+
+import asyncio
+
+import pytest
+
+from src.auth import cache as auth_cache
+from src.auth.cache import MISS, TTLCache, invalidate_user_role, role_cache
+from src.auth.middleware import AuthMiddleware
+from src.auth.models import UserRole
+from src.db import connect, execute
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(auth_cache.time, "monotonic", clock)
+    return clock
+
+
+class TestTTLCache:
+    def test_miss_then_hit(self):
+        cache = TTLCache("t", ttl_seconds=60, max_entries=10)
+        assert cache.get("k") is MISS
+        cache.set("k", None)
+        assert cache.get("k") is None
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"], stats["hit_rate"]) == (1, 1, 0.5)
+
+    def test_entries_expire_after_ttl(self, clock):
+        cache = TTLCache("t", ttl_seconds=60, max_entries=10)
+        cache.set("k", "v")
+        clock.now += 59
+        assert cache.get("k") == "v"
+        clock.now += 2
+        assert cache.get("k") is MISS
+        assert cache.stats()["expirations"] == 1
+        assert cache.stats()["size"] == 0
+
+    def test_least_recently_used_is_evicted(self):
+        cache = TTLCache("t", ttl_seconds=60, max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        assert cache.get("b") is MISS
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert cache.stats()["evictions"] == 1
+
+    def test_invalidate_where(self):
+        cache = TTLCache("t", ttl_seconds=60, max_entries=10)
+        cache.set(("u1", "x"), 1)
+        cache.set(("u1", "y"), 2)
+        cache.set(("u2", "x"), 3)
+        assert cache.invalidate_where(lambda key: key[0] == "u1") == 2
+        assert cache.get(("u2", "x")) == 3
+        assert cache.stats()["invalidations"] == 2
+
+    def test_set_after_invalidation_is_skipped(self):
+        cache = TTLCache("t", ttl_seconds=60, max_entries=10)
+        generation = cache.generation()
+        cache.invalidate_where(lambda key: key == "k")
+        assert not cache.set("k", "stale", generation)
+        assert cache.get("k") is MISS
+        assert cache.stats()["stale_sets"] == 1
+
+        assert cache.set("k", "fresh", cache.generation())
+        assert cache.get("k") == "fresh"
+
+    def test_ttl_from_env(self, monkeypatch):
+        monkeypatch.setenv("AUTH_CACHE_TTL_SECONDS", "5")
+        monkeypatch.setenv("AUTH_CACHE_MAX_ENTRIES", "bogus")
+        cache = TTLCache("t")
+        assert cache.ttl_seconds == 5.0
+        assert cache.max_entries == auth_cache.DEFAULT_MAX_ENTRIES
+
+
+def _insert_user(user_id: str, email: str, role: str) -> None:
+    con = connect()
+    execute(
+        con,
+        "INSERT INTO users (user_id, email, display_name, role) VALUES (:uid, :email, 'U', :role)",
+        {"uid": user_id, "email": email, "role": role},
+    )
+    con.commit()
+    con.close()
+
+
+def _set_role(user_id: str, role: str) -> None:
+    con = connect()
+    execute(
+        con, "UPDATE users SET role = :role WHERE user_id = :uid", {"uid": user_id, "role": role}
+    )
+    con.commit()
+    con.close()
+
+
+class TestUserRoleCache:
+    def _role(self, user_id, email):
+        middleware = AuthMiddleware.__new__(AuthMiddleware)
+        return asyncio.run(middleware._get_user_role(user_id, email))
+
+    def test_role_is_served_from_cache(self):
+        _insert_user("cache-uid", "cache@test.com", "analyst")
+        assert self._role("cache-uid", "cache@test.com") == UserRole.ANALYST
+
+        _set_role("cache-uid", "commander")
+        assert self._role("cache-uid", "cache@test.com") == UserRole.ANALYST
+        assert role_cache.stats()["hits"] >= 1
+
+    def test_invalidation_picks_up_role_change(self):
+        _insert_user("cache-uid", "cache@test.com", "analyst")
+        assert self._role("cache-uid", "cache@test.com") == UserRole.ANALYST
+
+        _set_role("cache-uid", "commander")
+        assert invalidate_user_role(email="cache@test.com") == 1
+        assert self._role("cache-uid", "cache@test.com") == UserRole.COMMANDER
+
+    def test_unknown_user_defaults_to_viewer_and_is_cached(self):
+        assert self._role("nobody", "nobody@test.com") == UserRole.VIEWER
+        assert role_cache.get(("nobody", "nobody@test.com")) == UserRole.VIEWER
+
+    def test_invalidation_during_lookup_is_not_undone(self, monkeypatch):
+        import src.db as db
+
+        fetch_one = db.fetch_one
+        _insert_user("cache-uid", "cache@test.com", "analyst")
+
+        async def racing_fetch_one(sql, params):
+            # The role changes, and is invalidated, after the lookup read the old one
+            _set_role("cache-uid", "commander")
+            invalidate_user_role(user_id="cache-uid")
+            return ("analyst",)
+
+        monkeypatch.setattr(db, "fetch_one", racing_fetch_one)
+        assert self._role("cache-uid", "cache@test.com") == UserRole.ANALYST
+        assert role_cache.get(("cache-uid", "cache@test.com")) is MISS
+
+        monkeypatch.setattr(db, "fetch_one", fetch_one)
+        assert self._role("cache-uid", "cache@test.com") == UserRole.COMMANDER
@@ -37,6 +37,14 @@ def use_test_db(tmp_path, monkeypatch):
     yield
 
     # Cleanup - close any lingering connections
+    db_module.close_pool()
+    # Cached roles/tenants/ML scores would otherwise outlive this test's database
+    auth_cache = sys.modules.get("src.auth.cache")
+    if auth_cache is not None:
+        auth_cache.clear_auth_caches()
+    score_cache = sys.modules.get("src.ml.cache")
+    if score_cache is not None:
+        score_cache.get_score_cache().clear()
     if test_db.exists():
         try:
             test_db.unlink()
@@ -94,3 +94,134 @@ class TestCheckSmtpHealth:
         assert result["configured"] is True
         assert result["reachable"] is False
         assert "Authentication failed" in result["error"]
+
+
+SMTP_ENV = {
+    "SMTP_HOST": "smtp.example.com",
+    "SMTP_PORT": "587",
+    "SMTP_USER": "user@example.com",
+    "SMTP_PASS": "password",
+    "EMAIL_FROM": "from@example.com",
+    "EMAIL_TO": "to@example.com",
+}
+
+
+class TestSMTPHealthProber:
+    """Tests for the cached background SMTP prober."""
+
+    def _wait_for_probe(self, prober):
+        import time
+
+        deadline = time.monotonic() + 5
+        while prober._probing and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    def test_unconfigured_answers_without_probe_thread(self):
+        from src.notify_email import SMTPHealthProber
+
+        prober = SMTPHealthProber()
+        with patch.dict(os.environ, {}, clear=True):
+            result = prober.status()
+        assert result["configured"] is False
+        assert prober._probing is False
+
+    def test_first_call_pending_then_cached_within_ttl(self):
+        from src.notify_email import SMTPHealthProber
+
+        prober = SMTPHealthProber(ttl_seconds=60)
+        probe_result = {"configured": True, "reachable": True, "error": None}
+        with (
+            patch.dict(os.environ, SMTP_ENV, clear=True),
+            patch("src.notify_email.check_smtp_health", return_value=probe_result) as mock_check,
+        ):
+            first = prober.status()
+            self._wait_for_probe(prober)
+            second = prober.status()
+            third = prober.status()
+
+        assert first == {"configured": True, "reachable": False, "error": "SMTP check pending"}
+        assert second == third == probe_result
+        assert mock_check.call_count == 1
+
+    def test_stale_result_served_while_reprobing(self):
+        from src.notify_email import SMTPHealthProber
+
+        prober = SMTPHealthProber(ttl_seconds=0)
+        results = [
+            {"configured": True, "reachable": True, "error": None},
+            {"configured": True, "reachable": False, "error": "timed out"},
+        ]
+        with (
+            patch.dict(os.environ, SMTP_ENV, clear=True),
+            patch("src.notify_email.check_smtp_health", side_effect=results),
+        ):
+            prober.status()
+            self._wait_for_probe(prober)
+            stale = prober.status()
+            self._wait_for_probe(prober)
+            fresh = prober.status()
+
+        assert stale["reachable"] is True
+        assert fresh["error"] == "timed out"
+
+
+class TestHealthEndpoint:
+    """Tests for /api/health per-source aggregation."""
+
+    def test_latest_status_and_last_success_per_source(self):
+        from fastapi.testclient import TestClient
+
+        from src.auth.models import AuthContext, UserRole
+        from src.dashboard_api import app
+        from src.db import connect, execute
+
+        con = connect()
+        for source_id, status, ended_at in [
+            ("fr", "SUCCESS", "2026-01-01T00:00:00+00:00"),
+            ("fr", "ERROR", "2026-01-02T00:00:00+00:00"),
+            ("fr", "SUCCESS", "2026-01-01T12:00:00+00:00"),
+            ("bills", "NO_DATA", "2026-01-03T00:00:00+00:00"),
+        ]:
+            execute(
+                con,
+                """INSERT INTO source_runs (source_id, started_at, ended_at, status)
+                   VALUES (:source_id, :ended_at, :ended_at, :status)""",
+                {"source_id": source_id, "status": status, "ended_at": ended_at},
+            )
+        con.commit()
+        con.close()
+
+        mock_user = AuthContext(
+            user_id="test-uid",
+            email="test@test.com",
+            role=UserRole.VIEWER,
+            display_name="Test",
+            auth_method="firebase",
+        )
+        smtp_status = {"configured": True, "reachable": True, "error": None}
+        with (
+            patch("src.auth.middleware.get_current_user", return_value=mock_user),
+            patch("src.routers.health.smtp_prober.status", return_value=smtp_status),
+        ):
+            resp = TestClient(app).get("/api/health")
+
+        assert resp.status_code == 200
+        data = resp.json()
+        by_source = {s["source_id"]: s for s in data["sources"]}
+        assert by_source["fr"]["last_run_status"] == "ERROR"
+        assert by_source["fr"]["last_success_at"] == "2026-01-01T12:00:00+00:00"
+        assert by_source["bills"]["last_run_status"] == "NO_DATA"
+        assert by_source["bills"]["last_success_at"] is None
+        assert by_source["bills"]["hours_since_success"] is None
+        assert data["email"]["reachable"] is True
+
+    def test_latest_runs_query_uses_index_seeks_only(self):
+        from src.db import connect, execute
+        from src.routers.health import LATEST_SOURCE_RUNS_SQL
+
+        con = connect()
+        plan = [row[-1] for row in execute(con, f"EXPLAIN QUERY PLAN {LATEST_SOURCE_RUNS_SQL}")]
+        con.close()
+
+        assert not [step for step in plan if step.startswith("SCAN source_runs")]
+        assert not [step for step in plan if "TEMP B-TREE" in step]
@@ -5,7 +5,9 @@ from unittest.mock import patch
 
 from src.oversight.db_helpers import insert_om_event
 from src.oversight.pipeline.baseline import (
+    BaselineCache,
     BaselineSummary,
+    _save_baseline,
     build_baseline,
     compute_topic_distribution,
     get_latest_baseline,
@@ -107,3 +109,54 @@ def test_get_latest_baseline():
     assert baseline is not None
     assert baseline["source_type"] == "oig"
     assert baseline["theme"] == "fraud"
+
+
+def _summary(source_type="gao", theme=None, summary="v1"):
+    return BaselineSummary(
+        source_type=source_type,
+        theme=theme,
+        window_start="2026-01-01",
+        window_end="2026-01-31",
+        event_count=10,
+        summary=summary,
+        topic_distribution={"audit": 0.5},
+    )
+
+
+def test_baseline_cache_hits_and_misses():
+    _save_baseline(_summary())
+    cache = BaselineCache()
+
+    first = cache.get("gao")
+    second = cache.get("gao")
+    missing = cache.get("oig")
+    cache.get("oig")
+
+    assert first is second
+    assert first.topic_distribution == {"audit": 0.5}
+    assert missing is None
+    assert cache.stats() == {"hits": 2, "misses": 2}
+
+
+def test_baseline_cache_keyed_by_theme():
+    _save_baseline(_summary(theme="healthcare", summary="themed"))
+    cache = BaselineCache()
+
+    assert cache.get("gao", "healthcare").summary == "themed"
+    assert cache.get("gao") is None
+
+
+def test_save_baseline_invalidates_live_caches():
+    _save_baseline(_summary(summary="v1"))
+    cache = BaselineCache()
+    assert cache.get("gao").summary == "v1"
+
+    with patch(
+        "src.oversight.pipeline.baseline.datetime",
+        wraps=datetime,
+    ) as mock_dt:
+        mock_dt.now.return_value = datetime(2099, 1, 1)
+        _save_baseline(_summary(summary="v2"))
+
+    assert cache.get("gao").summary == "v2"
+    assert cache.stats() == {"hits": 0, "misses": 2}
@@ -1,6 +1,10 @@
 """Tests for deduplicator module."""
 
-from src.oversight.db_helpers import insert_om_event
+import importlib
+import json
+
+from src.db import connect, execute
+from src.oversight.db_helpers import insert_om_event, update_canonical_refs
 from src.oversight.pipeline.deduplicator import (
     DeduplicationResult,
     extract_entities,
@@ -95,6 +99,109 @@ def test_find_canonical_event_no_match():
     assert result is None
 
 
+def _insert_canonical(event_id: str, refs: dict | None) -> None:
+    insert_om_event(
+        {
+            "event_id": event_id,
+            "event_type": "report_release",
+            "primary_source_type": "gao",
+            "primary_url": f"https://gao.gov/{event_id}",
+            "pub_precision": "datetime",
+            "pub_source": "extracted",
+            "title": f"Event {event_id}",
+            "canonical_refs": refs,
+            "fetched_at": "2026-01-20T12:00:00Z",
+        }
+    )
+
+
+def _entity_refs(event_id: str) -> set[tuple[str, str]]:
+    con = connect()
+    cur = execute(
+        con,
+        "SELECT entity_type, entity_value FROM om_entity_refs WHERE event_id = :event_id",
+        {"event_id": event_id},
+    )
+    rows = {(r[0], r[1]) for r in cur.fetchall()}
+    con.close()
+    return rows
+
+
+def test_insert_om_event_indexes_string_refs():
+    """Only string refs (and strings inside lists) land in om_entity_refs."""
+    _insert_canonical(
+        "om-bva-1",
+        {
+            "bva_docket": "21-12345",
+            "decision_types": ["remand", "denial"],
+            "is_precedential": True,
+        },
+    )
+
+    assert _entity_refs("om-bva-1") == {
+        ("bva_docket", "21-12345"),
+        ("decision_types", "remand"),
+        ("decision_types", "denial"),
+    }
+
+
+def test_find_canonical_event_prefers_first_entity():
+    """Entities resolve in one lookup; the earliest-listed entity wins."""
+    _insert_canonical("om-bill", {"bill": "HR1234"})
+    _insert_canonical("om-gao", {"gao_report": "GAO-26-111111"})
+
+    result = find_canonical_event(
+        entities={"gao_report": "GAO-26-111111", "bill": "HR1234"},
+        source_type="news_wire",
+    )
+
+    assert result["event_id"] == "om-gao"
+    assert result["canonical_refs"] == {"gao_report": "GAO-26-111111"}
+
+
+def test_find_canonical_event_matches_value_under_other_type():
+    """A value indexed under a different entity type still matches."""
+    _insert_canonical("om-news", {"bill_mentioned": "HR77"})
+
+    result = find_canonical_event(entities={"bill": "HR77"}, source_type="gao")
+
+    assert result["event_id"] == "om-news"
+
+
+def test_update_canonical_refs_reindexes_event():
+    _insert_canonical("om-compound", {"gao_report": "GAO-26-222222"})
+
+    update_canonical_refs("om-compound", {"compound_signal": "cs-1"})
+
+    assert _entity_refs("om-compound") == {
+        ("gao_report", "GAO-26-222222"),
+        ("compound_signal", "cs-1"),
+    }
+    result = find_canonical_event({"compound_signal": "cs-1"}, "news_wire")
+    assert result["event_id"] == "om-compound"
+
+
+def test_backfill_migration_indexes_existing_events():
+    """Migration 011 rebuilds the index from canonical_refs and is re-runnable."""
+    _insert_canonical("om-legacy", None)
+    con = connect()
+    execute(
+        con,
+        "UPDATE om_events SET canonical_refs = :refs WHERE event_id = 'om-legacy'",
+        {"refs": json.dumps({"crs_report": "R12345"})},
+    )
+    con.commit()
+    con.close()
+    assert find_canonical_event({"crs_report": "R12345"}, "news_wire") is None
+
+    migration = importlib.import_module("migrations.011_add_om_entity_refs")
+    assert migration.run_migration(batch_size=1) == {"indexed": 1}
+    assert migration.run_migration(batch_size=1) == {"indexed": 1}
+
+    assert _entity_refs("om-legacy") == {("crs_report", "R12345")}
+    assert find_canonical_event({"crs_report": "R12345"}, "news_wire")["event_id"] == "om-legacy"
+
+
 def test_link_related_coverage():
     """Link news coverage to canonical event."""
     # Insert canonical event
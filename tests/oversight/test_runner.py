@@ -3,8 +3,10 @@
 import time
 from unittest.mock import MagicMock, patch
 
+from src.db import connect, execute
 from src.oversight.runner import (
     OversightRunResult,
+    StageTimings,
     _process_raw_event,
     generate_digest,
     run_agent,
@@ -135,7 +137,7 @@ def test_generate_digest(mock_get_events):
     assert "Test Event" in digest or len(digest) > 50
 
 
-@patch("src.oversight.runner.deduplicate_event")
+@patch("src.oversight.runner.find_canonical_event")
 @patch("src.oversight.runner.extract_entities")
 @patch("src.oversight.runner.check_quality_gate")
 @patch("src.oversight.runner.check_escalation")
@@ -146,8 +148,8 @@ def test_processed_event_includes_ml_fields(mock_escalation, mock_qg, mock_entit
 
     # Setup mocks
     mock_qg.return_value = MagicMock(passed=True)
-    mock_entities.return_value = set()
-    mock_dedup.return_value = MagicMock(is_duplicate=False)
+    mock_entities.return_value = {}
+    mock_dedup.return_value = None
     mock_escalation.return_value = EscalationResult(
         is_escalation=False,
         matched_signals=[],
@@ -176,9 +178,10 @@ def test_processed_event_includes_ml_fields(mock_escalation, mock_qg, mock_entit
     )
     mock_agent.extract_canonical_refs.return_value = {}
 
-    event, rejection = _process_raw_event(raw, mock_agent, "gao")
+    event, rejection, coverage_link = _process_raw_event(raw, mock_agent, "gao")
 
     assert rejection is None
+    assert coverage_link is None
     assert event is not None
     assert event["ml_score"] == 0.72
     assert event["ml_risk_level"] == "HIGH"
@@ -208,3 +211,140 @@ def test_run_all_agents_parallelism(mock_run_agent):
 
     assert len(results) == 10, f"Expected 10 results, got {len(results)}"
     assert elapsed < 0.5, f"Took {elapsed:.2f}s — agents likely running sequentially"
+
+
+def _mock_registry_with_events(mock_registry, raw_events):
+    mock_agent = MagicMock()
+    mock_agent.fetch_new.return_value = raw_events
+    mock_agent.extract_timestamps.return_value = MagicMock(
+        pub_timestamp="2026-01-20T10:00:00Z",
+        pub_precision="datetime",
+        pub_source="extracted",
+        event_timestamp=None,
+        event_precision=None,
+        event_source=None,
+    )
+    mock_agent.extract_canonical_refs.return_value = {}
+    mock_registry.__contains__ = lambda self, x: x == "gao"
+    mock_registry.__getitem__ = lambda self, x: MagicMock(return_value=mock_agent)
+
+
+def _raw_events(n, title=lambda i: f"Oversight item {chr(65 + i % 26)}"):
+    from src.oversight.agents.base import RawEvent
+
+    return [
+        RawEvent(
+            url=f"https://example.gov/e/{i}",
+            title=title(i),
+            raw_html="<p>Body</p>",
+            fetched_at="2026-01-20T12:00:00Z",
+        )
+        for i in range(n)
+    ]
+
+
+def _stored_urls():
+    con = connect()
+    rows = execute(con, "SELECT primary_url FROM om_events ORDER BY rowid").fetchall()
+    con.close()
+    return [r[0] for r in rows]
+
+
+@patch("src.oversight.pipeline.signal_bridge.route_oversight_event")
+@patch("src.oversight.runner.AGENT_REGISTRY")
+def test_run_agent_concurrent_inserts_in_fetch_order(mock_registry, mock_route):
+    mock_route.return_value = MagicMock(surfaced=False)
+    raw_events = _raw_events(150)
+    _mock_registry_with_events(mock_registry, raw_events)
+
+    result = run_agent("gao", workers=8)
+
+    assert result.status == "SUCCESS"
+    assert result.events_processed == 150
+    assert _stored_urls() == [r.url for r in raw_events]
+    routed = [c.args[0]["primary_url"] for c in mock_route.call_args_list]
+    assert routed == [r.url for r in raw_events]
+    for stage in ("fetch", "ingest", "timestamps", "dedup", "escalation", "persist", "routing"):
+        assert stage in result.stage_timings
+
+
+@patch("src.oversight.pipeline.signal_bridge.route_oversight_event")
+@patch("src.oversight.runner.AGENT_REGISTRY")
+def test_run_agent_concurrent_dedups_within_chunk(mock_registry, mock_route):
+    """Events sharing an entity in one chunk collapse like a serial run would."""
+    mock_route.return_value = MagicMock(surfaced=False)
+    raw_events = _raw_events(4, title=lambda i: f"Coverage of GAO-26-100 part {chr(65 + i)}")
+    _mock_registry_with_events(mock_registry, raw_events)
+
+    result = run_agent("gao", workers=4)
+
+    assert result.events_processed == 1
+    assert _stored_urls() == [raw_events[0].url]
+    con = connect()
+    linked = execute(con, "SELECT url FROM om_related_coverage ORDER BY url").fetchall()
+    rejected = execute(con, "SELECT COUNT(*) FROM om_rejected").fetchone()[0]
+    con.close()
+    assert [r[0] for r in linked] == [r.url for r in raw_events[1:]]
+    assert rejected == 3
+
+
+@patch("src.oversight.pipeline.signal_bridge.route_oversight_event")
+@patch("src.oversight.runner.AGENT_REGISTRY")
+def test_run_agent_links_existing_duplicates_on_commit_thread(mock_registry, mock_route):
+    """Workers only look up canonical events; coverage links are written serially."""
+    import threading
+
+    from src.oversight.pipeline import deduplicator
+
+    mock_route.return_value = MagicMock(surfaced=False)
+    _mock_registry_with_events(
+        mock_registry, _raw_events(1, title=lambda i: "Original GAO-26-200 report")
+    )
+    run_agent("gao", workers=1)
+
+    raw_events = _raw_events(6, title=lambda i: f"Follow-up {i} on GAO-26-200")
+    for raw in raw_events:
+        raw.url = raw.url.replace("/e/", "/followup/")
+    _mock_registry_with_events(mock_registry, raw_events)
+    link_threads = []
+    link = deduplicator.link_related_coverage
+
+    def recording_link(**kwargs):
+        link_threads.append(threading.current_thread())
+        return link(**kwargs)
+
+    with patch("src.oversight.runner.link_related_coverage", side_effect=recording_link):
+        result = run_agent("gao", workers=4)
+
+    assert result.events_processed == 0
+    assert link_threads == [threading.main_thread()] * 6
+    con = connect()
+    linked = execute(
+        con, "SELECT url FROM om_related_coverage WHERE url LIKE '%/followup/%' ORDER BY url"
+    ).fetchall()
+    con.close()
+    assert [r[0] for r in linked] == sorted(r.url for r in raw_events)
+
+
+@patch("src.oversight.pipeline.baseline.get_latest_baseline", return_value=None)
+@patch("src.oversight.pipeline.signal_bridge.route_oversight_event")
+@patch("src.oversight.runner.AGENT_REGISTRY")
+def test_run_agent_baseline_cache_hits(mock_registry, mock_route, mock_baseline):
+    mock_route.return_value = MagicMock(surfaced=False)
+    _mock_registry_with_events(mock_registry, _raw_events(20))
+
+    result = run_agent("gao", workers=4)
+
+    mock_baseline.assert_called_once_with("gao", None)
+    assert result.baseline_cache == {"hits": 19, "misses": 1}
+
+
+def test_stage_timings_accumulate():
+    timings = StageTimings()
+    timings.add("dedup", 0.5)
+    with timings.measure("dedup"):
+        pass
+    timings.add("fetch", 1.0)
+    result = timings.as_dict()
+    assert set(result) == {"dedup", "fetch"}
+    assert 0.5 <= result["dedup"] < 0.6
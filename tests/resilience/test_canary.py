@@ -5,6 +5,7 @@ from datetime import UTC, datetime
 from unittest.mock import patch
 
 from src.resilience.canary import (
+    capture_watermarks,
     no_duplicate_ids,
     run_canaries,
     timestamps_monotonic,
@@ -96,6 +97,22 @@ class TestNoDuplicateIds:
             result = no_duplicate_ids("fr_seen", "doc_id")
         assert result.passed is True
 
+    def test_run_scope_only_checks_new_rows(self):
+        """With a watermark, only ids of rows at or past it are checked."""
+        con = self._make_db_with_dupes()
+        with patch("src.db.connect", return_value=con):
+            result = no_duplicate_ids("fr_seen", "doc_id", "first_seen_at", "2026-01-03")
+        assert result.passed is True
+
+    def test_run_scope_catches_new_duplicate_of_old_row(self):
+        """A new row duplicating an id written before the watermark is caught."""
+        con = self._make_db_no_dupes()
+        con.execute("INSERT INTO fr_seen VALUES ('DOC-001', '2026-01-04')")
+        with patch("src.db.connect", return_value=con):
+            result = no_duplicate_ids("fr_seen", "doc_id", "first_seen_at", "2026-01-04")
+        assert result.passed is False
+        assert "DOC-001" in result.message
+
 
 class TestTimestampsMonotonic:
     """Tests for timestamps_monotonic canary."""
@@ -104,14 +121,14 @@ class TestTimestampsMonotonic:
         """Create DB with monotonically increasing timestamps."""
         con = sqlite3.connect(":memory:")
         con.execute("PRAGMA journal_mode=WAL")
-        con.execute("CREATE TABLE source_runs (ended_at TEXT)")
+        con.execute("CREATE TABLE source_runs (id INTEGER PRIMARY KEY, ended_at TEXT)")
         for ts in [
             "2026-01-01T01:00:00",
             "2026-01-01T02:00:00",
             "2026-01-01T03:00:00",
             "2026-01-01T04:00:00",
         ]:
-            con.execute("INSERT INTO source_runs VALUES (?)", (ts,))
+            con.execute("INSERT INTO source_runs (ended_at) VALUES (?)", (ts,))
         con.commit()
         return con
 
@@ -119,14 +136,14 @@ class TestTimestampsMonotonic:
         """Create DB with non-monotonic timestamps."""
         con = sqlite3.connect(":memory:")
         con.execute("PRAGMA journal_mode=WAL")
-        con.execute("CREATE TABLE source_runs (ended_at TEXT)")
+        con.execute("CREATE TABLE source_runs (id INTEGER PRIMARY KEY, ended_at TEXT)")
         for ts in [
             "2026-01-01T01:00:00",
             "2026-01-01T03:00:00",
             "2026-01-01T02:00:00",  # out of order
             "2026-01-01T04:00:00",
         ]:
-            con.execute("INSERT INTO source_runs VALUES (?)", (ts,))
+            con.execute("INSERT INTO source_runs (ended_at) VALUES (?)", (ts,))
         con.commit()
         return con
 
@@ -145,6 +162,18 @@ class TestTimestampsMonotonic:
         assert result.passed is False
         assert "Non-monotonic" in result.message
 
+    def test_run_scope_checks_rows_from_watermark(self):
+        """With a watermark, only rows with id >= watermark are compared."""
+        con = self._make_db_non_monotonic()
+        with patch("src.db.connect", return_value=con):
+            result = timestamps_monotonic("source_runs", "ended_at", "id", since=3)
+        assert result.passed is True
+
+        con = self._make_db_non_monotonic()
+        with patch("src.db.connect", return_value=con):
+            result = timestamps_monotonic("source_runs", "ended_at", "id", since=2)
+        assert result.passed is False
+
 
 class TestRunCanaries:
     """Tests for run_canaries orchestrator."""
@@ -169,3 +198,62 @@ class TestRunCanaries:
         assert len(results) == 1
         assert results[0].passed is False
         assert "boom" in results[0].message
+
+
+def _insert_run(source_id: str, ended_at: str) -> None:
+    from src.db import connect, execute
+
+    con = connect()
+    execute(
+        con,
+        """INSERT INTO source_runs(source_id, started_at, ended_at, status, records_fetched)
+           VALUES (:source_id, :ended_at, :ended_at, 'SUCCESS', 1)""",
+        {"source_id": source_id, "ended_at": ended_at},
+    )
+    con.commit()
+    con.close()
+
+
+class TestRunScopedCanaries:
+    """Tests for watermark-scoped canaries against the test database."""
+
+    def test_capture_watermarks(self):
+        _insert_run("oversight", "2026-01-01T01:00:00+00:00")
+
+        watermarks = capture_watermarks("oversight")
+
+        assert watermarks == {"om_events.fetched_at": None, "source_runs.id": 1}
+        assert capture_watermarks("nonexistent_source") == {}
+
+    def test_scope_and_timing_recorded(self):
+        _insert_run("oversight", "2026-01-01T01:00:00+00:00")
+        watermarks = capture_watermarks("oversight")
+        _insert_run("oversight", "2026-01-01T02:00:00+00:00")
+
+        results = run_canaries("oversight", None, watermarks=watermarks)
+
+        assert [r.check for r in results] == [
+            "no_duplicate_ids(om_events.event_id)",
+            "timestamps_monotonic(source_runs.ended_at)",
+        ]
+        assert all(r.passed for r in results)
+        assert {r.scope for r in results} == {"run"}
+        assert all(r.duration_ms is not None and r.duration_ms >= 0 for r in results)
+
+    def test_run_scope_sees_only_new_runs(self):
+        # An out-of-order run before the watermark is not this run's problem
+        _insert_run("oversight", "2026-01-01T03:00:00+00:00")
+        _insert_run("oversight", "2026-01-01T02:00:00+00:00")
+        watermarks = capture_watermarks("oversight")
+        _insert_run("oversight", "2026-01-01T04:00:00+00:00")
+
+        scoped = run_canaries("oversight", None, watermarks=watermarks)
+        full = run_canaries("oversight", None, watermarks=watermarks, full_scan=True)
+
+        assert all(r.passed for r in scoped)
+        assert {r.scope for r in full} == {"full"}
+        assert "Non-monotonic" in full[1].message
+
+    def test_missing_watermark_falls_back_to_full_scan(self):
+        results = run_canaries("oversight", None)
+        assert {r.scope for r in results} == {"full"}
@@ -2,6 +2,7 @@
 
 from unittest.mock import MagicMock, patch
 
+from src.resilience.canary import CanaryResult
 from src.resilience.run_lifecycle import (
     RunContext,
     post_run_check,
@@ -114,6 +115,61 @@ class TestPostRunCheck:
         assert len(ctx.canary_failures) == 1
         assert "0 documents on weekday" in ctx.canary_failures[0]
 
+    def test_passes_watermarks_and_records_timings(self):
+        """Post-run should scope canaries by the pre-run watermarks and keep their timings."""
+        ctx = RunContext(source_id="oversight", canary_watermarks={"source_runs.id": 41})
+        canary_result = CanaryResult(
+            passed=True,
+            message="OK",
+            check="no_duplicate_ids(om_events.event_id)",
+            duration_ms=1.5,
+        )
+
+        with (
+            patch(
+                "src.resilience.canary.run_canaries",
+                return_value=[canary_result],
+            ) as run_canaries,
+            patch(
+                "src.resilience.staleness_monitor.load_expectations",
+                return_value=[],
+            ),
+        ):
+            ctx = post_run_check(ctx, run_record=None)
+
+        run_canaries.assert_called_once_with("oversight", None, watermarks={"source_runs.id": 41})
+        assert ctx.canary_timings == {"no_duplicate_ids(om_events.event_id)": 1.5}
+
+
+class TestCanaryWatermarks:
+    """Pre-run watermark capture against the test database."""
+
+    def test_pre_run_records_watermarks(self):
+        with patch(
+            "src.resilience.circuit_breaker.CircuitBreaker.get",
+            return_value=None,
+        ):
+            ctx = pre_run_check("oversight")
+
+        assert ctx.preconditions_passed is True
+        assert ctx.canary_watermarks == {"om_events.fetched_at": None, "source_runs.id": None}
+
+    def test_watermark_failure_does_not_block_run(self):
+        with (
+            patch(
+                "src.resilience.circuit_breaker.CircuitBreaker.get",
+                return_value=None,
+            ),
+            patch(
+                "src.resilience.canary.capture_watermarks",
+                side_effect=RuntimeError("boom"),
+            ),
+        ):
+            ctx = pre_run_check("oversight")
+
+        assert ctx.preconditions_passed is True
+        assert ctx.canary_watermarks == {}
+
 
 class TestWithLifecycleDecorator:
     """Tests for @with_lifecycle decorator."""
@@ -975,6 +975,23 @@ class TestCompoundDB:
             result = insert_compound_signal(data)
             assert result == data["compound_id"]
 
+    def test_insert_compound_signals_bulk_skips_existing(self, tmp_db):
+        with patch("src.db.core.DB_PATH", tmp_db):
+            from src.db.compound import (
+                get_compound_signals,
+                insert_compound_signal,
+                insert_compound_signals,
+            )
+
+            existing = self._make_signal_data()
+            insert_compound_signal(existing)
+            fresh = [self._make_signal_data() for _ in range(3)]
+
+            inserted = insert_compound_signals([existing, *fresh, fresh[0]])
+
+            assert inserted == [d["compound_id"] for d in fresh]
+            assert len(get_compound_signals(limit=10)) == 4
+
     def test_get_compound_signal(self, tmp_db):
         with patch("src.db.core.DB_PATH", tmp_db):
             from src.db.compound import get_compound_signal, insert_compound_signal
@@ -0,0 +1,118 @@
+"""Tests for compiled expression plans."""
+
+from dataclasses import FrozenInstanceError, asdict
+
+import pytest
+
+from src.signals.engine.compiler import compile_expression
+from src.signals.engine.evaluator import evaluate_compiled, evaluate_expression
+from src.signals.envelope import Envelope
+from src.signals.schema.loader import load_category_schema
+
+CATEGORIES = [
+    "oversight_accountability",
+    "legislative_action",
+    "regulatory_change",
+    "claims_operations",
+]
+
+ENVELOPES = [
+    Envelope(
+        event_id="env-1",
+        authority_id="AUTH-1",
+        authority_source="congress_gov",
+        authority_type="hearing_notice",
+        title="Hearing on GAO Report",
+        body_text="The GAO found issues with VA disability claims. This is an investigation.",
+        committee="HVAC",
+        topics=["disability_benefits"],
+    ),
+    Envelope(
+        event_id="env-2",
+        authority_id="AUTH-2",
+        authority_source="govinfo",
+        authority_type="rule",
+        title="Final Rule: Schedule for Rating Disabilities",
+        body_text="VA amends 38 CFR part 4. Interim final rule; comments due. Effective date set.",
+        metadata={"status": "final"},
+    ),
+    Envelope(
+        event_id="env-3",
+        authority_id="AUTH-3",
+        authority_source="congress_gov",
+        authority_type="bill_text",
+        title="Veterans Benefits Act passed House",
+        body_text="Bill passed the House and was referred to SVAC. Markup scheduled.",
+        committee="SVAC",
+        topics=["claims_backlog"],
+    ),
+    Envelope(
+        event_id="env-4",
+        authority_id="AUTH-4",
+        authority_source="house_veterans",
+        authority_type="press_release",
+        title="",
+        body_text="",
+    ),
+]
+
+
+def _all_conditions(schema):
+    for indicator in schema.indicators:
+        if "indicator_condition" in indicator:
+            yield indicator["indicator_condition"], f"{schema.plan.category_id}:indicator_condition"
+        for trigger in indicator.get("triggers", []):
+            if trigger.get("condition"):
+                yield trigger["condition"], trigger["trigger_id"]
+
+
+@pytest.mark.parametrize("category_id", CATEGORIES)
+def test_compiled_matches_interpreted_for_every_condition(category_id):
+    schema = load_category_schema(category_id)
+    for expr, trigger_id in _all_conditions(schema):
+        compiled = compile_expression(expr, trigger_id)
+        for envelope in ENVELOPES:
+            expected = evaluate_expression(expr, envelope, trigger_id)
+            actual = evaluate_compiled(compiled, envelope)
+            assert asdict(actual) == asdict(expected), (trigger_id, envelope.event_id)
+
+
+def test_plan_built_at_load_time():
+    schema = load_category_schema("oversight_accountability")
+    assert schema.plan is not None
+    trigger_ids = [t.trigger_id for ind in schema.plan.indicators for t in ind.triggers]
+    assert "formal_audit_signal" in trigger_ids
+    formal = next(
+        t
+        for ind in schema.plan.indicators
+        for t in ind.triggers
+        if t.trigger_id == "formal_audit_signal"
+    )
+    assert formal.routing["severity"] == "high"
+
+
+def test_compiled_plan_is_immutable():
+    schema = load_category_schema("oversight_accountability")
+    with pytest.raises(FrozenInstanceError):
+        schema.plan.indicators[0].triggers = ()
+
+
+def test_nested_groups_preserve_passed_semantics():
+    # any_of whose last child is a failing all_of still passes overall
+    expr = {
+        "any_of": [
+            {"evaluator": "contains_any", "args": {"field": "title", "terms": ["GAO"]}},
+            {
+                "all_of": [
+                    {"evaluator": "equals", "args": {"field": "committee", "value": "SVAC"}},
+                ]
+            },
+        ],
+        "label": "disc",
+    }
+    envelope = ENVELOPES[0]
+    expected = evaluate_expression(expr, envelope, "t")
+    actual = evaluate_compiled(compile_expression(expr, "t"), envelope)
+    assert asdict(actual) == asdict(expected)
+    assert actual.passed is True
+    assert actual.matched_discriminators == ["contains_any(title)"]
@@ -0,0 +1,61 @@
+"""Tests for the multi-pattern term matcher."""
+
+import random
+import string
+
+import pytest
+
+from src.signals.envelope import Envelope, normalize_text
+from src.signals.evaluators.term_matcher import AhoCorasickAutomaton, TermMatcher
+from src.signals.evaluators.text import ContainsAnyEvaluator
+
+
+def _naive(terms, text):
+    normalized = normalize_text(text)
+    return [t for t in terms if normalize_text(t) in normalized]
+
+
+def test_automaton_finds_overlapping_patterns():
+    automaton = AhoCorasickAutomaton(["he", "she", "his", "hers"])
+    assert automaton.search("ushers") == {0, 1, 3}
+
+
+@pytest.mark.parametrize("force_automaton", [True, False])
+def test_matcher_preserves_term_order_and_duplicates(force_automaton):
+    terms = ["OIG", "GAO", "gao", "Inspector  General", "audit", "OIG"]
+    matcher = TermMatcher(terms, min_automaton_terms=1 if force_automaton else 10_000)
+    assert matcher.uses_automaton is force_automaton
+
+    text = "The GAO and the inspector general reviewed OIG findings."
+    assert matcher.find(normalize_text(text)) == ["OIG", "GAO", "gao", "Inspector  General", "OIG"]
+
+
+@pytest.mark.parametrize("force_automaton", [True, False])
+def test_matcher_empty_term_always_matches(force_automaton):
+    matcher = TermMatcher(["", "x"], min_automaton_terms=1 if force_automaton else 10_000)
+    assert matcher.find("") == [""]
+    assert matcher.find("abc") == [""]
+
+
+def test_automaton_matches_naive_scan_on_random_corpus():
+    rng = random.Random(7)
+    words = ["".join(rng.choice("abcde") for _ in range(rng.randint(1, 5))) for _ in range(400)]
+    terms = rng.sample(words, 300)
+    matcher = TermMatcher(terms, min_automaton_terms=1)
+    for _ in range(50):
+        text = " ".join(rng.choice(words + list(string.ascii_uppercase)) for _ in range(60))
+        assert matcher.find(normalize_text(text)) == _naive(terms, text)
+
+
+def test_compiled_contains_any_matches_evaluate():
+    envelope = Envelope(
+        event_id="t-1",
+        authority_id="A-1",
+        authority_source="congress_gov",
+        authority_type="hearing_notice",
+        title="VA Hearing on GAO Report",
+        body_text="The GAO found issues with OIG oversight of disability claims.",
+    )
+    evaluator = ContainsAnyEvaluator()
+    args = {"field": "body_text", "terms": ["audit", "OIG", "GAO", "Disability  Claims"]}
+    assert evaluator.compile(**args)(envelope) == evaluator.evaluate(envelope, **args)
@@ -319,6 +319,45 @@ class TestStateClassifications:
         assert len(unnotified) == 1
         assert unnotified[0]["signal_id"] == "sig_unnotified_2"
 
+    def test_insert_classified_signals_and_existing_ids(self):
+        """Test bulk insert of signals plus classifications and the batch existence check."""
+        db_helpers.insert_state_source(
+            {
+                "source_id": "tx_bulk",
+                "state": "TX",
+                "source_type": "official",
+                "name": "Test",
+                "url": "https://test.gov",
+            }
+        )
+        ids = [f"sig_bulk_{i}" for i in range(3)]
+        signals = [
+            {
+                "signal_id": sig_id,
+                "state": "TX",
+                "source_id": "tx_bulk",
+                "program": "pact_act" if i == 0 else None,
+                "title": f"Bulk {i}",
+                "url": f"https://test.gov/bulk/{i}",
+            }
+            for i, sig_id in enumerate(ids)
+        ]
+        classifications = [
+            {"signal_id": sig_id, "severity": "medium", "classification_method": "keyword"}
+            for sig_id in ids
+        ]
+
+        assert db_helpers.existing_signal_ids(ids + ["sig_other"]) == set()
+        db_helpers.insert_classified_signals(signals, classifications)
+        # Idempotent, like the single-row helpers
+        db_helpers.insert_classified_signals(signals, classifications)
+
+        assert db_helpers.existing_signal_ids(ids + ["sig_other"]) == set(ids)
+        assert db_helpers.existing_signal_ids([]) == set()
+        assert db_helpers.get_state_signal("sig_bulk_0")["program"] == "pact_act"
+        assert db_helpers.get_state_classification("sig_bulk_2")["severity"] == "medium"
+        assert len(db_helpers.get_unnotified_signals(severity="medium")) == 3
+
 
 class TestStateRuns:
     """Tests for state run tracking."""
@@ -382,6 +421,29 @@ class TestSourceHealth:
         assert health["last_success"] is not None
         assert health["last_failure"] is None
 
+    def test_update_source_health_records_latency(self):
+        """Latency is stored on success and failure and kept when none is given."""
+        db_helpers.insert_state_source(
+            {
+                "source_id": "health_latency",
+                "state": "TX",
+                "source_type": "official",
+                "name": "Test",
+                "url": "https://test.gov",
+            }
+        )
+
+        db_helpers.update_source_health("health_latency", success=True, latency_ms=120)
+        assert db_helpers.get_source_health("health_latency")["last_latency_ms"] == 120
+
+        db_helpers.update_source_health(
+            "health_latency", success=False, error="timeout", latency_ms=45000
+        )
+        assert db_helpers.get_source_health("health_latency")["last_latency_ms"] == 45000
+
+        db_helpers.update_source_health("health_latency", success=True)
+        assert db_helpers.get_source_health("health_latency")["last_latency_ms"] == 45000
+
     def test_update_source_health_failure(self):
         """Test updating source health on failure."""
         source = {
@@ -0,0 +1,97 @@
+"""Tests for the shared state-fetch HTTP budget."""
+
+import threading
+import time
+
+import pytest
+
+from src.state import http_budget
+from src.state.http_budget import SlotTimeoutError, run_with_timeouts
+
+
+@pytest.fixture
+def two_slots(monkeypatch):
+    monkeypatch.setattr(http_budget, "_slots", threading.BoundedSemaphore(2))
+
+
+def test_results_returned_in_call_order():
+    calls = [
+        (lambda: (time.sleep(0.05), "slow")[1], 5.0, False),
+        (lambda: "fast", 5.0, True),
+    ]
+    assert run_with_timeouts(calls) == ["slow", "fast"]
+    assert run_with_timeouts([]) == []
+
+
+def test_calls_run_concurrently():
+    started = time.monotonic()
+    run_with_timeouts([(lambda: time.sleep(0.2), 5.0, True) for _ in range(4)])
+    assert time.monotonic() - started < 0.6
+
+
+def test_timeout_is_reported_per_call():
+    release = threading.Event()
+    results = run_with_timeouts([(release.wait, 0.05, False), (lambda: "ok", 5.0, False)])
+    release.set()
+
+    assert isinstance(results[0], TimeoutError)
+    assert not isinstance(results[0], SlotTimeoutError)
+    assert results[1] == "ok"
+
+
+def test_exceptions_propagate():
+    def boom():
+        raise RuntimeError("feed exploded")
+
+    with pytest.raises(RuntimeError, match="feed exploded"):
+        run_with_timeouts([(boom, 5.0, True)])
+
+
+def test_http_slots_bound_concurrency(two_slots):
+    lock = threading.Lock()
+    active = peak = 0
+
+    def fetch():
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.05)
+        with lock:
+            active -= 1
+
+    run_with_timeouts([(fetch, 5.0, True) for _ in range(6)])
+
+    assert peak == 2
+
+
+def test_deadline_starts_after_slot_is_acquired(two_slots):
+    # Four 0.1s calls through two slots: the second pair finishes 0.2s after
+    # submission, past its 0.15s deadline, but within it once it has a slot
+    results = run_with_timeouts([(lambda: (time.sleep(0.1), "ok")[1], 0.15, True)] * 4)
+
+    assert results == ["ok"] * 4
+
+
+def test_slot_wait_timeout_is_reported_separately(two_slots):
+    release = threading.Event()
+    ran = []
+
+    def hold():
+        release.wait(5)
+
+    results = run_with_timeouts([(hold, 0.05, True), (hold, 0.05, True), (ran.append, 0.05, True)])
+    release.set()
+
+    assert [type(r) for r in results] == [TimeoutError, TimeoutError, SlotTimeoutError]
+    time.sleep(0.05)
+    assert ran == []
+
+
+def test_nested_slot_timeout_is_reported():
+    def source():
+        raise SlotTimeoutError("no HTTP slot for any feed")
+
+    (result,) = run_with_timeouts([(source, 5.0, False)])
+
+    assert isinstance(result, SlotTimeoutError)
@@ -680,6 +680,162 @@ class TestProcessSingleState:
             assert result["high_severity_count"] >= 1
             assert result["new_signals_count"] >= 1
 
+    def test_batch_path_skips_existing_and_stores_llm_program(self):
+        """Existing signals are skipped; new ones are classified and stored in one batch."""
+        from src.state.common import generate_signal_id
+
+        db_helpers.insert_state_source(
+            {
+                "source_id": "tx_tvc_news",
+                "state": "TX",
+                "source_type": "official",
+                "name": "TVC",
+                "url": "https://tx.gov",
+            }
+        )
+        db_helpers.insert_state_signal(
+            {
+                "signal_id": generate_signal_id("https://tx.gov/already-stored"),
+                "state": "TX",
+                "source_id": "tx_tvc_news",
+                "title": "Old",
+                "url": "https://tx.gov/already-stored",
+            }
+        )
+
+        tx_instance = Mock()
+        tx_instance.source_id = "tx_tvc_news"
+        tx_instance.fetch.return_value = [
+            RawSignal(
+                url="https://tx.gov/already-stored",
+                title="Old",
+                source_id="tx_tvc_news",
+                state="TX",
+            ),
+            RawSignal(
+                url="https://tx.gov/batch-new",
+                title="Program suspended immediately",
+                source_id="tx_tvc_news",
+                state="TX",
+            ),
+        ]
+        newsapi_instance = Mock()
+        newsapi_instance.source_id = "newsapi_tx"
+        newsapi_instance.fetch.return_value = [
+            RawSignal(
+                url=f"https://news.com/batch-{i}",
+                title=f"Local veterans story {i}",
+                source_id="newsapi_tx",
+                state="TX",
+            )
+            for i in range(3)
+        ]
+        rss_instance = Mock()
+        rss_instance.source_id = "rss_tx"
+        rss_instance.fetch.return_value = []
+
+        with (
+            patch(
+                "src.state.runner._get_official_source", return_value=Mock(return_value=tx_instance)
+            ),
+            patch("src.state.runner.NewsAPISource", return_value=newsapi_instance),
+            patch("src.state.runner.RSSSource", return_value=rss_instance),
+            patch(
+                "src.state.runner.classify_by_llm",
+                return_value=ClassificationResult(
+                    severity="medium", method="llm", program="caregiver"
+                ),
+            ) as mock_llm,
+            patch(
+                "src.state.runner.existing_signal_ids", wraps=db_helpers.existing_signal_ids
+            ) as mock_exists,
+        ):
+            result = _process_single_state("TX", dry_run=True)
+
+        assert result["total_signals_found"] == 5
+        assert result["new_signals_count"] == 4
+        assert result["high_severity_count"] == 1
+        assert mock_exists.call_count == 1
+        assert mock_llm.call_count == 3
+        news_id = generate_signal_id("https://news.com/batch-1")
+        assert db_helpers.get_state_signal(news_id)["program"] == "caregiver"
+        assert db_helpers.get_state_classification(news_id)["classification_method"] == "llm"
+        assert (
+            db_helpers.get_state_classification(generate_signal_id("https://tx.gov/already-stored"))
+            is None
+        )
+
+    def test_slow_source_times_out_without_stalling_others(self, monkeypatch):
+        """A source past its deadline fails with its latency; other sources still land."""
+        import threading
+
+        from src.state import runner
+
+        release = threading.Event()
+        tx_instance = Mock()
+        tx_instance.source_id = "tx_tvc_news"
+        tx_instance.fetch.side_effect = lambda: release.wait(5) and []
+
+        newsapi_instance = Mock()
+        newsapi_instance.source_id = "newsapi_tx"
+        newsapi_instance.fetch.return_value = [
+            RawSignal(
+                url="https://news.com/on-time",
+                title="Veterans story",
+                source_id="newsapi_tx",
+                state="TX",
+            )
+        ]
+        rss_instance = Mock()
+        rss_instance.source_id = "rss_tx"
+        rss_instance.fetch.return_value = []
+
+        monkeypatch.setitem(runner.SOURCE_TIMEOUTS_S, "official", 0.1)
+        with (
+            patch(
+                "src.state.runner._get_official_source", return_value=Mock(return_value=tx_instance)
+            ),
+            patch("src.state.runner.NewsAPISource", return_value=newsapi_instance),
+            patch("src.state.runner.RSSSource", return_value=rss_instance),
+            patch(
+                "src.state.runner.classify_by_llm",
+                return_value=ClassificationResult(severity="low", method="llm"),
+            ),
+        ):
+            result = _process_single_state("TX", dry_run=True)
+        release.set()
+
+        assert result["source_failures"] == 1
+        assert result["source_successes"] == 2
+        assert result["new_signals_count"] == 1
+        assert result["errors"] == ["TX official: TimeoutError: no response within 0.1s"]
+        health = db_helpers.get_source_health("tx_tvc_news")
+        assert health["consecutive_failures"] == 1
+        assert health["last_latency_ms"] == 100
+        assert db_helpers.get_source_health("newsapi_tx")["last_latency_ms"] is not None
+
+    def test_slot_timeout_leaves_source_health_alone(self):
+        """A source that never got an HTTP slot is not recorded as a failed fetch."""
+        from src.state.http_budget import SlotTimeoutError
+
+        newsapi_instance = Mock()
+        newsapi_instance.source_id = "newsapi_tx"
+        newsapi_instance.fetch.return_value = []
+        rss_instance = Mock()
+        rss_instance.source_id = "rss_tx"
+        rss_instance.fetch.side_effect = SlotTimeoutError("no HTTP slot for any TX feed")
+
+        with (
+            patch("src.state.runner._get_official_source", return_value=None),
+            patch("src.state.runner.NewsAPISource", return_value=newsapi_instance),
+            patch("src.state.runner.RSSSource", return_value=rss_instance),
+        ):
+            result = _process_single_state("TX", dry_run=True)
+
+        assert (result["source_successes"], result["source_failures"]) == (1, 1)
+        assert result["errors"] == ["TX RSS: SlotTimeoutError: no HTTP slot for any TX feed"]
+        assert db_helpers.get_source_health("rss_tx") is None
+
 
 class TestParallelExecution:
     """Tests that run_state_monitor uses ThreadPoolExecutor for multi-state runs."""
@@ -2,9 +2,25 @@
 
 from unittest.mock import MagicMock, patch
 
+import httpx
+import pytest
+
+from src.state.sources import rss
 from src.state.sources.rss import RSS_FEEDS, RSSSource
 
 
+def _response(url):
+    return MagicMock(content=f"<rss>{url}</rss>".encode())
+
+
+@pytest.fixture(autouse=True)
+def feed_requests(monkeypatch):
+    """Serve every feed request from memory; returns the mock for inspection."""
+    get = MagicMock(side_effect=lambda url, **kwargs: _response(url))
+    monkeypatch.setattr(rss.httpx, "get", get)
+    return get
+
+
 def _make_feed_entry(title, link, summary, published_parsed):
     """Create a mock feed entry that behaves like feedparser entries."""
     entry = MagicMock()
@@ -103,3 +119,78 @@ def test_rss_filters_veteran_relevant(mock_parse):
     # Should only have the veteran-related article
     assert len(signals) == 1
     assert "Veterans" in signals[0].title
+
+
+def test_rss_fetches_feeds_with_io_timeout(feed_requests):
+    """Each feed is fetched with its own I/O timeout; feedparser only parses the body."""
+    with patch("src.state.sources.rss.feedparser.parse") as mock_parse:
+        mock_parse.return_value = MagicMock(bozo=False, entries=[])
+        RSSSource(state="TX").fetch()
+
+    urls = [feed["url"] for feed in RSS_FEEDS["TX"]]
+    assert sorted(call.args[0] for call in feed_requests.call_args_list) == sorted(urls)
+    assert all(
+        call.kwargs["timeout"] == rss.FEED_TIMEOUT_S for call in feed_requests.call_args_list
+    )
+    assert sorted(call.args[0] for call in mock_parse.call_args_list) == sorted(
+        _response(url).content for url in urls
+    )
+
+
+def test_rss_skips_feed_that_fails_to_download(feed_requests):
+    feed_requests.side_effect = httpx.ConnectError("connection refused")
+
+    with patch("src.state.sources.rss.feedparser.parse") as mock_parse:
+        assert RSSSource(state="TX").fetch() == []
+    mock_parse.assert_not_called()
+
+
+def test_rss_skips_feed_that_times_out(monkeypatch, feed_requests):
+    """A feed that misses its deadline is skipped; the other feeds still count."""
+    import threading
+
+    release = threading.Event()
+    slow_url = RSS_FEEDS["TX"][0]["url"]
+
+    def get(url, **kwargs):
+        if url == slow_url:
+            release.wait(5)
+        return _response(url)
+
+    feed_requests.side_effect = get
+    parsed = MagicMock(
+        bozo=False,
+        entries=[
+            _make_feed_entry(
+                title="Veterans clinic expands hours",
+                link="https://example.com/clinic",
+                summary="",
+                published_parsed=None,
+            )
+        ],
+    )
+
+    monkeypatch.setattr(rss, "FEED_TIMEOUT_S", 0.1)
+    with patch("src.state.sources.rss.feedparser.parse", return_value=parsed):
+        signals = RSSSource(state="TX").fetch()
+    release.set()
+
+    assert [s.url for s in signals] == ["https://example.com/clinic"]
+
+
+def test_rss_without_any_slot_raises(monkeypatch, feed_requests):
+    """If no feed got an HTTP slot, the source reports a slot timeout, not empty results."""
+    import threading
+
+    from src.state import http_budget
+    from src.state.http_budget import SlotTimeoutError
+
+    monkeypatch.setattr(http_budget, "_slots", threading.BoundedSemaphore(1))
+    monkeypatch.setattr(rss, "FEED_TIMEOUT_S", 0.05)
+    http_budget._slots.acquire()
+    try:
+        with pytest.raises(SlotTimeoutError):
+            RSSSource(state="TX").fetch()
+    finally:
+        http_budget._slots.release()
+    feed_requests.assert_not_called()
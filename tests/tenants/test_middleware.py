@@ -344,3 +344,66 @@ class TestResolveTenantWithHeaders:
         )
         # After request completes, context should be None
         assert get_tenant_context() is None
+
+
+class TestTenantResolutionCache:
+    def _client(self, user_id: str, email: str) -> TestClient:
+        app = FastAPI()
+
+        @app.get("/api/test")
+        async def endpoint(request: Request):
+            ctx = get_tenant_context()
+            if ctx:
+                return {"tenant_id": ctx.tenant_id, "role": ctx.user_role}
+            return {"tenant_id": None}
+
+        app.add_middleware(TenantMiddleware)
+
+        class InjectUser(BaseHTTPMiddleware):
+            async def dispatch(self, request, call_next):
+                request.state.user_id = user_id
+                request.state.user_email = email
+                return await call_next(request)
+
+        app.add_middleware(InjectUser)
+        return TestClient(app)
+
+    def test_repeat_resolution_is_cached(self, manager, created_tenant, _seed_owner_user):
+        from src.tenants.cache import tenant_context_cache
+
+        client = self._client("owner-001", "owner@test.com")
+        before = tenant_context_cache.stats()
+        assert client.get("/api/test").json()["tenant_id"] == created_tenant.tenant_id
+        assert client.get("/api/test").json()["tenant_id"] == created_tenant.tenant_id
+        after = tenant_context_cache.stats()
+        assert after["misses"] - before["misses"] == 1
+        assert after["hits"] - before["hits"] == 1
+
+    def test_invalidation_during_lookup_is_not_undone(
+        self, manager, created_tenant, _seed_extra_users, monkeypatch
+    ):
+        manager.add_member(created_tenant.tenant_id, "user-002", "analyst")
+        client = self._client("user-002", "member2@test.com")
+        headers = {"X-Tenant-ID": created_tenant.tenant_id}
+        lookup = TenantMiddleware._lookup_tenant
+
+        def racing_lookup(self, headers, user_id):
+            # The role changes, and is invalidated, after the lookup read the old one
+            context = lookup(self, headers, user_id)
+            manager.update_member_role(created_tenant.tenant_id, "user-002", "viewer")
+            return context
+
+        monkeypatch.setattr(TenantMiddleware, "_lookup_tenant", racing_lookup)
+        assert client.get("/api/test", headers=headers).json()["role"] == "analyst"
+
+        monkeypatch.setattr(TenantMiddleware, "_lookup_tenant", lookup)
+        assert client.get("/api/test", headers=headers).json()["role"] == "viewer"
+
+    def test_member_role_change_invalidates(self, manager, created_tenant, _seed_extra_users):
+        manager.add_member(created_tenant.tenant_id, "user-002", "analyst")
+        client = self._client("user-002", "member2@test.com")
+        headers = {"X-Tenant-ID": created_tenant.tenant_id}
+        assert client.get("/api/test", headers=headers).json()["role"] == "analyst"
+
+        manager.update_member_role(created_tenant.tenant_id, "user-002", "viewer")
+        assert client.get("/api/test", headers=headers).json()["role"] == "viewer"
@@ -0,0 +1,107 @@
+"""Equivalence tests: NumPy agenda drift engine vs the pure-Python helpers."""
+
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src import agenda_drift, db  # noqa: E402
+
+DIM = 384
+
+
+def _random_vectors(n: int, seed: int = 11) -> list[list[float]]:
+    rng = random.Random(seed)
+    return [[rng.uniform(-1, 1) for _ in range(DIM)] for _ in range(n)]
+
+
+def _reference_baseline(vectors):
+    centroid = agenda_drift._mean_vector(vectors)
+    distances = [agenda_drift.cosine_distance(v, centroid) for v in vectors]
+    mu = sum(distances) / len(distances)
+    return centroid, distances, mu, agenda_drift._std_dev(distances, mu)
+
+
+class TestVectorizedEquivalence:
+    def test_centroid_matches_mean_vector(self):
+        vectors = _random_vectors(50)
+        expected = agenda_drift._mean_vector(vectors)
+        actual = agenda_drift.centroid_vector(agenda_drift.to_matrix(vectors))
+        assert np.allclose(actual, expected, atol=1e-7)
+
+    def test_cosine_distances_match_scalar(self):
+        vectors = _random_vectors(40)
+        target = _random_vectors(1, seed=3)[0]
+        expected = [agenda_drift.cosine_distance(v, target) for v in vectors]
+        actual = agenda_drift.cosine_distances(agenda_drift.to_matrix(vectors), target)
+        assert np.allclose(actual, expected, atol=1e-6)
+
+    def test_degenerate_vectors_distance_one(self):
+        vectors = [[0.0] * DIM, _random_vectors(1)[0]]
+        actual = agenda_drift.cosine_distances(agenda_drift.to_matrix(vectors), [0.0] * DIM)
+        assert actual.tolist() == [1.0, 1.0]
+        zero_row = agenda_drift.cosine_distances(
+            agenda_drift.to_matrix(vectors), _random_vectors(1, seed=5)[0]
+        )
+        assert zero_row[0] == 1.0
+
+    def test_baseline_stats_match_reference(self):
+        vectors = _random_vectors(120)
+        centroid, _, mu, sigma = _reference_baseline(vectors)
+        np_centroid, np_mu, np_sigma = agenda_drift.compute_baseline_stats(
+            agenda_drift.to_matrix(vectors)
+        )
+        assert np.allclose(np_centroid, centroid, atol=1e-7)
+        assert np_mu == pytest.approx(mu, abs=1e-6)
+        assert np_sigma == pytest.approx(sigma, abs=1e-6)
+
+
+class TestBuildBaselineAndDetect:
+    def _seed_member(self, vectors):
+        db.upsert_ad_member("M001", "Sen. Smith")
+        db.bulk_insert_ad_utterances(
+            [
+                {
+                    "utterance_id": f"U{i:03d}",
+                    "member_id": "M001",
+                    "hearing_id": "H001",
+                    "content": "x" * 150,
+                    "spoken_at": f"2024-01-{(i % 28) + 1:02d}",
+                }
+                for i in range(len(vectors))
+            ]
+        )
+        for i, vec in enumerate(vectors):
+            db.upsert_ad_embedding(f"U{i:03d}", vec, "test-model")
+
+    def test_build_baseline_matches_reference(self):
+        vectors = _random_vectors(12)
+        self._seed_member(vectors)
+        stored = [v for _, v in db.get_ad_embeddings_for_member("M001")]
+        centroid, _, mu, sigma = _reference_baseline(stored)
+
+        result = agenda_drift.build_baseline("M001")
+
+        assert result["n"] == 12
+        assert np.allclose(result["vec_mean"], centroid, atol=1e-7)
+        assert result["mu"] == pytest.approx(mu, abs=1e-6)
+        assert result["sigma"] == pytest.approx(sigma, abs=1e-6)
+
+    def test_precomputed_distance_gives_same_event(self):
+        vectors = _random_vectors(12)
+        self._seed_member(vectors)
+        agenda_drift.build_baseline("M001")
+        baseline = db.get_latest_ad_baseline("M001")
+        outlier = [-x for x in baseline["vec_mean"]]
+
+        matrix = agenda_drift.to_matrix([outlier])
+        dist = agenda_drift.cosine_distances(matrix, baseline["vec_mean"])
+        batched = agenda_drift.detect_deviation(
+            "M001", "U000", outlier, "H001", baseline=baseline, dist=float(dist[0])
+        )
+        scalar = agenda_drift.detect_deviation("M001", "U001", outlier, "H001")
+
+        assert batched is not None and scalar is not None
+        assert batched["cos_dist"] == scalar["cos_dist"]
+        assert batched["zscore"] == scalar["zscore"]
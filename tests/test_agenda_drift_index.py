@@ -0,0 +1,266 @@
+"""Tests for the agenda drift nearest-neighbour index."""
+
+import random
+from unittest.mock import patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+np = pytest.importorskip("numpy")
+
+from src import agenda_drift_index as adi  # noqa: E402
+from src import db  # noqa: E402
+from src.auth.models import AuthContext, UserRole  # noqa: E402
+
+DIM = 16
+
+
+def _random_vectors(n: int, seed: int = 7) -> list[list[float]]:
+    rng = random.Random(seed)
+    return [[rng.uniform(-1, 1) for _ in range(DIM)] for _ in range(n)]
+
+
+def _brute_force(vectors, ids, query, k):
+    matrix = np.asarray(vectors, dtype=np.float64)
+    q = np.asarray(query, dtype=np.float64)
+    sims = matrix @ q / (np.linalg.norm(matrix, axis=1) * np.linalg.norm(q))
+    order = np.argsort(-sims, kind="stable")[:k]
+    return [ids[i] for i in order]
+
+
+@pytest.fixture(autouse=True)
+def _index_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("AD_INDEX_DIR", str(tmp_path / "ad_index"))
+    adi.clear_cache()
+    yield
+    adi.clear_cache()
+
+
+class TestMemberIndex:
+    def test_flat_search_matches_brute_force(self):
+        vectors = _random_vectors(200)
+        ids = [f"U{i:03d}" for i in range(200)]
+        index = adi.MemberIndex("M001")
+        index.upsert(ids, vectors)
+        query = _random_vectors(1, seed=99)[0]
+
+        hits = index.search(query, k=10)
+
+        assert [h.utterance_id for h in hits] == _brute_force(vectors, ids, query, 10)
+        assert hits[0].similarity >= hits[-1].similarity
+
+    def test_exclude_and_k_larger_than_index(self):
+        vectors = _random_vectors(5)
+        index = adi.MemberIndex("M001")
+        index.upsert(["a", "b", "c", "d", "e"], vectors)
+
+        hits = index.search(vectors[0], k=50, exclude=["a", "zzz"])
+
+        assert len(hits) == 4
+        assert "a" not in {h.utterance_id for h in hits}
+
+    def test_upsert_overwrites_existing_rows(self):
+        index = adi.MemberIndex("M001")
+        index.upsert(["a", "b"], [[1.0] + [0.0] * (DIM - 1), [0.0, 1.0] + [0.0] * (DIM - 2)])
+        index.upsert(["b", "c"], [[1.0] + [0.0] * (DIM - 1), [0.0, 0.0, 1.0] + [0.0] * (DIM - 3)])
+
+        assert len(index) == 3
+        top = index.search([1.0] + [0.0] * (DIM - 1), k=2)
+        assert {h.utterance_id for h in top} == {"a", "b"}
+
+    def test_zero_query_and_dimension_mismatch(self):
+        index = adi.MemberIndex("M001")
+        index.upsert(["a"], _random_vectors(1))
+        assert index.search([0.0] * DIM) == []
+        with pytest.raises(ValueError):
+            index.search([1.0, 2.0])
+
+    def test_save_and_load_round_trip(self, tmp_path):
+        vectors = _random_vectors(20)
+        index = adi.MemberIndex("M001")
+        index.upsert([f"U{i}" for i in range(20)], vectors)
+        index.watermark = "2024-01-01T00:00:00+00:00"
+        path = tmp_path / "M001.npz"
+
+        index.save(path)
+        loaded = adi.MemberIndex.load(path)
+
+        assert loaded.ids == index.ids
+        assert loaded.watermark == index.watermark
+        assert np.array_equal(loaded.matrix, index.matrix)
+        assert loaded.search(vectors[3], k=1)[0].utterance_id == "U3"
+
+    def test_ivf_recall_on_clustered_data(self, monkeypatch):
+        monkeypatch.setattr(adi, "IVF_MIN_ROWS", 100)
+        rng = np.random.default_rng(1)
+        centers = rng.normal(size=(8, DIM))
+        vectors = np.vstack([c + 0.05 * rng.normal(size=(100, DIM)) for c in centers])
+        ids = [f"U{i:04d}" for i in range(len(vectors))]
+        index = adi.MemberIndex("M001", mode=adi.MODE_IVF, nprobe=4)
+        index.upsert(ids, vectors)
+        query = centers[2] + 0.05 * rng.normal(size=DIM)
+
+        hits = index.search(query, k=10)
+
+        expected = set(_brute_force(vectors, ids, query, 10))
+        assert len(expected & {h.utterance_id for h in hits}) >= 9
+        assert index._centroids is not None
+
+    def test_ivf_incremental_upsert_is_searchable(self, monkeypatch):
+        monkeypatch.setattr(adi, "IVF_MIN_ROWS", 50)
+        vectors = _random_vectors(100)
+        index = adi.MemberIndex("M001", mode=adi.MODE_IVF, nprobe=100)
+        index.upsert([f"U{i}" for i in range(100)], vectors)
+        index.search(vectors[0], k=1)  # trains
+
+        new_vec = _random_vectors(1, seed=1234)[0]
+        index.upsert(["NEW"], [new_vec])
+
+        assert index.search(new_vec, k=1)[0].utterance_id == "NEW"
+
+
+def _seed_member(member_id: str, vectors, prefix: str = "U"):
+    db.upsert_ad_member(member_id, f"Member {member_id}")
+    db.bulk_insert_ad_utterances(
+        [
+            {
+                "utterance_id": f"{prefix}{i:03d}",
+                "member_id": member_id,
+                "hearing_id": "H001",
+                "content": f"utterance {i} " + "x" * 150,
+                "spoken_at": f"2024-01-{(i % 28) + 1:02d}",
+            }
+            for i in range(len(vectors))
+        ]
+    )
+    db.bulk_upsert_ad_embeddings(
+        [(f"{prefix}{i:03d}", v) for i, v in enumerate(vectors)], "test-model"
+    )
+
+
+class TestPersistedIndexes:
+    def test_builds_from_db_and_persists(self):
+        _seed_member("M001", _random_vectors(12))
+
+        index = adi.get_member_index("M001")
+
+        assert len(index) == 12
+        assert index.watermark is not None
+        assert (adi.index_dir() / "M001.npz").exists()
+
+    def test_refresh_applies_only_new_embeddings(self):
+        _seed_member("M001", _random_vectors(6))
+        adi.get_member_index("M001")
+        _seed_member("M001", _random_vectors(4, seed=3), prefix="V")
+
+        sizes = adi.refresh_member_indexes(["M001"])
+
+        assert sizes == {"M001": 10}
+        adi.clear_cache()
+        assert len(adi.get_member_index("M001")) == 10
+
+    def test_typical_utterances_nearest_centroid_skip_flagged(self):
+        from src import agenda_drift
+
+        vectors = _random_vectors(12)
+        _seed_member("M001", vectors)
+        baseline = agenda_drift.build_baseline("M001")
+        ids = [f"U{i:03d}" for i in range(12)]
+        ranked = _brute_force(vectors, ids, baseline["vec_mean"], 12)
+        db.insert_ad_deviation_event(
+            {
+                "member_id": "M001",
+                "hearing_id": "H001",
+                "utterance_id": ranked[0],
+                "baseline_id": baseline["baseline_id"],
+                "cos_dist": 0.5,
+                "zscore": 3.0,
+                "detected_at": "2024-02-01T00:00:00+00:00",
+                "note": None,
+            }
+        )
+
+        typical = adi.typical_utterances("M001", exclude_utterance_id=ranked[1], limit=3)
+
+        assert [u["utterance_id"] for u in typical] == ranked[2:5]
+        assert all("content" in u and "similarity" in u for u in typical)
+
+    def test_typical_utterances_falls_back_without_baseline(self):
+        _seed_member("M001", _random_vectors(4))
+        typical = adi.typical_utterances("M001", limit=2)
+        assert len(typical) == 2
+        assert "similarity" not in typical[0]
+
+    def test_similar_to_utterance(self):
+        vectors = _random_vectors(10)
+        _seed_member("M001", vectors)
+        ids = [f"U{i:03d}" for i in range(10)]
+
+        results = adi.similar_to_utterance("U004", "M001", k=3)
+
+        assert [r["utterance_id"] for r in results] == _brute_force(vectors, ids, vectors[4], 4)[1:]
+        assert adi.similar_to_utterance("NOPE", "M001") is None
+
+
+class TestSimilarityEndpoints:
+    @pytest.fixture
+    def client(self):
+        with patch("src.auth.firebase_config.init_firebase"):
+            from src.dashboard_api import app
+
+            return TestClient(app)
+
+    @staticmethod
+    def _auth():
+        return patch(
+            "src.auth.middleware.get_current_user",
+            return_value=AuthContext(
+                user_id="test-analyst-uid",
+                email="analyst@veteran-signals.com",
+                role=UserRole.ANALYST,
+                display_name="Test Analyst",
+                auth_method="firebase",
+            ),
+        )
+
+    def test_typical_endpoint(self, client):
+        from src import agenda_drift
+
+        _seed_member("M001", _random_vectors(8))
+        agenda_drift.build_baseline("M001")
+        with self._auth():
+            resp = client.get("/api/agenda-drift/members/M001/typical", params={"k": 3})
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["count"] == 3
+        assert data["results"][0]["similarity"] >= data["results"][-1]["similarity"]
+
+    def test_similar_endpoint(self, client):
+        _seed_member("M001", _random_vectors(8))
+        with self._auth():
+            resp = client.get("/api/agenda-drift/utterances/U002/similar", params={"k": 4})
+            missing = client.get("/api/agenda-drift/utterances/NOPE/similar")
+        assert resp.status_code == 200
+        assert resp.json()["member_id"] == "M001"
+        assert "U002" not in [r["utterance_id"] for r in resp.json()["results"]]
+        assert missing.status_code == 404
+
+    def test_similar_text_endpoint(self, client, monkeypatch):
+        vectors = _random_vectors(8)
+        _seed_member("M001", vectors)
+        monkeypatch.setattr(adi, "encode_text", lambda text: np.asarray(vectors[5]))
+        with self._auth():
+            resp = client.post(
+                "/api/agenda-drift/members/M001/similar-text", json={"text": "budget", "k": 2}
+            )
+        assert resp.status_code == 200
+        assert resp.json()["results"][0]["utterance_id"] == "U005"
+
+    def test_similar_text_without_model_returns_503(self, client, monkeypatch):
+        def _unavailable(text):
+            raise RuntimeError("sentence-transformers not installed")
+
+        monkeypatch.setattr(adi, "encode_text", _unavailable)
+        with self._auth():
+            resp = client.post("/api/agenda-drift/members/M001/similar-text", json={"text": "x"})
+        assert resp.status_code == 503
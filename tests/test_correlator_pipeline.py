@@ -8,7 +8,12 @@ do not fire) under various conditions.
 from datetime import UTC, datetime, timedelta
 
 from src.db import connect, execute
-from src.signals.correlator import CorrelationEngine
+from src.signals.correlator import (
+    TITLE_SIMILARITY_THRESHOLD,
+    CorrelationEngine,
+    CorrelationWindow,
+    MemberEvent,
+)
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -284,3 +289,134 @@ class TestTitleSimilarity:
             ["Agricultural trade policy reform legislation"],
         )
         assert sim < 0.3, f"Expected low similarity for unrelated titles, got {sim}"
+
+
+class TestIncrementalMode:
+    """evaluate_rules(incremental=True): watermark + sliding window."""
+
+    def _seed_pair(self):
+        _insert_om_event(
+            "om-inc-1",
+            "Report on disability benefits backlog at VA",
+            pub_timestamp=_hours_ago(100),
+        )
+        _insert_bill(
+            "hr-inc-1",
+            "Veterans Disability Compensation Improvement Act",
+            policy_area="disability",
+            introduced_date=_hours_ago(50),
+        )
+
+    def test_first_run_correlates_window_and_persists_watermarks(self):
+        self._seed_pair()
+
+        engine = CorrelationEngine()
+        result = engine.run(incremental=True)
+
+        assert result["mode"] == "incremental"
+        assert result["by_rule"].get("legislative_to_oversight") == 1
+        assert result["stored"] == result["total_signals"]
+        from src.db.compound import get_compound_watermarks
+
+        assert set(get_compound_watermarks()) == {"oversight", "bill"}
+
+    def test_warm_engine_only_evaluates_new_rows(self):
+        self._seed_pair()
+        engine = CorrelationEngine()
+        engine.run(incremental=True)
+
+        assert engine.evaluate_rules(incremental=True) == []
+
+        _insert_bill(
+            "hr-inc-2",
+            "Disability Benefits Backlog Reduction Act",
+            policy_area="disability",
+            introduced_date=_hours_ago(1),
+        )
+        signals = engine.evaluate_rules(incremental=True)
+
+        assert len(signals) == 1
+        member_ids = [e.event_id for e in signals[0].member_events]
+        assert member_ids == ["hr-inc-2", "om-inc-1"]
+
+    def test_cold_engine_resumes_from_persisted_watermarks(self):
+        self._seed_pair()
+        CorrelationEngine().run(incremental=True)
+        _insert_om_event(
+            "om-inc-2",
+            "GAO finds disability compensation exam errors",
+            pub_timestamp=_hours_ago(2),
+        )
+
+        signals = CorrelationEngine().evaluate_rules(incremental=True)
+
+        leg = [s for s in signals if s.rule_id == "legislative_to_oversight"]
+        assert len(leg) == 1
+        assert leg[0].member_events[0].event_id == "om-inc-2"
+        assert {e.event_id for e in leg[0].member_events} == {"om-inc-2", "hr-inc-1"}
+
+    def test_incremental_state_divergence(self):
+        _seed_state_sources()
+        recent = _hours_ago(24)
+        for sid, state in (("ss-tx", "TX"), ("ss-fl", "FL")):
+            _insert_state_signal(
+                sid, state, f"Claims processing backlog grows in {state}", pub_date=recent
+            )
+        engine = CorrelationEngine()
+        assert engine.run(incremental=True)["total_signals"] == 0
+
+        _insert_state_signal("ss-ca", "CA", "Claims processing backlog grows in CA")
+        signals = engine.evaluate_rules(incremental=True)
+
+        div = [s for s in signals if s.rule_id == "state_divergence"]
+        assert len(div) == 1
+        assert div[0].topics == ["claims_backlog"]
+        assert {e.metadata["state"] for e in div[0].member_events} == {"TX", "FL", "CA"}
+
+
+class TestCorrelationWindow:
+    def _event(self, event_id, title, topics=(), source_type="bill"):
+        return MemberEvent(
+            source_type=source_type,
+            event_id=event_id,
+            title=title,
+            timestamp=None,
+            topics=list(topics),
+            metadata={},
+        )
+
+    def test_with_topic_newest_first_and_evict(self):
+        window = CorrelationWindow()
+        now = datetime.now(UTC)
+        for i in range(5):
+            window.add(self._event(f"b{i}", "t", ["appeals"]), now - timedelta(hours=10 - i))
+
+        recent = window.with_topic("bill", "appeals", now - timedelta(hours=8), limit=2)
+        assert [e.event_id for e in recent] == ["b4", "b3"]
+
+        assert window.evict(now - timedelta(hours=7)) == 3
+        assert len(window) == 2
+        assert window.with_topic("bill", "appeals", now - timedelta(hours=100)) == [
+            window.get(("bill", "b4")),
+            window.get(("bill", "b3")),
+        ]
+
+    def test_similar_titles_matches_brute_force(self):
+        engine = CorrelationEngine()
+        window = CorrelationWindow()
+        now = datetime.now(UTC)
+        words = ["veteran", "disability", "claims", "rating", "exam", "appeal", "board", "reform"]
+        titles = [" ".join(words[: 3 + i % 6]) + f" act {chr(97 + i % 3)}" for i in range(40)]
+        for i, title in enumerate(titles):
+            window.add(self._event(f"b{i}", title), now)
+
+        query = "veteran disability claims rating exam appeal act a"
+        expected = {
+            f"b{i}"
+            for i, title in enumerate(titles)
+            if engine._title_similarity([query], [title]) >= TITLE_SIMILARITY_THRESHOLD
+        }
+        matched = window.similar_titles("bill", query, TITLE_SIMILARITY_THRESHOLD, now)
+
+        assert expected
+        assert {e.event_id for e in matched} == expected
@@ -140,3 +140,107 @@ def test_named_params_round_trip_sqlite(tmp_path, monkeypatch):
     con.close()
 
     assert row == ("SUCCESS", 3)
+
+
+def test_connect_reuses_pooled_sqlite_connection():
+    first = db.connect()
+    raw = first.raw
+    first.close()
+
+    second = db.connect()
+    assert second.raw is raw
+    second.close()
+
+    stats = db.get_pool_stats()
+    sqlite_stats = next(p for p in stats["pools"] if p["backend"] == "sqlite")
+    assert sqlite_stats["reuses"] >= 1
+    assert sqlite_stats["in_use"] == 0
+
+
+def test_pooled_connection_release_discards_uncommitted_work():
+    con = db.connect()
+    db.execute(
+        con,
+        "INSERT INTO source_runs(source_id, started_at, ended_at, status, records_fetched, errors_json) "
+        "VALUES ('pool_test', 'a', 'b', 'SUCCESS', 0, '[]')",
+    )
+    con.row_factory = lambda cursor, row: {"source_id": row[0]}
+    con.close()
+
+    con = db.connect()
+    assert con.row_factory is None
+    row = db.execute(
+        con, "SELECT COUNT(*) FROM source_runs WHERE source_id = 'pool_test'"
+    ).fetchone()
+    con.close()
+    assert row == (0,)
+
+
+def test_nested_connections_are_distinct():
+    outer = db.connect()
+    inner = db.connect()
+    assert inner.raw is not outer.raw
+    inner.close()
+    outer.close()
+
+
+def test_pool_disabled_returns_plain_connection(monkeypatch):
+    import sqlite3
+
+    db.close_pool()
+    monkeypatch.setenv("DB_POOL_ENABLED", "0")
+    con = db.connect()
+    try:
+        assert isinstance(con, sqlite3.Connection)
+        assert db.get_pool_stats()["enabled"] is False
+    finally:
+        con.close()
+        db.close_pool()
+
+
+def test_async_fetch_runs_on_db_executor():
+    import asyncio
+    import threading
+
+    con = db.connect()
+    db.execute(
+        con,
+        "INSERT INTO source_runs(source_id, started_at, ended_at, status, records_fetched, errors_json) "
+        "VALUES ('aio_test', 'a', 'b', 'SUCCESS', 0, '[]')",
+    )
+    con.commit()
+    con.close()
+
+    async def scenario():
+        rows = await db.fetch_all(
+            "SELECT source_id FROM source_runs WHERE source_id = :source_id",
+            {"source_id": "aio_test"},
+        )
+        count = await db.fetch_one("SELECT COUNT(*) FROM source_runs")
+        thread_name = await db.run_db(lambda: threading.current_thread().name)
+        return rows, count, thread_name
+
+    try:
+        rows, count, thread_name = asyncio.run(scenario())
+    finally:
+        asyncio.run(db.close_async_db())
+
+    assert rows == [("aio_test",)]
+    assert count == (1,)
+    assert thread_name.startswith("db-async")
+
+
+def test_run_db_propagates_context_vars():
+    import asyncio
+    import contextvars
+
+    var: contextvars.ContextVar[str | None] = contextvars.ContextVar("aio_test", default=None)
+
+    async def scenario():
+        var.set("tenant-1")
+        return await db.run_db(var.get)
+
+    try:
+        assert asyncio.run(scenario()) == "tenant-1"
+    finally:
+        asyncio.run(db.close_async_db())
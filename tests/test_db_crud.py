@@ -1,6 +1,11 @@
 """Tests for db.py CRUD functions — covers FR, eCFR, Agenda Drift, Bills,
 Hearings, Authority Docs, and LDA helpers."""
 
+import asyncio
+import json
+
+import pytest
+
 import src.db as db
 
 # ── helpers ──────────────────────────────────────────────────────
@@ -105,6 +110,46 @@ class TestUpsertFrSeen:
         assert row == ("2024-03-01", "2024-04-01", "proposed rule", "Test Rule")
 
 
+class TestInsertNewFrSeen:
+    def _pkg(self, doc_id, published_date="2024-01-15"):
+        return {
+            "doc_id": doc_id,
+            "published_date": published_date,
+            "source_url": f"https://fr.gov/{doc_id}",
+        }
+
+    def test_returns_only_unseen_in_input_order(self):
+        db.upsert_fr_seen("FR-101", "2024-01-15", "2024-01-01T00:00:00Z", "https://fr.gov/101")
+        packages = [self._pkg("FR-103"), self._pkg("FR-101"), self._pkg("FR-102")]
+
+        new_docs = db.insert_new_fr_seen(packages, "2024-02-01T00:00:00Z")
+
+        assert [d["doc_id"] for d in new_docs] == ["FR-103", "FR-102"]
+        assert db.get_existing_fr_doc_ids(["FR-101", "FR-102", "FR-103"]) == {
+            "FR-101",
+            "FR-102",
+            "FR-103",
+        }
+
+    def test_matches_per_row_upsert_for_docs_outside_window(self):
+        # Stored with a different published_date than the listing reports
+        db.upsert_fr_seen("FR-110", "2023-06-01", "2023-06-02T00:00:00Z", "https://fr.gov/110")
+
+        new_docs = db.insert_new_fr_seen([self._pkg("FR-110")], "2024-02-01T00:00:00Z")
+
+        assert new_docs == []
+
+    def test_duplicate_packages_inserted_once(self):
+        new_docs = db.insert_new_fr_seen(
+            [self._pkg("FR-120"), self._pkg("FR-120")], "2024-02-01T00:00:00Z"
+        )
+        assert [d["doc_id"] for d in new_docs] == ["FR-120"]
+        assert db.insert_new_fr_seen([self._pkg("FR-120")], "2024-02-02T00:00:00Z") == []
+
+    def test_empty_input(self):
+        assert db.insert_new_fr_seen([], "2024-02-01T00:00:00Z") == []
+
+
 class TestUpdateFrSeenDates:
     def test_update_existing_returns_true(self):
         db.upsert_fr_seen("FR-010", "2024-01-01", "2024-01-02T00:00:00Z", "https://fr.gov/10")
@@ -361,7 +406,7 @@ class TestAdEmbedding:
         db.upsert_ad_embedding("U032", [0.5, 0.6], "model-v1")
         results = db.get_ad_embeddings_for_member("M022", min_content_length=100)
         assert len(results) == 1
-        assert results[0][1] == [0.5, 0.6]
+        assert list(results[0][1]) == pytest.approx([0.5, 0.6])
 
     def test_get_embeddings_filters_short_content(self):
         db.upsert_ad_member("M023", "Rep. Short")
@@ -381,6 +426,92 @@ class TestAdEmbedding:
         results = db.get_ad_embeddings_for_member("M023", min_content_length=100)
         assert len(results) == 0
 
+    def test_stored_as_packed_float32(self):
+        db.upsert_ad_member("M024", "Sen. Packed")
+        db.bulk_insert_ad_utterances(
+            [
+                {
+                    "utterance_id": "U034",
+                    "member_id": "M024",
+                    "hearing_id": "H024",
+                    "content": "p" * 200,
+                    "spoken_at": "2024-01-15T10:00:00Z",
+                },
+            ]
+        )
+        db.upsert_ad_embedding("U034", [0.25] * 384, "model-v1")
+        con = db.connect()
+        raw = db.execute(
+            con, "SELECT vec FROM ad_embeddings WHERE utterance_id = 'U034'"
+        ).fetchone()
+        con.close()
+        assert len(raw[0]) == 4 + 384 * 4
+
+    def test_legacy_json_rows_still_decode(self):
+        db.upsert_ad_member("M025", "Rep. Legacy")
+        db.bulk_insert_ad_utterances(
+            [
+                {
+                    "utterance_id": "U035",
+                    "member_id": "M025",
+                    "hearing_id": "H025",
+                    "content": "l" * 200,
+                    "spoken_at": "2024-01-15T10:00:00Z",
+                },
+            ]
+        )
+        con = db.connect()
+        db.execute(
+            con,
+            """INSERT INTO ad_embeddings(utterance_id, vec, model_id, embedded_at)
+               VALUES('U035', :vec, 'model-v0', '2024-01-01T00:00:00Z')""",
+            {"vec": json.dumps([0.5, -1.5])},
+        )
+        con.commit()
+        con.close()
+        results = db.get_ad_embeddings_for_member("M025", min_content_length=100)
+        assert list(results[0][1]) == [0.5, -1.5]
+
+    def test_bulk_upsert_inserts_and_updates(self):
+        db.upsert_ad_member("M026", "Sen. Bulk")
+        db.bulk_insert_ad_utterances(
+            [
+                {
+                    "utterance_id": f"U04{i}",
+                    "member_id": "M026",
+                    "hearing_id": "H026",
+                    "content": "b" * 200,
+                    "spoken_at": "2024-01-15T10:00:00Z",
+                }
+                for i in range(3)
+            ]
+        )
+        assert db.bulk_upsert_ad_embeddings([("U040", [1.0]), ("U041", [2.0])], "m1") == 2
+        db.bulk_upsert_ad_embeddings([("U041", [3.0]), ("U042", [4.0])], "m2")
+        results = dict(db.get_ad_embeddings_for_member("M026", min_content_length=100))
+        assert {k: list(v) for k, v in results.items()} == {
+            "U040": [1.0],
+            "U041": [3.0],
+            "U042": [4.0],
+        }
+        assert db.bulk_upsert_ad_embeddings([], "m1") == 0
+
+
+class TestEmbeddingEncoding:
+    def test_round_trip(self):
+        vec = [0.1, -0.2, 3.5, 0.0]
+        blob = db.encode_embedding(vec)
+        assert blob[:4] == b"VEC" + bytes([db.EMBEDDING_FORMAT_VERSION])
+        assert list(db.decode_embedding(blob)) == pytest.approx(vec, abs=1e-7)
+
+    def test_decodes_legacy_json(self):
+        assert db.decode_embedding("[0.5, 0.25]") == [0.5, 0.25]
+        assert db.decode_embedding(b"[0.5, 0.25]") == [0.5, 0.25]
+
+    def test_rejects_unknown_encoding(self):
+        with pytest.raises(ValueError):
+            db.decode_embedding(b"\x00\x01garbage")
+
 
 class TestAdBaseline:
     def test_insert_and_get(self):
@@ -956,3 +1087,81 @@ class TestCoreHelpers:
 
     def test_assert_tables_exist(self):
         db.assert_tables_exist()  # Should not raise
+
+
+# ── Source run rollups ───────────────────────────────────────────
+
+
+def _run(source_id="fr", ended_at="2024-01-01T01:00:00Z", status="SUCCESS"):
+    return {
+        "source_id": source_id,
+        "started_at": ended_at,
+        "ended_at": ended_at,
+        "status": status,
+        "records_fetched": 0,
+        "errors": [],
+    }
+
+
+class TestSourceRunRollups:
+    def test_rollup_day_uses_utc_date(self):
+        assert db.rollup_day("2024-01-01T23:30:00-05:00") == "2024-01-02"
+        assert db.rollup_day("2024-01-01T01:00:00Z") == "2024-01-01"
+        assert db.rollup_day("2024-01-01") == "2024-01-01"
+        assert db.rollup_day("garbage") == "garbage"
+
+    def test_insert_source_run_maintains_rollups(self):
+        db.insert_source_run(_run())
+        db.insert_source_run(_run())
+        db.insert_source_run(_run(status="ERROR"))
+        db.insert_source_run(_run(source_id="bills", ended_at="2024-01-02T00:00:00+00:00"))
+
+        assert sorted(db.get_source_run_rollups()) == [
+            ("bills", "2024-01-02", "SUCCESS", 1),
+            ("fr", "2024-01-01", "ERROR", 1),
+            ("fr", "2024-01-01", "SUCCESS", 2),
+        ]
+        assert db.check_source_run_rollups() == []
+
+    def test_check_and_rebuild_repair_drift(self):
+        db.insert_source_run(_run())
+        db.insert_source_run(_run())
+        con = db.connect()
+        db.execute(con, "DELETE FROM source_runs WHERE id = (SELECT MIN(id) FROM source_runs)")
+        con.commit()
+        con.close()
+
+        assert db.check_source_run_rollups() == [
+            {
+                "source_id": "fr",
+                "day": "2024-01-01",
+                "status": "SUCCESS",
+                "expected": 1,
+                "actual": 2,
+            }
+        ]
+        assert db.rebuild_source_run_rollups() == 1
+        assert db.check_source_run_rollups() == []
+        assert db.get_source_run_rollups() == [("fr", "2024-01-01", "SUCCESS", 1)]
+
+    def test_runs_stats_reads_rollups(self):
+        from datetime import UTC, datetime, timedelta
+
+        from src.routers.pipeline import get_runs_stats
+
+        now = datetime.now(UTC)
+        today = now.isoformat()
+        old = (now - timedelta(days=30)).isoformat()
+        db.insert_source_run(_run("fr", today, "SUCCESS"))
+        db.insert_source_run(_run("fr", today, "NO_DATA"))
+        db.insert_source_run(_run("bills", today, "ERROR"))
+        db.insert_source_run(_run("fr", old, "SUCCESS"))
+
+        stats = asyncio.run(get_runs_stats(_=None))
+
+        assert stats.total_runs == 4
+        assert (stats.success_count, stats.error_count, stats.no_data_count) == (2, 1, 1)
+        assert stats.healthy_rate == 75.0
+        assert stats.runs_today == 3
+        assert [(r.source_id, r.count) for r in stats.runs_by_source] == [("fr", 3), ("bills", 1)]
+        assert [(d.date, d.count) for d in stats.runs_by_day] == [(now.date().isoformat(), 3)]
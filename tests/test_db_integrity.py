@@ -1,6 +1,7 @@
 """Tests for LOE2 data integrity: post-write verification, partial failure
 handling, router connection safety, and config schema validation."""
 
+import asyncio
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -160,11 +161,11 @@ class TestRouterConnectionSafety:
         mock_con = MagicMock()
         mock_con.cursor.return_value.execute.side_effect = Exception("DB error")
 
-        with patch("src.routers.pipeline.connect", return_value=mock_con):
+        with patch("src.db.aio.connect", return_value=mock_con):
             with pytest.raises(Exception, match="DB error"):
                 from src.routers.pipeline import get_runs
 
-                get_runs(source_id=None, status=None, limit=10, _=None)
+                asyncio.run(get_runs(source_id=None, status=None, limit=10, _=None))
 
         mock_con.close.assert_called_once()
 
@@ -173,11 +174,11 @@ class TestRouterConnectionSafety:
         mock_con = MagicMock()
         mock_con.cursor.return_value.execute.side_effect = Exception("DB error")
 
-        with patch("src.routers.health.connect", return_value=mock_con):
+        with patch("src.db.aio.connect", return_value=mock_con):
             with pytest.raises(Exception, match="DB error"):
                 from src.routers.health import get_health
 
-                get_health(_=None)
+                asyncio.run(get_health(_=None))
 
         mock_con.close.assert_called_once()
 
@@ -0,0 +1,124 @@
+"""Tests for the streaming embedding backfill in src.embed_utterances."""
+
+import json
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src import db, embed_utterances  # noqa: E402
+
+DIM = 8
+
+
+class FakeModel:
+    """Deterministic stand-in for SentenceTransformer.encode."""
+
+    def __init__(self, fail_after: int | None = None):
+        self.calls = 0
+        self.fail_after = fail_after
+
+    def encode(self, texts, batch_size=32, show_progress_bar=False, convert_to_numpy=True):
+        self.calls += 1
+        if self.fail_after is not None and self.calls > self.fail_after:
+            raise RuntimeError("encoder crashed")
+        return np.array([[float(len(t))] * DIM for t in texts], dtype=np.float32)
+
+
+@pytest.fixture(autouse=True)
+def _index_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("AD_INDEX_DIR", str(tmp_path / "ad_index"))
+
+
+def _seed(n: int):
+    db.upsert_ad_member("M001", "Sen. Backfill")
+    db.bulk_insert_ad_utterances(
+        [
+            {
+                "utterance_id": f"U{i:04d}",
+                "member_id": "M001",
+                "hearing_id": "H001",
+                "content": "x" * (100 + i),
+                "spoken_at": "2024-01-15",
+            }
+            for i in range(n)
+        ]
+    )
+
+
+class TestStreamBackfill:
+    def test_embeds_all_pending_and_removes_checkpoint(self, tmp_path):
+        _seed(25)
+        checkpoint = tmp_path / "ckpt.json"
+
+        stats = embed_utterances.stream_backfill(
+            model_name="fake", page_size=4, checkpoint_path=checkpoint, model=FakeModel()
+        )
+
+        assert stats["embedded"] == 25
+        assert stats["rate"] > 0
+        assert embed_utterances.count_pending() == 0
+        assert not checkpoint.exists()
+        vecs = dict(db.get_ad_embeddings_for_member("M001"))
+        assert list(vecs["U0003"]) == [103.0] * DIM
+
+    def test_resumes_from_checkpoint_after_crash(self, tmp_path):
+        _seed(20)
+        checkpoint = tmp_path / "ckpt.json"
+
+        with pytest.raises(RuntimeError, match="encoder crashed"):
+            embed_utterances.stream_backfill(
+                model_name="fake",
+                page_size=5,
+                checkpoint_path=checkpoint,
+                model=FakeModel(fail_after=2),
+            )
+
+        saved = json.loads(checkpoint.read_text())
+        assert saved["cursor"] == "U0009"
+        assert saved["embedded"] == 10
+        assert embed_utterances.count_pending() == 10
+
+        model = FakeModel()
+        stats = embed_utterances.stream_backfill(
+            model_name="fake", page_size=5, checkpoint_path=checkpoint, model=model
+        )
+        assert stats["embedded"] == 10
+        assert model.calls == 2
+        assert embed_utterances.count_pending() == 0
+
+    def test_checkpoint_for_other_model_is_ignored(self, tmp_path):
+        _seed(3)
+        checkpoint = tmp_path / "ckpt.json"
+        checkpoint.write_text(json.dumps({"model": "other", "cursor": "U0002", "embedded": 3}))
+
+        stats = embed_utterances.stream_backfill(
+            model_name="fake", page_size=2, checkpoint_path=checkpoint, model=FakeModel()
+        )
+
+        assert stats["embedded"] == 3
+
+    def test_limit_caps_work_and_keeps_checkpoint(self, tmp_path):
+        _seed(10)
+        checkpoint = tmp_path / "ckpt.json"
+
+        stats = embed_utterances.stream_backfill(
+            model_name="fake", page_size=4, limit=6, checkpoint_path=checkpoint, model=FakeModel()
+        )
+
+        assert stats["embedded"] == 6
+        assert embed_utterances.count_pending() == 4
+        assert json.loads(checkpoint.read_text())["cursor"] == "U0005"
+
+    def test_nothing_pending(self, tmp_path):
+        stats = embed_utterances.stream_backfill(
+            model_name="fake", checkpoint_path=tmp_path / "ckpt.json", model=FakeModel()
+        )
+        assert stats["embedded"] == 0
+
+    def test_keyset_pages(self):
+        _seed(7)
+        first = embed_utterances.get_pending_page(None, 3)
+        second = embed_utterances.get_pending_page(first[-1]["utterance_id"], 3)
+        assert [u["utterance_id"] for u in first] == ["U0000", "U0001", "U0002"]
+        assert [u["utterance_id"] for u in second] == ["U0003", "U0004", "U0005"]
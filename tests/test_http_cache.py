@@ -0,0 +1,220 @@
+"""Tests for the conditional on-disk HTTP cache."""
+
+from unittest.mock import patch
+
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
+
+from src.http_cache import CachingHTTPAdapter, HTTPCache, ParsedCache
+
+
+class FakeServer:
+    """Stands in for the network below CachingHTTPAdapter."""
+
+    def __init__(self):
+        self.bodies: dict[str, tuple[bytes, str]] = {}
+        self.requests: list[dict] = []
+        self.not_modified_headers: dict[str, str] = {}
+
+    def send(self, adapter, request, **kwargs):
+        self.requests.append(dict(request.headers))
+        body, etag = self.bodies[request.url]
+        response = requests.Response()
+        response.url = request.url
+        response.request = request
+        response.headers["Content-Type"] = "application/json"
+        if etag:
+            response.headers["ETag"] = etag
+        if etag and request.headers.get("If-None-Match") == etag:
+            response.status_code = 304
+            response._content = b""
+            response.headers.update(self.not_modified_headers)
+        else:
+            response.status_code = 200
+            response._content = body
+        return response
+
+
+@pytest.fixture
+def server():
+    fake = FakeServer()
+    with patch.object(HTTPAdapter, "send", lambda self, request, **kw: fake.send(self, request)):
+        yield fake
+
+
+def _session(cache: HTTPCache) -> requests.Session:
+    session = requests.Session()
+    session.mount("https://", CachingHTTPAdapter(cache=cache))
+    return session
+
+
+def test_304_served_from_cache(tmp_path, server):
+    cache = HTTPCache(tmp_path, max_bytes=10_000)
+    server.bodies["https://api.test/a"] = (b'{"n": 1}', '"v1"')
+    session = _session(cache)
+
+    first = session.get("https://api.test/a")
+    second = session.get("https://api.test/a")
+
+    assert first.json() == second.json() == {"n": 1}
+    assert first.from_cache is False
+    assert second.from_cache is True
+    assert second.status_code == 200
+    assert "If-None-Match" not in server.requests[0]
+    assert server.requests[1]["If-None-Match"] == '"v1"'
+    assert cache.stats() == {
+        "hits": 1,
+        "misses": 1,
+        "bytes_saved": 8,
+        "stores": 1,
+        "evictions": 0,
+        "entries": 1,
+        "bytes": 8,
+    }
+
+
+def test_changed_resource_replaces_entry(tmp_path, server):
+    cache = HTTPCache(tmp_path, max_bytes=10_000)
+    server.bodies["https://api.test/a"] = (b"old", '"v1"')
+    session = _session(cache)
+    session.get("https://api.test/a")
+
+    server.bodies["https://api.test/a"] = (b"newer", '"v2"')
+    response = session.get("https://api.test/a")
+
+    assert response.content == b"newer"
+    assert response.from_cache is False
+    assert cache.lookup("https://api.test/a").etag == '"v2"'
+    assert cache.stats()["bytes"] == 5
+
+
+def test_responses_without_validators_not_stored(tmp_path, server):
+    cache = HTTPCache(tmp_path, max_bytes=10_000)
+    server.bodies["https://api.test/plain"] = (b"body", "")
+
+    _session(cache).get("https://api.test/plain")
+
+    assert cache.lookup("https://api.test/plain") is None
+    assert cache.stats()["misses"] == 1
+
+
+def test_lru_eviction_by_size(tmp_path, server):
+    cache = HTTPCache(tmp_path, max_bytes=10)
+    session = _session(cache)
+    for name in "abc":
+        server.bodies[f"https://api.test/{name}"] = (b"xxxx", f'"{name}"')
+    session.get("https://api.test/a")
+    session.get("https://api.test/b")
+    session.get("https://api.test/a")  # a is now most recently used
+    session.get("https://api.test/c")
+
+    assert cache.lookup("https://api.test/b") is None
+    assert cache.lookup("https://api.test/a") is not None
+    assert cache.stats()["evictions"] == 1
+    assert cache.stats()["bytes"] == 8
+    assert len(list(tmp_path.glob("*.body"))) == 2
+
+
+def test_entries_survive_restart(tmp_path, server):
+    server.bodies["https://api.test/a"] = (b"persisted", '"v1"')
+    _session(HTTPCache(tmp_path, max_bytes=10_000)).get("https://api.test/a")
+
+    reopened = HTTPCache(tmp_path, max_bytes=10_000)
+    response = _session(reopened).get("https://api.test/a")
+
+    assert response.from_cache is True
+    assert response.content == b"persisted"
+
+
+def test_missing_body_refetches_unconditionally(tmp_path, server):
+    cache = HTTPCache(tmp_path, max_bytes=10_000)
+    server.bodies["https://api.test/a"] = (b"body", '"v1"')
+    session = _session(cache)
+    session.get("https://api.test/a")
+    for path in tmp_path.glob("*.body"):
+        path.unlink()
+
+    response = session.get("https://api.test/a")
+
+    assert response.content == b"body"
+    assert response.from_cache is False
+    assert "If-None-Match" not in server.requests[-1]
+
+
+def test_non_get_bypasses_cache(tmp_path, server):
+    cache = HTTPCache(tmp_path, max_bytes=10_000)
+    server.bodies["https://api.test/a"] = (b"body", '"v1"')
+
+    _session(cache).post("https://api.test/a")
+
+    assert cache.stats()["misses"] == 0
+    assert cache.lookup("https://api.test/a") is None
+
+
+def test_304_refreshed_validators_are_persisted(tmp_path, server):
+    cache = HTTPCache(tmp_path, max_bytes=10_000)
+    server.bodies["https://api.test/a"] = (b"body", '"v1"')
+    session = _session(cache)
+    session.get("https://api.test/a")
+
+    server.not_modified_headers = {"Last-Modified": "Fri, 16 Oct 2026 12:00:00 GMT"}
+    response = session.get("https://api.test/a")
+
+    assert response.from_cache is True
+    assert response.headers["Last-Modified"] == "Fri, 16 Oct 2026 12:00:00 GMT"
+    for reopened in (cache, HTTPCache(tmp_path, max_bytes=10_000)):
+        entry = reopened.lookup("https://api.test/a")
+        assert (entry.etag, entry.last_modified) == ('"v1"', "Fri, 16 Oct 2026 12:00:00 GMT")
+    session.get("https://api.test/a")
+    assert server.requests[-1]["If-Modified-Since"] == "Fri, 16 Oct 2026 12:00:00 GMT"
+
+
+def test_parsed_cache_skips_unchanged_bodies(tmp_path, server):
+    cache = HTTPCache(tmp_path, max_bytes=10_000)
+    parsed = ParsedCache()
+    server.bodies["https://api.test/a"] = (b'{"n": 1}', '"v1"')
+    session = _session(cache)
+
+    with patch.object(requests.Response, "json", autospec=True, side_effect=lambda r: {"n": 1}):
+        first = parsed.json(session.get("https://api.test/a"))
+        second = parsed.json(session.get("https://api.test/a"))
+        assert requests.Response.json.call_count == 1
+
+        server.bodies["https://api.test/a"] = (b'{"n": 2}', '"v2"')
+        parsed.json(session.get("https://api.test/a"))
+        assert requests.Response.json.call_count == 2
+
+    assert first is second
+    assert parsed.stats() == {"hits": 1, "misses": 2, "entries": 1}
+
+
+def test_parsed_cache_is_bounded():
+    parsed = ParsedCache(max_entries=2)
+    for name in "abc":
+        response = requests.Response()
+        response.url = f"https://api.test/{name}"
+        response.headers["ETag"] = f'"{name}"'
+        response._content = b"{}"
+        parsed.json(response)
+
+    assert parsed.stats()["entries"] == 2
+
+
+def test_fr_bulk_listing_not_reparsed_when_unchanged(tmp_path, server, monkeypatch):
+    import threading
+
+    from src import fr_bulk
+
+    url = "https://www.govinfo.gov/bulkdata/json/FR/2026"
+    server.bodies[url] = (b'{"files": [{"displayLabel": "01", "folder": true}]}', '"v1"')
+    session = _session(HTTPCache(tmp_path, max_bytes=10_000))
+    monkeypatch.setattr(fr_bulk, "_session_local", threading.local())
+    monkeypatch.setattr(fr_bulk, "_listings", ParsedCache())
+    fr_bulk._session_local.session = session
+
+    first = fr_bulk.list_folder_children(url)
+    second = fr_bulk.list_folder_children(url)
+
+    assert first == second == [{"displayLabel": "01", "folder": True}]
+    assert fr_bulk._listings.stats()["hits"] == 1
@@ -0,0 +1,87 @@
+"""Tests for the compiled keyword taxonomy matchers."""
+
+import random
+import re
+
+import pytest
+
+from src.ceo_brief.aggregator import ISSUE_PATTERNS
+from src.keyword_taxonomy import KeywordTaxonomy, RegexTaxonomy
+from src.signals.correlator import TOPIC_KEYWORDS
+from src.state.classify import HIGH_SEVERITY_KEYWORDS, MEDIUM_SEVERITY_KEYWORDS
+
+SEVERITY = {"high": HIGH_SEVERITY_KEYWORDS, "medium": MEDIUM_SEVERITY_KEYWORDS}
+
+
+def _random_texts(vocabulary: list[str], n: int = 300, seed: int = 3) -> list[str]:
+    rng = random.Random(seed)
+    filler = ["update", "the", "VA", "review", "of", "-", "regional", "2024", "x"]
+    words = vocabulary + filler
+    return [" ".join(rng.choice(words) for _ in range(rng.randint(1, 12))) for _ in range(n)]
+
+
+def _naive_substring_tag(taxonomy, text):
+    lower = text.lower()
+    return [label for label, kws in taxonomy.items() if any(kw in lower for kw in kws)]
+
+
+def _naive_whole_word_matches(taxonomy, text):
+    result = {}
+    for label, kws in taxonomy.items():
+        hits = [kw for kw in kws if re.search(rf"\b{re.escape(kw)}\b", text, re.IGNORECASE)]
+        if hits:
+            result[label] = hits
+    return result
+
+
+class TestKeywordTaxonomy:
+    def test_substring_tags_match_naive_loop(self):
+        taxonomy = KeywordTaxonomy(TOPIC_KEYWORDS)
+        vocabulary = [kw for kws in TOPIC_KEYWORDS.values() for kw in kws]
+        for text in _random_texts(vocabulary):
+            assert taxonomy.tag(text) == _naive_substring_tag(TOPIC_KEYWORDS, text)
+
+    def test_whole_word_matches_match_naive_regexes(self):
+        taxonomy = KeywordTaxonomy(SEVERITY, whole_words=True)
+        vocabulary = HIGH_SEVERITY_KEYWORDS + MEDIUM_SEVERITY_KEYWORDS
+        for text in _random_texts(vocabulary):
+            assert taxonomy.matches(text) == _naive_whole_word_matches(SEVERITY, text)
+
+    def test_overlapping_keywords_are_all_found(self):
+        taxonomy = KeywordTaxonomy({"a": ["claims backlog"], "b": ["backlog"], "c": ["log"]})
+        assert taxonomy.tag("CLAIMS BACKLOG grows") == ["a", "b", "c"]
+        assert taxonomy.keywords("claims backlog") == {"claims backlog", "backlog", "log"}
+
+    def test_whole_words_respect_boundaries(self):
+        taxonomy = KeywordTaxonomy(
+            {"cut": ["budget cut"], "cuts": ["budget cuts"], "program": ["program"]},
+            whole_words=True,
+        )
+        assert taxonomy.tag("Budget cuts announced") == ["cuts"]
+        assert taxonomy.tag("a budget cut") == ["cut"]
+        assert taxonomy.tag("programs expand") == []
+
+    def test_no_match_and_empty_text(self):
+        taxonomy = KeywordTaxonomy(TOPIC_KEYWORDS)
+        assert taxonomy.tag("") == []
+        assert taxonomy.matches("nothing relevant here") == {}
+
+    def test_empty_keyword_rejected(self):
+        with pytest.raises(ValueError):
+            KeywordTaxonomy({"bad": ["ok", ""]})
+
+
+class TestRegexTaxonomy:
+    def test_counts_match_naive_loop(self):
+        taxonomy = RegexTaxonomy(ISSUE_PATTERNS)
+        vocabulary = ["claims", "backlog", "appeal", "court", "decision", "county", "veteran"]
+        for text in _random_texts(vocabulary):
+            expected = {}
+            for label, patterns in ISSUE_PATTERNS.items():
+                score = sum(1 for p in patterns if re.search(p, text, re.IGNORECASE))
+                if score:
+                    expected[label] = score
+            assert taxonomy.counts(text) == expected
+
+    def test_empty_taxonomy(self):
+        assert RegexTaxonomy({"none": []}).counts("anything") == {}
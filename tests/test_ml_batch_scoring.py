@@ -0,0 +1,228 @@
+"""Tests for columnar batch feature extraction and scoring in src.ml."""
+
+import asyncio
+import random
+import re
+from datetime import UTC, datetime
+
+import pytest
+
+from src.ml import FeatureExtractor, SignalScorer
+from src.ml import features as features_module
+from src.ml.features import (
+    ORGANIZATION_PATTERNS,
+    REGULATION_PATTERNS,
+    _count_entities,
+    extract_features_batch,
+)
+from src.ml.models import BatchPredictionRequest
+from src.ml.scoring import score_batch
+
+FIXED_NOW = datetime(2026, 3, 14, 15, 9, 26, 535897, tzinfo=UTC)
+
+WORDS = (
+    "The Veteran disability benefit claim appeal of to Congress committee Senate House "
+    "final rule proposed rule hearing. report! inspector general? audit found that VA "
+    "did not 38 CFR 3.1 Public Law 117-168 5 U.S.C. 552 P.L. 1-2 Department DoD va, "
+    "effective date deadline mandatory required retroactive urgent agency amendment"
+).split()
+
+DATES = [
+    None,
+    "",
+    "2026-03-01",
+    "2026-03-14",
+    "2026-03-15",
+    "2026-05-30",
+    "03/20/2026",
+    "April 2, 2026",
+    "2026-03-14T23:59:59Z",
+    "2026-03-13T15:09:27",
+    "not a date",
+    20260314,
+]
+
+SOURCES = [None, "", "federal_register", "News", "congress_gov", "va_gov", "crs", "other"]
+
+
+class _FixedDatetime(datetime):
+    @classmethod
+    def now(cls, tz=None):
+        return FIXED_NOW
+
+
+@pytest.fixture(autouse=True)
+def fixed_now(monkeypatch):
+    monkeypatch.setattr(features_module, "datetime", _FixedDatetime)
+
+
+def _signals(count: int, seed: int = 7) -> list[dict]:
+    rng = random.Random(seed)
+    signals = []
+    for i in range(count):
+        signal = {
+            "signal_id": f"sig-{i}",
+            "title": " ".join(rng.choices(WORDS, k=rng.randint(0, 12))),
+            "content": " ".join(rng.choices(WORDS, k=rng.randint(0, 900))),
+            "source_type": rng.choice(SOURCES),
+            "effective_date": rng.choice(DATES),
+            "comments_close_date": rng.choice(DATES),
+        }
+        if i % 5 == 0:
+            signal["summary"] = "Summary citing 38 CFR 17.1 and ſenate action."
+        signals.append(signal)
+    return signals
+
+
+def _comparable(result) -> dict:
+    fields = dict(vars(result))
+    fields.pop("scored_at")
+    return fields
+
+
+class TestExtractBatch:
+    def test_matches_per_signal_extract(self):
+        signals = _signals(400)
+        extractor = FeatureExtractor()
+
+        expected = [extractor.extract(signal) for signal in signals]
+        actual = extractor.extract_batch(signals).to_feature_sets()
+
+        assert actual == expected
+
+    def test_matches_per_signal_extract_with_db(self):
+        signals = _signals(50, seed=3)
+        extractor = FeatureExtractor(db_connection=object())
+
+        expected = [extractor.extract(signal) for signal in signals]
+        assert extractor.extract_batch(signals).to_feature_sets() == expected
+
+    def test_matrix_columns(self):
+        matrix = FeatureExtractor().extract_batch(
+            [
+                {"title": "VA final rule", "effective_date": "2026-03-24"},
+                {"title": "news item", "source_type": "News"},
+            ]
+        )
+
+        assert len(matrix) == 2
+        assert matrix.source_types == ["other", "news"]
+        assert matrix.column("days_until_effective")[0] == 9
+        assert matrix.column("is_retroactive").tolist() == [0.0, 0.0]
+        assert matrix.column("source_reliability_score").tolist() == [0.5, 0.6]
+
+    def test_empty_batch(self):
+        matrix = FeatureExtractor().extract_batch([])
+        assert len(matrix) == 0
+        assert matrix.to_feature_sets() == []
+
+    def test_extract_features_batch_uses_matrix(self):
+        signals = _signals(20, seed=11)
+        extractor = FeatureExtractor()
+        assert extract_features_batch(signals) == [extractor.extract(s) for s in signals]
+
+
+class TestEntityCounting:
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "",
+            "va dod congress senate house committee agency department",
+            "va-dod va_dod vacancy houses subcommittee",
+            "38 cfr 3.1 38cfr3 5 u.s.c. 552 5 usc552 42 u.s.c 1983",
+            "38 cfr 3 cfr 5 and 38\x1ccfr\x1c3",
+            "public law 117-168, p.l. 1-2, pl 3-4, apple 5-6",
+            "ſenate and the kommittee of the ſtate department",
+        ],
+    )
+    def test_matches_original_patterns(self, text):
+        text = text.lower()
+        expected_orgs = sum(len(re.findall(p, text, re.IGNORECASE)) for p in ORGANIZATION_PATTERNS)
+        expected_regs = sum(len(re.findall(p, text, re.IGNORECASE)) for p in REGULATION_PATTERNS)
+
+        assert _count_entities(text) == (expected_orgs, expected_regs)
+
+
+class TestScoreBatch:
+    def test_matches_per_signal_score(self):
+        signals = _signals(400)
+        scorer = SignalScorer(use_cache=False)
+
+        expected = [_comparable(scorer.score(signal)) for signal in signals]
+        actual = [_comparable(result) for result in scorer.score_batch(signals)]
+
+        assert actual == expected
+
+    def test_module_score_batch(self):
+        signals = _signals(30, seed=5)
+        scorer = SignalScorer(use_cache=False)
+
+        expected = [_comparable(scorer.score(signal)) for signal in signals]
+        assert [_comparable(r) for r in score_batch(signals)] == expected
+
+    def test_empty_batch(self):
+        assert SignalScorer(use_cache=False).score_batch([]) == []
+
+
+def _insert_om_event(event_id: str, title: str, summary: str) -> None:
+    from src.db import connect, execute
+
+    con = connect()
+    execute(
+        con,
+        """
+        INSERT INTO om_events(event_id, event_type, primary_source_type, primary_url,
+                              pub_precision, pub_source, title, summary, fetched_at)
+        VALUES (:event_id, 'report', 'gao', 'https://example.com', 'day', 'extracted',
+                :title, :summary, '2026-03-14T00:00:00Z')
+        """,
+        {"event_id": event_id, "title": title, "summary": summary},
+    )
+    con.commit()
+    con.close()
+
+
+class TestBatchEndpoint:
+    def test_scores_found_signals(self):
+        from src.ml.api import score_batch_signals, score_existing_signal
+
+        _insert_om_event("om-1", "VA final rule", "Implements 38 CFR 3.310 for veterans.")
+        _insert_om_event("om-2", "GAO report", "Audit of VA disability claim appeals.")
+
+        request = BatchPredictionRequest(
+            signal_type="oversight",
+            signal_ids=["om-2", "missing", "om-1"],
+            min_confidence=0.0,
+            include_features=True,
+        )
+        response = asyncio.run(score_batch_signals(request, _=None))
+
+        assert response.count == 2
+        assert response.not_found == ["missing"]
+        assert [r.signal_id for r in response.results] == ["om-2", "om-1"]
+        for item in response.results:
+            single = asyncio.run(score_existing_signal("oversight", item.signal_id, _=None))
+            assert item.model_dump(exclude={"features"}) == single.model_dump()
+            assert item.features["source_type"] == "gao"
+
+    def test_min_confidence_filters_results(self):
+        from src.ml.api import score_batch_signals
+
+        _insert_om_event("om-1", "Short", "")
+        request = BatchPredictionRequest(
+            signal_type="oversight", signal_ids=["om-1"], min_confidence=0.99
+        )
+        response = asyncio.run(score_batch_signals(request, _=None))
+
+        assert response.count == 0
+        assert response.not_found == []
+
+    def test_unknown_signal_type(self):
+        from fastapi import HTTPException
+
+        from src.ml.api import score_batch_signals
+
+        request = BatchPredictionRequest(signal_type="nope", signal_ids=["x"])
+        with pytest.raises(HTTPException) as exc:
+            asyncio.run(score_batch_signals(request, _=None))
+        assert exc.value.status_code == 400
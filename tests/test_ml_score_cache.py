@@ -0,0 +1,180 @@
+"""Tests for content-hash score memoization in src.ml."""
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from src.ml import ScoreCache, SignalScorer
+from src.ml import features as features_module
+from src.ml.models import PredictionConfig
+
+NOW = datetime(2026, 3, 14, 15, 0, 0, tzinfo=UTC)
+
+SIGNAL = {
+    "signal_id": "fr-1",
+    "title": "VA final rule on disability compensation",
+    "content": "Amends 38 CFR 3.310. Effective date and comment period deadline apply.",
+    "source_type": "federal_register",
+    "effective_date": "2026-04-01",
+    "comments_close_date": "2026-03-20",
+}
+
+
+class _Clock:
+    now = NOW
+
+
+class _FakeDatetime(datetime):
+    @classmethod
+    def now(cls, tz=None):
+        return _Clock.now
+
+
+@pytest.fixture(autouse=True)
+def fixed_now(monkeypatch):
+    monkeypatch.setattr(features_module, "datetime", _FakeDatetime)
+    _Clock.now = NOW
+
+
+def _comparable(result) -> dict:
+    fields = dict(vars(result))
+    fields.pop("scored_at")
+    return fields
+
+
+def _count_extractions(monkeypatch, scorer: SignalScorer) -> list[int]:
+    calls = [0, 0]
+    extract, extract_batch = (
+        scorer.feature_extractor.extract,
+        scorer.feature_extractor.extract_batch,
+    )
+
+    def counting_extract(signal):
+        calls[0] += 1
+        return extract(signal)
+
+    def counting_extract_batch(signals):
+        calls[1] += len(signals)
+        return extract_batch(signals)
+
+    monkeypatch.setattr(scorer.feature_extractor, "extract", counting_extract)
+    monkeypatch.setattr(scorer.feature_extractor, "extract_batch", counting_extract_batch)
+    return calls
+
+
+class TestScoreMemoization:
+    def test_repeat_score_is_a_lookup(self, monkeypatch):
+        scorer = SignalScorer(cache=ScoreCache(persist=False))
+        calls = _count_extractions(monkeypatch, scorer)
+
+        first = scorer.score(SIGNAL)
+        second = scorer.score({**SIGNAL, "signal_id": "fr-1-copy"})
+
+        assert calls[0] == 1
+        assert second.signal_id == "fr-1-copy"
+        assert _comparable(second) == {**_comparable(first), "signal_id": "fr-1-copy"}
+        assert _comparable(first) == _comparable(SignalScorer(use_cache=False).score(SIGNAL))
+        stats = scorer.cache.stats()
+        assert (stats["hits"], stats["misses"], stats["hit_rate"]) == (1, 1, 0.5)
+
+    def test_changed_content_misses(self, monkeypatch):
+        scorer = SignalScorer(cache=ScoreCache(persist=False))
+        calls = _count_extractions(monkeypatch, scorer)
+
+        scorer.score(SIGNAL)
+        scorer.score({**SIGNAL, "content": SIGNAL["content"] + " Retroactive."})
+        scorer.score({**SIGNAL, "source_type": "news"})
+        scorer.score({**SIGNAL, "comments_close_date": "2026-03-16"})
+
+        assert calls[0] == 4
+
+    def test_day_change_misses(self, monkeypatch):
+        scorer = SignalScorer(cache=ScoreCache(persist=False))
+        calls = _count_extractions(monkeypatch, scorer)
+
+        scorer.score(SIGNAL)
+        _Clock.now = NOW + timedelta(hours=10)  # past midnight UTC
+        second = scorer.score(SIGNAL)
+
+        assert calls[0] == 2
+        assert _comparable(second) == _comparable(SignalScorer(use_cache=False).score(SIGNAL))
+
+    def test_config_change_misses(self, monkeypatch):
+        cache = ScoreCache(persist=False)
+        SignalScorer(cache=cache).score(SIGNAL)
+
+        scorer = SignalScorer(config=PredictionConfig(threshold_high=0.9), cache=cache)
+        calls = _count_extractions(monkeypatch, scorer)
+        scorer.score(SIGNAL)
+
+        assert calls[0] == 1
+
+    def test_lru_eviction(self):
+        scorer = SignalScorer(cache=ScoreCache(max_entries=2, persist=False))
+        for i in range(3):
+            scorer.score({**SIGNAL, "title": f"title {i}"})
+
+        stats = scorer.cache.stats()
+        assert (stats["size"], stats["evictions"]) == (2, 1)
+
+    def test_score_batch_uses_cache(self, monkeypatch):
+        signals = [{**SIGNAL, "signal_id": f"s{i}", "title": f"title {i % 3}"} for i in range(6)]
+        scorer = SignalScorer(cache=ScoreCache(persist=False))
+        calls = _count_extractions(monkeypatch, scorer)
+
+        scorer.score(signals[0])
+        results = scorer.score_batch(signals)
+
+        # title 0 was cached; titles 1 and 2 are extracted once each
+        assert calls == [1, 2]
+        uncached = SignalScorer(use_cache=False)
+        assert [_comparable(r) for r in results] == [
+            _comparable(uncached.score(signal)) for signal in signals
+        ]
+
+        scorer.score_batch(signals)
+        assert calls == [1, 2]
+
+
+class TestPersistedScoreCache:
+    def test_shared_across_caches(self, monkeypatch):
+        SignalScorer(cache=ScoreCache(persist=True)).score(SIGNAL)
+
+        # A new process starts with an empty LRU
+        scorer = SignalScorer(cache=ScoreCache(persist=True))
+        calls = _count_extractions(monkeypatch, scorer)
+        result = scorer.score(SIGNAL)
+
+        assert calls[0] == 0
+        assert _comparable(result) == _comparable(SignalScorer(use_cache=False).score(SIGNAL))
+        assert scorer.cache.stats()["persisted_hits"] == 1
+
+    def test_other_config_rows_purged(self):
+        from src.db import connect, execute
+
+        SignalScorer(cache=ScoreCache(persist=True)).score(SIGNAL)
+        SignalScorer(
+            config=PredictionConfig(threshold_low=0.1), cache=ScoreCache(persist=True)
+        ).score(SIGNAL)
+
+        con = connect()
+        rows = execute(con, "SELECT COUNT(DISTINCT config_hash) FROM ml_score_cache").fetchone()
+        con.close()
+        assert rows[0] == 1
+
+
+def test_stats_endpoint_reports_hit_rate(monkeypatch):
+    from src.ml import cache as cache_module
+    from src.ml.api import get_scoring_stats
+    from src.ml.cache import get_score_cache
+
+    monkeypatch.setattr(cache_module, "score_cache", ScoreCache(persist=False))
+    scorer = SignalScorer()
+    scorer.score(SIGNAL)
+    scorer.score(SIGNAL)
+
+    stats = asyncio.run(get_scoring_stats(_=None))
+
+    assert stats["score_cache"] == get_score_cache().stats()
+    assert stats["score_cache"]["hit_rate"] == 0.5
@@ -35,7 +35,9 @@ FAKE_UTTERANCES = [
 ]
 
 FAKE_BASELINE = {
+    "id": 1,
     "member_id": "M001",
+    "vec_mean": [0.1, 0.2, 0.25],
     "mu": 0.15,
     "sigma": 0.05,
     "n": 8,
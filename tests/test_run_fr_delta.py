@@ -54,7 +54,7 @@ def _setup_schema(tmp_path, monkeypatch):
 class TestRunFrDelta:
     @patch.object(run_fr_delta, "send_new_docs_alert")
     @patch.object(run_fr_delta, "send_error_alert")
-    @patch.object(run_fr_delta, "upsert_fr_seen")
+    @patch.object(run_fr_delta, "insert_new_fr_seen")
     @patch.object(run_fr_delta, "list_month_packages")
     @patch.object(run_fr_delta, "list_latest_month_folders")
     @patch.object(run_fr_delta, "load_cfg")
@@ -85,7 +85,7 @@ class TestRunFrDelta:
                 "source_url": "https://example.com/doc2",
             },
         ]
-        mock_upsert.return_value = True  # new doc
+        mock_upsert.side_effect = lambda pkgs, _ts: list(pkgs)  # all new
 
         result = run_fr_delta.run_fr_delta.__wrapped__(max_months=1)
 
@@ -101,7 +101,7 @@ class TestRunFrDelta:
 
     @patch.object(run_fr_delta, "send_new_docs_alert")
     @patch.object(run_fr_delta, "send_error_alert")
-    @patch.object(run_fr_delta, "upsert_fr_seen")
+    @patch.object(run_fr_delta, "insert_new_fr_seen")
     @patch.object(run_fr_delta, "list_month_packages")
     @patch.object(run_fr_delta, "list_latest_month_folders")
     @patch.object(run_fr_delta, "load_cfg")
@@ -128,7 +128,7 @@ class TestRunFrDelta:
                 "source_url": "https://example.com/doc1",
             },
         ]
-        mock_upsert.return_value = False  # already seen
+        mock_upsert.return_value = []  # already seen
 
         result = run_fr_delta.run_fr_delta.__wrapped__(max_months=1)
 
@@ -186,7 +186,7 @@ class TestRunFrDelta:
 
     @patch.object(run_fr_delta, "send_new_docs_alert")
     @patch.object(run_fr_delta, "send_error_alert")
-    @patch.object(run_fr_delta, "upsert_fr_seen")
+    @patch.object(run_fr_delta, "insert_new_fr_seen")
     @patch.object(run_fr_delta, "list_month_packages")
     @patch.object(run_fr_delta, "list_latest_month_folders")
     @patch.object(run_fr_delta, "load_cfg")
@@ -224,12 +224,15 @@ class TestRunFrDelta:
                 }
             ],
         ]
-        mock_upsert.return_value = True
+        mock_upsert.side_effect = lambda pkgs, _ts: list(pkgs)
 
         result = run_fr_delta.run_fr_delta.__wrapped__(max_months=3)
 
         assert result["status"] == "SUCCESS"
         assert result["records_fetched"] == 2
+        mock_upsert.assert_called_once()
+        packages = mock_upsert.call_args.args[0]
+        assert [p["doc_id"] for p in packages] == ["FR-2024-0001", "FR-2024-0010"]
 
 
 # ── write_run_record ─────────────────────────────────────────────
@@ -107,7 +107,7 @@ class TestCmdRun:
         )
         mock_run_all.return_value = [result]
 
-        args = argparse.Namespace(agent=None, since=None)
+        args = argparse.Namespace(agent=None, since=None, workers=None)
         run_oversight.cmd_run(args)
 
         mock_init_db.assert_called_once()
@@ -127,15 +127,19 @@ class TestCmdRun:
             events_processed=8,
             escalations=2,
             errors=[],
+            stage_timings={"fetch": 1.5, "dedup": 0.25},
+            baseline_cache={"hits": 9, "misses": 1},
         )
 
-        args = argparse.Namespace(agent="gao", since=None)
+        args = argparse.Namespace(agent="gao", since=None, workers=None)
         run_oversight.cmd_run(args)
 
-        mock_run.assert_called_once_with("gao", since=None)
+        mock_run.assert_called_once_with("gao", since=None, workers=None)
         output = capsys.readouterr().out
         assert "gao" in output
         assert "Fetched: 10" in output
+        assert "Timings: fetch=1.50s, dedup=0.25s" in output
+        assert "Baseline cache: 9 hits, 1 misses" in output
 
     @patch.object(run_oversight, "init_oversight")
     @patch.object(run_oversight, "init_db")
@@ -150,7 +154,7 @@ class TestCmdRun:
             errors=["API timeout"],
         )
 
-        args = argparse.Namespace(agent="gao", since=None)
+        args = argparse.Namespace(agent="gao", since=None, workers=None)
         run_oversight.cmd_run(args)
 
         output = capsys.readouterr().out
@@ -168,7 +172,7 @@ class TestCmdRun:
             escalations=0,
             errors=[],
         )
-        args = argparse.Namespace(agent="gao", since="2026-01-01T00:00:00")
+        args = argparse.Namespace(agent="gao", since="2026-01-01T00:00:00", workers=None)
         run_oversight.cmd_run(args)
         call_kwargs = mock_run.call_args
         assert call_kwargs[1]["since"] is not None
@@ -187,11 +191,11 @@ class TestCmdBackfill:
             events_fetched=50,
             events_processed=48,
         )
-        args = argparse.Namespace(agent="gao", start="2025-01-01", end="2025-06-01")
+        args = argparse.Namespace(agent="gao", start="2025-01-01", end="2025-06-01", workers=4)
         run_oversight.cmd_backfill(args)
 
         mock_bf.assert_called_once_with(
-            agent_name="gao", start_date="2025-01-01", end_date="2025-06-01"
+            agent_name="gao", start_date="2025-01-01", end_date="2025-06-01", workers=4
         )
         output = capsys.readouterr().out
         assert "Backfill gao" in output
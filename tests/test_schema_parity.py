@@ -15,7 +15,7 @@ PROJECT_ROOT = Path(__file__).resolve().parent.parent
 SQLITE_SCHEMA = PROJECT_ROOT / "schema.sql"
 POSTGRES_SCHEMA = PROJECT_ROOT / "schema.postgres.sql"
 
-EXPECTED_TABLE_COUNT = 57
+EXPECTED_TABLE_COUNT = 62
 
 # Lines starting with these tokens inside a CREATE TABLE block are constraints,
 # not column definitions.